@@ -29,21 +29,33 @@
     StateManager,
     __version__,
     __version_date__,
+    api_metrics,
 )
 from lib import argocd as argocd_lib
 from lib import (
     setup_logging,
     validate_decommission_permissions,
 )
+from lib.argocd_cache import ArgocdDiscoveryCache, argocd_cache_dir_for_state_dir
 from lib.constants import (
+    API_BURST_DEFAULT,
+    API_METRICS_TABLE_ROWS,
+    API_QPS_DEFAULT,
+    ARGOCD_DISCOVERY_CACHE_TTL_SECONDS,
     EXIT_FAILURE,
     EXIT_INTERRUPT,
     EXIT_SUCCESS,
+    KLUSTERLET_VERIFY_BUDGET,
+    KLUSTERLET_VERIFY_MODE_DEFAULT,
+    KLUSTERLET_VERIFY_MODES,
     OBSERVABILITY_NAMESPACE,
+    RBAC_CACHE_TTL_SECONDS,
     STALE_STATE_THRESHOLD,
 )
 from lib.exceptions import StateLoadError, StateLockError
 from lib.gitops_detector import GitOpsCollector
+from lib.rbac_cache import RBACResultCache, cache_dir_for_state_dir
+from lib.state_journal import journal_path_for
 from lib.validation import InputValidator, ValidationError
 from modules import (
     Decommission,
@@ -270,6 +282,86 @@ def parse_args():
         action="store_true",
         help="Non-interactive mode for decommission (dangerous)",
     )
+    parser.add_argument(
+        "--informer-cache",
+        action="store_true",
+        help=(
+            "Serve repeated ManagedCluster lists, including metadata-only lists, from a watch-maintained "
+            "in-memory cache instead of re-listing from the API server (requires the watch verb)"
+        ),
+    )
+    parser.add_argument(
+        "--api-qps",
+        type=float,
+        default=API_QPS_DEFAULT,
+        metavar="QPS",
+        help=(
+            "Sustained Kubernetes API requests per second per hub client "
+            f"(default: {API_QPS_DEFAULT:g}; 0 disables client-side throttling)"
+        ),
+    )
+    parser.add_argument(
+        "--api-burst",
+        type=int,
+        default=API_BURST_DEFAULT,
+        metavar="N",
+        help=f"Requests allowed in a burst above --api-qps per hub client (default: {API_BURST_DEFAULT})",
+    )
+    parser.add_argument(
+        "--rbac-cache-ttl",
+        type=int,
+        default=RBAC_CACHE_TTL_SECONDS,
+        metavar="SECONDS",
+        help=(
+            "Reuse RBAC permissions granted within this many seconds, cached per API server, "
+            f"identity and role under the state directory (default: {RBAC_CACHE_TTL_SECONDS}; 0 disables the cache)"
+        ),
+    )
+    parser.add_argument(
+        "--refresh-rbac-cache",
+        action="store_true",
+        help="Ignore cached RBAC results, re-check every permission and rewrite the cache",
+    )
+    parser.add_argument(
+        "--argocd-discovery-cache-ttl",
+        type=int,
+        default=ARGOCD_DISCOVERY_CACHE_TTL_SECONDS,
+        metavar="SECONDS",
+        help=(
+            "Reuse Argo CD discovery results cached per API server under the state directory for this many seconds "
+            f"while the Argo CD CRDs are unchanged (default: {ARGOCD_DISCOVERY_CACHE_TTL_SECONDS}; 0 disables the cache)"
+        ),
+    )
+    parser.add_argument(
+        "--klusterlet-verify-budget",
+        type=int,
+        default=KLUSTERLET_VERIFY_BUDGET,
+        metavar="SECONDS",
+        help=(
+            "Time allowed for checking and fixing klusterlet connections on managed clusters during "
+            f"post-activation; clusters not reached in time are reported (default: {KLUSTERLET_VERIFY_BUDGET}; "
+            "0 means no limit)"
+        ),
+    )
+    parser.add_argument(
+        "--klusterlet-verify-mode",
+        choices=list(KLUSTERLET_VERIFY_MODES),
+        default=KLUSTERLET_VERIFY_MODE_DEFAULT,
+        help=(
+            "How klusterlet connections are verified after activation: 'spoke' connects to every managed "
+            "cluster through its kubeconfig context; 'lease' only reads klusterlet leases and ManagedCluster "
+            "conditions on the new hub (no fixes); 'auto' reads the leases first and connects only to clusters "
+            f"they do not prove connected (default: {KLUSTERLET_VERIFY_MODE_DEFAULT})"
+        ),
+    )
+    parser.add_argument(
+        "--state-journal",
+        action="store_true",
+        help=(
+            "Append state changes to a write-ahead journal next to the state file and fold it "
+            "into the state file at phase boundaries, instead of rewriting the file per change"
+        ),
+    )
 
     # Logging
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
@@ -498,6 +590,29 @@ def _fail_phase(state: StateManager, message: str, logger: logging.Logger) -> bo
     return False
 
 
+def _build_rbac_cache(args: argparse.Namespace) -> Optional[RBACResultCache]:
+    """Return the RBAC result cache that lives next to the state file, if one is in use."""
+    state_file = getattr(args, "state_file", None)
+    if not state_file:
+        return None
+    return RBACResultCache(
+        cache_dir_for_state_dir(os.path.dirname(state_file)),
+        ttl_seconds=getattr(args, "rbac_cache_ttl", RBAC_CACHE_TTL_SECONDS),
+        refresh=getattr(args, "refresh_rbac_cache", False),
+    )
+
+
+def _build_argocd_discovery_cache(args: argparse.Namespace) -> Optional[ArgocdDiscoveryCache]:
+    """Return the Argo CD discovery cache that lives next to the state file, if one is in use."""
+    state_file = getattr(args, "state_file", None)
+    if not state_file:
+        return None
+    return ArgocdDiscoveryCache(
+        argocd_cache_dir_for_state_dir(os.path.dirname(state_file)),
+        ttl_seconds=getattr(args, "argocd_discovery_cache_ttl", ARGOCD_DISCOVERY_CACHE_TTL_SECONDS),
+    )
+
+
 def _run_phase_preflight(
     args: argparse.Namespace,
     state: StateManager,
@@ -518,6 +633,7 @@ def _run_phase_preflight(
         include_decommission=args.old_hub_action == "decommission",
         argocd_manage=effective_argocd_manage,
         skip_gitops_check=getattr(args, "skip_gitops_check", False),
+        rbac_cache=_build_rbac_cache(args),
     )
     passed, config = validator.validate_all()
 
@@ -580,8 +696,7 @@ def _report_argocd_acm_impact(
                 discovery.install_type,
                 instances,
             )
-            apps = argocd_lib.list_argocd_applications(client, namespaces=None)
-            acm_apps = argocd_lib.find_acm_touching_apps(apps)
+            acm_apps = argocd_lib.find_acm_touching_apps(argocd_lib.iter_argocd_applications(client, namespaces=None))
             if not acm_apps:
                 logger.info("[%s] No ACM-touching Argo CD Applications detected", label)
                 continue
@@ -608,9 +723,7 @@ def _report_argocd_acm_impact(
             )
 
     if not argocd_manage and all_acm_apps:
-        autosync_count = sum(
-            1 for a in all_acm_apps if (a.app.get("spec", {}) or {}).get("syncPolicy", {}).get("automated")
-        )
+        autosync_count = sum(1 for a in all_acm_apps if a.sync_policy.get("automated"))
         if autosync_count:
             logger.warning(
                 "\n⚠ ArgoCD advisory: %d ACM-touching Application(s) with auto-sync detected.\n"
@@ -690,6 +803,8 @@ def _run_phase_post_activation(
         state,
         state.get_config("secondary_has_observability", False),
         dry_run=args.dry_run,
+        klusterlet_budget=getattr(args, "klusterlet_verify_budget", KLUSTERLET_VERIFY_BUDGET),
+        klusterlet_verify_mode=getattr(args, "klusterlet_verify_mode", KLUSTERLET_VERIFY_MODE_DEFAULT),
     )
 
     if not verification.verify():
@@ -919,12 +1034,14 @@ def main():  # noqa: C901
             logger.warning("Resetting state file: %s", resolved_state_file)
             try:
                 os.remove(resolved_state_file)
+                if os.path.exists(journal_path_for(resolved_state_file)):
+                    os.remove(journal_path_for(resolved_state_file))
             except OSError as exc:
                 logger.error("Failed to remove state file: %s", exc)
                 sys.exit(EXIT_FAILURE)
 
     try:
-        state = StateManager(resolved_state_file)
+        state = StateManager(resolved_state_file, journal=getattr(args, "state_journal", False))
     except (StateLoadError, StateLockError) as exc:
         logger.error("")
         logger.error("FATAL: Cannot initialize switchover state file.")
@@ -945,6 +1062,7 @@ def main():  # noqa: C901
         logger.error("Failed to initialize Kubernetes clients: %s", exc)
         sys.exit(EXIT_FAILURE)
 
+    argocd_lib.configure_discovery_cache(_build_argocd_discovery_cache(args))
     operation_exit_code = EXIT_FAILURE
     try:
         if getattr(args, "argocd_resume_only", False):
@@ -976,23 +1094,75 @@ def main():  # noqa: C901
     finally:
         # Print GitOps detection report if any markers were found
         GitOpsCollector.get_instance().print_report()
+        _log_throttle_stats(logger, primary, secondary)
+        _report_api_metrics(logger, args.state_file, primary, secondary)
 
     sys.exit(operation_exit_code)
 
 
+def _report_api_metrics(logger: logging.Logger, state_file: str, *clients: Optional[KubeClient]) -> None:
+    """Log the slowest API calls of the run and write all of them next to the state file."""
+    recorded = [getattr(kube_client, "api_metrics", None) for kube_client in clients]
+    rows = api_metrics.collect(item for item in recorded if isinstance(item, api_metrics.ApiCallMetrics))
+    if not rows:
+        return
+
+    logger.info("API calls by total time (top %d of %d):", min(len(rows), API_METRICS_TABLE_ROWS), len(rows))
+    for line in api_metrics.format_table(rows, limit=API_METRICS_TABLE_ROWS):
+        logger.info("  %s", line)
+
+    metrics_file = api_metrics.metrics_path_for_state_file(state_file)
+    try:
+        api_metrics.write_json(metrics_file, rows)
+    except OSError as exc:
+        logger.warning("Could not write API call metrics to %s: %s", metrics_file, exc)
+    else:
+        logger.info("API call metrics written to: %s", metrics_file)
+
+
+def _log_throttle_stats(logger: logging.Logger, *clients: Optional[KubeClient]) -> None:
+    """Report how long requests waited on each hub's client-side rate limiter."""
+    for kube_client in clients:
+        if kube_client is None:
+            continue
+        stats = kube_client.throttle_stats()
+        if not isinstance(stats, dict):
+            continue
+        log = logger.info if stats["throttled_requests"] or stats["retry_after_pauses"] else logger.debug
+        log(
+            "API throttling for %s: %d request(s), %d throttled for %.1fs total, %d Retry-After pause(s) "
+            "(qps=%g, burst=%d)",
+            kube_client.context or "default",
+            stats["requests"],
+            stats["throttled_requests"],
+            stats["throttled_seconds"],
+            stats["retry_after_pauses"],
+            stats["qps"],
+            stats["burst"],
+        )
+
+
 def _initialize_clients(
     args: argparse.Namespace,
     logger: logging.Logger,
 ) -> Tuple[KubeClient, Optional[KubeClient]]:
     """Create Kubernetes clients for provided contexts."""
 
+    qps = getattr(args, "api_qps", API_QPS_DEFAULT)
+    burst = getattr(args, "api_burst", API_BURST_DEFAULT)
+
     logger.info("Connecting to primary hub: %s", args.primary_context)
-    primary = KubeClient(args.primary_context, dry_run=args.dry_run)
+    primary = KubeClient(args.primary_context, dry_run=args.dry_run, qps=qps, burst=burst)
 
     secondary = None
     if args.secondary_context:
         logger.info("Connecting to secondary hub: %s", args.secondary_context)
-        secondary = KubeClient(args.secondary_context, dry_run=args.dry_run)
+        secondary = KubeClient(args.secondary_context, dry_run=args.dry_run, qps=qps, burst=burst)
+
+    if getattr(args, "informer_cache", False):
+        for kube_client in (primary, secondary):
+            if kube_client is not None:
+                kube_client.enable_informer_cache()
 
     return primary, secondary
 
@@ -1062,7 +1232,7 @@ def _run_argocd_resume_only(
         )
         return False
     run_id = state.get_config("argocd_run_id")
-    paused_apps = state.get_config("argocd_paused_apps") or []
+    paused_apps = argocd_lib.PausedAppIndex(state.get_config("argocd_paused_apps") or [])
     if not run_id or not paused_apps:
         logger.error("No Argo CD paused apps in state file (argocd_run_id or argocd_paused_apps missing).")
         return False
@@ -8,10 +8,15 @@
 
 import argparse
 import logging
+import os
 import sys
 import traceback
 
 from lib import KubeClient, RBACValidator, __version__, __version_date__, setup_logging
+from lib.constants import RBAC_CACHE_TTL_SECONDS
+from lib.rbac_cache import RBACResultCache, cache_dir_for_state_dir
+
+STATE_DIR_ENV_VAR = "ACM_SWITCHOVER_STATE_DIR"
 
 
 def parse_args():
@@ -47,6 +52,9 @@ def parse_args():
 
   # Validate read-only access on managed cluster
   %(prog)s --context prod1 --managed-cluster --role validator
+
+  # Ignore cached results after changing RBAC
+  %(prog)s --refresh-rbac-cache
         """,
     )
 
@@ -84,6 +92,21 @@ def parse_args():
         default="operator",
         help="Role to validate permissions for (default: operator). " "Use 'validator' for read-only service accounts.",
     )
+    parser.add_argument(
+        "--rbac-cache-ttl",
+        type=int,
+        default=RBAC_CACHE_TTL_SECONDS,
+        metavar="SECONDS",
+        help=(
+            "Reuse permissions granted within this many seconds from the cache in "
+            f"$ACM_SWITCHOVER_STATE_DIR/rbac-cache (default: {RBAC_CACHE_TTL_SECONDS}; 0 disables the cache)"
+        ),
+    )
+    parser.add_argument(
+        "--refresh-rbac-cache",
+        action="store_true",
+        help="Ignore cached results, re-check every permission and rewrite the cache",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -94,6 +117,16 @@ def parse_args():
     return parser.parse_args()
 
 
+def build_rbac_cache(args) -> RBACResultCache:
+    """Build the RBAC result cache in the switchover state directory."""
+    state_dir = (os.environ.get(STATE_DIR_ENV_VAR) or "").strip() or ".state"
+    return RBACResultCache(
+        cache_dir_for_state_dir(state_dir),
+        ttl_seconds=args.rbac_cache_ttl,
+        refresh=args.refresh_rbac_cache,
+    )
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -107,6 +140,9 @@ def main():
             file=sys.stderr,
         )
         sys.exit(1)
+    if args.rbac_cache_ttl < 0:
+        print("Error: --rbac-cache-ttl must be a non-negative integer", file=sys.stderr)
+        sys.exit(1)
 
     # Set up logging
     setup_logging(verbose=args.verbose, log_format="text")
@@ -114,6 +150,8 @@ def main():
 
     logger.info("ACM Switchover RBAC Checker v%s (%s)", __version__, __version_date__)
 
+    rbac_cache = build_rbac_cache(args)
+
     try:
         # Determine which contexts to check
         if args.primary_context and args.secondary_context:
@@ -127,7 +165,12 @@ def main():
             logger.info("\n" + "=" * 80)
             logger.info("PRIMARY HUB (%s) - Role: %s", args.primary_context, args.role)
             logger.info("=" * 80)
-            primary_validator = RBACValidator(primary_client, role=args.role)
+            primary_validator = RBACValidator(
+                primary_client,
+                role=args.role,
+                batched=True,
+                cache=rbac_cache.entry(primary_client, args.role, "none"),
+            )
             primary_valid, _ = primary_validator.validate_all_permissions(
                 include_decommission=args.include_decommission,
                 skip_observability=args.skip_observability,
@@ -142,7 +185,12 @@ def main():
             logger.info("\n" + "=" * 80)
             logger.info("SECONDARY HUB (%s) - Role: %s", args.secondary_context, args.role)
             logger.info("=" * 80)
-            secondary_validator = RBACValidator(secondary_client, role=args.role)
+            secondary_validator = RBACValidator(
+                secondary_client,
+                role=args.role,
+                batched=True,
+                cache=rbac_cache.entry(secondary_client, args.role, "none"),
+            )
             secondary_valid, _ = secondary_validator.validate_all_permissions(
                 include_decommission=False,
                 skip_observability=args.skip_observability,
@@ -171,7 +219,9 @@ def main():
                 logger.info("Checking RBAC permissions on current context")
 
             client = KubeClient(context=context)
-            validator = RBACValidator(client, role=args.role)
+            validator = RBACValidator(
+                client, role=args.role, batched=True, cache=rbac_cache.entry(client, args.role, "none")
+            )
 
             logger.info("Validating for role: %s", args.role)
 
@@ -23,6 +23,10 @@
             _acm_complete_from_list "secondary decommission none"
             return
             ;;
+        --klusterlet-verify-mode)
+            _acm_complete_from_list "spoke lease auto"
+            return
+            ;;
         --log-format)
             _acm_complete_from_list "text json"
             return
@@ -58,6 +62,12 @@
         COMPREPLY=( "${COMPREPLY[@]/#/${prefix}}" )
         return
     fi
+    if [[ "$cur" == --klusterlet-verify-mode=* ]]; then
+        local value="${cur#*=}" prefix="--klusterlet-verify-mode="
+        COMPREPLY=( $(compgen -W "spoke lease auto" -- "$value") )
+        COMPREPLY=( "${COMPREPLY[@]/#/${prefix}}" )
+        return
+    fi
     if [[ "$cur" == --log-format=* ]]; then
         local value="${cur#*=}" prefix="--log-format="
         COMPREPLY=( $(compgen -W "text json" -- "$value") )
@@ -67,7 +77,7 @@
 
     # Option list completion
     if [[ "$cur" == -* ]]; then
-        local opts="--primary-context --secondary-context --validate-only --dry-run --decommission --method --manage-auto-import-strategy --state-file --reset-state --old-hub-action --skip-observability-checks --skip-rbac-validation --non-interactive --verbose -v --log-format --help -h"
+        local opts="--primary-context --secondary-context --validate-only --dry-run --decommission --method --manage-auto-import-strategy --state-file --reset-state --old-hub-action --skip-observability-checks --skip-rbac-validation --non-interactive --informer-cache --api-qps --api-burst --rbac-cache-ttl --refresh-rbac-cache --argocd-discovery-cache-ttl --klusterlet-verify-budget --klusterlet-verify-mode --state-journal --verbose -v --log-format --help -h"
         _acm_complete_from_list "$opts"
         return
     fi
@@ -36,7 +36,7 @@
     fi
 
     if [[ "$cur" == -* ]]; then
-        local opts="--context --primary-context --secondary-context --include-decommission --skip-observability --verbose -v --help -h"
+        local opts="--context --primary-context --secondary-context --include-decommission --skip-observability --rbac-cache-ttl --refresh-rbac-cache --verbose -v --help -h"
         _acm_complete_from_list "$opts"
         return
     fi
@@ -0,0 +1,190 @@
+"""Per-API-call latency, retry and error instrumentation for KubeClient.
+
+Every method wrapped in ``retry_api_call`` (and therefore ``api_call``) is
+recorded as one logical call keyed by (context, verb, resource). The
+transport layer attributes the HTTP requests it sends to the call that is
+active on the current thread, so each key carries:
+
+- wall time of the call, including tenacity backoff between attempts
+- time spent waiting on the apiserver (sum of HTTP round trips)
+- attempts beyond the first (retries)
+- 4xx / 5xx responses and bytes received
+
+Requests sent outside a decorated method (e.g. watch streams) are recorded
+under their HTTP method and URL resource instead.
+"""
+
+import os
+import threading
+import time
+import urllib.parse
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lib.utils import atomic_write_json
+
+# (context, verb, resource)
+ApiCallKey = Tuple[str, str, str]
+
+_active = threading.local()
+
+
+@dataclass
+class ApiCallStats:
+    """Aggregated counters for one (context, verb, resource) key."""
+
+    calls: int = 0
+    requests: int = 0
+    retries: int = 0
+    errors_4xx: int = 0
+    errors_5xx: int = 0
+    bytes_received: int = 0
+    total_seconds: float = 0.0
+    request_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class _ActiveCall:
+    """Per-thread accumulator for the decorated call currently in progress."""
+
+    __slots__ = ("metrics", "key", "attempts", "previous")
+
+    def __init__(self, metrics: "ApiCallMetrics", key: ApiCallKey, previous: Optional["_ActiveCall"]) -> None:
+        self.metrics = metrics
+        self.key = key
+        self.attempts = 0
+        self.previous = previous
+
+
+def _resource_from_url(url: str) -> str:
+    """Return the resource plural addressed by a Kubernetes API URL."""
+    parts = [part for part in urllib.parse.urlsplit(url).path.split("/") if part]
+    if parts[:1] == ["api"]:
+        rest = parts[2:]
+    elif parts[:1] == ["apis"]:
+        rest = parts[3:]
+    else:
+        return parts[-1] if parts else ""
+    if len(rest) > 2 and rest[0] == "namespaces":
+        rest = rest[2:]
+    return rest[0] if rest else ""
+
+
+class ApiCallMetrics:
+    """Thread-safe per-client store of API call statistics."""
+
+    def __init__(self, context: Optional[str]) -> None:
+        self.context = context or "default"
+        self._stats: Dict[ApiCallKey, ApiCallStats] = {}
+        self._lock = threading.Lock()
+
+    def _entry_locked(self, key: ApiCallKey) -> ApiCallStats:
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = self._stats[key] = ApiCallStats()
+        return entry
+
+    def begin_call(self, verb: str, resource: str) -> _ActiveCall:
+        """Mark the start of a decorated call on this thread."""
+        call = _ActiveCall(self, (self.context, verb, resource), getattr(_active, "call", None))
+        _active.call = call
+        return call
+
+    def end_call(self, call: _ActiveCall, elapsed: float) -> None:
+        """Close a call started with ``begin_call`` and fold in its wall time."""
+        _active.call = call.previous
+        with self._lock:
+            entry = self._entry_locked(call.key)
+            entry.calls += 1
+            entry.retries += max(0, call.attempts - 1)
+            entry.total_seconds += elapsed
+            entry.max_seconds = max(entry.max_seconds, elapsed)
+
+    def _request_key(self, method: str, url: str) -> ApiCallKey:
+        call = getattr(_active, "call", None)
+        if call is not None and call.metrics is self:
+            return call.key
+        return (self.context, method.lower(), _resource_from_url(url))
+
+    def record_request(self, method: str, url: str, status: Optional[int], elapsed: float) -> None:
+        """Record one HTTP round trip (called by the transport)."""
+        key = self._request_key(method, url)
+        with self._lock:
+            entry = self._entry_locked(key)
+            entry.requests += 1
+            entry.request_seconds += elapsed
+            if status is not None:
+                if 400 <= status < 500:
+                    entry.errors_4xx += 1
+                elif status >= 500:
+                    entry.errors_5xx += 1
+
+    def record_bytes(self, method: str, url: str, size: int) -> None:
+        """Record the size of a response body that was read."""
+        key = self._request_key(method, url)
+        with self._lock:
+            self._entry_locked(key).bytes_received += size
+
+    def snapshot(self) -> Dict[ApiCallKey, ApiCallStats]:
+        """Return a copy of the current statistics."""
+        with self._lock:
+            return {key: ApiCallStats(**asdict(stats)) for key, stats in self._stats.items()}
+
+
+def note_attempt() -> None:
+    """Count one attempt of the decorated call active on this thread."""
+    call = getattr(_active, "call", None)
+    if call is not None:
+        call.attempts += 1
+
+
+def collect(metrics: Iterable[Optional[ApiCallMetrics]]) -> List[Dict[str, Any]]:
+    """Merge per-client statistics into rows sorted by total time, slowest first."""
+    rows = []
+    for item in metrics:
+        if item is None:
+            continue
+        for (context, verb, resource), stats in item.snapshot().items():
+            row: Dict[str, Any] = {"context": context, "verb": verb, "resource": resource}
+            row.update(asdict(stats))
+            row["total_seconds"] = round(row["total_seconds"], 3)
+            row["request_seconds"] = round(row["request_seconds"], 3)
+            row["max_seconds"] = round(row["max_seconds"], 3)
+            rows.append(row)
+    rows.sort(key=lambda row: (-row["total_seconds"], row["context"], row["verb"], row["resource"]))
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]], limit: Optional[int] = None) -> List[str]:
+    """Render rows as fixed-width table lines."""
+    header = ("CONTEXT", "VERB", "RESOURCE", "CALLS", "RETRIES", "4XX", "5XX", "KIB", "TOTAL S", "API S", "MAX S")
+    body = [
+        (
+            row["context"],
+            row["verb"],
+            row["resource"],
+            str(row["calls"]),
+            str(row["retries"]),
+            str(row["errors_4xx"]),
+            str(row["errors_5xx"]),
+            f"{row['bytes_received'] / 1024:.1f}",
+            f"{row['total_seconds']:.2f}",
+            f"{row['request_seconds']:.2f}",
+            f"{row['max_seconds']:.2f}",
+        )
+        for row in (rows if limit is None else rows[:limit])
+    ]
+    widths = [max(len(line[i]) for line in [header, *body]) for i in range(len(header))]
+    return ["  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip() for line in [header, *body]]
+
+
+def metrics_path_for_state_file(state_file: str) -> str:
+    """Return the metrics JSON path that sits next to ``state_file``."""
+    base, _ = os.path.splitext(state_file)
+    return f"{base}.api-metrics.json"
+
+
+def write_json(path: str, rows: List[Dict[str, Any]]) -> None:
+    """Atomically write rows to ``path`` as JSON."""
+    payload = {"generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "calls": rows}
+    atomic_write_json(path, payload, indent=2)
@@ -6,14 +6,19 @@
 that touch ACM namespaces/kinds to prevent GitOps drift during switchover.
 """
 
+import functools
 import logging
 import re
+import threading
 import uuid
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from kubernetes.client.rest import ApiException
 
+from lib.argocd_cache import ArgocdDiscoveryCache
+from lib.bulk import BulkOperation, run_bulk
 from lib.constants import (
     ACM_NAMESPACE,
     BACKUP_NAMESPACE,
@@ -32,6 +37,14 @@
 ARGOCD_APP_VERSION = "v1alpha1"
 ARGOCD_APP_PLURAL = "applications"
 ARGOCD_INSTANCE_CRD_PLURAL = "argocds"
+ARGOCD_APPLICATIONS_CRD = "applications.argoproj.io"
+ARGOCD_INSTANCES_CRD = "argocds.argoproj.io"
+ARGOCD_CRD_NAMES = (ARGOCD_APPLICATIONS_CRD, ARGOCD_INSTANCES_CRD)
+
+# Discovery results per client for this process, and the optional on-disk cache
+_discovery_memo: "weakref.WeakKeyDictionary[KubeClient, ArgocdDiscoveryResult]" = weakref.WeakKeyDictionary()
+_discovery_memo_lock = threading.Lock()
+_discovery_cache: Optional[ArgocdDiscoveryCache] = None
 
 # Annotation key for our pause marker (must match scripts/argocd-manage.sh)
 ARGOCD_PAUSED_BY_ANNOTATION = "acm-switchover.argoproj.io/paused-by"
@@ -85,14 +98,26 @@ class ArgocdDiscoveryResult:
     install_type: str = "none"  # "operator" | "vanilla" | "unknown" | "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class AppImpact:
-    """An Application that touches ACM resources."""
+    """An Application that touches ACM resources.
+
+    Only the fields pause and reporting need are kept; the rest of the
+    Application (status.resources, history, operationState) is not retained.
+    """
 
     namespace: str
     name: str
     resource_count: int
-    app: Dict[str, Any]
+    sync_policy: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def app(self) -> Dict[str, Any]:
+        """Return a minimal Application document (metadata and spec.syncPolicy) for pause_autosync."""
+        return {
+            "metadata": {"namespace": self.namespace, "name": self.name},
+            "spec": {"syncPolicy": dict(self.sync_policy)},
+        }
 
 
 @dataclass
@@ -131,6 +156,76 @@ class ResumeSummary:
     failed: int = 0
 
 
+# (hub, namespace, name) of one pause record
+PauseKey = Tuple[Any, Any, Any]
+
+
+def pause_key(entry: Any) -> Optional[PauseKey]:
+    """Return the (hub, namespace, name) key of a pause record, or None if it is not a mapping."""
+    if not isinstance(entry, dict):
+        return None
+    return (entry.get("hub"), entry.get("namespace"), entry.get("name"))
+
+
+class PausedAppIndex:
+    """Argo CD pause records (state key ``argocd_paused_apps``) indexed by (hub, namespace, name).
+
+    Lookups, inserts and removals are constant-time. Records keep their original
+    order, and malformed or duplicate records are kept as they are, so ``to_list``
+    returns the on-disk shape.
+    """
+
+    def __init__(self, entries: Optional[Iterable[Any]] = None) -> None:
+        self._entries: Dict[int, Any] = {}  # insertion-ordered, keyed by serial number
+        self._serials: Dict[PauseKey, List[int]] = {}
+        self._next_serial = 0
+        for entry in entries or []:
+            self._append(entry)
+
+    def _append(self, entry: Any) -> None:
+        serial = self._next_serial
+        self._next_serial += 1
+        self._entries[serial] = entry
+        key = pause_key(entry)
+        if key is not None:
+            self._serials.setdefault(key, []).append(serial)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._entries.values()))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PausedAppIndex):
+            other = other.to_list()
+        if not isinstance(other, list):
+            return NotImplemented
+        return self.to_list() == other
+
+    def to_list(self) -> List[Any]:
+        """Return the records in order, as stored in state."""
+        return list(self._entries.values())
+
+    def find(self, hub: str, namespace: str, name: str) -> Optional[Dict[str, Any]]:
+        """Return the first record for an Application, or None."""
+        serials = self._serials.get((hub, namespace, name))
+        return self._entries[serials[0]] if serials else None
+
+    def upsert(self, hub: str, namespace: str, name: str) -> Dict[str, Any]:
+        """Return the record for an Application, appending an empty one if there is none."""
+        entry = self.find(hub, namespace, name)
+        if entry is None:
+            entry = {"hub": hub, "namespace": namespace, "name": name}
+            self._append(entry)
+        return entry
+
+    def remove(self, hub: str, namespace: str, name: str) -> None:
+        """Drop every record for an Application."""
+        for serial in self._serials.pop((hub, namespace, name), []):
+            del self._entries[serial]
+
+
 def is_resume_noop(result: ResumeResult) -> bool:
     """Return True when resume did not patch because app is already resumed."""
     return (not result.restored) and (result.skip_reason == RESUME_SKIP_REASON_MARKER_MISSING)
@@ -189,12 +284,39 @@ def _get_crd_presence(
     return None
 
 
+def configure_discovery_cache(cache: Optional[ArgocdDiscoveryCache]) -> None:
+    """Set (or, with None, clear) the on-disk cache used by detect_argocd_installation."""
+    global _discovery_cache  # pylint: disable=global-statement
+    _discovery_cache = cache
+
+
+def _crd_resource_versions(client: KubeClient) -> Optional[Dict[str, Optional[str]]]:
+    """Return the resourceVersion of each Argo CD CRD (None when absent), or None if a lookup failed."""
+    versions: Dict[str, Optional[str]] = {}
+    for crd_name in ARGOCD_CRD_NAMES:
+        try:
+            crd = client.get_metadata(
+                group="apiextensions.k8s.io",
+                version="v1",
+                plural="customresourcedefinitions",
+                name=crd_name,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Could not read resourceVersion of CRD %s: %s", crd_name, e)
+            return None
+        versions[crd_name] = (crd.get("metadata") or {}).get("resourceVersion") if crd else None
+    return versions
+
+
 def detect_argocd_installation(client: KubeClient) -> ArgocdDiscoveryResult:
     """
-    Detect Argo CD installation (operator and/or vanilla).
+    Detect Argo CD installation (operator and/or vanilla), reusing earlier results.
 
-    Checks for applications.argoproj.io CRD (required for any check) and
-    optionally argocds.argoproj.io for operator install.
+    A result is remembered per client for the rest of the process. When an
+    on-disk cache is configured (configure_discovery_cache), a result cached
+    by an earlier run is reused while it is within its TTL and both Argo CD
+    CRDs still have the recorded resourceVersion. Results whose install type
+    could not be determined are never cached.
 
     Args:
         client: KubeClient for the cluster.
@@ -202,8 +324,40 @@ def detect_argocd_installation(client: KubeClient) -> ArgocdDiscoveryResult:
     Returns:
         ArgocdDiscoveryResult with CRD presence and instance list.
     """
-    has_app = _get_crd_presence(client, "applications.argoproj.io", required=True)
-    has_argocds_present = _get_crd_presence(client, "argocds.argoproj.io", required=False)
+    with _discovery_memo_lock:
+        memoized = _discovery_memo.get(client)
+    if memoized is not None:
+        return memoized
+
+    entry = _discovery_cache.entry(client) if _discovery_cache is not None else None
+    crd_versions = _crd_resource_versions(client) if entry is not None else None
+    result = None
+    if entry is not None and crd_versions is not None:
+        cached = entry.load(crd_versions)
+        try:
+            result = ArgocdDiscoveryResult(**cached) if cached is not None else None
+        except TypeError:
+            result = None
+    if result is None:
+        result = _discover_argocd_installation(client)
+        if entry is not None and crd_versions is not None and result.install_type != "unknown":
+            entry.store(crd_versions, asdict(result))
+
+    if result.install_type != "unknown":
+        with _discovery_memo_lock:
+            _discovery_memo[client] = result
+    return result
+
+
+def _discover_argocd_installation(client: KubeClient) -> ArgocdDiscoveryResult:
+    """
+    Probe the Argo CD CRDs and instances on a hub.
+
+    Checks for applications.argoproj.io CRD (required for any check) and
+    optionally argocds.argoproj.io for operator install.
+    """
+    has_app = _get_crd_presence(client, ARGOCD_APPLICATIONS_CRD, required=True)
+    has_argocds_present = _get_crd_presence(client, ARGOCD_INSTANCES_CRD, required=False)
     has_argocds = bool(has_argocds_present)
     install_type_override = None
     if has_argocds_present is None:
@@ -252,11 +406,11 @@ def detect_argocd_installation(client: KubeClient) -> ArgocdDiscoveryResult:
     )
 
 
-def _list_argocd_applications_once(client: KubeClient, namespace: Optional[str]) -> List[Dict[str, Any]]:
-    """List Argo CD Applications for one namespace scope and surface real errors."""
+def _iter_argocd_applications_once(client: KubeClient, namespace: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """Stream Argo CD Applications for one namespace scope and surface real errors."""
     scope_label = namespace or "cluster-wide scope"
     try:
-        return client.list_custom_resources(
+        yield from client.iter_custom_resources(
             group=ARGOCD_APP_GROUP,
             version=ARGOCD_APP_VERSION,
             plural=ARGOCD_APP_PLURAL,
@@ -265,7 +419,7 @@ def _list_argocd_applications_once(client: KubeClient, namespace: Optional[str])
     except ApiException as e:
         if e.status == 404:
             logger.debug("Argo CD Applications not found in %s: %s", scope_label, e)
-            return []
+            return
         logger.warning("Failed to list Argo CD Applications in %s (status=%s)", scope_label, e.status)
         raise
     except Exception as e:
@@ -273,6 +427,32 @@ def _list_argocd_applications_once(client: KubeClient, namespace: Optional[str])
         raise
 
 
+def iter_argocd_applications(
+    client: KubeClient,
+    namespaces: Optional[List[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream Argo CD Application resources page by page.
+
+    Args:
+        client: KubeClient for the cluster.
+        namespaces: If set, list only from these namespaces; else cluster-wide.
+
+    Yields:
+        Application resource dicts.
+
+    Raises:
+        ApiException: When listing fails for reasons other than 404/not-installed.
+    """
+    if namespaces is not None:
+        for ns in namespaces:
+            if not ns:
+                continue
+            yield from _iter_argocd_applications_once(client, ns)
+        return
+    yield from _iter_argocd_applications_once(client, namespace=None)
+
+
 def list_argocd_applications(
     client: KubeClient,
     namespaces: Optional[List[str]] = None,
@@ -280,6 +460,8 @@ def list_argocd_applications(
     """
     List Argo CD Application resources.
 
+    Prefer iter_argocd_applications() when Applications can be processed one by one.
+
     Args:
         client: KubeClient for the cluster.
         namespaces: If set, list only from these namespaces; else discover (operator or cluster-wide).
@@ -290,14 +472,7 @@ def list_argocd_applications(
     Raises:
         ApiException: When Argo CD discovery fails for reasons other than 404/not-installed.
     """
-    if namespaces is not None:
-        result: List[Dict[str, Any]] = []
-        for ns in namespaces:
-            if not ns:
-                continue
-            result.extend(_list_argocd_applications_once(client, ns))
-        return result
-    return _list_argocd_applications_once(client, namespace=None)
+    return list(iter_argocd_applications(client, namespaces=namespaces))
 
 
 def _resource_touches_acm(resource: Dict[str, Any]) -> bool:
@@ -311,40 +486,58 @@ def _resource_touches_acm(resource: Dict[str, Any]) -> bool:
     return False
 
 
-def find_acm_touching_apps(apps: List[Dict[str, Any]]) -> List[AppImpact]:
+def find_acm_touching_apps(apps: Iterable[Dict[str, Any]]) -> List[AppImpact]:
     """
     Filter Applications to those that touch ACM namespaces/kinds (per status.resources).
 
+    Each Application is reduced to an AppImpact as soon as it has been evaluated,
+    so passing iter_argocd_applications() keeps memory proportional to one page
+    of Applications plus the compact records of the ACM-touching subset.
+
     Args:
-        apps: List of Application resource dicts.
+        apps: Application resource dicts (list or stream).
 
     Returns:
         List of AppImpact for apps that have at least one ACM-touching resource.
     """
     result: List[AppImpact] = []
     for app in apps:
-        meta = app.get("metadata", {})
-        ns = meta.get("namespace", "")
-        name = meta.get("name", "")
-        resources = app.get("status", {}).get("resources") or []
+        resources = (app.get("status") or {}).get("resources") or []
         if not isinstance(resources, list):
             continue
         acm_count = sum(1 for r in resources if isinstance(r, dict) and _resource_touches_acm(r))
         if acm_count > 0:
-            result.append(AppImpact(namespace=ns, name=name, resource_count=acm_count, app=app))
+            meta = app.get("metadata") or {}
+            result.append(
+                AppImpact(
+                    namespace=meta.get("namespace", ""),
+                    name=meta.get("name", ""),
+                    resource_count=acm_count,
+                    sync_policy=dict((app.get("spec") or {}).get("syncPolicy") or {}),
+                )
+            )
     return result
 
 
 def resume_recorded_applications(
-    paused_apps: List[Any],
+    paused_apps: Iterable[Any],
     run_id: str,
     primary: Optional[KubeClient],
     secondary: Optional[KubeClient],
     logger: logging.Logger,
 ) -> ResumeSummary:
-    """Restore auto-sync for recorded pause state and return an aggregated summary."""
+    """Restore auto-sync for recorded pause state and return an aggregated summary.
+
+    Valid entries are resumed concurrently on the bulk worker pool, one hub at a time.
+    A repeated valid record for the same Application is not patched again; it counts
+    as already resumed when the first resume succeeded, and as failed otherwise.
+    """
+    records = paused_apps if isinstance(paused_apps, PausedAppIndex) else PausedAppIndex(paused_apps)
     summary = ResumeSummary()
-    for entry in paused_apps:
+    hub_operations: Dict[str, List[BulkOperation]] = {}
+    scheduled: Dict[str, Set[str]] = {}
+    hub_duplicates: Dict[str, List[str]] = {}
+    for entry in records:
         if not isinstance(entry, dict):
             summary.failed += 1
             logger.warning("  Skip entry with unexpected format in Argo CD pause state")
@@ -382,16 +575,38 @@ def resume_recorded_applications(
             logger.warning("  Skip %s/%s (no client for hub=%s)", ns, name, hub)
             continue
 
-        result = resume_autosync(client, ns, name, original_sync_policy, run_id)
-        if result.restored:
-            summary.restored += 1
-            logger.info("  Resumed %s/%s on %s", ns, name, hub)
-        elif is_resume_noop(result):
-            summary.already_resumed += 1
-            logger.info("  Already resumed %s/%s on %s", ns, name, hub)
-        else:
-            summary.failed += 1
-            logger.warning("  Failed %s/%s: %s", ns, name, result.skip_reason or "not restored")
+        if f"{ns}/{name}" in scheduled.get(hub, ()):
+            hub_duplicates.setdefault(hub, []).append(f"{ns}/{name}")
+            continue
+        scheduled.setdefault(hub, set()).add(f"{ns}/{name}")
+        hub_operations.setdefault(hub, []).append(
+            (f"{ns}/{name}", functools.partial(resume_autosync, client, ns, name, original_sync_policy, run_id))
+        )
+
+    for hub, operations in hub_operations.items():
+        bulk = run_bulk(f"Argo CD auto-sync resume on {hub} hub", operations)
+        for key in hub_duplicates.get(hub, []):
+            result = bulk.results.get(key)
+            if result is not None and (result.restored or is_resume_noop(result)):
+                summary.already_resumed += 1
+            else:
+                summary.failed += 1
+            logger.warning("  Skip %s (duplicate record on %s)", key, hub)
+        for key, _ in operations:
+            ns, name = key.split("/", 1)
+            result = bulk.results.get(key)
+            if result is None:
+                summary.failed += 1
+                logger.warning("  Failed %s/%s: %s", ns, name, bulk.failed[key])
+            elif result.restored:
+                summary.restored += 1
+                logger.info("  Resumed %s/%s on %s", ns, name, hub)
+            elif is_resume_noop(result):
+                summary.already_resumed += 1
+                logger.info("  Already resumed %s/%s on %s", ns, name, hub)
+            else:
+                summary.failed += 1
+                logger.warning("  Failed %s/%s: %s", ns, name, result.skip_reason or "not restored")
 
     return summary
 
@@ -0,0 +1,98 @@
+"""On-disk cache of Argo CD discovery results.
+
+Preflight, primary preparation and later runs against the same hub (for
+example ``--validate-only``, then the switchover, then ``--argocd-resume-only``)
+each need to know whether Argo CD is installed. Discovery reads two large
+CRDs and lists the ArgoCD instances; this cache keeps its result in
+``<state dir>/argocd-cache/<digest>.json``, one file per API server.
+
+An entry is reused only while it is younger than its TTL and the
+resourceVersion of both Argo CD CRDs (or their absence) still matches what
+was recorded, so installing, upgrading or removing Argo CD invalidates it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from lib.constants import ARGOCD_DISCOVERY_CACHE_TTL_SECONDS
+from lib.utils import atomic_write_json
+
+logger = logging.getLogger("acm_switchover")
+
+ARGOCD_CACHE_DIRNAME = "argocd-cache"
+_CACHE_VERSION = 1
+
+
+def argocd_cache_dir_for_state_dir(state_dir: str) -> str:
+    """Return the Argo CD discovery cache directory inside ``state_dir``."""
+    return os.path.join(state_dir or ".", ARGOCD_CACHE_DIRNAME)
+
+
+class ArgocdDiscoveryCacheEntry:
+    """Cached discovery result for one API server."""
+
+    def __init__(self, path: str, ttl_seconds: int) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+
+    def load(self, crd_versions: Dict[str, Optional[str]]) -> Optional[Dict[str, Any]]:
+        """Return the cached result fields, or None on a miss, expiry or CRD change."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") != _CACHE_VERSION:
+                return None
+            cached_at = float(data["cached_at"])
+            cached_versions = data["crd_versions"]
+            result = data["result"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable Argo CD discovery cache %s: %s", self.path, e)
+            return None
+
+        age = time.time() - cached_at
+        if age < 0 or age > self.ttl_seconds:
+            return None
+        if cached_versions != crd_versions:
+            logger.debug("Argo CD CRDs changed since discovery was cached; discovering again")
+            return None
+        if not isinstance(result, dict):
+            return None
+        logger.debug("Using Argo CD discovery cached %.0fs ago", age)
+        return result
+
+    def store(self, crd_versions: Dict[str, Optional[str]], result: Dict[str, Any]) -> None:
+        """Write a discovery result; failures are logged, not raised."""
+        payload = {"version": _CACHE_VERSION, "cached_at": time.time(), "crd_versions": crd_versions, "result": result}
+        try:
+            atomic_write_json(self.path, payload)
+        except OSError as e:
+            logger.warning("Could not write Argo CD discovery cache %s: %s", self.path, e)
+
+
+class ArgocdDiscoveryCache:
+    """Factory for per-server cache entries in one directory."""
+
+    def __init__(self, directory: str, ttl_seconds: int = ARGOCD_DISCOVERY_CACHE_TTL_SECONDS) -> None:
+        """
+        Args:
+            directory: Cache directory (see ``argocd_cache_dir_for_state_dir``)
+            ttl_seconds: Maximum age of a reused result; 0 disables the cache
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    def entry(self, client: Any) -> Optional[ArgocdDiscoveryCacheEntry]:
+        """Return the cache entry for a client's API server, or None when caching is disabled."""
+        if self.ttl_seconds <= 0:
+            return None
+        server = client.core_v1.api_client.configuration.host
+        if not isinstance(server, str) or not server:
+            return None
+        digest = hashlib.sha256(server.encode("utf-8")).hexdigest()
+        return ArgocdDiscoveryCacheEntry(os.path.join(self.directory, f"{digest}.json"), self.ttl_seconds)
@@ -0,0 +1,131 @@
+"""Bounded-concurrency execution of per-resource API mutations.
+
+Steps that patch or delete every ManagedCluster hand the individual calls to
+``run_bulk``, which runs them on a small worker pool under a client-side rate
+limit and collects the outcome of each item. Every call keeps its own retry
+behaviour (KubeClient methods are wrapped in ``retry_api_call``), so an item
+that exhausts its retries is reported as a failure without aborting the rest.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from lib.constants import BULK_MUTATION_MAX_WORKERS, BULK_MUTATION_QPS
+
+logger = logging.getLogger("acm_switchover")
+
+# (item name, zero-argument callable performing the mutation)
+BulkOperation = Tuple[str, Callable[[], Any]]
+
+
+@dataclass
+class BulkResult:
+    """Aggregated outcome of a bulk run."""
+
+    description: str
+    succeeded: List[str] = field(default_factory=list)
+    failed: Dict[str, Optional[Exception]] = field(default_factory=dict)
+    results: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def failure_summary(self) -> str:
+        """Return "name (error), ..." for failed items, sorted by name."""
+        parts = []
+        for name in sorted(self.failed):
+            exc = self.failed[name]
+            parts.append(f"{name} ({_format_error(exc)})" if exc is not None else name)
+        return ", ".join(parts)
+
+
+def _format_error(exc: Exception) -> str:
+    status = getattr(exc, "status", None)
+    reason = getattr(exc, "reason", None)
+    if status is not None:
+        return f"{status} {reason}" if reason else str(status)
+    return str(exc) or type(exc).__name__
+
+
+class RateLimiter:
+    """Spaces call starts at least ``1 / qps`` seconds apart across threads."""
+
+    def __init__(self, qps: float) -> None:
+        self._interval = 1.0 / qps
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def run_bulk(
+    description: str,
+    operations: Iterable[BulkOperation],
+    max_workers: int = BULK_MUTATION_MAX_WORKERS,
+    qps: Optional[float] = BULK_MUTATION_QPS,
+) -> BulkResult:
+    """
+    Run independent mutations concurrently and aggregate their outcomes.
+
+    An operation fails when it raises or returns ``False``; any other return
+    value counts as success.
+
+    Args:
+        description: What the operations do, for logging (e.g. "disable auto-import")
+        operations: (name, callable) pairs; names should be unique
+        max_workers: Upper bound on concurrent operations
+        qps: Maximum operation starts per second across all workers (None or 0 disables)
+
+    Returns:
+        BulkResult with succeeded names (sorted), failures keyed by name and
+        the return value of every operation that did not raise
+    """
+    operations = list(operations)
+    result = BulkResult(description=description)
+    if not operations:
+        return result
+
+    limiter = RateLimiter(qps) if qps else None
+
+    def _run(func: Callable[[], Any]) -> Any:
+        if limiter is not None:
+            limiter.acquire()
+        return func()
+
+    workers = max(1, min(max_workers, len(operations)))
+    logger.debug("Running %s for %d item(s) with %d worker(s)", description, len(operations), workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_run, func): name for name, func in operations}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug("%s failed for %s: %s", description, name, exc)
+                result.failed[name] = exc
+                continue
+            result.results[name] = outcome
+            if outcome is False:
+                result.failed[name] = None
+            else:
+                result.succeeded.append(name)
+
+    result.succeeded.sort()
+    logger.debug(
+        "%s finished: %d succeeded, %d failed",
+        description,
+        len(result.succeeded),
+        len(result.failed),
+    )
+    return result
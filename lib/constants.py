@@ -31,6 +31,10 @@
 # ManagedCluster deletion wait (for finalizers to complete before MCH deletion)
 MANAGED_CLUSTER_DELETE_TIMEOUT = 300
 MANAGED_CLUSTER_DELETE_INTERVAL = 10
+# Quiet period before a watch-triggered re-check; deletion events arriving closer
+# together than this are coalesced up to MANAGED_CLUSTER_DELETE_INTERVAL, so a mass
+# delete does not re-list the fleet on every event
+MANAGED_CLUSTER_DELETE_SETTLE_SECONDS = 5
 
 # ACM operator pod prefix (these pods remain after MCH deletion)
 ACM_OPERATOR_POD_PREFIX = "multiclusterhub-operator"
@@ -38,6 +42,9 @@
 # Observability pod readiness timeout
 OBSERVABILITY_POD_TIMEOUT = 300
 
+# Resync interval while waiting for observability workloads to become ready
+OBSERVABILITY_ROLLOUT_INTERVAL = 5
+
 # Velero restore wait timeout
 VELERO_RESTORE_TIMEOUT = 300
 
@@ -45,8 +52,91 @@
 SECRET_VISIBILITY_TIMEOUT = 10
 SECRET_VISIBILITY_INTERVAL = 1
 
-# Parallel cluster verification settings
+# Parallel cluster verification settings. Klusterlet checks start with
+# CLUSTER_VERIFY_MAX_WORKERS calls in flight and adapt (AIMD) up to
+# CLUSTER_VERIFY_MAX_CONCURRENCY; a call slower than the latency target halves it
 CLUSTER_VERIFY_MAX_WORKERS = 10
+CLUSTER_VERIFY_MAX_CONCURRENCY = 200
+CLUSTER_VERIFY_LATENCY_TARGET = 6.0
+CLUSTER_VERIFY_PROGRESS_INTERVAL = 10
+
+# Overall time for the klusterlet check and fix passes (seconds, 0 = unlimited)
+KLUSTERLET_VERIFY_BUDGET = 600
+
+# Hub-side klusterlet verification. The klusterlet registration agent renews
+# this Lease in its cluster namespace on the hub it is connected to; the hub
+# marks a cluster unknown once the lease is older than 5 lease durations
+KLUSTERLET_LEASE_NAME = "managed-cluster-lease"
+KLUSTERLET_LEASE_GRACE_MULTIPLIER = 5
+KLUSTERLET_LEASE_DEFAULT_DURATION = 60
+
+# How klusterlet connections are verified after activation: contact every
+# spoke ("spoke"), read hub-side leases only ("lease"), or read leases and
+# contact only the clusters they do not prove connected ("auto")
+KLUSTERLET_VERIFY_MODES = ("spoke", "lease", "auto")
+KLUSTERLET_VERIFY_MODE_DEFAULT = "spoke"
+
+# Per-request connect and read timeouts for managed-cluster (spoke) API calls
+SPOKE_CONNECT_TIMEOUT = 5
+SPOKE_READ_TIMEOUT = 10
+
+# Managed-cluster ApiClients kept open between the klusterlet check and fix passes
+SPOKE_CLIENT_POOL_SIZE = CLUSTER_VERIFY_MAX_CONCURRENCY
+
+# Preflight validators that run concurrently (independent checks across both hubs)
+PREFLIGHT_MAX_WORKERS = 8
+
+# Concurrent RBAC self-checks (SelfSubjectRulesReview per namespace plus the
+# SelfSubjectAccessReviews for cluster-scoped permissions)
+RBAC_CHECK_MAX_WORKERS = 8
+
+# How long granted RBAC self-check results are reused from the on-disk cache
+RBAC_CACHE_TTL_SECONDS = 900
+
+# How long an Argo CD discovery result is reused from the on-disk cache (it is
+# also dropped as soon as either Argo CD CRD's resourceVersion changes)
+ARGOCD_DISCOVERY_CACHE_TTL_SECONDS = 3600
+
+# Bulk per-ManagedCluster mutations (patch/delete): worker pool size and
+# client-side request rate across all workers
+BULK_MUTATION_MAX_WORKERS = 10
+BULK_MUTATION_QPS = 50
+
+# Argo CD Applications paused per wave: each wave is recorded in state with one
+# write before its patches run on the bulk worker pool, and confirmed with one more
+ARGOCD_PAUSE_WAVE_SIZE = 50
+
+# Per-KubeClient API request budget (token bucket) and the longest server
+# Retry-After delay honored on a single retry
+API_QPS_DEFAULT = 50.0
+API_BURST_DEFAULT = 100
+RETRY_AFTER_MAX_SECONDS = 60
+
+# Rows of the end-of-run API call summary logged to the console (the JSON file has all of them)
+API_METRICS_TABLE_ROWS = 15
+
+# Watch-backed waits: server-side stream timeout, event coalescing window and
+# reconnect backoff. The poll interval of each wait remains the resync period.
+WATCH_TIMEOUT_SECONDS = 300
+WATCH_SETTLE_SECONDS = 1
+WATCH_RECONNECT_BACKOFF = 5
+# Statuses meaning the watch cannot be used (no watch verb, missing CRD, or not
+# served); callers fall back to polling / plain LISTs.
+WATCH_UNAVAILABLE_STATUSES = frozenset({401, 403, 404, 405})
+
+# Page size for unbounded custom resource lists (keeps apiserver responses and
+# peak client memory bounded on very large collections)
+LIST_PAGE_SIZE = 500
+# Accept header for metadata-only lists; plain JSON remains as a fallback for
+# servers that cannot convert (items then still carry their metadata)
+PARTIAL_METADATA_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
+# Accept header for a metadata-only read of a single object
+PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadata;v=v1;g=meta.k8s.io,application/json"
+# Bytes read per chunk when streaming pod logs
+LOG_STREAM_CHUNK_SIZE = 64 * 1024
+
+# (group, version, plural) collections served from the opt-in informer cache
+INFORMER_CACHE_RESOURCES = frozenset({("cluster.open-cluster-management.io", "v1", "managedclusters")})
 
 # Maximum kubeconfig file size (10MB default) to prevent memory exhaustion
 # Can be overridden via ACM_KUBECONFIG_MAX_SIZE environment variable (bytes)
@@ -85,6 +175,7 @@
 THANOS_COMPACTOR_STATEFULSET = "observability-thanos-compact"
 THANOS_COMPACTOR_LABEL_SELECTOR = "app.kubernetes.io/name=thanos-compact"
 OBSERVATORIUM_API_DEPLOYMENT = "observability-observatorium-api"
+OBSERVATORIUM_API_LABEL_SELECTOR = "app.kubernetes.io/name=observatorium-api"
 
 # ACM Spec Field Names
 SPEC_VELERO_MANAGED_CLUSTERS_BACKUP_NAME = "veleroManagedClustersBackupName"
@@ -143,6 +234,14 @@
 # Backup verification settings
 BACKUP_VERIFY_TIMEOUT = 600
 BACKUP_POLL_INTERVAL = 30
+# Seconds before the next scheduled backup at which finalization starts looking for it
+BACKUP_SCHEDULE_WAKE_LEAD = 15
+# Velero pods whose logs are scanned at once after a backup
+VELERO_LOG_SCAN_MAX_WORKERS = 4
+# Extra seconds of Velero logs read before a backup's start time (clock skew, queueing)
+VELERO_LOG_SINCE_SLACK = 300
+# Lines read per Velero pod when the backup's start time is unknown
+VELERO_LOG_TAIL_LINES = 2000
 BACKUP_INTEGRITY_MAX_AGE_SECONDS = 600
 ACM_BACKUP_SCHEDULE_TYPE_LABEL = "cluster.open-cluster-management.io/backup-schedule-type"
 ACM_BACKUP_SCHEDULE_TYPES = frozenset({"managedClusters", "credentials", "resources"})
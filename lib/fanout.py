@@ -0,0 +1,205 @@
+"""Adaptive-concurrency fan-out across many slow, independent endpoints.
+
+Klusterlet verification contacts every managed cluster. Round trips of a few
+seconds are normal and some clusters never answer, so a fixed pool is either
+too small for a large fleet or too large for a congested network. ``run_adaptive``
+runs the calls on a thread pool whose number of in-flight calls is set by an
+``AIMDLimiter``: the limit doubles per round of healthy calls until the first
+sign of congestion, then grows by one per round and is halved whenever a call
+fails or takes longer than the latency target (at most once per target
+interval). Progress is logged periodically, and once the overall budget is
+spent no further calls are started; calls already running are left to finish.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from lib.constants import (
+    CLUSTER_VERIFY_LATENCY_TARGET,
+    CLUSTER_VERIFY_MAX_CONCURRENCY,
+    CLUSTER_VERIFY_MAX_WORKERS,
+    CLUSTER_VERIFY_PROGRESS_INTERVAL,
+)
+
+logger = logging.getLogger("acm_switchover")
+
+# (item name, zero-argument callable contacting that item)
+FanOutOperation = Tuple[str, Callable[[], Any]]
+
+
+class AIMDLimiter:
+    """Additive-increase / multiplicative-decrease limit on concurrent calls."""
+
+    def __init__(
+        self,
+        initial: int = CLUSTER_VERIFY_MAX_WORKERS,
+        minimum: int = 1,
+        maximum: int = CLUSTER_VERIFY_MAX_CONCURRENCY,
+        latency_target: float = CLUSTER_VERIFY_LATENCY_TARGET,
+        backoff: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            initial: Starting limit
+            minimum: Lower bound the limit never drops below
+            maximum: Upper bound the limit never exceeds
+            latency_target: Calls slower than this count as congestion
+            backoff: Factor applied to the limit on congestion
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self._clock = clock
+        self._limit = float(min(self.maximum, max(self.minimum, initial)))
+        self._slow_start = True
+        self._last_decrease: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        with self._lock:
+            return int(self._limit)
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Adjust the limit after one call finished."""
+        with self._lock:
+            if ok and latency <= self.latency_target:
+                # Slow start adds one per call (doubling per round), then one per round
+                self._limit += 1.0 if self._slow_start else 1.0 / self._limit
+                self._limit = min(float(self.maximum), self._limit)
+                return
+            now = self._clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.latency_target:
+                return
+            self._slow_start = False
+            self._last_decrease = now
+            self._limit = max(float(self.minimum), self._limit * self.backoff)
+
+
+@dataclass
+class FanOutResult:
+    """Outcome of an adaptive fan-out."""
+
+    description: str
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    not_started: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def budget_exhausted(self) -> bool:
+        return bool(self.not_started)
+
+
+def run_adaptive(
+    description: str,
+    operations: Iterable[FanOutOperation],
+    limiter: Optional[AIMDLimiter] = None,
+    budget_seconds: Optional[float] = None,
+    is_healthy: Optional[Callable[[Any], bool]] = None,
+    progress_interval: float = CLUSTER_VERIFY_PROGRESS_INTERVAL,
+) -> FanOutResult:
+    """
+    Run independent calls with an adaptive concurrency limit and an overall budget.
+
+    Calls already running when the budget runs out are waited for and their
+    results kept, so nothing they use is torn down under them and no call
+    keeps acting after the fan-out has reported. Each call should therefore
+    enforce its own timeouts, which bound how far the budget can be overrun.
+
+    Args:
+        description: What the calls do, for logging (e.g. "klusterlet check")
+        operations: (name, callable) pairs; names should be unique
+        limiter: Concurrency controller (a default AIMDLimiter when None)
+        budget_seconds: Stop starting calls after this many seconds (None or <= 0: no budget)
+        is_healthy: Classifies a returned value as healthy (default: every value is)
+        progress_interval: Seconds between progress log lines
+
+    Returns:
+        FanOutResult with per-name return values, exceptions, and names never started
+    """
+    pending = list(operations)
+    pending.reverse()  # pop() from the end keeps the caller's order
+    result = FanOutResult(description=description)
+    if not pending:
+        return result
+
+    limiter = limiter or AIMDLimiter()
+    total = len(pending)
+    started_at = time.monotonic()
+    deadline = started_at + budget_seconds if budget_seconds and budget_seconds > 0 else None
+    next_progress = started_at + progress_interval
+    running: Dict[Future, Tuple[str, float]] = {}
+
+    def _log_progress() -> None:
+        logger.info(
+            "%s: %d/%d done (%d failed), %d in flight, concurrency limit %d, %.0fs elapsed",
+            description,
+            len(result.results) + len(result.errors),
+            total,
+            len(result.errors),
+            len(running),
+            limiter.limit,
+            time.monotonic() - started_at,
+        )
+
+    executor = ThreadPoolExecutor(max_workers=limiter.maximum)
+    try:
+        while pending or running:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                deadline = None
+                result.not_started = [name for name, _ in reversed(pending)]
+                pending.clear()
+                if running:
+                    logger.info("%s: budget spent; waiting for %d call(s) still in flight", description, len(running))
+            while pending and len(running) < limiter.limit:
+                name, func = pending.pop()
+                running[executor.submit(func)] = (name, time.monotonic())
+
+            timeout = max(0.0, next_progress - now)
+            if deadline is not None:
+                timeout = min(timeout, max(0.0, deadline - now))
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, submitted_at = running.pop(future)
+                latency = time.monotonic() - submitted_at
+                try:
+                    value = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.debug("%s failed for %s: %s", description, name, exc)
+                    result.errors[name] = exc
+                    limiter.record(latency, ok=False)
+                    continue
+                result.results[name] = value
+                limiter.record(latency, ok=is_healthy(value) if is_healthy else True)
+
+            if time.monotonic() >= next_progress:
+                _log_progress()
+                next_progress = time.monotonic() + progress_interval
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    result.elapsed = time.monotonic() - started_at
+    if result.budget_exhausted:
+        logger.warning(
+            "%s: budget of %.0fs exhausted; %d item(s) not started",
+            description,
+            budget_seconds,
+            len(result.not_started),
+        )
+    logger.debug(
+        "%s finished in %.1fs: %d done, %d failed",
+        description,
+        result.elapsed,
+        len(result.results),
+        len(result.errors),
+    )
+    return result
@@ -6,6 +6,7 @@
 """
 
 import logging
+import threading
 from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -84,6 +85,8 @@ def __init__(self) -> None:
         # Structure: {context: {(namespace, kind, name): [markers]}}
         self._records: Dict[str, Dict[Tuple[str, str, str], List[str]]] = defaultdict(dict)
         self._enabled = True
+        # Validators may record from concurrent preflight tasks
+        self._lock = threading.Lock()
 
     def clear(self) -> None:
         """Clear in-memory detections and restore the default enabled state."""
@@ -142,7 +145,8 @@ def record(
             return
 
         key = (namespace, kind, name)
-        self._records[context][key] = markers
+        with self._lock:
+            self._records[context][key] = markers
 
     def has_detections(self) -> bool:
         """Check if any GitOps markers were detected."""
@@ -0,0 +1,190 @@
+"""Watch-maintained in-memory cache for custom resource collections.
+
+KubeClient uses this for resources registered via ``enable_informer_cache``
+so repeated full LISTs of large collections (e.g. ManagedClusters) within one
+run are served from memory instead of the apiserver.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from kubernetes import watch as kube_watch
+from kubernetes.client.rest import ApiException
+
+from lib.constants import WATCH_UNAVAILABLE_STATUSES
+
+if TYPE_CHECKING:
+    from lib.kube_client import KubeClient
+
+logger = logging.getLogger("acm_switchover")
+
+# (group, version, plural, namespace, label_selector)
+InformerKey = Tuple[str, str, str, Optional[str], Optional[str]]
+
+
+def _object_key(obj: Dict[str, Any]) -> Tuple[str, str]:
+    metadata = obj.get("metadata") or {}
+    return metadata.get("namespace") or "", metadata.get("name") or ""
+
+
+class ResourceInformer:
+    """In-memory copy of one custom resource collection kept current by a watch.
+
+    The first read LISTs the collection and starts a background watch from the
+    list's resourceVersion that applies ADDED/MODIFIED/DELETED events. The
+    client invalidates the informer after its own writes, and a broken watch
+    invalidates it as well; the next read then re-LISTs, so callers never get
+    a snapshot older than their last write. If the apiserver rejects the
+    watch, the informer disables itself and every read goes to the API.
+    """
+
+    def __init__(
+        self,
+        client: "KubeClient",
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+    ) -> None:
+        self._client = client
+        self._group = group
+        self._version = version
+        self._plural = plural
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._lock = threading.Lock()
+        self._items: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._synced = False
+        self._generation = 0
+        self._watcher: Optional[kube_watch.Watch] = None
+        self.disabled_reason: Optional[str] = None
+        self.hits = 0
+        self.relists = 0
+
+    @property
+    def description(self) -> str:
+        return f"{self._plural} in {self._namespace}" if self._namespace else self._plural
+
+    @property
+    def synced(self) -> bool:
+        with self._lock:
+            return self._synced
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Return copies of the cached objects, re-listing if the cache is stale."""
+        with self._lock:
+            if self._synced:
+                self.hits += 1
+                return [copy.deepcopy(self._items[key]) for key in sorted(self._items)]
+            listed_generation = self._generation
+
+        items, resource_version = self._client._list_custom_resources_snapshot(
+            group=self._group,
+            version=self._version,
+            plural=self._plural,
+            namespace=self._namespace,
+            label_selector=self._label_selector,
+        )
+        self.relists += 1
+
+        with self._lock:
+            if resource_version is None or self.disabled_reason is not None:
+                return items
+            if listed_generation != self._generation:
+                # Invalidated while the LIST was in flight (e.g. by the client's own
+                # write); the result may predate that write, so don't cache it.
+                return items
+            self._generation += 1
+            generation = self._generation
+            self._items = {_object_key(item): copy.deepcopy(item) for item in items}
+            self._synced = True
+            previous_watcher = self._watcher
+            self._watcher = kube_watch.Watch()
+            watcher = self._watcher
+
+        if previous_watcher is not None:
+            previous_watcher.stop()
+        threading.Thread(
+            target=self._run,
+            args=(generation, watcher, resource_version),
+            name=f"informer-{self._plural}",
+            daemon=True,
+        ).start()
+        return items
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next read re-lists."""
+        with self._lock:
+            self._invalidate_locked()
+
+    def _invalidate_locked(self) -> None:
+        self._synced = False
+        self._items = {}
+        self._generation += 1
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.stop()
+
+    def _run(self, generation: int, watcher: kube_watch.Watch, resource_version: str) -> None:
+        try:
+            while True:
+                received = False
+                for event in self._client.watch_custom_resources(
+                    group=self._group,
+                    version=self._version,
+                    plural=self._plural,
+                    namespace=self._namespace,
+                    label_selector=self._label_selector,
+                    resource_version=resource_version,
+                    watcher=watcher,
+                ):
+                    received = True
+                    with self._lock:
+                        if generation != self._generation:
+                            return
+                        resource_version = self._apply_event(event) or resource_version
+                with self._lock:
+                    if generation != self._generation:
+                        return
+                    if not received:
+                        # Not even a bookmark arrived; re-list on the next read rather than
+                        # reconnecting in a tight loop.
+                        self._invalidate_locked()
+                        return
+                # The server closed the stream at its timeout; resume from the last version seen
+        except ApiException as e:
+            with self._lock:
+                if generation != self._generation:
+                    return
+                if e.status in WATCH_UNAVAILABLE_STATUSES:
+                    self.disabled_reason = f"watch rejected: {e.status} {e.reason}"
+                    logger.info(
+                        "Informer cache for %s disabled (%s); listing from the API",
+                        self.description,
+                        self.disabled_reason,
+                    )
+                else:
+                    logger.debug("Informer watch for %s ended (%s); will re-list", self.description, e.status)
+                self._invalidate_locked()
+        except Exception as e:  # pylint: disable=broad-except
+            with self._lock:
+                if generation != self._generation:
+                    return
+                logger.debug("Informer watch for %s failed (%s); will re-list", self.description, e)
+                self._invalidate_locked()
+
+    def _apply_event(self, event: Dict[str, Any]) -> Optional[str]:
+        obj = event.get("raw_object") or event.get("object")
+        if not isinstance(obj, dict):
+            return None
+        event_type = event.get("type")
+        if event_type in ("ADDED", "MODIFIED"):
+            self._items[_object_key(obj)] = obj
+        elif event_type == "DELETED":
+            self._items.pop(_object_key(obj), None)
+        return (obj.get("metadata") or {}).get("resourceVersion")
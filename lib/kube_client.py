@@ -7,12 +7,14 @@
 
 import errno
 import functools
+import inspect
 import logging
 import socket
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
-from kubernetes import client, config
+from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
 from kubernetes.config.config_exception import ConfigException
 from tenacity import (
@@ -25,6 +27,19 @@
 from urllib3.exceptions import HTTPError, MaxRetryError, NewConnectionError
 from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
 
+from lib import api_metrics, kubeconfig_index
+from lib.constants import (
+    API_BURST_DEFAULT,
+    API_QPS_DEFAULT,
+    INFORMER_CACHE_RESOURCES,
+    LIST_PAGE_SIZE,
+    LOG_STREAM_CHUNK_SIZE,
+    PARTIAL_METADATA_ACCEPT,
+    PARTIAL_METADATA_LIST_ACCEPT,
+    WATCH_TIMEOUT_SECONDS,
+)
+from lib.informer import InformerKey, ResourceInformer
+from lib.throttle import TokenBucket, parse_retry_after
 from lib.validation import InputValidator, ValidationError
 
 logger = logging.getLogger("acm_switchover")
@@ -134,15 +149,77 @@ def _is_requested_subset(requested_value: Any, existing_value: Any) -> bool:
     return _is_requested_subset(requested, existing)
 
 
-# Standard retry decorator for API calls
-retry_api_call = retry(
+_exponential_wait = wait_exponential(multiplier=1, min=1, max=10)
+
+
+def _wait_retry_after_or_exponential(retry_state: Any) -> float:
+    """Wait for the server's Retry-After when given (429/503), else back off exponentially."""
+    outcome = retry_state.outcome
+    exc = outcome.exception() if outcome is not None and outcome.failed else None
+    if isinstance(exc, ApiException):
+        delay = parse_retry_after(exc.headers)
+        if delay is not None:
+            return delay
+    return _exponential_wait(retry_state)
+
+
+_retry_policy = retry(
     retry=retry_if_exception(_should_retry),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
+    wait=_wait_retry_after_or_exponential,
     stop=stop_after_attempt(5),
     before_sleep=before_sleep_log(logger, logging.DEBUG),
     reraise=True,
 )
 
+# Method-name prefixes mapped to the verb recorded in API call metrics (longest first)
+_METRIC_VERB_PREFIXES = ("create_or_patch", "rollout_restart", "create", "delete", "get", "list", "patch", "scale")
+
+
+def _metric_verb_and_resource(name: str) -> Tuple[str, str]:
+    """Split a KubeClient method name into (verb, resource) for metrics."""
+    name = name.lstrip("_")
+    for prefix in _METRIC_VERB_PREFIXES:
+        if name.startswith(prefix + "_"):
+            return prefix, name[len(prefix) + 1 :]
+    return "call", name
+
+
+def retry_api_call(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Standard retry decorator for API calls (5xx/429/network errors → backoff).
+
+    Calls made on a KubeClient are also recorded in its ``api_metrics`` keyed by
+    (context, verb, resource); the resource is the ``plural`` argument when the
+    method takes one, else derived from the method name.
+    """
+    verb, default_resource = _metric_verb_and_resource(func.__name__)
+    params = list(inspect.signature(func).parameters)
+    plural_index = params.index("plural") if "plural" in params else None
+
+    @functools.wraps(func)
+    def attempt(*args: Any, **kwargs: Any) -> Any:
+        api_metrics.note_attempt()
+        return func(*args, **kwargs)
+
+    retrying = _retry_policy(attempt)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        metrics = getattr(args[0], "api_metrics", None) if args else None
+        if not isinstance(metrics, api_metrics.ApiCallMetrics):
+            return retrying(*args, **kwargs)
+        resource = kwargs.get("plural")
+        if resource is None and plural_index is not None and len(args) > plural_index:
+            resource = args[plural_index]
+        call = metrics.begin_call(verb, resource or default_resource)
+        start = time.monotonic()
+        try:
+            return retrying(*args, **kwargs)
+        finally:
+            metrics.end_call(call, time.monotonic() - start)
+
+    return wrapper
+
 
 def api_call(
     not_found_value: Any = None,
@@ -190,6 +267,89 @@ def wrapper(*args: Any, **kwargs: Any) -> Any:
     return decorator
 
 
+# Older kubernetes clients come from the python-legacy generator: call_api takes
+# (resource_path, method, ...), sends through ApiClient.request() and raises
+# ApiException on non-2xx. Newer clients take (method, url, ...), return the raw
+# response and only raise in response_deserialize().
+_LEGACY_API_CLIENT = not hasattr(client.ApiClient, "response_deserialize")
+
+
+class _InstrumentedApiClient(client.ApiClient):
+    """ApiClient that throttles and measures every request of its KubeClient.
+
+    Each request takes a token from the client's bucket first; a 429 response
+    carrying Retry-After pauses the bucket, so concurrent workers sharing the
+    client back off together rather than each retrying on its own. Status,
+    round-trip time and response size are recorded in the client's metrics.
+    Both ApiClient generations are supported: legacy clients are instrumented
+    in request(), current ones in call_api() and response_deserialize().
+    """
+
+    def __init__(
+        self,
+        configuration: client.Configuration,
+        rate_limiter: Optional[TokenBucket],
+        metrics: Optional[api_metrics.ApiCallMetrics] = None,
+    ) -> None:
+        super().__init__(configuration)
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self._last_request = threading.local()
+
+    def call_api(self, *args: Any, **kwargs: Any) -> Any:
+        if _LEGACY_API_CLIENT:
+            return super().call_api(*args, **kwargs)
+        method = args[0] if args else kwargs["method"]
+        url = args[1] if len(args) > 1 else kwargs["url"]
+        self._last_request.value = (method, url)
+        send_call = super().call_api
+        return self._send(method, url, lambda: send_call(*args, **kwargs))
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        # Only reached on legacy clients, where call_api() sends through here
+        send_request = getattr(super(), "request")  # absent from the current ApiClient
+        response = self._send(method, url, lambda: send_request(method, url, *args, **kwargs))
+        # Streaming responses (watches, logs) must not be read here
+        data = getattr(response, "data", None) if kwargs.get("_preload_content", True) else None
+        if self.metrics is not None and data is not None:
+            self.metrics.record_bytes(method, url, len(data))
+        return response
+
+    def response_deserialize(self, response_data: Any, response_types_map: Any = None) -> Any:
+        last = getattr(self._last_request, "value", None)
+        if self.metrics is not None and last is not None and response_data.data is not None:
+            self.metrics.record_bytes(last[0], last[1], len(response_data.data))
+        return super().response_deserialize(response_data, response_types_map)
+
+    def _send(self, method: str, url: str, send: Callable[[], Any]) -> Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        start = time.monotonic()
+        status = None
+        try:
+            response = send()
+            status = getattr(response, "status", None)
+        except ApiException as exc:
+            status = exc.status
+            # Legacy clients raise on non-2xx instead of returning the response
+            if status == 429:
+                self._pause_for_retry_after(exc.headers)
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_request(method, url, status, time.monotonic() - start)
+        if status == 429:
+            self._pause_for_retry_after(getattr(response, "headers", None))
+        return response
+
+    def _pause_for_retry_after(self, headers: Any) -> None:
+        if self.rate_limiter is None:
+            return
+        delay = parse_retry_after(headers)
+        if delay:
+            self.rate_limiter.pause(delay)
+
+
 class KubeClient:
     """Wrapper for Kubernetes API client with ACM-specific helpers."""
 
@@ -199,6 +359,9 @@ def __init__(
         dry_run: bool = False,
         request_timeout: int = 30,
         disable_hostname_verification: bool = False,
+        enable_watches: bool = True,
+        qps: float = API_QPS_DEFAULT,
+        burst: int = API_BURST_DEFAULT,
     ) -> None:
         """
         Initialize Kubernetes client for specific context.
@@ -208,20 +371,27 @@ def __init__(
             dry_run: If True, don't make actual changes
             request_timeout: API request timeout in seconds
             disable_hostname_verification: If True, skip TLS hostname verification (not recommended)
+            enable_watches: If False, waiters poll instead of opening watch streams
+            qps: Sustained API requests per second for this client (0 disables client-side throttling)
+            burst: Requests allowed in a burst above the sustained rate
         """
         self.context = context
         self.dry_run = dry_run
         self.disable_hostname_verification = disable_hostname_verification
-
-        # Load config for specific context with clearer error handling
+        self.watch_enabled = enable_watches
+        self._informer_resources: frozenset = frozenset()
+        self._informers: Dict[InformerKey, ResourceInformer] = {}
+        self._informers_lock = threading.Lock()
+
+        # Per-instance configuration built from the shared kubeconfig index, so
+        # clients never touch the global default and the files are parsed once
+        configuration = client.Configuration()
         try:
-            config.load_kube_config(context=context)
+            kubeconfig_index.get_kubeconfig_index().load_and_set(configuration, context=context)
         except ConfigException as exc:
             logger.error("Failed to load kubeconfig for context %s: %s", context or "default", exc)
             raise
 
-        # Create per-instance configuration to avoid affecting other clients
-        configuration = client.Configuration.get_default_copy()
         # Tenacity handles retries for API calls; disable urllib3 retries to avoid double retry layers.
         # NOTE: With this setting, the underlying HTTP client will not retry failed requests on its own.
         #       Any operation that is not wrapped by the Tenacity-based retry decorator (e.g., @retry_api_call),
@@ -236,8 +406,12 @@ def __init__(
                 context or "default",
             )
 
+        # All requests of this client share one QPS/burst budget
+        self.rate_limiter: Optional[TokenBucket] = TokenBucket(qps, burst) if qps and qps > 0 else None
+
         # Create API clients with this specific configuration
-        api_client = client.ApiClient(configuration)
+        self.api_metrics = api_metrics.ApiCallMetrics(context)
+        api_client = _InstrumentedApiClient(configuration, self.rate_limiter, self.api_metrics)
         self.core_v1 = client.CoreV1Api(api_client)
         self.apps_v1 = client.AppsV1Api(api_client)
         self.custom_api = client.CustomObjectsApi(api_client)
@@ -253,6 +427,50 @@ def __init__(
             request_timeout,
         )
 
+    def throttle_stats(self) -> Optional[Dict[str, Any]]:
+        """Return client-side throttling counters, or None when throttling is disabled."""
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.stats()
+
+    def enable_informer_cache(self, resources: Iterable[Tuple[str, str, str]] = INFORMER_CACHE_RESOURCES) -> None:
+        """Serve unbounded lists of the given collections from watch-maintained caches.
+
+        Args:
+            resources: (group, version, plural) tuples to cache
+        """
+        self._informer_resources = frozenset(resources)
+        logger.debug(
+            "Informer cache enabled for context %s: %s",
+            self.context or "default",
+            ", ".join(sorted(plural for _, _, plural in self._informer_resources)),
+        )
+
+    def _get_informer(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str],
+        label_selector: Optional[str],
+    ) -> Optional[ResourceInformer]:
+        if (group, version, plural) not in self._informer_resources or self.watch_enabled is not True:
+            return None
+        key: InformerKey = (group, version, plural, namespace, label_selector)
+        with self._informers_lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = ResourceInformer(self, group, version, plural, namespace, label_selector)
+                self._informers[key] = informer
+        return informer
+
+    def _invalidate_informers(self, group: str, version: str, plural: str) -> None:
+        """Drop cached lists of a collection after this client wrote to it."""
+        with self._informers_lock:
+            informers = [informer for key, informer in self._informers.items() if key[:3] == (group, version, plural)]
+        for informer in informers:
+            informer.invalidate()
+
     def _validate_resource_inputs(
         self,
         namespace: Optional[str] = None,
@@ -551,6 +769,46 @@ def get_custom_resource(
             resource = self.custom_api.get_cluster_custom_object(group=group, version=version, plural=plural, name=name)
         return resource
 
+    @api_call(not_found_value=None, log_on_error=False)
+    def get_metadata(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        name: str,
+        namespace: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        Get only the metadata of a custom resource.
+
+        Requests a PartialObjectMetadata, so objects with a large spec or
+        status (such as CRDs with their OpenAPI schemas) are not transferred
+        just to read a resourceVersion or label.
+
+        Returns:
+            Slim resource dict or None if not found
+
+        Raises:
+            ValidationError: If resource name or namespace is invalid
+        """
+        self._validate_resource_inputs(namespace, name, "custom resource")
+
+        headers = {"Accept": PARTIAL_METADATA_ACCEPT}
+        if namespace:
+            result = self.custom_api.get_namespaced_custom_object(
+                group=group,
+                version=version,
+                namespace=namespace,
+                plural=plural,
+                name=name,
+                _headers=headers,
+            )
+        else:
+            result = self.custom_api.get_cluster_custom_object(
+                group=group, version=version, plural=plural, name=name, _headers=headers
+            )
+        return cast(Dict[str, Any], result)
+
     def _get_custom_resource_raw(
         self,
         group: str,
@@ -603,7 +861,11 @@ def list_custom_resources(
             label_selector: Label selector filter
             max_items: Maximum number of items to return (None for unlimited).
                       Use this to prevent memory exhaustion on large clusters.
-                      When set, a server-side `limit` is passed to the API calls.
+                      Pages are fetched LIST_PAGE_SIZE items at a time either way;
+                      prefer iter_custom_resources() when items can be processed
+                      one by one.
+                      Unbounded lists of collections registered via
+                      enable_informer_cache() are served from memory.
 
         Returns:
             List of resource dicts, limited to max_items if specified
@@ -613,6 +875,37 @@ def list_custom_resources(
         """
         self._validate_resource_inputs(namespace=namespace)
 
+        if max_items is None:
+            informer = self._get_informer(group, version, plural, namespace, label_selector)
+            if informer is not None and informer.disabled_reason is None:
+                return informer.list()
+
+        items, _ = self._list_custom_resources_snapshot(
+            group=group,
+            version=version,
+            plural=plural,
+            namespace=namespace,
+            label_selector=label_selector,
+            max_items=max_items,
+        )
+        return items
+
+    def _list_custom_resources_snapshot(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        max_items: Optional[int] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Page through a custom resource collection.
+
+        Returns:
+            Tuple of (items, resourceVersion of the list); the resourceVersion is
+            None when the collection does not exist (404).
+        """
+        resource_version: Optional[str] = None
         items: List[Dict] = []
         continue_token: Optional[str] = None
 
@@ -623,8 +916,10 @@ def list_custom_resources(
                 break
 
             remaining = None
+            page_limit = LIST_PAGE_SIZE
             if max_items is not None:
                 remaining = max_items - len(items)
+                page_limit = min(remaining, LIST_PAGE_SIZE)
 
             try:
                 if namespace:
@@ -635,7 +930,7 @@ def list_custom_resources(
                         plural=plural,
                         label_selector=label_selector,
                         _continue=continue_token,
-                        limit=remaining,
+                        limit=page_limit,
                     )
                 else:
                     result = self.custom_api.list_cluster_custom_object(
@@ -644,11 +939,11 @@ def list_custom_resources(
                         plural=plural,
                         label_selector=label_selector,
                         _continue=continue_token,
-                        limit=remaining,
+                        limit=page_limit,
                     )
             except ApiException as e:
                 if e.status == 404:
-                    return []
+                    return [], None
                 if is_retryable_error(e):
                     raise
                 raise
@@ -663,12 +958,237 @@ def list_custom_resources(
 
             metadata = result.get("metadata") or {}
             continue_token = metadata.get("continue")
+            # Continued pages share the snapshot of the first page
+            if resource_version is None:
+                resource_version = metadata.get("resourceVersion")
 
             # Stop if no more pages or we've hit the limit
             if not continue_token or (max_items is not None and len(items) >= max_items):
                 break
 
-        return items
+        return items, resource_version
+
+    def iter_custom_resources(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        page_size: int = LIST_PAGE_SIZE,
+        field_selector: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """
+        Yield custom resources page by page.
+
+        Unlike list_custom_resources, only one page is held in memory at a time,
+        so callers that filter or act on each item keep a flat memory profile on
+        very large collections. Each page request is retried independently.
+
+        Args:
+            group: API group
+            version: API version
+            plural: Resource plural
+            namespace: Namespace (None for cluster-scoped)
+            label_selector: Label selector filter
+            page_size: Server-side page size (`limit`)
+            field_selector: Field selector filter (e.g. "metadata.name=foo")
+
+        Yields:
+            Resource dicts; nothing if the resource type does not exist (404)
+
+        Raises:
+            ValidationError: If namespace is invalid
+        """
+        self._validate_resource_inputs(namespace=namespace)
+        return self._iter_custom_resource_pages(
+            group, version, plural, namespace, label_selector, page_size, field_selector=field_selector
+        )
+
+    def list_metadata(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        List only the metadata of custom resources.
+
+        Requests a PartialObjectMetadataList, so the apiserver drops spec and
+        status and each item carries just apiVersion, kind and metadata
+        (name, labels, annotations, timestamps). Use it where only those
+        fields are read; for large Velero Backup or ManagedCluster lists it
+        cuts response size and decode time considerably. Collections
+        registered via enable_informer_cache() are served from the cache,
+        trimmed to the same fields.
+
+        Args:
+            group: API group
+            version: API version
+            plural: Resource plural
+            namespace: Namespace (None for cluster-scoped)
+            label_selector: Label selector filter
+
+        Returns:
+            List of slim resource dicts (empty if the resource type does not exist)
+
+        Raises:
+            ValidationError: If namespace is invalid
+        """
+        self._validate_resource_inputs(namespace=namespace)
+
+        informer = self._get_informer(group, version, plural, namespace, label_selector)
+        if informer is not None and informer.disabled_reason is None:
+            return [
+                {key: item[key] for key in ("apiVersion", "kind", "metadata") if key in item}
+                for item in informer.list()
+            ]
+
+        return list(
+            self._iter_custom_resource_pages(
+                group,
+                version,
+                plural,
+                namespace,
+                label_selector,
+                LIST_PAGE_SIZE,
+                accept=PARTIAL_METADATA_LIST_ACCEPT,
+            )
+        )
+
+    def _iter_custom_resource_pages(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str],
+        label_selector: Optional[str],
+        page_size: int,
+        accept: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        continue_token: Optional[str] = None
+        while True:
+            page = self._list_custom_resources_page(
+                group=group,
+                version=version,
+                plural=plural,
+                namespace=namespace,
+                label_selector=label_selector,
+                continue_token=continue_token,
+                limit=page_size,
+                accept=accept,
+                field_selector=field_selector,
+            )
+            if page is None:
+                return
+            yield from page.get("items", [])
+            continue_token = (page.get("metadata") or {}).get("continue")
+            if not continue_token:
+                return
+
+    @api_call(not_found_value=None, log_on_error=False)
+    def _list_custom_resources_page(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str],
+        label_selector: Optional[str],
+        continue_token: Optional[str],
+        limit: int,
+        accept: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> Optional[Dict]:
+        kwargs: Dict[str, Any] = {
+            "group": group,
+            "version": version,
+            "plural": plural,
+            "label_selector": label_selector,
+            "_continue": continue_token,
+            "limit": limit,
+        }
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+        if accept:
+            kwargs["_headers"] = {"Accept": accept}
+        if namespace:
+            result = self.custom_api.list_namespaced_custom_object(namespace=namespace, **kwargs)
+        else:
+            result = self.custom_api.list_cluster_custom_object(**kwargs)
+        return cast(Dict[str, Any], result)
+
+    def watch_custom_resources(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str] = None,
+        name: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        timeout_seconds: int = WATCH_TIMEOUT_SECONDS,
+        watcher: Optional[watch.Watch] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream watch events for custom resources.
+
+        When no resource_version is given, the current collection version is
+        fetched with a single-item LIST so that existing objects are not
+        replayed as ADDED events. Bookmarks are requested so that callers can
+        resume from the latest resourceVersion after the stream ends.
+
+        Args:
+            group: API group
+            version: API version
+            plural: Resource plural
+            namespace: Namespace (None for cluster-scoped)
+            name: Restrict the watch to a single object name
+            label_selector: Label selector filter
+            resource_version: resourceVersion to resume from
+            timeout_seconds: Server-side timeout for the watch request
+            watcher: Optional Watch instance so another thread can stop() the stream
+
+        Yields:
+            Event dicts with ``type``, ``object`` and ``raw_object`` keys
+
+        Raises:
+            ApiException: On API errors, including 410 when resource_version has expired
+            ValidationError: If namespace or name is invalid
+        """
+        self._validate_resource_inputs(namespace=namespace, name=name)
+
+        selector_kwargs: Dict[str, Any] = {}
+        if label_selector:
+            selector_kwargs["label_selector"] = label_selector
+        if name:
+            selector_kwargs["field_selector"] = f"metadata.name={name}"
+
+        list_func: Callable[..., Any] = self.custom_api.list_cluster_custom_object
+        if namespace:
+            list_func = self.custom_api.list_namespaced_custom_object
+            selector_kwargs["namespace"] = namespace
+
+        if resource_version is None:
+            current = list_func(group=group, version=version, plural=plural, limit=1, **selector_kwargs)
+            resource_version = (current.get("metadata") or {}).get("resourceVersion")
+
+        stream_watcher = watcher or watch.Watch()
+        try:
+            yield from stream_watcher.stream(
+                list_func,
+                group=group,
+                version=version,
+                plural=plural,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=timeout_seconds,
+                **selector_kwargs,
+            )
+        finally:
+            stream_watcher.stop()
 
     @retry_api_call
     def patch_custom_resource(
@@ -736,6 +1256,7 @@ def patch_custom_resource(
                 "KUBE_CLIENT: Patch result keys: %s",
                 list(result.keys()) if result else "None",
             )
+            self._invalidate_informers(group, version, plural)
             return result
         except ApiException as e:
             logger.error(
@@ -804,6 +1325,7 @@ def create_custom_resource(
                 result = self.custom_api.create_cluster_custom_object(
                     group=group, version=version, plural=plural, body=body
                 )
+            self._invalidate_informers(group, version, plural)
             return result
         except ApiException as e:
             if e.status == 409:
@@ -899,6 +1421,7 @@ def delete_custom_resource(
             self.custom_api.delete_cluster_custom_object(
                 group=group, version=version, plural=plural, name=name, **kwargs
             )
+        self._invalidate_informers(group, version, plural)
         return True
 
     def list_managed_clusters(self) -> List[Dict]:
@@ -909,6 +1432,14 @@ def list_managed_clusters(self) -> List[Dict]:
             plural="managedclusters",
         )
 
+    def iter_managed_clusters(self) -> Iterator[Dict]:
+        """Yield ManagedCluster resources page by page."""
+        return self.iter_custom_resources(
+            group="cluster.open-cluster-management.io",
+            version="v1",
+            plural="managedclusters",
+        )
+
     def patch_managed_cluster(self, name: str, patch: Dict[str, Any]) -> Dict:
         """Patch a ManagedCluster resource."""
         return self.patch_custom_resource(
@@ -1142,20 +1673,80 @@ def get_pod_logs(
             logger.info("[DRY-RUN] Would read logs for pod %s/%s", namespace, name)
             return ""
 
+        kwargs = self._pod_log_kwargs(container, tail_lines=tail_lines)
+        return self.core_v1.read_namespaced_pod_log(name=name, namespace=namespace, **kwargs) or ""
+
+    @staticmethod
+    def _pod_log_kwargs(
+        container: Optional[str],
+        tail_lines: Optional[int] = None,
+        since_seconds: Optional[int] = None,
+    ) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {}
         if container:
             kwargs["container"] = container
-        if tail_lines is not None:
-            # Validate tail_lines to fail fast with clear, actionable errors
+        for key, value in (("tail_lines", tail_lines), ("since_seconds", since_seconds)):
+            if value is None:
+                continue
+            # Validate to fail fast with clear, actionable errors
             try:
-                tail_lines_int = int(tail_lines)
+                value_int = int(value)
             except (TypeError, ValueError) as exc:
-                raise ValidationError("tail_lines must be a non-negative integer") from exc
-            if tail_lines_int < 0:
-                raise ValidationError("tail_lines must be a non-negative integer")
-            kwargs["tail_lines"] = tail_lines_int
+                raise ValidationError(f"{key} must be a non-negative integer") from exc
+            if value_int < 0:
+                raise ValidationError(f"{key} must be a non-negative integer")
+            kwargs[key] = value_int
+        return kwargs
 
-        return self.core_v1.read_namespaced_pod_log(name=name, namespace=namespace, **kwargs) or ""
+    @api_call(not_found_value=None, log_on_error=False, resource_desc="stream pod logs")
+    def _open_pod_log_stream(self, name: str, namespace: str, **kwargs: Any) -> Any:
+        return self.core_v1.read_namespaced_pod_log(name=name, namespace=namespace, _preload_content=False, **kwargs)
+
+    def iter_pod_log_lines(
+        self,
+        name: str,
+        namespace: str,
+        container: Optional[str] = None,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Yield a pod's log lines as they arrive, without holding the whole log.
+
+        The response is read in LOG_STREAM_CHUNK_SIZE chunks; only the current
+        chunk and one partial line are kept in memory. Opening the stream is
+        retried like other calls, reading it is not.
+
+        Args:
+            name: Pod name
+            namespace: Namespace name
+            container: Optional container name
+            since_seconds: Only return lines logged within this many seconds
+            tail_lines: Only return this many lines from the end of the log
+
+        Yields:
+            Log lines without trailing newlines (nothing if the pod is not found)
+        """
+        self._validate_resource_inputs(namespace, name, "pod")
+        kwargs = self._pod_log_kwargs(container, tail_lines=tail_lines, since_seconds=since_seconds)
+
+        if self.dry_run:
+            logger.info("[DRY-RUN] Would read logs for pod %s/%s", namespace, name)
+            return
+
+        response = self._open_pod_log_stream(name, namespace, **kwargs)
+        if response is None:
+            return
+        try:
+            partial = b""
+            for chunk in response.stream(LOG_STREAM_CHUNK_SIZE):
+                lines = (partial + chunk).split(b"\n")
+                partial = lines.pop()
+                for line in lines:
+                    yield line.decode("utf-8", errors="replace")
+            if partial:
+                yield partial.decode("utf-8", errors="replace")
+        finally:
+            response.release_conn()
 
     def wait_for_pods_ready(
         self,
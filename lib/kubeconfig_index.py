@@ -0,0 +1,198 @@
+"""Process-wide index of the merged kubeconfig.
+
+Every file listed in ``KUBECONFIG`` (or ``~/.kube/config``) is parsed once per
+process and merged the way the kubernetes client merges them: the first
+definition of a context, cluster or user name wins and the last
+``current-context`` wins. The index is rebuilt when the path list changes or
+any file's mtime/size changes.
+
+Lookups by context name and by API server host are dictionary hits, and
+``ApiClient``s are built from the parsed entries with the client's own
+``KubeConfigLoader``, so relative certificate paths still resolve against the
+file that defined them and exec/auth-provider credentials behave as before.
+"""
+
+import logging
+import os
+import threading
+import urllib.parse
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+from kubernetes import client
+from kubernetes.config.config_exception import ConfigException
+from kubernetes.config.kube_config import (
+    ENV_KUBECONFIG_PATH_SEPARATOR,
+    KUBE_CONFIG_DEFAULT_LOCATION,
+    ConfigNode,
+    KubeConfigLoader,
+)
+
+logger = logging.getLogger("acm_switchover")
+
+# Per-path (mtime_ns, size), or None when the file does not exist
+_FileSignature = Optional[Tuple[int, int]]
+
+
+def kubeconfig_paths() -> Tuple[str, ...]:
+    """Return the kubeconfig paths in effect, in KUBECONFIG order."""
+    raw = os.environ.get("KUBECONFIG", "") or KUBE_CONFIG_DEFAULT_LOCATION
+    return tuple(os.path.expanduser(path.strip()) for path in raw.split(ENV_KUBECONFIG_PATH_SEPARATOR) if path.strip())
+
+
+def server_host(url: str) -> str:
+    """Return the lower-cased host of an API server URL, without scheme, port or path."""
+    if not url:
+        return ""
+    parsed = urllib.parse.urlsplit(url if "//" in url else f"//{url}")
+    return parsed.hostname or ""
+
+
+def _signature(paths: Tuple[str, ...]) -> Dict[str, _FileSignature]:
+    signature: Dict[str, _FileSignature] = {}
+    for path in paths:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            signature[path] = None
+        else:
+            signature[path] = (stat_result.st_mtime_ns, stat_result.st_size)
+    return signature
+
+
+class KubeconfigIndex:
+    """Parsed, merged kubeconfig with constant-time lookups."""
+
+    def __init__(self, paths: Tuple[str, ...]) -> None:
+        self.paths = paths
+        self.signature = _signature(paths)
+        self.current_context: Optional[str] = None
+        self._contexts: Dict[str, ConfigNode] = {}
+        self._clusters: Dict[str, ConfigNode] = {}
+        self._users: Dict[str, ConfigNode] = {}
+        self._file_entries: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+        for path in paths:
+            self._load_file(path)
+
+        self._context_by_host: Dict[str, str] = {}
+        for name in self._contexts:
+            host = server_host(self.server_for_context(name))
+            if host:
+                self._context_by_host.setdefault(host, name)
+
+        self.merged = self.merged_data()
+
+    def _load_file(self, path: str) -> None:
+        if self.signature.get(path) is None:
+            logger.debug("Kubeconfig path does not exist: %s", os.path.basename(path))
+            return
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = yaml.safe_load(handle) or {}
+        except (OSError, yaml.YAMLError) as e:
+            logger.debug("Error loading kubeconfig %s: %s", os.path.basename(path), e)
+            return
+        if not isinstance(data, dict):
+            logger.debug("Ignoring kubeconfig %s: not a mapping", os.path.basename(path))
+            return
+
+        entries: Dict[str, List[Dict[str, Any]]] = {}
+        for kind, table in (("contexts", self._contexts), ("clusters", self._clusters), ("users", self._users)):
+            items = [item for item in data.get(kind) or [] if isinstance(item, dict) and item.get("name")]
+            entries[kind] = items
+            for item in items:
+                if item["name"] not in table:
+                    table[item["name"]] = ConfigNode(f"{path}/{kind}", item, path)
+        self._file_entries[path] = entries
+        if data.get("current-context"):
+            self.current_context = data["current-context"]
+
+    def is_stale(self) -> bool:
+        """Return True when a kubeconfig file changed, appeared or disappeared since loading."""
+        return _signature(self.paths) != self.signature
+
+    def file_size(self, path: str) -> Optional[int]:
+        """Return the size of a loaded kubeconfig file when it was indexed."""
+        signature = self.signature.get(path)
+        return signature[1] if signature else None
+
+    def merged_data(self, exclude: Tuple[str, ...] = ()) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the raw contexts, clusters and users of every loaded file, in path order."""
+        merged: Dict[str, List[Dict[str, Any]]] = {"contexts": [], "clusters": [], "users": []}
+        for path in self.paths:
+            if path in exclude or path not in self._file_entries:
+                continue
+            for kind, items in self._file_entries[path].items():
+                merged[kind].extend(items)
+        return merged
+
+    def contexts(self) -> List[Dict[str, Any]]:
+        """Return the effective contexts (first definition of each name wins)."""
+        return [node.value for node in self._contexts.values()]
+
+    def has_context(self, name: str) -> bool:
+        return name in self._contexts
+
+    def server_for_context(self, name: Optional[str]) -> str:
+        """Return the API server URL of a context's cluster, or an empty string."""
+        node = self._contexts.get(name or "")
+        if node is None:
+            return ""
+        cluster = self._clusters.get((node.value.get("context") or {}).get("cluster", ""))
+        if cluster is None:
+            return ""
+        return (cluster.value.get("cluster") or {}).get("server", "")
+
+    def context_for_host(self, url_or_host: str) -> Optional[str]:
+        """Return the first context whose cluster server has the given host."""
+        return self._context_by_host.get(server_host(url_or_host))
+
+    def load_and_set(self, configuration: client.Configuration, context: Optional[str] = None) -> None:
+        """
+        Populate a client Configuration for a context.
+
+        Raises:
+            ConfigException: If the context (or its cluster) is not defined
+        """
+        name = context or self.current_context
+        if not name:
+            raise ConfigException("Invalid kube-config file. No current-context set and no context given.")
+        node = self._contexts.get(name)
+        if node is None:
+            raise ConfigException(f"Invalid kube-config file. Expected object with name {name} in contexts list")
+        context_spec = node.value.get("context") or {}
+        cluster = self._clusters.get(context_spec.get("cluster", ""))
+        user = self._users.get(context_spec.get("user", ""))
+        subset = {
+            "current-context": name,
+            "contexts": [node],
+            "clusters": [cluster] if cluster is not None else [],
+            "users": [user] if user is not None else [],
+        }
+        loader = KubeConfigLoader(
+            config_dict=ConfigNode("kube-config", subset, node.path),
+            active_context=name,
+            config_base_path=None,
+        )
+        loader.load_and_set(configuration)
+
+    def new_api_client(self, context: str) -> client.ApiClient:
+        """Build an ApiClient for a context without touching the global default configuration."""
+        configuration = client.Configuration()
+        self.load_and_set(configuration, context)
+        return client.ApiClient(configuration=configuration)
+
+
+_index_lock = threading.Lock()
+_index: Optional[KubeconfigIndex] = None
+
+
+def get_kubeconfig_index(force_reload: bool = False) -> KubeconfigIndex:
+    """Return the shared index, re-parsing only when the kubeconfig files changed."""
+    global _index  # pylint: disable=global-statement
+    paths = kubeconfig_paths()
+    with _index_lock:
+        if force_reload or _index is None or _index.paths != paths or _index.is_stale():
+            _index = KubeconfigIndex(paths)
+        return _index
@@ -0,0 +1,152 @@
+"""On-disk cache of RBAC self-check results.
+
+Repeated ``check_rbac.py`` and ``--validate-only`` runs against the same hub
+with the same credentials re-use the permissions granted on an earlier run
+instead of asking the API server again. Entries live in
+``<state dir>/rbac-cache/<digest>.json``, one per (API server, identity, role,
+Argo CD mode). The identity is a SHA-256 of the bearer token or client
+certificate, or of the user name and groups reported by a SelfSubjectReview
+when neither is available; credentials themselves are never written.
+
+Only granted permissions are cached. A denied permission is always checked
+again, so fixing RBAC takes effect on the next run, and an entry expires as a
+whole once its TTL has passed since it was first written.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from lib.constants import RBAC_CACHE_TTL_SECONDS
+from lib.utils import atomic_write_json
+
+logger = logging.getLogger("acm_switchover")
+
+RBAC_CACHE_DIRNAME = "rbac-cache"
+_CACHE_VERSION = 1
+
+# (api_group, resource, verb, namespace); namespace is None for cluster scope
+_Check = Tuple[str, str, str, Optional[str]]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_dir_for_state_dir(state_dir: str) -> str:
+    """Return the RBAC cache directory inside ``state_dir``."""
+    return os.path.join(state_dir or ".", RBAC_CACHE_DIRNAME)
+
+
+def client_identity(client: Any) -> Optional[str]:
+    """
+    Return a stable, non-secret identifier for the credentials a client uses.
+
+    Returns:
+        Identity string, or None when the identity cannot be determined
+    """
+    configuration = client.core_v1.api_client.configuration
+    api_key = configuration.api_key or {}
+    token = api_key.get("authorization") or api_key.get("BearerToken")
+    if isinstance(token, str) and token:
+        return f"token:{_sha256(token.encode('utf-8'))}"
+
+    if isinstance(configuration.cert_file, str) and configuration.cert_file:
+        try:
+            with open(configuration.cert_file, "rb") as handle:
+                return f"cert:{_sha256(handle.read())}"
+        except OSError as e:
+            logger.debug("Could not read client certificate for RBAC cache key: %s", e)
+
+    try:
+        from kubernetes import client as k8s_client
+
+        api_instance = k8s_client.AuthenticationV1Api(client.core_v1.api_client)
+        user = api_instance.create_self_subject_review(k8s_client.V1SelfSubjectReview()).status.user_info
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug("Could not determine identity for RBAC cache key: %s", e)
+        return None
+    if not user or not isinstance(user.username, str) or not user.username:
+        return None
+    payload = json.dumps([user.username, sorted(user.groups or [])])
+    return f"user:{_sha256(payload.encode('utf-8'))}"
+
+
+class RBACCacheEntry:
+    """Cached results for one (API server, identity, role, Argo CD mode) key."""
+
+    def __init__(self, path: str, ttl_seconds: int, refresh: bool = False) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.refresh = refresh
+        self._cached_at: Optional[float] = None
+
+    def load(self) -> Dict[_Check, Tuple[bool, str]]:
+        """Return the cached granted permissions, or an empty dict on a miss."""
+        if self.refresh:
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") != _CACHE_VERSION:
+                return {}
+            cached_at = float(data["cached_at"])
+            granted = [tuple(check) for check in data["granted"]]
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Ignoring unreadable RBAC cache %s: %s", self.path, e)
+            return {}
+
+        age = time.time() - cached_at
+        if age < 0 or age > self.ttl_seconds:
+            return {}
+        self._cached_at = cached_at
+        logger.info("Using %d cached RBAC result(s) from %.0fs ago", len(granted), age)
+        return {check: (True, "") for check in granted}  # type: ignore[misc]
+
+    def store(self, results: Dict[_Check, Tuple[bool, str]]) -> None:
+        """Write the granted permissions in ``results``; failures are logged, not raised."""
+        granted = sorted(
+            (list(check) for check, (allowed, _) in results.items() if allowed),
+            key=lambda check: [part or "" for part in check],
+        )
+        if self._cached_at is None:
+            self._cached_at = time.time()
+        payload = {"version": _CACHE_VERSION, "cached_at": self._cached_at, "granted": granted}
+
+        try:
+            atomic_write_json(self.path, payload)
+        except OSError as e:
+            logger.warning("Could not write RBAC cache %s: %s", self.path, e)
+
+
+class RBACResultCache:
+    """Factory for per-key cache entries in one directory."""
+
+    def __init__(self, directory: str, ttl_seconds: int = RBAC_CACHE_TTL_SECONDS, refresh: bool = False) -> None:
+        """
+        Args:
+            directory: Cache directory (see ``cache_dir_for_state_dir``)
+            ttl_seconds: Maximum age of reused results; 0 disables the cache
+            refresh: Ignore existing entries and overwrite them with fresh results
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.refresh = refresh
+
+    def entry(self, client: Any, role: str, argocd_mode: str) -> Optional[RBACCacheEntry]:
+        """Return the cache entry for a client, or None when caching is disabled or impossible."""
+        if self.ttl_seconds <= 0:
+            return None
+        server = client.core_v1.api_client.configuration.host
+        if not isinstance(server, str):
+            return None
+        identity = client_identity(client)
+        if identity is None:
+            return None
+        digest = _sha256(json.dumps([server, identity, role, argocd_mode]).encode("utf-8"))
+        return RBACCacheEntry(os.path.join(self.directory, f"{digest}.json"), self.ttl_seconds, self.refresh)
@@ -7,15 +7,23 @@
 The module supports two roles:
 - operator: Full permissions for executing switchover operations
 - validator: Read-only permissions for validation and dry-run operations
+
+In batched mode namespaced permissions are evaluated locally against one
+SelfSubjectRulesReview per namespace instead of one SelfSubjectAccessReview
+per verb; only cluster-scoped permissions (and anything the rules review
+cannot decide) are checked with individual access reviews, concurrently.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from kubernetes.client.rest import ApiException
 
 from lib import KubeClient
+from lib.constants import RBAC_CHECK_MAX_WORKERS
 from lib.exceptions import ValidationError
+from lib.rbac_cache import RBACCacheEntry, RBACResultCache
 
 logger = logging.getLogger("acm_switchover")
 
@@ -24,6 +32,9 @@
 # Valid Argo CD RBAC validation modes
 VALID_ARGOCD_MODES = ("none", "check", "manage")
 
+# (api_group, resource, verb, namespace); namespace is None for cluster scope
+PermissionCheck = Tuple[str, str, str, Optional[str]]
+
 
 def _validate_argocd_mode(argocd_mode: str) -> None:
     """Validate Argo CD RBAC mode."""
@@ -31,6 +42,35 @@ def _validate_argocd_mode(argocd_mode: str) -> None:
         raise ValueError(f"Invalid argocd_mode '{argocd_mode}'. Must be one of: {VALID_ARGOCD_MODES}")
 
 
+def _matches(values: Optional[List[str]], wanted: str) -> bool:
+    return bool(values) and ("*" in values or wanted in values)
+
+
+def _resource_matches(resources: Optional[List[str]], resource: str) -> bool:
+    if _matches(resources, resource):
+        return True
+    # "*/scale" grants the scale subresource of every resource
+    return "/" in resource and f"*/{resource.split('/', 1)[1]}" in (resources or [])
+
+
+def rule_allows(rule: Any, api_group: str, resource: str, verb: str) -> bool:
+    """
+    Check whether a SelfSubjectRulesReview resource rule grants a permission.
+
+    Follows the Kubernetes RBAC matcher: ``*`` matches any group, resource or
+    verb and ``*/<subresource>`` matches that subresource of any resource. A rule
+    limited to ``resourceNames`` never grants access to the resource type as a
+    whole, which is what the validator asks for.
+    """
+    if rule.resource_names:
+        return False
+    return (
+        _matches(rule.verbs, verb)
+        and _matches(rule.api_groups, api_group)
+        and _resource_matches(rule.resources, resource)
+    )
+
+
 class RBACValidator:
     """Validates RBAC permissions for ACM switchover operations."""
 
@@ -211,18 +251,31 @@ class RBACValidator:
         ("argoproj.io", "applications", ["patch"]),
     ]
 
-    def __init__(self, client: KubeClient, role: str = "operator"):
+    def __init__(
+        self,
+        client: KubeClient,
+        role: str = "operator",
+        batched: bool = False,
+        cache: Optional[RBACCacheEntry] = None,
+    ):
         """
         Initialize RBAC validator.
 
         Args:
             client: KubeClient instance to use for validation
             role: Role to validate for ("operator" or "validator")
+            batched: Evaluate namespaced permissions against SelfSubjectRulesReview
+                and issue the remaining access reviews concurrently
+            cache: On-disk cache entry for this client's granted permissions
+                (used in batched mode)
         """
         if role not in VALID_ROLES:
             raise ValueError(f"Invalid role '{role}'. Must be one of: {VALID_ROLES}")
         self.client = client
         self.role = role
+        self.batched = batched
+        self.cache = cache
+        self._results: Dict[PermissionCheck, Tuple[bool, str]] = cache.load() if batched and cache is not None else {}
 
     def _get_cluster_permissions(self) -> List[Tuple[str, str, List[str]]]:
         """Get cluster permissions based on role."""
@@ -334,6 +387,101 @@ def check_permission(
         except Exception as e:
             raise ValidationError(f"Unable to check permission {verb} {group_name}/{resource} on {scope}: {e}") from e
 
+    def _check_single(self, check: PermissionCheck) -> Tuple[bool, str]:
+        api_group, resource, verb, namespace = check
+        if namespace is None:
+            return self.check_permission(api_group, resource, verb)
+        return self.check_permission(api_group, resource, verb, namespace)
+
+    def _fetch_namespace_rules(self, namespace: str) -> Optional[Tuple[List[Any], bool]]:
+        """
+        Fetch the current identity's effective rules in a namespace.
+
+        Returns:
+            Tuple of (resource rules, incomplete), or None when the review could
+            not be performed and the caller should fall back to access reviews
+        """
+        try:
+            from kubernetes import client as k8s_client
+
+            api_instance = k8s_client.AuthorizationV1Api(self.client.core_v1.api_client)
+            body = k8s_client.V1SelfSubjectRulesReview(
+                spec=k8s_client.V1SelfSubjectRulesReviewSpec(namespace=namespace)
+            )
+            status = api_instance.create_self_subject_rules_review(body).status
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("SelfSubjectRulesReview failed in namespace %s, using access reviews: %s", namespace, e)
+            return None
+
+        if status.incomplete:
+            logger.debug(
+                "SelfSubjectRulesReview in namespace %s is incomplete (%s); unmatched checks use access reviews",
+                namespace,
+                status.evaluation_error or "no reason given",
+            )
+        return list(status.resource_rules or []), bool(status.incomplete)
+
+    def check_permissions(self, checks: Sequence[PermissionCheck]) -> Dict[PermissionCheck, Tuple[bool, str]]:
+        """
+        Check a set of permissions.
+
+        Without batching every check is one ``check_permission`` call, in order.
+        In batched mode namespaced checks are resolved against one
+        SelfSubjectRulesReview per namespace; cluster-scoped checks, and
+        namespaced checks the rules review cannot decide, are issued as
+        concurrent access reviews. Batched results are kept for the lifetime of
+        the validator, so a report pass after validation does not repeat them,
+        and granted ones are written to the on-disk cache when one is set.
+
+        Args:
+            checks: (api_group, resource, verb, namespace) tuples
+
+        Returns:
+            Dict mapping each check to (has_permission, error_message)
+
+        Raises:
+            ValidationError: If an access review cannot be completed
+        """
+        if not self.batched:
+            return {check: self._check_single(check) for check in checks}
+
+        pending = [check for check in dict.fromkeys(checks) if check not in self._results]
+        if not pending:
+            return {check: self._results[check] for check in checks}
+        namespaces = sorted({check[3] for check in pending if check[3]})
+        residue = [check for check in pending if not check[3]]
+
+        with ThreadPoolExecutor(max_workers=RBAC_CHECK_MAX_WORKERS) as executor:
+            reviews = dict(zip(namespaces, executor.map(self._fetch_namespace_rules, namespaces)))
+            for check in pending:
+                namespace = check[3]
+                if not namespace:
+                    continue
+                review = reviews[namespace]
+                if review is None:
+                    residue.append(check)
+                    continue
+                rules, incomplete = review
+                if any(rule_allows(rule, check[0], check[1], check[2]) for rule in rules):
+                    self._results[check] = (True, "")
+                elif incomplete:
+                    residue.append(check)
+                else:
+                    self._results[check] = (False, "Not granted by any RBAC rule")
+
+            logger.debug(
+                "Resolved %d permission check(s) with %d rules review(s) and %d access review(s)",
+                len(pending),
+                len(namespaces),
+                len(residue),
+            )
+            for check, result in zip(residue, executor.map(self._check_single, residue)):
+                self._results[check] = result
+
+        if self.cache is not None:
+            self.cache.store(self._results)
+        return {check: self._results[check] for check in checks}
+
     def validate_cluster_permissions(
         self,
         include_decommission: bool = False,
@@ -364,53 +512,26 @@ def validate_cluster_permissions(
         # Get permissions based on role
         cluster_permissions = self._get_cluster_permissions()
 
-        # Check standard cluster permissions
+        # (error prefix, api_group, resource, verb) in report order
+        required: List[Tuple[str, str, str, str]] = []
         for api_group, resource, verbs in cluster_permissions:
             # Skip observability permissions if requested
             if skip_observability and "observability" in api_group:
                 logger.info("Skipping observability permission: %s/%s", api_group, resource)
                 continue
-
-            for verb in verbs:
-                has_perm, error = self.check_permission(api_group, resource, verb)
-                if not has_perm:
-                    all_valid = False
-                    group_name = api_group if api_group else "core"
-                    error_msg = f"Missing permission: {verb} {group_name}/{resource}"
-                    if error:
-                        error_msg += f" - {error}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
+            required.extend(("Missing permission", api_group, resource, verb) for verb in verbs)
 
         # Check Argo CD permissions if requested
         argocd_permissions = self._get_argocd_cluster_permissions(argocd_mode, argocd_install_type)
         if argocd_permissions:
             logger.info("Including Argo CD RBAC checks (mode: %s)", argocd_mode)
             for api_group, resource, verbs in argocd_permissions:
-                for verb in verbs:
-                    has_perm, error = self.check_permission(api_group, resource, verb)
-                    if not has_perm:
-                        all_valid = False
-                        group_name = api_group if api_group else "core"
-                        error_msg = f"Missing Argo CD permission: {verb} {group_name}/{resource}"
-                        if error:
-                            error_msg += f" - {error}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
+                required.extend(("Missing Argo CD permission", api_group, resource, verb) for verb in verbs)
 
         # Check decommission permissions if requested (operator role only)
         if include_decommission and self.role == "operator":
             for api_group, resource, verbs in self.DECOMMISSION_PERMISSIONS:
-                for verb in verbs:
-                    has_perm, error = self.check_permission(api_group, resource, verb)
-                    if not has_perm:
-                        all_valid = False
-                        group_name = api_group if api_group else "core"
-                        error_msg = f"Missing decommission permission: {verb} {group_name}/{resource}"
-                        if error:
-                            error_msg += f" - {error}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
+                required.extend(("Missing decommission permission", api_group, resource, verb) for verb in verbs)
         elif include_decommission and self.role == "validator":
             # F7 fix: Reject this combination explicitly instead of silently skipping.
             raise ValueError(
@@ -418,6 +539,20 @@ def validate_cluster_permissions(
                 "Decommission permissions are only applicable to the operator role."
             )
 
+        results = self.check_permissions(
+            [(api_group, resource, verb, None) for _, api_group, resource, verb in required]
+        )
+        for prefix, api_group, resource, verb in required:
+            has_perm, error = results[(api_group, resource, verb, None)]
+            if not has_perm:
+                all_valid = False
+                group_name = api_group if api_group else "core"
+                error_msg = f"{prefix}: {verb} {group_name}/{resource}"
+                if error:
+                    error_msg += f" - {error}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+
         if all_valid:
             logger.info("✓ All cluster-scoped permissions validated for role: %s", self.role)
         else:
@@ -425,6 +560,23 @@ def validate_cluster_permissions(
 
         return all_valid, errors
 
+    def _report_namespace_checks(self, checks: List[PermissionCheck], errors: List[str]) -> bool:
+        """Run namespaced checks, append an error per missing permission, and return whether all passed."""
+        all_valid = True
+        results = self.check_permissions(checks)
+        for check in checks:
+            has_perm, error = results[check]
+            if not has_perm:
+                all_valid = False
+                api_group, resource, verb, namespace = check
+                group_name = api_group if api_group else "core"
+                error_msg = f"Missing permission in {namespace}: {verb} {group_name}/{resource}"
+                if error:
+                    error_msg += f" - {error}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+        return all_valid
+
     def validate_namespace_permissions(
         self, skip_observability: bool = False, skip_agent_namespace: bool = True
     ) -> Tuple[bool, List[str]]:
@@ -449,6 +601,7 @@ def validate_namespace_permissions(
 
         # Get permissions based on role
         namespace_permissions = self._get_hub_namespace_permissions()
+        checks: List[PermissionCheck] = []
 
         for namespace, permissions in namespace_permissions.items():
             # Skip observability namespace if requested
@@ -473,18 +626,11 @@ def validate_namespace_permissions(
                 continue
 
             logger.info("Checking permissions in namespace: %s", namespace)
+            checks.extend(
+                (api_group, resource, verb, namespace) for api_group, resource, verbs in permissions for verb in verbs
+            )
 
-            for api_group, resource, verbs in permissions:
-                for verb in verbs:
-                    has_perm, error = self.check_permission(api_group, resource, verb, namespace)
-                    if not has_perm:
-                        all_valid = False
-                        group_name = api_group if api_group else "core"
-                        error_msg = f"Missing permission in {namespace}: " f"{verb} {group_name}/{resource}"
-                        if error:
-                            error_msg += f" - {error}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
+        all_valid = self._report_namespace_checks(checks, errors) and all_valid
 
         if all_valid:
             logger.info("✓ All namespace-scoped permissions validated")
@@ -511,6 +657,7 @@ def validate_managed_cluster_permissions(self) -> Tuple[bool, List[str]]:
 
         # Get managed cluster permissions based on role
         namespace_permissions = self._get_managed_cluster_namespace_permissions()
+        checks: List[PermissionCheck] = []
 
         for namespace, permissions in namespace_permissions.items():
             # Check if namespace exists first
@@ -522,18 +669,11 @@ def validate_managed_cluster_permissions(self) -> Tuple[bool, List[str]]:
                 continue
 
             logger.info("Checking permissions in namespace: %s", namespace)
+            checks.extend(
+                (api_group, resource, verb, namespace) for api_group, resource, verbs in permissions for verb in verbs
+            )
 
-            for api_group, resource, verbs in permissions:
-                for verb in verbs:
-                    has_perm, error = self.check_permission(api_group, resource, verb, namespace)
-                    if not has_perm:
-                        all_valid = False
-                        group_name = api_group if api_group else "core"
-                        error_msg = f"Missing permission in {namespace}: {verb} {group_name}/{resource}"
-                        if error:
-                            error_msg += f" - {error}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
+        all_valid = self._report_namespace_checks(checks, errors) and all_valid
 
         if all_valid:
             logger.info("✓ All managed cluster permissions validated")
@@ -669,6 +809,7 @@ def validate_rbac_permissions(
     argocd_mode: str = "none",
     argocd_install_type: str = "unknown",
     secondary_argocd_install_type: Optional[str] = None,
+    rbac_cache: Optional[RBACResultCache] = None,
 ) -> None:
     """
     Validate RBAC permissions on primary and optionally secondary hub.
@@ -682,6 +823,7 @@ def validate_rbac_permissions(
         argocd_install_type: 'vanilla', 'operator', or 'unknown'
         secondary_argocd_install_type: Secondary hub install type override.
             Falls back to argocd_install_type when not provided.
+        rbac_cache: Optional on-disk cache of granted permissions
 
     Raises:
         ValidationError: If RBAC validation fails
@@ -691,7 +833,11 @@ def validate_rbac_permissions(
 
     # Validate primary hub
     logger.info("Validating RBAC permissions on primary hub...")
-    primary_validator = RBACValidator(primary_client)
+    primary_validator = RBACValidator(
+        primary_client,
+        batched=True,
+        cache=rbac_cache.entry(primary_client, "operator", argocd_mode) if rbac_cache else None,
+    )
     try:
         primary_valid, primary_errors = primary_validator.validate_all_permissions(
             include_decommission=include_decommission,
@@ -715,7 +861,11 @@ def validate_rbac_permissions(
     # Validate secondary hub if provided
     if secondary_client:
         logger.info("Validating RBAC permissions on secondary hub...")
-        secondary_validator = RBACValidator(secondary_client)
+        secondary_validator = RBACValidator(
+            secondary_client,
+            batched=True,
+            cache=rbac_cache.entry(secondary_client, "operator", argocd_mode) if rbac_cache else None,
+        )
         secondary_install_type = secondary_argocd_install_type or argocd_install_type
         try:
             secondary_valid, secondary_errors = secondary_validator.validate_all_permissions(
@@ -752,7 +902,7 @@ def validate_decommission_permissions(
     """Validate only the RBAC permissions used by standalone decommission."""
     logger.info("Starting decommission RBAC permission validation...")
 
-    validator = RBACValidator(primary_client)
+    validator = RBACValidator(primary_client, batched=True)
     try:
         cluster_valid, cluster_errors = validator.validate_cluster_permissions(
             include_decommission=True,
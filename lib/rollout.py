@@ -0,0 +1,118 @@
+"""Tracking of Deployment/StatefulSet rollouts to a replica target.
+
+Observability scale-down on the old hub and scale-up on the new hub both wait
+for a handful of workloads to reach a replica count. ``track_rollouts`` waits
+for all of them at once, one thread per workload, so waits on different hubs
+and different workloads overlap instead of running back to back.
+
+A rollout to zero resolves once no pod matches the workload's pod selector; a
+rollout to N resolves once the workload reports ``status.readyReplicas >= N``.
+Each wait watches the workload itself (the ``apps/v1`` resource, when watches
+are enabled) and re-checks as soon as its status changes; the interval only
+acts as a resync period, which also covers pods still terminating after the
+workload status has already dropped to zero.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from kubernetes.client.rest import ApiException
+
+from lib.kube_client import KubeClient
+from lib.waiter import ResourceWatch, wait_for_condition
+
+logger = logging.getLogger("acm_switchover")
+
+# Workload kinds (apps/v1 plurals) that can be tracked
+ROLLOUT_KINDS = frozenset({"deployments", "statefulsets"})
+
+
+@dataclass
+class WorkloadRollout:
+    """One workload expected to reach a replica count on one hub."""
+
+    hub: str
+    client: KubeClient
+    kind: str
+    name: str
+    namespace: str
+    pod_selector: str
+    # None: the replica count in the workload's own spec
+    replicas: Optional[int] = None
+    done: bool = field(default=False, init=False)
+    found: bool = field(default=True, init=False)
+    ready_replicas: int = field(default=0, init=False)
+    remaining_pods: List[Dict] = field(default_factory=list, init=False)
+
+    def __post_init__(self) -> None:
+        if self.kind not in ROLLOUT_KINDS:
+            raise ValueError(f"Unsupported workload kind: {self.kind}")
+
+    @property
+    def description(self) -> str:
+        target = "its spec" if self.replicas is None else f"{self.replicas} replica(s)"
+        return f"{self.name} on {self.hub} to reach {target}"
+
+    def _get_workload(self) -> Optional[Dict]:
+        if self.kind == "deployments":
+            return self.client.get_deployment(name=self.name, namespace=self.namespace)
+        return self.client.get_statefulset(name=self.name, namespace=self.namespace)
+
+    def observe(self) -> Tuple[bool, str]:
+        """Check the rollout once; suitable as a ``wait_for_condition`` callback."""
+        try:
+            if self.replicas == 0:
+                self.remaining_pods = self.client.get_pods(namespace=self.namespace, label_selector=self.pod_selector)
+                self.done = not self.remaining_pods
+                return self.done, f"{len(self.remaining_pods)} pod(s) remaining"
+
+            workload = self._get_workload()
+            self.found = workload is not None
+            if workload is None:
+                # Nothing to wait for unless an explicit target was requested
+                self.done = self.replicas is None
+                return self.done, "workload not found"
+            target = self.replicas
+            if target is None:
+                target = int((workload.get("spec") or {}).get("replicas") or 0)
+            self.ready_replicas = int((workload.get("status") or {}).get("readyReplicas") or 0)
+            self.done = self.ready_replicas >= target
+            return self.done, f"{self.ready_replicas}/{target} ready"
+        except (ApiException, Exception) as e:
+            logger.debug("Rollout check for %s failed: %s", self.name, e)
+            return False, f"check failed: {e}"
+
+    def watch(self) -> ResourceWatch:
+        return ResourceWatch(self.client, "apps", "v1", self.kind, namespace=self.namespace, name=self.name)
+
+
+def track_rollouts(rollouts: Sequence[WorkloadRollout], *, timeout: int, interval: int) -> bool:
+    """
+    Wait for every rollout concurrently.
+
+    Args:
+        rollouts: Workloads to track, on any number of hubs
+        timeout: Seconds each rollout may take
+        interval: Resync period between checks of one rollout
+
+    Returns:
+        True when every rollout reached its target; see each rollout's ``done``
+    """
+    if not rollouts:
+        return True
+
+    def _track(rollout: WorkloadRollout) -> bool:
+        return wait_for_condition(
+            rollout.description,
+            rollout.observe,
+            timeout=timeout,
+            interval=interval,
+            logger=logger,
+            watch=rollout.watch(),
+        )
+
+    with ThreadPoolExecutor(max_workers=len(rollouts), thread_name_prefix="rollout") as executor:
+        results = list(executor.map(_track, rollouts))
+    return all(results)
@@ -0,0 +1,107 @@
+"""Bounded pool of managed-cluster (spoke) API clients.
+
+Klusterlet verification talks to every managed cluster through its own
+kubeconfig context, first to check which hub the klusterlet reports and then,
+for clusters attached to the wrong hub, to force a reconnect. The pool keeps
+one ``ApiClient`` per context so the fix pass reuses the connection opened by
+the check pass instead of building a new client and TLS session. The least
+recently used client is closed once the pool is full, and ``close()`` releases
+everything at the end of a run.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from kubernetes import client
+
+from lib import kubeconfig_index
+from lib.constants import SPOKE_CLIENT_POOL_SIZE
+
+logger = logging.getLogger("acm_switchover")
+
+
+def _new_api_client(context: str) -> client.ApiClient:
+    return kubeconfig_index.get_kubeconfig_index().new_api_client(context)
+
+
+def _close_quietly(context: str, api_client: client.ApiClient) -> None:
+    try:
+        api_client.close()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.debug("Error closing client for context %s: %s", context, e)
+
+
+class SpokeClientPool:
+    """Thread-safe LRU cache of per-context ``ApiClient``s."""
+
+    def __init__(
+        self,
+        max_size: int = SPOKE_CLIENT_POOL_SIZE,
+        factory: Optional[Callable[[str], client.ApiClient]] = None,
+    ) -> None:
+        """
+        Args:
+            max_size: Maximum number of open clients; the least recently used is closed beyond it
+            factory: Builds an ApiClient for a context (defaults to the shared kubeconfig index)
+        """
+        self.max_size = max(1, max_size)
+        self._factory = factory or _new_api_client
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[str, client.ApiClient]" = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def api_client(self, context: str) -> client.ApiClient:
+        """
+        Return the pooled ApiClient for a context, creating it on first use.
+
+        Raises:
+            ConfigException: If the context does not exist in kubeconfig
+        """
+        with self._lock:
+            pooled = self._clients.get(context)
+            if pooled is not None:
+                self._clients.move_to_end(context)
+                return pooled
+
+        # Build outside the lock: loading credentials may run an exec plugin
+        created = self._factory(context)
+        evicted = []
+        with self._lock:
+            pooled = self._clients.get(context)
+            if pooled is not None:
+                # Another thread won the race; keep its client
+                self._clients.move_to_end(context)
+                evicted.append((context, created))
+            else:
+                pooled = created
+                self._clients[context] = created
+                while len(self._clients) > self.max_size:
+                    evicted.append(self._clients.popitem(last=False))
+        for evicted_context, evicted_client in evicted:
+            _close_quietly(evicted_context, evicted_client)
+        return pooled
+
+    def clients(self, context: str) -> Tuple[client.CoreV1Api, client.AppsV1Api]:
+        """Return CoreV1Api and AppsV1Api bound to the pooled client for a context."""
+        api_client = self.api_client(context)
+        return client.CoreV1Api(api_client=api_client), client.AppsV1Api(api_client=api_client)
+
+    def discard(self, context: str) -> None:
+        """Close and forget the client for a context that will not be used again."""
+        with self._lock:
+            api_client = self._clients.pop(context, None)
+        if api_client is not None:
+            _close_quietly(context, api_client)
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            pooled = list(self._clients.items())
+            self._clients.clear()
+        for context, api_client in pooled:
+            _close_quietly(context, api_client)
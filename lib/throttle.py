@@ -0,0 +1,110 @@
+"""Client-side request throttling for Kubernetes API clients.
+
+Each KubeClient owns one ``TokenBucket`` that every HTTP request passes
+through, so parallel workers share a single QPS/burst budget per apiserver
+instead of each hammering API Priority and Fairness on its own. A 429 with a
+``Retry-After`` header pauses the whole bucket for the requested time.
+"""
+
+import email.utils
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Mapping, Optional
+
+from lib.constants import RETRY_AFTER_MAX_SECONDS
+
+
+def parse_retry_after(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Return the Retry-After delay in seconds from response headers, if any.
+
+    Accepts both delta-seconds and HTTP-date values; the result is capped at
+    RETRY_AFTER_MAX_SECONDS.
+    """
+    if not headers:
+        return None
+    value = None
+    for key, header_value in headers.items():
+        if str(key).lower() == "retry-after":
+            value = str(header_value).strip()
+            break
+    if not value:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(delay, 0.0), RETRY_AFTER_MAX_SECONDS)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``qps`` tokens/s up to ``burst``.
+
+    ``acquire`` blocks until a token is available and records how long callers
+    were held back; ``pause`` stops handing out tokens until a deadline (used
+    for server-requested Retry-After backoff).
+    """
+
+    def __init__(self, qps: float, burst: int) -> None:
+        if qps <= 0:
+            raise ValueError("qps must be positive")
+        self.qps = float(qps)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+        self.retry_after_pauses = 0
+
+    def _refill_locked(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.qps)
+        self._last_refill = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as needed. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill_locked(now)
+                delay = max(0.0, self._paused_until - now)
+                if delay == 0.0:
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        self.requests += 1
+                        if waited:
+                            self.throttled_requests += 1
+                            self.throttled_seconds += waited
+                        return waited
+                    delay = (1.0 - self._tokens) / self.qps
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next ``seconds`` (extends, never shortens, a pause)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self.retry_after_pauses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for tuning QPS/burst against the apiserver's APF budget."""
+        with self._lock:
+            return {
+                "qps": self.qps,
+                "burst": self.burst,
+                "requests": self.requests,
+                "throttled_requests": self.throttled_requests,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "retry_after_pauses": self.retry_after_pauses,
+            }
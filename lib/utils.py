@@ -11,11 +11,14 @@
 import shutil
 import signal
 import stat
+import tempfile
+import time
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, Literal, Optional, Set, Tuple, TypeVar
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, TypeVar
 
 from lib.exceptions import StateLoadError, StateLockError
+from lib.state_journal import StateJournal, journal_path_for, read_journal, replay
 
 # File locking is best-effort; fcntl isn't available on Windows.
 try:
@@ -110,16 +113,35 @@ class Phase(Enum):
     FAILED = "failed"
 
 
+# Phases that end a run; entering one closes the open phase timing without opening another
+_TERMINAL_PHASES = (Phase.COMPLETED, Phase.FAILED)
+
+
 def _utc_timestamp() -> str:
     """Return an ISO-8601 timestamp in UTC."""
     return datetime.now(timezone.utc).isoformat()
 
 
+def _seconds_between(start: str, end: str) -> Optional[float]:
+    """Return seconds between two ISO-8601 timestamps, or None if either is unparseable."""
+    try:
+        return round((datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds(), 3)
+    except (TypeError, ValueError):
+        return None
+
+
 class StateManager:
     """Manages switchover state for idempotent operations."""
 
-    def __init__(self, state_file: str = ".state/switchover-state.json"):
+    def __init__(self, state_file: str = ".state/switchover-state.json", journal: bool = False):
+        """
+        Args:
+            state_file: Path of the JSON state snapshot
+            journal: Append each change to ``<state_file>.journal`` and compact it into
+                the snapshot at phase boundaries, instead of rewriting the snapshot per change
+        """
         self.state_file = state_file
+        self._journal: Optional[StateJournal] = None
         self._dirty = False  # Track if state has pending writes
         self._active_temp_files: Set[str] = set()  # Track active temp files for cleanup
         self._flushing = False  # Track if we're currently flushing to avoid double-write
@@ -127,6 +149,7 @@ def __init__(self, state_file: str = ".state/switchover-state.json"):
         self._run_lock_path = os.path.realpath(self.state_file) + ".run.lock"
         self._run_lock_handle: Optional[Any] = None
         self._retry_error_baseline: Optional[Dict[str, Any]] = None
+        self._phase_started: Optional[float] = None  # monotonic start of the phase opened by this process
         # Register atexit handlers to flush pending state, clean up temp files,
         # and release the lifetime run lock on process exit.
         atexit.register(self._release_run_lock)
@@ -151,6 +174,10 @@ def signal_handler(signum: int, frame: Any) -> None:
                     # This is expected in test environments or when StateManager is used in workers
                     logging.debug("Cannot register signal handler for %s (not in main thread)", sig)
             self.state = self._load_state()
+            if journal:
+                self._journal = StateJournal(
+                    journal_path_for(self.state_file), last_seq=self.state.get("journal_seq", 0)
+                )
         except Exception:
             self._release_run_lock()
             raise
@@ -228,6 +255,7 @@ def _load_state(self) -> Dict[str, Any]:
         that would risk replaying mutations that were already applied to a real hub.
         """
         if not os.path.exists(self.state_file):
+            self._discard_orphan_journal()
             state = self._new_state()
             self._write_state(state)
             return state
@@ -236,7 +264,6 @@ def _load_state(self) -> Dict[str, Any]:
             with open(self.state_file, "r", encoding="utf-8") as f:
                 state = json.load(f)
                 self._validate_loaded_state(state)
-                return state
         except json.JSONDecodeError as e:
             corrupt_path = self._preserve_corrupt_state_file()
             raise StateLoadError(
@@ -252,6 +279,39 @@ def _load_state(self) -> Dict[str, Any]:
                 "Check file permissions. To start a fresh switchover, use --reset-state."
             ) from e
 
+        self._fold_journal(state)
+        return state
+
+    def _fold_journal(self, state: Dict[str, Any]) -> None:
+        """Replay a journal left by a previous run into ``state`` and persist the result.
+
+        The journal is removed afterwards, so every run starts from a plain snapshot
+        whether or not it uses journal mode itself.
+        """
+        journal_file = journal_path_for(self.state_file)
+        if not os.path.exists(journal_file):
+            return
+        try:
+            applied = replay(state, read_journal(journal_file))
+        except (OSError, ValueError, KeyError) as e:
+            raise StateLoadError(
+                f"State journal cannot be replayed: {journal_file}\n"
+                f"Error: {e}\n"
+                f"The snapshot {self.state_file} is unchanged. Review the journal, then remove it "
+                "to continue from the snapshot or use --reset-state."
+            ) from e
+        if applied:
+            logging.getLogger("acm_switchover").debug("Replayed %d state journal record(s)", applied)
+            self._write_state(state)
+        os.remove(journal_file)
+
+    def _discard_orphan_journal(self) -> None:
+        """Remove a journal whose snapshot no longer exists (e.g. after --reset-state)."""
+        journal_file = journal_path_for(self.state_file)
+        if os.path.exists(journal_file):
+            logging.getLogger("acm_switchover").warning("Discarding state journal without a snapshot: %s", journal_file)
+            os.remove(journal_file)
+
     def _validate_loaded_state(self, state: Any) -> None:
         """Validate persisted state before the workflow consumes it."""
         if not isinstance(state, dict):
@@ -305,6 +365,7 @@ def _new_state(self) -> Dict[str, Any]:
             "created_at": _utc_timestamp(),
             "current_phase": Phase.INIT.value,
             "completed_steps": [],
+            "phase_timings": [],
             "config": {},
             "errors": [],
             "last_updated": _utc_timestamp(),
@@ -387,7 +448,7 @@ def _do_flush(self, force: bool = False, suppress_errors: bool = False) -> bool:
         """
         if self._flushing:
             return False
-        if not force and not self._dirty:
+        if not force and not self._dirty and not (self._journal and self._journal.pending):
             return False
 
         self._flushing = True
@@ -395,19 +456,42 @@ def _do_flush(self, force: bool = False, suppress_errors: bool = False) -> bool:
         try:
             if suppress_errors:
                 try:
-                    self._write_state(self.state)
+                    self._write_snapshot()
                 except Exception as e:
                     import sys
 
                     print(f"Error flushing state: {e}", file=sys.stderr)
                     return False
             else:
-                self._write_state(self.state)
+                self._write_snapshot()
             self._dirty = False
             return True
         finally:
             self._flushing = False
 
+    def _write_snapshot(self) -> None:
+        """Write the full state and, in journal mode, drop the records it now contains."""
+        self._write_state(self.state)
+        if self._journal is not None:
+            self._journal.truncate()
+
+    def _persist_change(self, record: Dict[str, Any], critical: bool = False) -> None:
+        """Persist one already-applied change.
+
+        Journal mode appends ``record`` durably; otherwise the snapshot is rewritten
+        (forced for critical checkpoints).
+        """
+        if self._journal is not None:
+            timestamp = _utc_timestamp()
+            self.state["journal_seq"] = self._journal.append({**record, "ts": timestamp})
+            self.state["last_updated"] = timestamp
+            return
+        self._dirty = True
+        if critical:
+            self.flush_state()
+        else:
+            self.save_state()
+
     def save_state(self) -> None:
         """Persist current state to disk if dirty."""
         self._do_flush(force=False)
@@ -417,20 +501,59 @@ def flush_state(self) -> None:
         self._do_flush(force=True)
 
     def set_phase(self, phase: Phase) -> None:
-        """Update current phase."""
+        """Update current phase and record when the previous one ended."""
         self.state["current_phase"] = phase.value
+        self._record_phase_transition(phase)
         self.flush_state()  # Phase transitions are critical checkpoints
 
-    def capture_runtime_checkpoint(self) -> Dict[str, Optional[str]]:
+    def _record_phase_transition(self, phase: Phase) -> None:
+        """Close the open ``phase_timings`` entry and open one for ``phase``.
+
+        An entry left open by an earlier, interrupted run is closed at its last
+        completed step (or its start) and flagged ``interrupted`` so the time the
+        process was not running is not counted against the phase.
+        """
+        timings = self.state.setdefault("phase_timings", [])
+        if self._phase_started is not None and timings and timings[-1].get("phase") == phase.value:
+            return  # Re-entering the phase this process already has open
+        now = _utc_timestamp()
+        if timings and "ended_at" not in timings[-1]:
+            entry = timings[-1]
+            if self._phase_started is not None:
+                entry["ended_at"] = now
+                entry["duration_seconds"] = round(time.monotonic() - self._phase_started, 3)
+            else:
+                step_times = [
+                    s["timestamp"]
+                    for s in self.state.get("completed_steps", [])
+                    if s.get("timestamp", "") >= entry.get("started_at", "")
+                ]
+                entry["ended_at"] = max(step_times, default=entry.get("started_at", now))
+                entry["duration_seconds"] = _seconds_between(entry.get("started_at", ""), entry["ended_at"])
+                entry["interrupted"] = True
+
+        self._phase_started = None
+        if phase not in _TERMINAL_PHASES:
+            timings.append({"phase": phase.value, "started_at": now})
+            self._phase_started = time.monotonic()
+
+    def get_phase_timings(self) -> List[Dict[str, Any]]:
+        """Return recorded phase timings in transition order."""
+        return self.state.get("phase_timings", [])
+
+    def capture_runtime_checkpoint(self) -> Dict[str, Any]:
         """Capture the durable state fields that validate-only must preserve."""
         return {
             "current_phase": self.state.get("current_phase", Phase.INIT.value),
             "last_updated": self.state.get("last_updated"),
+            "phase_timings": [dict(entry) for entry in self.state.get("phase_timings", [])],
         }
 
-    def restore_runtime_checkpoint(self, checkpoint: Dict[str, Optional[str]]) -> None:
+    def restore_runtime_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
         """Restore a previously captured runtime checkpoint without touching other state."""
         self.state["current_phase"] = checkpoint.get("current_phase", Phase.INIT.value)
+        self.state["phase_timings"] = checkpoint.get("phase_timings", [])
+        self._phase_started = None
 
         last_updated = checkpoint.get("last_updated")
         if last_updated is None:
@@ -441,14 +564,29 @@ def restore_runtime_checkpoint(self, checkpoint: Dict[str, Optional[str]]) -> No
         # Write directly (not via _do_flush) to preserve the checkpoint's
         # original last_updated timestamp instead of stamping a new one.
         self._dirty = False
-        self._write_state(self.state)
+        self._write_snapshot()
 
-    def mark_step_completed(self, step_name: str) -> None:
-        """Mark a step as completed."""
+    def mark_step_completed(
+        self,
+        step_name: str,
+        started_at: Optional[str] = None,
+        duration_seconds: Optional[float] = None,
+    ) -> None:
+        """Mark a step as completed.
+
+        Args:
+            step_name: Unique identifier for the step
+            started_at: ISO-8601 UTC time the step started (recorded by ``step()``)
+            duration_seconds: Wall-clock duration of the step
+        """
         if not self.is_step_completed(step_name):
-            self.state["completed_steps"].append({"name": step_name, "timestamp": _utc_timestamp()})
-            self._dirty = True
-            self.save_state()
+            entry: Dict[str, Any] = {"name": step_name, "timestamp": _utc_timestamp()}
+            if started_at is not None:
+                entry["started_at"] = started_at
+            if duration_seconds is not None:
+                entry["duration_seconds"] = round(duration_seconds, 3)
+            self.state["completed_steps"].append(entry)
+            self._persist_change({"op": "append", "field": "completed_steps", "value": entry})
 
     def is_step_completed(self, step_name: str) -> bool:
         """Check if a step was already completed."""
@@ -470,6 +608,7 @@ def step(self, step_name: str, logger: Optional[logging.Logger] = None) -> "Step
         - If completed, logs "Step already completed: {step_name}" and sets should_run=False
         - If not completed, sets should_run=True and marks the step completed on exit
         - Only marks the step completed if no exception was raised
+        - Records the step's start time and duration alongside the completion
 
         Args:
             step_name: Unique identifier for the step
@@ -485,8 +624,7 @@ def set_config(self, key: str, value: Any) -> None:
         if self.state["config"].get(key) == value:
             return
         self.state["config"][key] = value
-        self._dirty = True
-        self.save_state()
+        self._persist_change({"op": "config", "key": key, "value": value})
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """Retrieve configuration value."""
@@ -494,14 +632,13 @@ def get_config(self, key: str, default: Any = None) -> Any:
 
     def add_error(self, error: str, phase: Optional[str] = None) -> None:
         """Record an error."""
-        self.state["errors"].append(
-            {
-                "error": error,
-                "phase": phase or self.state["current_phase"],
-                "timestamp": _utc_timestamp(),
-            }
-        )
-        self.flush_state()  # Errors are critical checkpoints
+        entry = {
+            "error": error,
+            "phase": phase or self.state["current_phase"],
+            "timestamp": _utc_timestamp(),
+        }
+        self.state["errors"].append(entry)
+        self._persist_change({"op": "append", "field": "errors", "value": entry}, critical=True)
 
     def get_errors(self) -> list:
         """Retrieve list of recorded errors."""
@@ -663,6 +800,8 @@ def __init__(
         self._step_name = step_name
         self._logger = logger
         self._should_run = False
+        self._started_at: Optional[str] = None
+        self._started: float = 0.0
 
     def __enter__(self) -> bool:
         """Check if step should run.
@@ -676,6 +815,8 @@ def __enter__(self) -> bool:
             self._should_run = False
         else:
             self._should_run = True
+            self._started_at = _utc_timestamp()
+            self._started = time.monotonic()
         return self._should_run
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> Literal[False]:
@@ -684,7 +825,11 @@ def __exit__(self, exc_type, exc_val, exc_tb) -> Literal[False]:
         # 1. The step was supposed to run (_should_run is True)
         # 2. No exception occurred (exc_type is None)
         if self._should_run and exc_type is None:
-            self._state.mark_step_completed(self._step_name)
+            self._state.mark_step_completed(
+                self._step_name,
+                started_at=self._started_at,
+                duration_seconds=time.monotonic() - self._started,
+            )
         # Don't suppress exceptions
         return False
 
@@ -793,6 +938,33 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.1f}h"
 
 
+def atomic_write_json(
+    path: str, payload: Any, mode: int = stat.S_IRUSR | stat.S_IWUSR, indent: Optional[int] = None
+) -> None:
+    """
+    Write ``payload`` as JSON to ``path`` atomically.
+
+    The JSON goes to a temporary file in the same directory, created with
+    ``mode`` (owner read/write by default) and renamed over ``path``, so
+    readers never see a partial file. Missing parent directories are created.
+
+    Raises:
+        OSError: If the directory or file cannot be written
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            os.fchmod(handle.fileno(), mode)
+            json.dump(payload, handle, indent=indent)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def confirm_action(prompt: str, default: bool = False) -> bool:
     """
     Prompt user for confirmation.
@@ -379,6 +379,28 @@ def validate_all_cli_args(args: object) -> None:  # noqa: C901
             if args.min_managed_clusters < 0:
                 raise ValidationError("--min-managed-clusters must be a non-negative integer")
 
+        # Validate client-side API throttling
+        api_qps = getattr(args, "api_qps", None)
+        if api_qps is not None:
+            if not isinstance(api_qps, (int, float)) or api_qps < 0:
+                raise ValidationError("--api-qps must be a non-negative number")
+        api_burst = getattr(args, "api_burst", None)
+        if api_burst is not None:
+            if not isinstance(api_burst, int) or api_burst < 1:
+                raise ValidationError("--api-burst must be a positive integer")
+        rbac_cache_ttl = getattr(args, "rbac_cache_ttl", None)
+        if rbac_cache_ttl is not None:
+            if not isinstance(rbac_cache_ttl, int) or rbac_cache_ttl < 0:
+                raise ValidationError("--rbac-cache-ttl must be a non-negative integer")
+        argocd_discovery_cache_ttl = getattr(args, "argocd_discovery_cache_ttl", None)
+        if argocd_discovery_cache_ttl is not None:
+            if not isinstance(argocd_discovery_cache_ttl, int) or argocd_discovery_cache_ttl < 0:
+                raise ValidationError("--argocd-discovery-cache-ttl must be a non-negative integer")
+        klusterlet_verify_budget = getattr(args, "klusterlet_verify_budget", None)
+        if klusterlet_verify_budget is not None:
+            if not isinstance(klusterlet_verify_budget, int) or klusterlet_verify_budget < 0:
+                raise ValidationError("--klusterlet-verify-budget must be a non-negative integer")
+
         is_decommission = hasattr(args, "decommission") and args.decommission
         is_setup = hasattr(args, "setup") and args.setup
         has_argocd_manage = hasattr(args, "argocd_manage") and args.argocd_manage
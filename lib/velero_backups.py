@@ -0,0 +1,118 @@
+"""Queries for the Velero Backups written by ACM's BackupSchedule.
+
+Backup namespaces with long retention hold thousands of Velero Backups, most
+of them irrelevant to a given check. ``list_acm_backups`` pushes the
+``backup-schedule-type`` label selector to the apiserver, so only ACM backups
+are returned, and can request metadata only. The ACM backup-name fallback for
+backups missing that label is applied to a second, metadata-only query for
+the backups without a recognised label value, and only its matches are
+fetched in full.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from lib.constants import (
+    ACM_BACKUP_NAME_RE,
+    ACM_BACKUP_SCHEDULE_TYPE_LABEL,
+    ACM_BACKUP_SCHEDULE_TYPES,
+    BACKUP_NAMESPACE,
+)
+from lib.kube_client import KubeClient
+
+logger = logging.getLogger("acm_switchover")
+
+# Name prefix of each ACM backup schedule type (see ACM_BACKUP_NAME_RE)
+_NAME_PREFIX_TYPES = {
+    "managed-clusters": "managedClusters",
+    "credentials": "credentials",
+    "resources": "resources",
+}
+
+
+def acm_backup_selector(schedule_types: Iterable[str] = ACM_BACKUP_SCHEDULE_TYPES, negate: bool = False) -> str:
+    """Return a label selector matching (or, with ``negate``, excluding) the given schedule types.
+
+    The negated selector also matches backups that have no schedule-type label.
+    """
+    operator = "notin" if negate else "in"
+    return f"{ACM_BACKUP_SCHEDULE_TYPE_LABEL} {operator} ({','.join(sorted(schedule_types))})"
+
+
+def acm_backup_ownership_signal(backup: Dict) -> Optional[str]:
+    """Return the ownership signal proving a Velero backup is ACM-owned.
+
+    Preferred signal is the ACM backup-schedule-type label. As a hardened
+    fallback, accept the well-known ACM backup naming convention if the
+    label is missing.
+    """
+    labels = backup.get("metadata", {}).get("labels", {}) or {}
+    label_value = labels.get(ACM_BACKUP_SCHEDULE_TYPE_LABEL)
+    if label_value in ACM_BACKUP_SCHEDULE_TYPES:
+        return "label"
+
+    backup_name = backup.get("metadata", {}).get("name", "")
+    if ACM_BACKUP_NAME_RE.match(backup_name):
+        return "name-pattern"
+
+    return None
+
+
+def _name_pattern_type(backup: Dict) -> Optional[str]:
+    match = ACM_BACKUP_NAME_RE.match(backup.get("metadata", {}).get("name", ""))
+    return _NAME_PREFIX_TYPES.get(match.group(1)) if match else None
+
+
+def list_acm_backups(
+    client: KubeClient,
+    namespace: str = BACKUP_NAMESPACE,
+    metadata_only: bool = False,
+    schedule_types: Iterable[str] = ACM_BACKUP_SCHEDULE_TYPES,
+    name_fallback: bool = True,
+) -> List[Dict]:
+    """
+    List the ACM-owned Velero Backups of the given schedule types.
+
+    Args:
+        client: KubeClient for the hub
+        namespace: Backup namespace
+        metadata_only: Return metadata only (no spec or status)
+        schedule_types: ACM backup schedule types to include
+        name_fallback: Also accept unlabelled backups whose name follows the ACM
+            naming convention; a warning is logged for each
+
+    Returns:
+        Labelled backups first (in list order), then name-pattern matches
+
+    Raises:
+        ApiException: If a list or get fails
+    """
+    schedule_types = frozenset(schedule_types)
+    list_kwargs: Dict[str, Any] = {"group": "velero.io", "version": "v1", "plural": "backups", "namespace": namespace}
+    if metadata_only:
+        backups = list(client.list_metadata(label_selector=acm_backup_selector(schedule_types), **list_kwargs))
+    else:
+        backups = list(client.iter_custom_resources(label_selector=acm_backup_selector(schedule_types), **list_kwargs))
+    if not name_fallback:
+        return backups
+
+    for candidate in client.list_metadata(
+        label_selector=acm_backup_selector(schedule_types, negate=True), **list_kwargs
+    ):
+        labels = candidate.get("metadata", {}).get("labels", {}) or {}
+        if labels.get(ACM_BACKUP_SCHEDULE_TYPE_LABEL) in ACM_BACKUP_SCHEDULE_TYPES:
+            continue  # labelled as another schedule type
+        if _name_pattern_type(candidate) not in schedule_types:
+            continue
+        backup_name = candidate.get("metadata", {}).get("name", "unknown")
+        logger.warning(
+            "Backup %s is missing ACM ownership label %s; accepting ACM name-pattern fallback",
+            backup_name,
+            ACM_BACKUP_SCHEDULE_TYPE_LABEL,
+        )
+        if not metadata_only:
+            candidate = client.get_custom_resource(name=backup_name, **list_kwargs)
+            if not candidate:
+                continue
+        backups.append(candidate)
+    return backups
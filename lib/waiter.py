@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from typing import Callable, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from kubernetes import watch as kube_watch
+from kubernetes.client.rest import ApiException
+
+from lib.constants import WATCH_RECONNECT_BACKOFF, WATCH_SETTLE_SECONDS, WATCH_UNAVAILABLE_STATUSES
+from lib.kube_client import is_retryable_error
+
+if TYPE_CHECKING:
+    from lib.kube_client import KubeClient
 
 ConditionFn = Callable[[], Tuple[bool, str]]
 
+module_logger = logging.getLogger("acm_switchover")
+_WATCH_CHANGE_EVENTS = frozenset({"ADDED", "MODIFIED", "DELETED"})
+
 
 def _sanitize_detail(detail: str, max_length: int = 256) -> str:
     """Sanitize a condition detail string for logging.
@@ -26,6 +39,148 @@ def _sanitize_detail(detail: str, max_length: int = 256) -> str:
     return safe
 
 
+class ResourceWatch:
+    """Background watch that wakes a waiter when a resource changes.
+
+    The watch stream runs in a daemon thread and resumes from the last
+    observed resourceVersion whenever the server closes it. If the apiserver
+    rejects the watch (e.g. the identity lacks the ``watch`` verb) the watch
+    marks itself unavailable and callers fall back to plain interval sleeps.
+    """
+
+    def __init__(
+        self,
+        client: "KubeClient",
+        group: str,
+        version: str,
+        plural: str,
+        *,
+        namespace: Optional[str] = None,
+        name: Optional[str] = None,
+        label_selector: Optional[str] = None,
+        settle_seconds: float = WATCH_SETTLE_SECONDS,
+    ) -> None:
+        self._client = client
+        self._group = group
+        self._version = version
+        self._plural = plural
+        self._namespace = namespace
+        self._name = name
+        self._label_selector = label_selector
+        self._settle_seconds = settle_seconds
+        self._changed = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher: Optional[kube_watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+        self._resource_version: Optional[str] = None
+        self.unavailable_reason: Optional[str] = None
+
+    @property
+    def description(self) -> str:
+        target = self._plural if not self._name else f"{self._plural}/{self._name}"
+        return f"{target} in {self._namespace}" if self._namespace else target
+
+    @property
+    def active(self) -> bool:
+        """True while the watch stream is usable for wake-ups."""
+        return self._thread is not None and self.unavailable_reason is None and not self._stopped.is_set()
+
+    def start(self) -> bool:
+        """Start the background watch; return False when watches are disabled."""
+        if self._thread is not None:
+            return self.active
+        if getattr(self._client, "watch_enabled", False) is not True:
+            self.unavailable_reason = "watches disabled for this client"
+            return False
+
+        self._watcher = kube_watch.Watch()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"watch-{self._plural}",
+            daemon=True,
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop the watch stream and release any waiter."""
+        self._stopped.set()
+        self._changed.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Block up to ``timeout`` seconds; return True if a change was observed.
+
+        Bursts of events (e.g. many ManagedClusters being deleted) are
+        coalesced by waiting ``settle_seconds`` for the stream to go quiet,
+        bounded by the original timeout.
+        """
+        deadline = time.monotonic() + timeout
+        if not self._changed.wait(timeout):
+            return False
+        while self._settle_seconds > 0 and self.active:
+            self._changed.clear()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._changed.wait(min(self._settle_seconds, remaining)):
+                break
+        self._changed.clear()
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                for event in self._client.watch_custom_resources(
+                    group=self._group,
+                    version=self._version,
+                    plural=self._plural,
+                    namespace=self._namespace,
+                    name=self._name,
+                    label_selector=self._label_selector,
+                    resource_version=self._resource_version,
+                    watcher=self._watcher,
+                ):
+                    if self._stopped.is_set():
+                        return
+                    self._handle_event(event)
+            except ApiException as e:
+                if self._stopped.is_set():
+                    return
+                if e.status == 410:
+                    # resourceVersion expired: restart from the current state and
+                    # let the waiter re-check in case a change was missed.
+                    self._resource_version = None
+                    self._changed.set()
+                    continue
+                if e.status in WATCH_UNAVAILABLE_STATUSES or not is_retryable_error(e):
+                    self._disable(f"watch rejected: {e.status} {e.reason}")
+                    return
+                module_logger.debug("Watch on %s interrupted: %s; reconnecting", self.description, e)
+                self._stopped.wait(WATCH_RECONNECT_BACKOFF)
+            except Exception as e:  # pylint: disable=broad-except
+                if self._stopped.is_set():
+                    return
+                if not is_retryable_error(e):
+                    self._disable(f"watch failed: {e}")
+                    return
+                module_logger.debug("Watch on %s interrupted: %s; reconnecting", self.description, e)
+                self._stopped.wait(WATCH_RECONNECT_BACKOFF)
+
+    def _handle_event(self, event: Dict[str, Any]) -> None:
+        obj = event.get("raw_object") or event.get("object")
+        if isinstance(obj, dict):
+            resource_version = (obj.get("metadata") or {}).get("resourceVersion")
+            if resource_version:
+                self._resource_version = resource_version
+        if event.get("type") in _WATCH_CHANGE_EVENTS:
+            self._changed.set()
+
+    def _disable(self, reason: str) -> None:
+        self.unavailable_reason = reason
+        module_logger.info("Watch on %s unavailable (%s); falling back to polling", self.description, reason)
+        self._changed.set()
+
+
 def wait_for_condition(
     description: str,
     condition_fn: ConditionFn,
@@ -36,12 +191,50 @@ def wait_for_condition(
     fast_timeout: int = 0,
     allow_success_after_timeout: bool = False,
     logger: logging.Logger,
+    watch: Optional[ResourceWatch] = None,
 ) -> bool:
-    """Poll until a condition succeeds or timeout expires."""
+    """Poll until a condition succeeds or timeout expires.
+
+    When ``watch`` is given, the condition is re-evaluated as soon as the
+    watched resource changes; ``interval`` then only acts as a resync period.
+    """
 
     start_time = time.time()
     logger.info("Waiting for %s (timeout: %ss)...", description, timeout)
 
+    if watch is not None and watch.start():
+        logger.debug("Watching %s for changes", watch.description)
+    try:
+        return _wait_loop(
+            description,
+            condition_fn,
+            start_time=start_time,
+            timeout=timeout,
+            interval=interval,
+            fast_interval=fast_interval,
+            fast_timeout=fast_timeout,
+            allow_success_after_timeout=allow_success_after_timeout,
+            logger=logger,
+            watch=watch,
+        )
+    finally:
+        if watch is not None:
+            watch.stop()
+
+
+def _wait_loop(
+    description: str,
+    condition_fn: ConditionFn,
+    *,
+    start_time: float,
+    timeout: int,
+    interval: int,
+    fast_interval: Optional[int],
+    fast_timeout: int,
+    allow_success_after_timeout: bool,
+    logger: logging.Logger,
+    watch: Optional[ResourceWatch],
+) -> bool:
     while time.time() - start_time < timeout:
         done, detail = condition_fn()
         safe_detail = _sanitize_detail(detail)
@@ -63,7 +256,10 @@ def wait_for_condition(
         if fast_interval:
             if fast_timeout <= 0 or elapsed < fast_timeout:
                 sleep_interval = fast_interval
-        time.sleep(sleep_interval)
+        if watch is not None and watch.active:
+            watch.wait_for_change(sleep_interval)
+        else:
+            time.sleep(sleep_interval)
 
     if allow_success_after_timeout:
         done, detail = condition_fn()
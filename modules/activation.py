@@ -4,12 +4,14 @@
 
 # Runbook: Step 4-5 (Method 1) / F4-F5 (Method 2)
 
+import functools
 import logging
 import time
 from typing import Dict, Optional
 
 from kubernetes.client.rest import ApiException
 
+from lib.bulk import run_bulk
 from lib.constants import (
     AUTO_IMPORT_STRATEGY_DEFAULT,
     AUTO_IMPORT_STRATEGY_KEY,
@@ -39,7 +41,7 @@
 from lib.gitops_detector import safe_record_gitops_markers
 from lib.kube_client import KubeClient
 from lib.utils import StateManager, is_acm_version_ge
-from lib.waiter import wait_for_condition
+from lib.waiter import ResourceWatch, wait_for_condition
 
 from .restore_discovery import find_passive_sync_restore
 
@@ -417,11 +419,23 @@ def _poll_restore_deletion():
             fast_interval=RESTORE_FAST_POLL_INTERVAL,
             fast_timeout=RESTORE_FAST_POLL_TIMEOUT,
             logger=logger,
+            watch=self._restore_watch(restore_name),
         )
 
         if not completed:
             raise FatalError(f"Timeout waiting for restore {restore_name} to be deleted after {timeout}s")
 
+    def _restore_watch(self, restore_name: str) -> ResourceWatch:
+        """Build a watch that wakes restore waits when the named ACM restore changes."""
+        return ResourceWatch(
+            self.secondary,
+            group="cluster.open-cluster-management.io",
+            version="v1beta1",
+            plural="restores",
+            namespace=BACKUP_NAMESPACE,
+            name=restore_name,
+        )
+
     def _get_restore_or_raise(self, restore_name: str) -> Dict:
         """Fetch restore resource or raise a fatal error if missing."""
         restore = self.secondary.get_custom_resource(
@@ -588,7 +602,7 @@ def _maybe_set_auto_import_strategy(self) -> None:
             if not is_acm_version_ge(version, "2.14.0"):
                 return
             # Count non-local clusters
-            mcs = self.secondary.list_custom_resources(
+            mcs = self.secondary.list_metadata(
                 group="cluster.open-cluster-management.io",
                 version="v1",
                 plural="managedclusters",
@@ -660,7 +674,7 @@ def _apply_immediate_import_annotations(self) -> None:
             )
             return
 
-        managed_clusters = self.secondary.list_custom_resources(
+        managed_clusters = self.secondary.list_metadata(
             group="cluster.open-cluster-management.io",
             version="v1",
             plural="managedclusters",
@@ -671,8 +685,7 @@ def _apply_immediate_import_annotations(self) -> None:
             logger.info("No non-local ManagedClusters found; skipping immediate-import annotations")
             return
 
-        updated = 0
-        failures = []
+        operations = []
         for mc in non_local_clusters:
             name = mc.get("metadata", {}).get("name")
             if not name:
@@ -681,10 +694,13 @@ def _apply_immediate_import_annotations(self) -> None:
             annotation_value = annotations.get(IMMEDIATE_IMPORT_ANNOTATION)
             if annotation_value == "":
                 continue
-            if self._reset_immediate_import_annotation(name, annotation_value):
-                updated += 1
-            else:
-                failures.append(name)
+            operations.append(
+                (name, functools.partial(self._reset_immediate_import_annotation, name, annotation_value))
+            )
+
+        result = run_bulk("immediate-import annotation", operations)
+        updated = len(result.succeeded)
+        failures = list(result.failed)
 
         if updated:
             logger.info("Applied immediate-import annotations to %s ManagedCluster(s)", updated)
@@ -866,6 +882,7 @@ def _poll_restore():
             fast_interval=RESTORE_FAST_POLL_INTERVAL,
             fast_timeout=RESTORE_FAST_POLL_TIMEOUT,
             logger=logger,
+            watch=self._restore_watch(restore_name),
         )
 
         if not completed:
@@ -947,6 +964,15 @@ def _poll_velero_restore():
             fast_interval=RESTORE_FAST_POLL_INTERVAL,
             fast_timeout=RESTORE_FAST_POLL_TIMEOUT,
             logger=logger,
+            # The Velero restore name is only known once the ACM restore reports it,
+            # so watch all Velero restores in the backup namespace.
+            watch=ResourceWatch(
+                self.secondary,
+                group="velero.io",
+                version="v1",
+                plural="restores",
+                namespace=BACKUP_NAMESPACE,
+            ),
         )
 
         if not completed:
@@ -964,7 +990,7 @@ def _verify_managed_clusters_restored(self):
         """
         logger.info("Verifying ManagedCluster resources were restored...")
 
-        managed_clusters = self.secondary.list_custom_resources(
+        managed_clusters = self.secondary.list_metadata(
             group="cluster.open-cluster-management.io",
             version="v1",
             plural="managedclusters",
@@ -4,8 +4,10 @@
 
 # Runbook: Step 14 (decommission) and Rollback references where applicable
 
+import functools
 import logging
 
+from lib.bulk import run_bulk
 from lib.constants import (
     ACM_NAMESPACE,
     ACM_OPERATOR_POD_PREFIX,
@@ -14,6 +16,7 @@
     DELETE_REQUEST_TIMEOUT,
     LOCAL_CLUSTER_NAME,
     MANAGED_CLUSTER_DELETE_INTERVAL,
+    MANAGED_CLUSTER_DELETE_SETTLE_SECONDS,
     MANAGED_CLUSTER_DELETE_TIMEOUT,
     OBSERVABILITY_NAMESPACE,
     OBSERVABILITY_TERMINATE_INTERVAL,
@@ -22,7 +25,7 @@
 from lib.exceptions import SwitchoverError
 from lib.kube_client import KubeClient
 from lib.utils import confirm_action
-from lib.waiter import wait_for_condition
+from lib.waiter import ResourceWatch, wait_for_condition
 
 logger = logging.getLogger("acm_switchover")
 
@@ -156,14 +159,11 @@ def _delete_managed_clusters(self):
         """Delete ManagedCluster resources (excluding local-cluster)."""
         logger.info("Deleting ManagedCluster resources...")
 
-        managed_clusters = self.primary.list_managed_clusters()
-
-        if not managed_clusters:
-            logger.info("No ManagedClusters found")
-            return
-
-        deleted_count = 0
-        for mc in managed_clusters:
+        # Stream page by page and keep only the names of clusters to delete
+        found_count = 0
+        to_delete = []
+        for mc in self.primary.iter_managed_clusters():
+            found_count += 1
             mc_name = mc.get("metadata", {}).get("name")
 
             # Skip local-cluster
@@ -173,25 +173,41 @@ def _delete_managed_clusters(self):
 
             if self.dry_run:
                 logger.info("[DRY-RUN] Would delete ManagedCluster: %s", mc_name)
-                deleted_count += 1
-                continue
-
-            logger.info("Deleting ManagedCluster: %s", mc_name)
-
-            self.primary.delete_custom_resource(
-                group="cluster.open-cluster-management.io",
-                version="v1",
-                plural="managedclusters",
-                name=mc_name,
-                timeout_seconds=DELETE_REQUEST_TIMEOUT,
-            )
+            else:
+                logger.info("Deleting ManagedCluster: %s", mc_name)
+            to_delete.append(mc_name)
 
-            deleted_count += 1
+        if not found_count:
+            logger.info("No ManagedClusters found")
+            return
 
         if self.dry_run:
+            deleted_count = len(to_delete)
             logger.info("[DRY-RUN] Would delete %s ManagedCluster(s)", deleted_count)
         else:
+            result = run_bulk(
+                "ManagedCluster deletion",
+                [
+                    (
+                        mc_name,
+                        functools.partial(
+                            self.primary.delete_custom_resource,
+                            group="cluster.open-cluster-management.io",
+                            version="v1",
+                            plural="managedclusters",
+                            name=mc_name,
+                            timeout_seconds=DELETE_REQUEST_TIMEOUT,
+                        ),
+                    )
+                    for mc_name in to_delete
+                ],
+            )
+            deleted_count = len(result.succeeded)
             logger.info("Deleted %s ManagedCluster(s)", deleted_count)
+            if not result.ok:
+                raise SwitchoverError(
+                    f"Failed to delete {len(result.failed)} ManagedCluster(s): {result.failure_summary()}"
+                )
 
         # Wait for ManagedClusters to be fully removed (finalizers to complete)
         # This is required before MCH deletion because the MCH admission webhook
@@ -200,7 +216,12 @@ def _delete_managed_clusters(self):
             logger.info("Waiting for ManagedCluster finalizers to complete...")
 
             def _managed_clusters_removed():
-                remaining = self.primary.list_managed_clusters()
+                # Only names are read, so skip spec and status of every remaining cluster
+                remaining = self.primary.list_metadata(
+                    group="cluster.open-cluster-management.io",
+                    version="v1",
+                    plural="managedclusters",
+                )
                 # Filter out local-cluster
                 non_local = [mc for mc in remaining if mc.get("metadata", {}).get("name") != LOCAL_CLUSTER_NAME]
                 if not non_local:
@@ -214,6 +235,13 @@ def _managed_clusters_removed():
                 timeout=MANAGED_CLUSTER_DELETE_TIMEOUT,
                 interval=MANAGED_CLUSTER_DELETE_INTERVAL,
                 logger=logger,
+                watch=ResourceWatch(
+                    self.primary,
+                    group="cluster.open-cluster-management.io",
+                    version="v1",
+                    plural="managedclusters",
+                    settle_seconds=MANAGED_CLUSTER_DELETE_SETTLE_SECONDS,
+                ),
             )
 
             if not success:
@@ -3,17 +3,17 @@
 # Runbook: Steps 11-12 (finalization) and Step 14 (old hub handling)
 
 import logging
+import re
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from kubernetes.client.rest import ApiException
 
 from lib import argocd as argocd_lib
 from lib.constants import (
-    ACM_BACKUP_NAME_RE,
     ACM_BACKUP_SCHEDULE_TYPE_LABEL,
-    ACM_BACKUP_SCHEDULE_TYPES,
     ACM_NAMESPACE,
     AUTO_IMPORT_STRATEGY_DEFAULT,
     AUTO_IMPORT_STRATEGY_KEY,
@@ -23,6 +23,7 @@
     BACKUP_POLL_INTERVAL,
     BACKUP_SCHEDULE_DEFAULT_NAME,
     BACKUP_SCHEDULE_DELETE_WAIT,
+    BACKUP_SCHEDULE_WAKE_LEAD,
     BACKUP_VERIFY_TIMEOUT,
     CLEANUP_BEFORE_RESTORE_VALUE,
     DELETE_REQUEST_TIMEOUT,
@@ -35,24 +36,34 @@
     OBSERVABILITY_TERMINATE_INTERVAL,
     OBSERVABILITY_TERMINATE_TIMEOUT,
     OBSERVATORIUM_API_DEPLOYMENT,
+    OBSERVATORIUM_API_LABEL_SELECTOR,
     RESTORE_PASSIVE_SYNC_NAME,
     SPEC_SYNC_RESTORE_WITH_NEW_BACKUPS,
     SPEC_VELERO_MANAGED_CLUSTERS_BACKUP_NAME,
+    THANOS_COMPACTOR_LABEL_SELECTOR,
     THANOS_COMPACTOR_STATEFULSET,
     VELERO_BACKUP_LATEST,
     VELERO_BACKUP_SKIP,
+    VELERO_LOG_SCAN_MAX_WORKERS,
+    VELERO_LOG_SINCE_SLACK,
+    VELERO_LOG_TAIL_LINES,
 )
 from lib.exceptions import SwitchoverError, TransientError
 from lib.gitops_detector import safe_record_gitops_markers
 from lib.kube_client import KubeClient, is_retryable_error
+from lib.rollout import WorkloadRollout, track_rollouts
 from lib.utils import StateManager, dry_run_skip, is_acm_version_ge
-from lib.waiter import wait_for_condition
+from lib.velero_backups import acm_backup_ownership_signal, list_acm_backups
+from lib.waiter import ResourceWatch, wait_for_condition
 
 from .backup_schedule import BackupScheduleManager
 from .decommission import Decommission
 
 logger = logging.getLogger("acm_switchover")
 
+# (low, high) of the minute, hour, day-of-month, month and day-of-week cron fields
+_CRON_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
 
 class Finalization:
     """Handles finalization steps on secondary hub."""
@@ -89,47 +100,9 @@ def __init__(
         self._cached_schedules: Optional[List[Dict]] = None  # Cache for backup schedules
 
     @staticmethod
-    def _get_acm_backup_ownership_signal(backup: Dict) -> Optional[str]:
-        """Return the ownership signal proving a Velero backup is ACM-owned.
-
-        Preferred signal is the ACM backup-schedule-type label. As a hardened
-        fallback, accept the well-known ACM backup naming convention if the
-        label is missing.
-        """
-        labels = backup.get("metadata", {}).get("labels", {}) or {}
-        label_value = labels.get(ACM_BACKUP_SCHEDULE_TYPE_LABEL)
-        if label_value in ACM_BACKUP_SCHEDULE_TYPES:
-            return "label"
-
-        backup_name = backup.get("metadata", {}).get("name", "")
-        if ACM_BACKUP_NAME_RE.match(backup_name):
-            return "name-pattern"
-
-        return None
-
-    def _is_acm_owned_backup(self, backup: Dict) -> bool:
+    def _is_acm_owned_backup(backup: Dict) -> bool:
         """Return True when the backup has a recognized ACM ownership signal."""
-        return self._get_acm_backup_ownership_signal(backup) is not None
-
-    def _filter_acm_owned_backups(self, backups: List[Dict]) -> List[Dict]:
-        """Filter Velero backups down to ACM-owned backups only.
-
-        Warn when the label is missing but a known ACM backup name pattern is
-        used as the fallback ownership signal.
-        """
-        acm_backups = []
-        for backup in backups:
-            signal = self._get_acm_backup_ownership_signal(backup)
-            if signal == "name-pattern":
-                backup_name = backup.get("metadata", {}).get("name", "unknown")
-                logger.warning(
-                    "Backup %s is missing ACM ownership label %s; accepting ACM name-pattern fallback",
-                    backup_name,
-                    ACM_BACKUP_SCHEDULE_TYPE_LABEL,
-                )
-            if signal:
-                acm_backups.append(backup)
-        return acm_backups
+        return acm_backup_ownership_signal(backup) is not None
 
     @staticmethod
     def _backup_is_detectable(backup: Dict) -> bool:
@@ -449,14 +422,65 @@ def _verify_new_backups(self, timeout: int = BACKUP_VERIFY_TIMEOUT):
         logger.info("Found %s existing backup(s)", len(initial_backups))
         logger.info("Waiting for new backup to appear (timeout: %ss)...", timeout)
 
+        # Wake as soon as an ACM backup is created or changes; the poll interval is only the resync period
+        backup_watch = ResourceWatch(
+            self.secondary,
+            group="velero.io",
+            version="v1",
+            plural="backups",
+            namespace=BACKUP_NAMESPACE,
+            label_selector=ACM_BACKUP_SCHEDULE_TYPE_LABEL,
+        )
+        backup_watch.start()
+        try:
+            self._wait_for_new_backup(backup_watch, initial_backup_names, enabled_at, timeout)
+        finally:
+            backup_watch.stop()
+
+    def _wait_for_new_backup(
+        self,
+        backup_watch: ResourceWatch,
+        initial_backup_names: set,
+        enabled_at: Optional[datetime],
+        timeout: int,
+    ) -> None:
+        """Wait for an ACM backup that is not in ``initial_backup_names`` and record it.
+
+        When the backup watch is active and the next scheduled run can be
+        derived from the BackupSchedule cron expression, backups are not listed
+        until shortly before it; a watch event (for example Velero's immediate
+        backup of a new schedule) ends that idle period early. Without the
+        watch an early backup would go unnoticed, so backups are polled every
+        BACKUP_POLL_INTERVAL instead.
+        """
         start_time = time.time()
 
+        next_run = self._get_next_scheduled_backup_at(enabled_at) if backup_watch.active else None
+        if next_run is not None:
+            # Leave time for at least one check before the timeout
+            idle_seconds = (
+                min(
+                    (next_run - datetime.now(timezone.utc)).total_seconds(),
+                    timeout,
+                )
+                - BACKUP_SCHEDULE_WAKE_LEAD
+            )
+            if idle_seconds > 0:
+                logger.info(
+                    "Next scheduled backup expected at %s; checking again %ss before it",
+                    next_run.isoformat(),
+                    BACKUP_SCHEDULE_WAKE_LEAD,
+                )
+                if backup_watch.wait_for_change(idle_seconds):
+                    logger.debug("ACM backup change observed before the scheduled run")
+
         while time.time() - start_time < timeout:
             try:
-                current_backups = self._list_acm_owned_velero_backups()
+                # Names and labels are enough to spot a new backup; only new ones are fetched in full
+                current_backups = self._list_acm_owned_velero_backups(metadata_only=True)
             except TransientError as exc:
                 logger.warning("%s", exc)
-                time.sleep(BACKUP_POLL_INTERVAL)
+                self._wait_for_backup_change(backup_watch, BACKUP_POLL_INTERVAL)
                 continue
 
             current_backup_names = {b.get("metadata", {}).get("name") for b in current_backups}
@@ -469,9 +493,12 @@ def _verify_new_backups(self, timeout: int = BACKUP_VERIFY_TIMEOUT):
 
                 # Verify at least one is in progress or completed
                 for backup_name in new_backups:
-                    backup = next(
-                        (b for b in current_backups if b.get("metadata", {}).get("name") == backup_name),
-                        None,
+                    backup = self.secondary.get_custom_resource(
+                        group="velero.io",
+                        version="v1",
+                        plural="backups",
+                        name=backup_name,
+                        namespace=BACKUP_NAMESPACE,
                     )
 
                     if backup:
@@ -487,22 +514,41 @@ def _verify_new_backups(self, timeout: int = BACKUP_VERIFY_TIMEOUT):
 
             elapsed = int(time.time() - start_time)
             logger.debug("Waiting for new backup... (elapsed: %ss)", elapsed)
-            time.sleep(BACKUP_POLL_INTERVAL)
+            self._wait_for_backup_change(backup_watch, BACKUP_POLL_INTERVAL)
 
         raise SwitchoverError(
             f"No new backup created within {timeout}s after enabling BackupSchedule on new hub. "
             "Finalization cannot succeed without proof of backup continuity."
         )
 
-    def _list_acm_owned_velero_backups(self) -> List[Dict]:
-        """List Velero backups, filter to ACM-owned backups, and normalize API failures."""
+    @staticmethod
+    def _wait_for_backup_change(backup_watch: ResourceWatch, seconds: float) -> bool:
+        """Block until an ACM backup changes or ``seconds`` pass; return True on a change."""
+        if backup_watch.active:
+            return backup_watch.wait_for_change(seconds)
+        time.sleep(seconds)
+        return False
+
+    def _get_next_scheduled_backup_at(self, enabled_at: Optional[datetime]) -> Optional[datetime]:
+        """Return the first BackupSchedule cron run after the schedule was enabled, if it can be derived."""
+        if enabled_at is None:
+            return None
+        schedules = self._get_backup_schedules()
+        if not schedules:
+            return None
+        cron_expr = (schedules[0].get("spec", {}) or {}).get("veleroSchedule")
+        if not cron_expr:
+            return None
+        return self._next_cron_run(cron_expr, enabled_at)
+
+    def _list_acm_owned_velero_backups(self, metadata_only: bool = False) -> List[Dict]:
+        """List ACM-owned Velero backups and normalize API failures.
+
+        The ACM label selector is applied by the apiserver; see lib.velero_backups.
+        With metadata_only, the returned backups carry metadata but no status.
+        """
         try:
-            backups = self.secondary.list_custom_resources(
-                group="velero.io",
-                version="v1",
-                plural="backups",
-                namespace=BACKUP_NAMESPACE,
-            )
+            return list_acm_backups(self.secondary, metadata_only=metadata_only)
         except ApiException as exc:
             if is_retryable_error(exc):
                 raise TransientError(f"Transient error listing Velero backups: {exc}") from exc
@@ -510,8 +556,6 @@ def _list_acm_owned_velero_backups(self) -> List[Dict]:
                 "Failed to list Velero backups while waiting for a new ACM backup: " f"{exc.status} {exc.reason}"
             ) from exc
 
-        return self._filter_acm_owned_backups(backups)
-
     def _get_backup_verify_timeout(self) -> int:
         """Derive backup verification timeout from BackupSchedule cadence."""
         schedule_interval = self._get_backup_schedule_interval_seconds()
@@ -588,58 +632,120 @@ def _parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
             return None
 
     @staticmethod
-    def _parse_cron_interval_seconds(cron_expr: str) -> Optional[int]:
-        """Estimate cron schedule interval in seconds for common Velero patterns.
+    def _expand_cron_fields(cron_expr: str) -> Optional[List[set]]:
+        """Expand a 5-field cron expression into the sets of values each field matches.
 
-        This is a simplified parser that supports typical Velero-style expressions
-        such as '*/15 * * * *', '0 */4 * * *', or '0 0 * * *'. It does not handle
-        all valid cron syntax (lists like '1,15,30', ranges like '1-5', or complex
-        day-of-week/month combinations) and may return None or an approximate
-        interval for those cases.
+        Fields may be ``*``, numbers, ranges, lists and ``/step`` forms; day of
+        week 7 is folded onto Sunday (0). Returns None for anything else
+        (names, ``CRON_TZ=`` prefixes, macros).
         """
         fields = cron_expr.split()
         if len(fields) != 5:
             return None
 
-        minute, hour, dom, month, dow = fields
+        def _expand(field: str, low: int, high: int) -> set:
+            values: set = set()
+            for part in field.split(","):
+                base, _, step_text = part.partition("/")
+                step = int(step_text) if step_text else 1
+                if base == "*":
+                    start, end = low, high
+                elif "-" in base:
+                    start_text, _, end_text = base.partition("-")
+                    start, end = int(start_text), int(end_text)
+                else:
+                    start = int(base)
+                    end = high if step_text else start
+                if step <= 0 or start < low or end > high or start > end:
+                    raise ValueError(f"cron field out of range: {field}")
+                values.update(range(start, end + 1, step))
+            return values
 
-        def _parse_every(field: str) -> Optional[int]:
-            if field.startswith("*/"):
-                value = field[2:]
-                if value.isdigit():
-                    interval = int(value)
-                    if interval > 0:
-                        return interval
+        try:
+            expanded = [_expand(field, low, high) for field, (low, high) in zip(fields, _CRON_FIELD_RANGES)]
+        except ValueError:
             return None
+        expanded[4] = {day % 7 for day in expanded[4]}
+        return expanded
 
-        def _is_number(field: str) -> bool:
-            return field.isdigit()
+    @staticmethod
+    def _parse_cron_interval_seconds(cron_expr: str) -> Optional[int]:
+        """Return the longest gap between runs of a cron schedule, in seconds.
 
-        every_minute = _parse_every(minute)
-        if every_minute and hour == dom == month == dow == "*":
-            return every_minute * 60
+        Schedules that restrict the day of week repeat weekly, those that
+        restrict the day of month are treated as repeating every 31 days, and
+        the rest repeat daily. Returns None when the expression cannot be
+        expanded, restricts the month, or restricts both day fields.
+        """
+        expanded = Finalization._expand_cron_fields(cron_expr)
+        if expanded is None:
+            return None
 
-        every_hour = _parse_every(hour)
-        if every_hour and dom == month == dow == "*" and _is_number(minute):
-            return every_hour * 3600
+        minutes, hours, days, months, weekdays = expanded
+        dom_restricted = len(days) < 31
+        dow_restricted = len(weekdays) < 7
+        if len(months) < 12 or (dom_restricted and dow_restricted):
+            return None
 
-        every_day = _parse_every(dom)
-        if every_day and month == dow == "*" and _is_number(minute) and _is_number(hour):
-            return every_day * 86400
+        if dow_restricted:
+            period_days, run_days = 7, weekdays
+        elif dom_restricted:
+            period_days, run_days = 31, {day - 1 for day in days}
+        else:
+            period_days, run_days = 1, {0}
 
-        if dom == "*" and month == "*" and dow == "*" and _is_number(minute) and _is_number(hour):
-            return 86400
+        # Minutes into the period of every run; the last gap wraps into the next period
+        runs = sorted(day * 1440 + hour * 60 + minute for day in run_days for hour in hours for minute in minutes)
+        gaps = [later - earlier for earlier, later in zip(runs, runs[1:])]
+        gaps.append(runs[0] + period_days * 1440 - runs[-1])
+        return max(gaps) * 60
 
-        if dom == "*" and month == "*" and _is_number(minute) and _is_number(hour) and dow.isdigit():
-            return 7 * 86400
+    @staticmethod
+    def _next_cron_run(cron_expr: str, after: datetime) -> Optional[datetime]:
+        """Return the first time strictly after ``after`` matched by a 5-field cron expression.
 
-        if _is_number(minute) and _is_number(hour) and dom.isdigit() and month == "*" and dow == "*":
-            return 30 * 86400
+        The expression is evaluated in UTC, as Velero does by default. Returns
+        None when it cannot be expanded (see ``_expand_cron_fields``) or when
+        no run falls within a year.
+        """
+        expanded = Finalization._expand_cron_fields(cron_expr)
+        if expanded is None:
+            return None
 
+        minute_set, hour_set, days, months, weekdays = expanded
+        minutes = sorted(minute_set)
+        hours = sorted(hour_set)
+        fields = cron_expr.split()
+        dom_restricted = not fields[2].startswith("*")
+        dow_restricted = not fields[4].startswith("*")
+
+        after = after.astimezone(timezone.utc)
+        day = after.replace(hour=0, minute=0, second=0, microsecond=0)
+        for _ in range(366):
+            cron_weekday = (day.weekday() + 1) % 7  # cron counts from Sunday
+            dom_match = day.day in days
+            dow_match = cron_weekday in weekdays
+            if dom_restricted and dow_restricted:
+                day_match = dom_match or dow_match
+            else:
+                day_match = dom_match and dow_match
+            if day.month in months and day_match:
+                for hour in hours:
+                    for minute in minutes:
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate > after:
+                            return candidate
+            day += timedelta(days=1)
         return None
 
-    def _check_velero_logs_for_backup(self, backup_name: str, tail_lines: int = 2000) -> None:
-        """Scan recent Velero logs for errors related to a backup."""
+    def _check_velero_logs_for_backup(self, backup_name: str, started_at: Optional[datetime] = None) -> None:
+        """Scan Velero logs for errors related to a backup.
+
+        All Velero pods are read concurrently and their logs are streamed line
+        by line. When the backup's start time is known, only lines logged since
+        then (plus VELERO_LOG_SINCE_SLACK) are requested, however many there
+        are; otherwise the last VELERO_LOG_TAIL_LINES lines of each pod are read.
+        """
         try:
             velero_pods = self.secondary.get_pods(
                 namespace=BACKUP_NAMESPACE,
@@ -649,44 +755,52 @@ def _check_velero_logs_for_backup(self, backup_name: str, tail_lines: int = 2000
             logger.warning("Unable to list Velero pods for log inspection: %s", e)
             return
 
-        if not velero_pods:
+        pod_names = [pod.get("metadata", {}).get("name") for pod in velero_pods or []]
+        pod_names = [name for name in pod_names if name]
+        if not pod_names:
             logger.warning("No Velero pods found for log inspection")
             return
 
+        window: Dict[str, int] = {"tail_lines": VELERO_LOG_TAIL_LINES}
+        if started_at is not None:
+            since = int((datetime.now(timezone.utc) - started_at).total_seconds()) + VELERO_LOG_SINCE_SLACK
+            window = {"since_seconds": max(since, VELERO_LOG_SINCE_SLACK)}
+        # A line counts when it names the backup and mentions an error or failure
+        error_line = re.compile(rf"^(?=.*{re.escape(backup_name)})(?=.*(?i:error|failed))")
+
+        def _scan(pod_name: str) -> int:
+            return sum(
+                1
+                for line in self.secondary.iter_pod_log_lines(
+                    name=pod_name, namespace=BACKUP_NAMESPACE, container="velero", **window
+                )
+                if error_line.search(line)
+            )
+
+        with ThreadPoolExecutor(max_workers=min(len(pod_names), VELERO_LOG_SCAN_MAX_WORKERS)) as executor:
+            futures = [(pod_name, executor.submit(_scan, pod_name)) for pod_name in pod_names]
+
         error_hits = 0
-        for pod in velero_pods:
-            pod_name = pod.get("metadata", {}).get("name")
-            if not pod_name:
-                continue
+        for pod_name, future in futures:
             try:
-                logs = self.secondary.get_pod_logs(
-                    name=pod_name,
-                    namespace=BACKUP_NAMESPACE,
-                    container="velero",
-                    tail_lines=tail_lines,
-                )
+                hits = future.result()
             except Exception as e:
                 logger.warning("Unable to read Velero logs from %s: %s", pod_name, e)
                 continue
-
-            if not logs:
-                continue
-
-            lines = [line for line in logs.splitlines() if backup_name in line]
-            error_lines = [line for line in lines if "error" in line.lower() or "failed" in line.lower()]
-            if error_lines:
-                error_hits += len(error_lines)
+            if hits:
+                error_hits += hits
                 logger.warning(
                     "Velero logs from %s show %s error line(s) for backup %s",
                     pod_name,
-                    len(error_lines),
+                    hits,
                     backup_name,
                 )
 
         if error_hits == 0:
             logger.info(
-                "No Velero log errors found for backup %s (recent logs checked)",
+                "No Velero log errors found for backup %s (%s checked)",
                 backup_name,
+                "logs since the backup started" if started_at is not None else "recent logs",
             )
 
     @dry_run_skip(message="Skipping backup integrity verification")
@@ -847,7 +961,8 @@ def _poll_backup_completion() -> Tuple[bool, str]:
                     )
                 logger.info("Latest backup %s completed %ss ago", backup_name, age_seconds)
 
-        self._check_velero_logs_for_backup(backup_name)
+        started_at = self._parse_timestamp(status.get("startTimestamp") or creation_ts)
+        self._check_velero_logs_for_backup(backup_name, started_at=started_at)
 
     def _get_backup_schedules(self, force_refresh: bool = False) -> List[Dict]:
         """Get backup schedules with caching.
@@ -893,62 +1008,77 @@ def _verify_multiclusterhub_health(self, timeout: int = MCH_VERIFY_TIMEOUT, inte
         logger.info("Verifying MultiClusterHub health...")
         start = time.time()
 
-        while True:
-            try:
-                mch = self.secondary.get_custom_resource(
-                    group="operator.open-cluster-management.io",
-                    version="v1",
-                    plural="multiclusterhubs",
-                    name="multiclusterhub",
-                    namespace=ACM_NAMESPACE,
-                )
-            except ApiException as e:
-                if getattr(e, "status", None) == 404:
-                    mch = None
-                else:
-                    raise
+        # Re-check as soon as the MCH status changes; interval remains the resync period
+        mch_watch = ResourceWatch(
+            self.secondary,
+            group="operator.open-cluster-management.io",
+            version="v1",
+            plural="multiclusterhubs",
+            namespace=ACM_NAMESPACE,
+        )
+        mch_watch.start()
+        try:
+            while True:
+                try:
+                    mch = self.secondary.get_custom_resource(
+                        group="operator.open-cluster-management.io",
+                        version="v1",
+                        plural="multiclusterhubs",
+                        name="multiclusterhub",
+                        namespace=ACM_NAMESPACE,
+                    )
+                except ApiException as e:
+                    if getattr(e, "status", None) == 404:
+                        mch = None
+                    else:
+                        raise
+
+                if not mch:
+                    hubs = self.secondary.list_custom_resources(
+                        group="operator.open-cluster-management.io",
+                        version="v1",
+                        plural="multiclusterhubs",
+                        namespace=ACM_NAMESPACE,
+                    )
+                    if hubs:
+                        mch = hubs[0]
 
-            if not mch:
-                hubs = self.secondary.list_custom_resources(
-                    group="operator.open-cluster-management.io",
-                    version="v1",
-                    plural="multiclusterhubs",
-                    namespace=ACM_NAMESPACE,
-                )
-                if hubs:
-                    mch = hubs[0]
+                if not mch:
+                    raise SwitchoverError("No MultiClusterHub resource found on secondary hub")
 
-            if not mch:
-                raise SwitchoverError("No MultiClusterHub resource found on secondary hub")
+                mch_name = mch.get("metadata", {}).get("name", "multiclusterhub")
+                phase = mch.get("status", {}).get("phase", "unknown")
 
-            mch_name = mch.get("metadata", {}).get("name", "multiclusterhub")
-            phase = mch.get("status", {}).get("phase", "unknown")
+                pods = self.secondary.get_pods(namespace=ACM_NAMESPACE)
+                non_running = [
+                    pod.get("metadata", {}).get("name", "unknown")
+                    for pod in pods
+                    if pod.get("status", {}).get("phase") not in ("Running", "Succeeded")
+                ]
 
-            pods = self.secondary.get_pods(namespace=ACM_NAMESPACE)
-            non_running = [
-                pod.get("metadata", {}).get("name", "unknown")
-                for pod in pods
-                if pod.get("status", {}).get("phase") not in ("Running", "Succeeded")
-            ]
+                if phase == "Running" and not non_running:
+                    logger.info("MultiClusterHub %s is Running and all pods are healthy", mch_name)
+                    return
 
-            if phase == "Running" and not non_running:
-                logger.info("MultiClusterHub %s is Running and all pods are healthy", mch_name)
-                return
+                elapsed = time.time() - start
+                if elapsed >= timeout:
+                    details = ", non-running pods=" + (", ".join(non_running) if non_running else "none")
+                    raise SwitchoverError(
+                        f"MultiClusterHub {mch_name} not healthy after {timeout}s (phase={phase}{details})"
+                    )
 
-            elapsed = time.time() - start
-            if elapsed >= timeout:
-                details = ", non-running pods=" + (", ".join(non_running) if non_running else "none")
-                raise SwitchoverError(
-                    f"MultiClusterHub {mch_name} not healthy after {timeout}s (phase={phase}{details})"
+                logger.info(
+                    "Waiting for MultiClusterHub %s to become healthy (phase=%s, non-running pods=%s)...",
+                    mch_name,
+                    phase,
+                    ", ".join(non_running) if non_running else "none",
                 )
-
-            logger.info(
-                "Waiting for MultiClusterHub %s to become healthy (phase=%s, non-running pods=%s)...",
-                mch_name,
-                phase,
-                ", ".join(non_running) if non_running else "none",
-            )
-            time.sleep(interval)
+                if mch_watch.active:
+                    mch_watch.wait_for_change(interval)
+                else:
+                    time.sleep(interval)
+        finally:
+            mch_watch.stop()
 
     def _disable_observability_on_old_hub(self) -> None:
         """Delete MultiClusterObservability on old hub (optional)."""
@@ -1391,17 +1521,17 @@ def _scale_down_old_hub_observability(self) -> None:
         Scale down observability components on the old primary hub.
 
         Scales thanos-compact and observatorium-api to 0 replicas, then waits
-        for pods to terminate with polling. Reports status of scale-down operation.
+        for pods to terminate. Reports status of scale-down operation.
         """
         assert self.primary is not None  # Guaranteed by guard at _verify_old_hub_state entry
         # Check both thanos-compact and observatorium-api pods
         compactor_pods = self.primary.get_pods(
             namespace=OBSERVABILITY_NAMESPACE,
-            label_selector="app.kubernetes.io/name=thanos-compact",
+            label_selector=THANOS_COMPACTOR_LABEL_SELECTOR,
         )
         api_pods = self.primary.get_pods(
             namespace=OBSERVABILITY_NAMESPACE,
-            label_selector="app.kubernetes.io/name=observatorium-api",
+            label_selector=OBSERVATORIUM_API_LABEL_SELECTOR,
         )
 
         # Issue scale-down commands (dry-run aware)
@@ -1414,7 +1544,7 @@ def _scale_down_old_hub_observability(self) -> None:
                 logger.info("Scaling down observatorium-api on old hub")
                 self.primary.scale_deployment(OBSERVATORIUM_API_DEPLOYMENT, OBSERVABILITY_NAMESPACE, 0)
 
-        # Wait for pods to terminate with polling
+        # Wait for pods to terminate
         compactor_pods_after, api_pods_after = self._wait_for_observability_scale_down(compactor_pods, api_pods)
 
         # Report status
@@ -1426,7 +1556,11 @@ def _wait_for_observability_scale_down(
         api_pods: List[Dict],
     ) -> Tuple[List[Dict], List[Dict]]:
         """
-        Wait for observability pods to scale down with polling.
+        Wait for observability pods to scale down.
+
+        When the new hub runs observability, its observatorium-api and
+        thanos-compact are tracked to their desired replicas in the same wait,
+        so both hubs are waited on at once.
 
         Args:
             compactor_pods: Initial thanos-compact pods
@@ -1436,39 +1570,77 @@ def _wait_for_observability_scale_down(
             Tuple of (compactor_pods_after, api_pods_after) after waiting
         """
         assert self.primary is not None  # Guaranteed by guard at _verify_old_hub_state entry
-        compactor_pods_after = []
-        api_pods_after = []
-
-        if not self.dry_run and (compactor_pods or api_pods):
-            logger.debug(
-                "Waiting for observability pods to scale down (timeout=%ds, interval=%ds)",
-                OBSERVABILITY_TERMINATE_TIMEOUT,
-                OBSERVABILITY_TERMINATE_INTERVAL,
-            )
-            start_time = time.time()
-
-            while time.time() - start_time < OBSERVABILITY_TERMINATE_TIMEOUT:
-                if compactor_pods:
-                    compactor_pods_after = self.primary.get_pods(
-                        namespace=OBSERVABILITY_NAMESPACE,
-                        label_selector="app.kubernetes.io/name=thanos-compact",
-                    )
-                if api_pods:
-                    api_pods_after = self.primary.get_pods(
-                        namespace=OBSERVABILITY_NAMESPACE,
-                        label_selector="app.kubernetes.io/name=observatorium-api",
-                    )
-
-                # Check if both are scaled down
-                compactor_done = not compactor_pods or not compactor_pods_after
-                api_done = not api_pods or not api_pods_after
-
-                if compactor_done and api_done:
-                    break
-
-                time.sleep(OBSERVABILITY_TERMINATE_INTERVAL)
+        if self.dry_run or not (compactor_pods or api_pods):
+            return [], []
+
+        compactor = WorkloadRollout(
+            "old hub",
+            self.primary,
+            "statefulsets",
+            THANOS_COMPACTOR_STATEFULSET,
+            OBSERVABILITY_NAMESPACE,
+            THANOS_COMPACTOR_LABEL_SELECTOR,
+            replicas=0,
+        )
+        api = WorkloadRollout(
+            "old hub",
+            self.primary,
+            "deployments",
+            OBSERVATORIUM_API_DEPLOYMENT,
+            OBSERVABILITY_NAMESPACE,
+            OBSERVATORIUM_API_LABEL_SELECTOR,
+            replicas=0,
+        )
+        rollouts = []
+        for rollout, pods in ((compactor, compactor_pods), (api, api_pods)):
+            if pods:
+                rollout.remaining_pods = list(pods)
+                rollouts.append(rollout)
+        new_hub_rollouts = self._new_hub_observability_rollouts()
+
+        logger.debug(
+            "Waiting for observability pods to scale down (timeout=%ds, interval=%ds)",
+            OBSERVABILITY_TERMINATE_TIMEOUT,
+            OBSERVABILITY_TERMINATE_INTERVAL,
+        )
+        track_rollouts(
+            rollouts + new_hub_rollouts,
+            timeout=OBSERVABILITY_TERMINATE_TIMEOUT,
+            interval=OBSERVABILITY_TERMINATE_INTERVAL,
+        )
 
-        return compactor_pods_after, api_pods_after
+        for rollout in new_hub_rollouts:
+            if not rollout.found:
+                logger.debug("%s not found on new hub", rollout.name)
+            elif rollout.done:
+                logger.info("%s is ready on new hub", rollout.name)
+            else:
+                logger.warning("%s is not ready on new hub (%d ready)", rollout.name, rollout.ready_replicas)
+
+        return compactor.remaining_pods, api.remaining_pods
+
+    def _new_hub_observability_rollouts(self) -> List[WorkloadRollout]:
+        """Return the new hub's observability workloads to track, if it runs observability."""
+        if not self.state.get_config("secondary_has_observability", False):
+            return []
+        return [
+            WorkloadRollout(
+                "new hub",
+                self.secondary,
+                "statefulsets",
+                THANOS_COMPACTOR_STATEFULSET,
+                OBSERVABILITY_NAMESPACE,
+                THANOS_COMPACTOR_LABEL_SELECTOR,
+            ),
+            WorkloadRollout(
+                "new hub",
+                self.secondary,
+                "deployments",
+                OBSERVATORIUM_API_DEPLOYMENT,
+                OBSERVABILITY_NAMESPACE,
+                OBSERVATORIUM_API_LABEL_SELECTOR,
+            ),
+        ]
 
     def _report_observability_scale_down_status(
         self,
@@ -1534,7 +1706,7 @@ def _resume_argocd_apps(self) -> None:
                 "Re-run pause without --dry-run to generate resumable state."
             )
         run_id = self.state.get_config("argocd_run_id")
-        paused_apps = self.state.get_config("argocd_paused_apps") or []
+        paused_apps = argocd_lib.PausedAppIndex(self.state.get_config("argocd_paused_apps") or [])
         if not run_id or not paused_apps:
             logger.info("No Argo CD paused apps in state; skipping resume")
             return
@@ -5,42 +5,68 @@
 # Runbook: Steps 6-10 (Method 1) / F6 (Method 2)
 
 import base64
+import functools
 import logging
 import os
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 import yaml
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
+from lib import kubeconfig_index
 from lib.constants import (
     CLUSTER_VERIFY_INTERVAL,
-    CLUSTER_VERIFY_MAX_WORKERS,
     CLUSTER_VERIFY_TIMEOUT,
     DEFAULT_KUBECONFIG_SIZE,
     DISABLE_AUTO_IMPORT_ANNOTATION,
     INITIAL_CLUSTER_WAIT_TIMEOUT,
+    KLUSTERLET_LEASE_DEFAULT_DURATION,
+    KLUSTERLET_LEASE_GRACE_MULTIPLIER,
+    KLUSTERLET_LEASE_NAME,
+    KLUSTERLET_VERIFY_BUDGET,
+    KLUSTERLET_VERIFY_MODE_DEFAULT,
     LOCAL_CLUSTER_NAME,
     MANAGED_CLUSTER_AGENT_NAMESPACE,
     MAX_KUBECONFIG_SIZE,
     OBSERVABILITY_NAMESPACE,
     OBSERVABILITY_POD_TIMEOUT,
+    OBSERVABILITY_ROLLOUT_INTERVAL,
     OBSERVATORIUM_API_DEPLOYMENT,
+    OBSERVATORIUM_API_LABEL_SELECTOR,
     POD_READINESS_TOLERANCE,
     SECRET_VISIBILITY_INTERVAL,
     SECRET_VISIBILITY_TIMEOUT,
+    SPOKE_CONNECT_TIMEOUT,
+    SPOKE_READ_TIMEOUT,
     THANOS_COMPACTOR_LABEL_SELECTOR,
     THANOS_COMPACTOR_STATEFULSET,
 )
 from lib.exceptions import SwitchoverError
+from lib.fanout import AIMDLimiter, run_adaptive
 from lib.kube_client import KubeClient
-from lib.utils import StateManager, dry_run_skip
+from lib.rollout import WorkloadRollout, track_rollouts
+from lib.spoke_clients import SpokeClientPool
+from lib.utils import Phase, StateManager, dry_run_skip
 from lib.waiter import wait_for_condition
 
 logger = logging.getLogger("acm_switchover")
 
+# (connect, read) deadline for every call made directly to a managed cluster
+SPOKE_REQUEST_TIMEOUT = (SPOKE_CONNECT_TIMEOUT, SPOKE_READ_TIMEOUT)
+
+
+def _parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
+    """Parse a Kubernetes timestamp into a timezone-aware datetime."""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
 
 class PostActivationVerification:
     """Handles post-activation verification on secondary hub."""
@@ -51,16 +77,20 @@ def __init__(
         state_manager: StateManager,
         has_observability: bool,
         dry_run: bool = False,
+        klusterlet_budget: float = KLUSTERLET_VERIFY_BUDGET,
+        klusterlet_verify_mode: str = KLUSTERLET_VERIFY_MODE_DEFAULT,
     ):
         self.secondary = secondary_client
         self.state = state_manager
         self.has_observability = has_observability
         self.dry_run = dry_run
+        # Seconds allowed for the klusterlet check and fix passes together (0 = unlimited)
+        self.klusterlet_budget = klusterlet_budget
+        # "spoke", "lease" or "auto" (see KLUSTERLET_VERIFY_MODES)
+        self.klusterlet_verify_mode = klusterlet_verify_mode
         self._cached_managed_clusters: Optional[List[Dict]] = None  # Cache for managed clusters
-        # Kubeconfig caching to reduce repeated file I/O (findings #10)
-        self._kubeconfig_cache: Optional[Dict] = None
-        self._kubeconfig_paths: List[str] = []
-        self._kubeconfig_mtime: Dict[str, float] = {}
+        # Managed-cluster clients shared by the klusterlet check and fix passes
+        self._spoke_clients = SpokeClientPool()
 
     def _get_managed_clusters(self, force_refresh: bool = False) -> List[Dict]:
         """Get managed clusters with caching.
@@ -282,7 +312,7 @@ def _scale_up_observability_components(self):
         OBSERVATORIUM_API_REPLICAS = 2  # Default for HA
         THANOS_COMPACT_REPLICAS = 1  # Default single replica
 
-        scaled_components = []
+        rollouts: List[WorkloadRollout] = []
 
         # Check and scale observatorium-api deployment
         try:
@@ -305,7 +335,17 @@ def _scale_up_observability_components(self):
                         namespace=OBSERVABILITY_NAMESPACE,
                         replicas=OBSERVATORIUM_API_REPLICAS,
                     )
-                    scaled_components.append(("observatorium-api", OBSERVATORIUM_API_REPLICAS))
+                    rollouts.append(
+                        WorkloadRollout(
+                            "new hub",
+                            self.secondary,
+                            "deployments",
+                            OBSERVATORIUM_API_DEPLOYMENT,
+                            OBSERVABILITY_NAMESPACE,
+                            OBSERVATORIUM_API_LABEL_SELECTOR,
+                            replicas=OBSERVATORIUM_API_REPLICAS,
+                        )
+                    )
                 else:
                     logger.info(
                         "observatorium-api already has %d replica(s), no scale-up needed",
@@ -336,7 +376,17 @@ def _scale_up_observability_components(self):
                         namespace=OBSERVABILITY_NAMESPACE,
                         replicas=THANOS_COMPACT_REPLICAS,
                     )
-                    scaled_components.append(("thanos-compact", THANOS_COMPACT_REPLICAS))
+                    rollouts.append(
+                        WorkloadRollout(
+                            "new hub",
+                            self.secondary,
+                            "statefulsets",
+                            THANOS_COMPACTOR_STATEFULSET,
+                            OBSERVABILITY_NAMESPACE,
+                            THANOS_COMPACTOR_LABEL_SELECTOR,
+                            replicas=THANOS_COMPACT_REPLICAS,
+                        )
+                    )
                 else:
                     logger.info(
                         "thanos-compact already has %d replica(s), no scale-up needed",
@@ -346,35 +396,15 @@ def _scale_up_observability_components(self):
             logger.warning("Failed to check/scale thanos-compact: %s", e)
             # Continue to wait for any components that were scaled
 
-        # Wait for scaled components to be ready
-        if scaled_components:
+        # Wait for scaled components to be ready, all at once
+        if rollouts:
             logger.info("Waiting for scaled components to be ready...")
-
-            # Wait for observatorium-api if it was scaled
-            if any(name == "observatorium-api" for name, _ in scaled_components):
-                logger.info("Waiting for observatorium-api pods to be ready...")
-                ready = self.secondary.wait_for_pods_ready(
-                    namespace=OBSERVABILITY_NAMESPACE,
-                    label_selector="app.kubernetes.io/name=observatorium-api",
-                    timeout=OBSERVABILITY_POD_TIMEOUT,
-                )
-                if ready:
-                    logger.info("observatorium-api pods are ready")
+            track_rollouts(rollouts, timeout=OBSERVABILITY_POD_TIMEOUT, interval=OBSERVABILITY_ROLLOUT_INTERVAL)
+            for rollout in rollouts:
+                if rollout.done:
+                    logger.info("%s pods are ready", rollout.name)
                 else:
-                    logger.warning("observatorium-api pods did not become ready in time")
-
-            # Wait for thanos-compact if it was scaled
-            if any(name == "thanos-compact" for name, _ in scaled_components):
-                logger.info("Waiting for thanos-compact pods to be ready...")
-                ready = self.secondary.wait_for_pods_ready(
-                    namespace=OBSERVABILITY_NAMESPACE,
-                    label_selector=THANOS_COMPACTOR_LABEL_SELECTOR,
-                    timeout=OBSERVABILITY_POD_TIMEOUT,
-                )
-                if ready:
-                    logger.info("thanos-compact pods are ready")
-                else:
-                    logger.warning("thanos-compact pods did not become ready in time")
+                    logger.warning("%s pods did not become ready in time", rollout.name)
         else:
             logger.info("No components needed scale-up")
 
@@ -633,20 +663,41 @@ def _verify_klusterlet_connections(self):  # noqa: C901
 
         If we can't connect to a managed cluster (no context available), we log a
         warning but don't fail the switchover.
+
+        In "lease" mode the managed clusters are not contacted at all; the klusterlet
+        leases on the new hub are read in one LIST and clusters they do not prove
+        connected are only reported. In "auto" mode the same lease check runs first
+        and only the clusters it does not prove connected are checked (and fixed)
+        through their kubeconfig contexts.
         """
 
         logger.info("Verifying klusterlet connections to new hub...")
 
+        proven_connected: set = set()
+        if self.klusterlet_verify_mode in ("lease", "auto"):
+            try:
+                lease_status = self._check_klusterlet_leases()
+            except (ApiException, Exception) as e:
+                logger.warning("Could not read klusterlet leases on new hub: %s", e)
+                if self.klusterlet_verify_mode == "lease":
+                    return
+                logger.info("Falling back to checking every managed cluster directly")
+            else:
+                proven_connected = {name for name, status in lease_status.items() if status == "connected"}
+                self._log_lease_results(lease_status)
+                if self.klusterlet_verify_mode == "lease" or len(proven_connected) == len(lease_status):
+                    return
+
         # Get the new hub's API server URL
         new_hub_server = self._get_hub_api_server()
         if not new_hub_server:
             logger.warning("Could not determine new hub API server URL, skipping klusterlet verification")
             return
 
-        # Load kubeconfig data for context lookup
+        # Host -> context lookups for every cluster come from the shared kubeconfig index
         # Use max_size=0 to bypass size check for critical klusterlet verification
-        kubeconfig_data = self._load_kubeconfig_data(max_size=0)
-        if not kubeconfig_data:
+        index = self._load_kubeconfig_index(max_size=0)
+        if index is None:
             logger.warning("Could not load kubeconfig, skipping klusterlet verification")
             return
 
@@ -657,7 +708,7 @@ def _verify_klusterlet_connections(self):  # noqa: C901
         cluster_info = []
         for mc in managed_clusters:
             name = mc.get("metadata", {}).get("name")
-            if name and name != LOCAL_CLUSTER_NAME:
+            if name and name != LOCAL_CLUSTER_NAME and name not in proven_connected:
                 # Get API server URL from ManagedCluster spec
                 client_configs = mc.get("spec", {}).get("managedClusterClientConfigs", [])
                 api_url = client_configs[0].get("url", "") if client_configs else ""
@@ -667,31 +718,51 @@ def _verify_klusterlet_connections(self):  # noqa: C901
             logger.info("No managed clusters to verify klusterlet connections")
             return
 
-        # Try to verify each cluster's klusterlet connection in parallel
+        # Check each cluster's klusterlet connection through the adaptive fan-out
         def check_cluster(cluster_name: str, cluster_api_url: str) -> tuple:
-            """Check a single cluster's klusterlet connection. Returns (cluster_name, result, context_name)."""
+            """Check a single cluster's klusterlet connection. Returns (result, context_name)."""
             try:
-                context_name = self._find_context_by_api_url(kubeconfig_data, cluster_api_url, cluster_name)
+                context_name = self._find_context_by_api_url(index, cluster_api_url, cluster_name)
                 if not context_name:
-                    return (cluster_name, "no_context", None)
+                    return ("no_context", None)
 
                 result = self._check_klusterlet_connection(context_name, cluster_name, new_hub_server)
-                return (cluster_name, result, context_name)
             except (ApiException, Exception) as e:
                 logger.debug("Error checking klusterlet for %s: %s", cluster_name, e)
-                return (cluster_name, "unreachable", None)
+                return ("unreachable", None)
+            # Only wrong-hub clusters are contacted again; release the other clients now
+            if result != "wrong_hub":
+                self._spoke_clients.discard(context_name)
+            return (result, context_name)
+
+        def fix_cluster(cluster_name: str, context_name: str) -> bool:
+            """Fix a single cluster's klusterlet connection."""
+            return self._force_klusterlet_reconnect(cluster_name, context_name)
 
         logger.info("Checking klusterlet connections for %d cluster(s) in parallel...", len(cluster_info))
+        deadline = time.monotonic() + self.klusterlet_budget if self.klusterlet_budget > 0 else None
+
+        def remaining_budget() -> Optional[float]:
+            return max(0.001, deadline - time.monotonic()) if deadline is not None else None
 
-        # Collect results from futures to avoid shared mutable state
         verified = []
         wrong_hub = []
         unreachable = []
+        not_checked = []
 
-        with ThreadPoolExecutor(max_workers=CLUSTER_VERIFY_MAX_WORKERS) as executor:
-            futures = [executor.submit(check_cluster, name, api_url) for name, api_url in cluster_info]
-            for future in as_completed(futures):
-                cluster_name, result, context_name = future.result()
+        try:
+            checks = run_adaptive(
+                "Klusterlet check",
+                [(name, functools.partial(check_cluster, name, api_url)) for name, api_url in cluster_info],
+                limiter=AIMDLimiter(),
+                budget_seconds=remaining_budget(),
+                is_healthy=lambda outcome: outcome[0] != "unreachable",
+            )
+            for cluster_name, _ in cluster_info:
+                if cluster_name not in checks.results:
+                    not_checked.append(cluster_name)
+                    continue
+                result, context_name = checks.results[cluster_name]
                 if result == "verified":
                     verified.append(cluster_name)
                 elif result == "wrong_hub":
@@ -699,53 +770,54 @@ def check_cluster(cluster_name: str, cluster_api_url: str) -> tuple:
                 else:  # unreachable, no_context, or error
                     unreachable.append(cluster_name)
 
-        # Log initial results
-        if verified:
-            logger.info(
-                "✓ Klusterlet verified for %d cluster(s): %s",
-                len(verified),
-                ", ".join(verified),
-            )
-
-        def fix_cluster(cluster_name: str, context_name: str) -> tuple:
-            """Fix a single cluster's klusterlet connection. Returns (cluster_name, success)."""
-            success = self._force_klusterlet_reconnect(cluster_name, context_name)
-            return (cluster_name, success)
-
-        # Fix clusters connected to wrong hub (also in parallel)
-        if wrong_hub:
-            logger.warning(
-                "Klusterlet connected to wrong hub for %d cluster(s): %s - attempting to fix...",
-                len(wrong_hub),
-                ", ".join([c[0] for c in wrong_hub]),
-            )
-
-            # Collect results from futures to avoid shared mutable state
-            fixed = []
-            fix_failed = []
-
-            with ThreadPoolExecutor(max_workers=CLUSTER_VERIFY_MAX_WORKERS) as executor:
-                futures = [executor.submit(fix_cluster, name, ctx) for name, ctx in wrong_hub]
-                for future in as_completed(futures):
-                    cluster_name, success = future.result()
-                    if success:
-                        fixed.append(cluster_name)
-                    else:
-                        fix_failed.append(cluster_name)
-
-            if fixed:
+            # Log initial results
+            if verified:
                 logger.info(
-                    "✓ Fixed klusterlet connection for %d cluster(s): %s",
-                    len(fixed),
-                    ", ".join(fixed),
+                    "✓ Klusterlet verified for %d cluster(s): %s",
+                    len(verified),
+                    ", ".join(verified),
                 )
-            if fix_failed:
+
+            # Fix clusters connected to wrong hub (also in parallel)
+            if wrong_hub:
                 logger.warning(
-                    "✗ Failed to fix klusterlet for %d cluster(s): %s",
-                    len(fix_failed),
-                    ", ".join(fix_failed),
+                    "Klusterlet connected to wrong hub for %d cluster(s): %s - attempting to fix...",
+                    len(wrong_hub),
+                    ", ".join([c[0] for c in wrong_hub]),
+                )
+
+                fixes = run_adaptive(
+                    "Klusterlet fix",
+                    [(name, functools.partial(fix_cluster, name, ctx)) for name, ctx in wrong_hub],
+                    limiter=AIMDLimiter(),
+                    budget_seconds=remaining_budget(),
+                    is_healthy=bool,
                 )
+                fixed = [name for name, _ in wrong_hub if fixes.results.get(name) is True]
+                fix_failed = [name for name, _ in wrong_hub if name not in fixed]
+
+                if fixed:
+                    logger.info(
+                        "✓ Fixed klusterlet connection for %d cluster(s): %s",
+                        len(fixed),
+                        ", ".join(fixed),
+                    )
+                if fix_failed:
+                    logger.warning(
+                        "✗ Failed to fix klusterlet for %d cluster(s): %s",
+                        len(fix_failed),
+                        ", ".join(fix_failed),
+                    )
+        finally:
+            self._spoke_clients.close()
 
+        if not_checked:
+            logger.warning(
+                "Klusterlet verification budget (%ss) exhausted before %d cluster(s) were checked: %s",
+                self.klusterlet_budget,
+                len(not_checked),
+                ", ".join(not_checked),
+            )
         if unreachable:
             logger.info(
                 "Klusterlet verification skipped for %d cluster(s) (no context available): %s",
@@ -753,6 +825,97 @@ def fix_cluster(cluster_name: str, context_name: str) -> tuple:
                 ", ".join(unreachable),
             )
 
+    def _check_klusterlet_leases(self) -> Dict[str, str]:
+        """
+        Classify every managed cluster from hub-side state, without contacting it.
+
+        Lists the klusterlet leases in all cluster namespaces with one field-selected
+        LIST and re-reads the ManagedClusters. A cluster is "connected" when it is
+        Available, its lease was renewed within the grace period, and either the
+        lease renewal or the Available transition happened after activation
+        started (when that time is known). Otherwise it is "unavailable",
+        "no_lease" or "stale_lease".
+
+        Returns:
+            Dict of ManagedCluster name to status, excluding local-cluster
+        """
+        leases = {}
+        for lease in self.secondary.iter_custom_resources(
+            group="coordination.k8s.io",
+            version="v1",
+            plural="leases",
+            field_selector=f"metadata.name={KLUSTERLET_LEASE_NAME}",
+        ):
+            namespace = (lease.get("metadata") or {}).get("namespace")
+            if namespace:
+                leases[namespace] = lease.get("spec") or {}
+
+        now = datetime.now(timezone.utc)
+        activated_at = self._activation_started_at()
+        status: Dict[str, str] = {}
+        for mc in self._get_managed_clusters(force_refresh=True):
+            name = mc.get("metadata", {}).get("name")
+            if not name or name == LOCAL_CLUSTER_NAME:
+                continue
+
+            available = next(
+                (
+                    c
+                    for c in mc.get("status", {}).get("conditions", [])
+                    if c.get("type") == "ManagedClusterConditionAvailable" and c.get("status") == "True"
+                ),
+                None,
+            )
+            lease = leases.get(name)
+            if available is None:
+                status[name] = "unavailable"
+                continue
+            if lease is None:
+                status[name] = "no_lease"
+                continue
+
+            renewed_at = _parse_timestamp(lease.get("renewTime"))
+            grace = (lease.get("leaseDurationSeconds") or KLUSTERLET_LEASE_DEFAULT_DURATION) * (
+                KLUSTERLET_LEASE_GRACE_MULTIPLIER
+            )
+            fresh = renewed_at is not None and (now - renewed_at).total_seconds() <= grace
+            if fresh and activated_at is not None:
+                available_since = _parse_timestamp(available.get("lastTransitionTime"))
+                fresh = renewed_at >= activated_at or (available_since is not None and available_since >= activated_at)
+            status[name] = "connected" if fresh else "stale_lease"
+        return status
+
+    def _activation_started_at(self) -> Optional[datetime]:
+        """Return when the activation phase started, from the state file's phase timings."""
+        timings = self.state.get_phase_timings()
+        if not isinstance(timings, list):
+            return None
+        for entry in reversed(timings):
+            if isinstance(entry, dict) and entry.get("phase") == Phase.ACTIVATION.value:
+                return _parse_timestamp(entry.get("started_at"))
+        return None
+
+    @staticmethod
+    def _log_lease_results(lease_status: Dict[str, str]) -> None:
+        connected = sorted(name for name, status in lease_status.items() if status == "connected")
+        if connected:
+            logger.info(
+                "✓ Klusterlet lease renewed on new hub for %d cluster(s): %s", len(connected), ", ".join(connected)
+            )
+        for status, description in (
+            ("unavailable", "ManagedCluster not Available"),
+            ("no_lease", "no klusterlet lease on new hub"),
+            ("stale_lease", "klusterlet lease not renewed since activation"),
+        ):
+            names = sorted(name for name, value in lease_status.items() if value == status)
+            if names:
+                logger.warning(
+                    "Klusterlet not proven connected (%s) for %d cluster(s): %s",
+                    description,
+                    len(names),
+                    ", ".join(names),
+                )
+
     def _force_klusterlet_reconnect(self, cluster_name: str, context_name: str) -> bool:
         """
         Force a managed cluster's klusterlet to reconnect to the new hub.
@@ -806,10 +969,11 @@ def _force_klusterlet_reconnect(self, cluster_name: str, context_name: str) -> b
             return False
 
     def _build_managed_cluster_clients(self, context_name: str) -> tuple:
-        """Build isolated per-context CoreV1Api and AppsV1Api for a managed cluster.
+        """Return isolated per-context CoreV1Api and AppsV1Api for a managed cluster.
 
-        Creates an ApiClient bound to the named context without mutating global
-        kubernetes configuration. Safe to call from concurrent threads.
+        The ApiClient comes from the spoke client pool, so the klusterlet check
+        and a later fix for the same context share one connection. It never
+        mutates global kubernetes configuration. Safe to call from concurrent threads.
 
         Args:
             context_name: Kubeconfig context name
@@ -820,8 +984,7 @@ def _build_managed_cluster_clients(self, context_name: str) -> tuple:
         Raises:
             config.ConfigException: If context does not exist in kubeconfig
         """
-        api_client = config.new_client_from_config(context=context_name, persist_config=False)
-        return client.CoreV1Api(api_client=api_client), client.AppsV1Api(api_client=api_client)
+        return self._spoke_clients.clients(context_name)
 
     def _get_import_secret(self, cluster_name: str) -> Optional[str]:
         """Get and decode the import secret from the new hub.
@@ -858,6 +1021,7 @@ def _delete_bootstrap_secret(self, v1: client.CoreV1Api, cluster_name: str) -> N
             v1.delete_namespaced_secret(
                 name="bootstrap-hub-kubeconfig",
                 namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                _request_timeout=SPOKE_REQUEST_TIMEOUT,
             )
             logger.debug("Deleted bootstrap-hub-kubeconfig secret on %s", cluster_name)
         except ApiException as e:
@@ -889,6 +1053,7 @@ def _apply_import_manifest(self, v1: client.CoreV1Api, import_yaml: str, cluster
                     v1.create_namespaced_secret(
                         namespace=namespace,
                         body=doc,
+                        _request_timeout=SPOKE_REQUEST_TIMEOUT,
                     )
                     logger.debug(
                         "Created bootstrap-hub-kubeconfig secret on %s",
@@ -921,6 +1086,7 @@ def secret_exists() -> tuple:
                 v1.read_namespaced_secret(
                     name="bootstrap-hub-kubeconfig",
                     namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                    _request_timeout=SPOKE_REQUEST_TIMEOUT,
                 )
                 return (True, "secret exists")
             except ApiException as e:
@@ -946,19 +1112,16 @@ def _restart_klusterlet(self, apps_v1: client.AppsV1Api, cluster_name: str) -> N
             apps_v1: AppsV1Api bound to the managed cluster's context
             cluster_name: Name of the ManagedCluster
         """
-        import time as time_module
-
         try:
             # Trigger a rollout restart by patching the deployment
             patch = {
-                "spec": {
-                    "template": {"metadata": {"annotations": {"acm-switchover/restart": str(int(time_module.time()))}}}
-                }
+                "spec": {"template": {"metadata": {"annotations": {"acm-switchover/restart": str(int(time.time()))}}}}
             }
             apps_v1.patch_namespaced_deployment(
                 name="klusterlet",
                 namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
                 body=patch,
+                _request_timeout=SPOKE_REQUEST_TIMEOUT,
             )
             logger.debug("Triggered klusterlet restart on %s", cluster_name)
         except ApiException as e:
@@ -990,15 +1153,31 @@ def _get_hub_api_server(self) -> str:
 
         return ""
 
-    def _load_kubeconfig_data(self, max_size: Optional[int] = None, force_reload: bool = False) -> dict:  # noqa: C901
-        """Load and merge kubeconfig data from all KUBECONFIG paths.
+    def _load_kubeconfig_data(self, max_size: Optional[int] = None, force_reload: bool = False) -> dict:
+        """Return merged kubeconfig data from all KUBECONFIG paths.
 
         Handles the KUBECONFIG environment variable which can contain multiple
         colon-separated paths (e.g., '/path/one:/path/two:~/.kube/config').
         Contexts, clusters, and users are merged from all files.
 
-        Uses caching to avoid repeated file I/O when called multiple times.
-        Cache is invalidated if any kubeconfig file has been modified.
+        Args:
+            max_size: Maximum file size in bytes, as for _load_kubeconfig_index.
+            force_reload: If True, bypass cache and reload from files.
+
+        Returns:
+            Merged kubeconfig data dict with contexts, clusters, and users.
+        """
+        index = self._load_kubeconfig_index(max_size=max_size, force_reload=force_reload)
+        return index.merged if index is not None else {}
+
+    def _load_kubeconfig_index(
+        self, max_size: Optional[int] = None, force_reload: bool = False
+    ) -> Optional[kubeconfig_index.KubeconfigIndex]:
+        """Return the kubeconfig index with the size limit applied.
+
+        The files are parsed once by the shared kubeconfig index, which is
+        re-read only if any kubeconfig file has been modified. Files over the
+        size limit are left out of the returned index.
 
         Args:
             max_size: Maximum file size in bytes. If None, uses MAX_KUBECONFIG_SIZE.
@@ -1006,111 +1185,54 @@ def _load_kubeconfig_data(self, max_size: Optional[int] = None, force_reload: bo
             force_reload: If True, bypass cache and reload from files.
 
         Returns:
-            Merged kubeconfig data dict with contexts, clusters, and users.
+            KubeconfigIndex, or None if the kubeconfig could not be loaded.
         """
         try:
-            # Check if we can use cached data
-            if not force_reload and self._kubeconfig_cache is not None:
-                # Verify no files have been modified since caching
-                cache_valid = True
-                for path in self._kubeconfig_paths:
-                    if os.path.exists(path):
-                        current_mtime = os.path.getmtime(path)
-                        if self._kubeconfig_mtime.get(path, 0) != current_mtime:
-                            cache_valid = False
-                            break
-                    else:
-                        # File was deleted
-                        cache_valid = False
-                        break
-
-                if cache_valid:
-                    return self._kubeconfig_cache
-            kubeconfig_env = os.environ.get("KUBECONFIG", "")
-            if kubeconfig_env:
-                # Split on colon (Unix path separator for KUBECONFIG)
-                paths = [p.strip() for p in kubeconfig_env.split(":") if p.strip()]
-            else:
-                paths = [os.path.expanduser("~/.kube/config")]
+            index = kubeconfig_index.get_kubeconfig_index(force_reload=force_reload)
 
             # Determine size limit: use provided max_size, or default to MAX_KUBECONFIG_SIZE
+            # (MAX_KUBECONFIG_SIZE of 0 or negative disables checking via the environment)
             if max_size is None:
-                # Check if MAX_KUBECONFIG_SIZE is set to 0 or negative to disable checking
-                if MAX_KUBECONFIG_SIZE <= 0:
-                    # Size checking disabled via environment variable
-                    size_limit = None
-                    check_size = False
-                else:
-                    size_limit = MAX_KUBECONFIG_SIZE
-                    check_size = True
+                size_limit = MAX_KUBECONFIG_SIZE if MAX_KUBECONFIG_SIZE > 0 else None
             elif max_size <= 0:
                 # Bypass size check for critical operations
                 size_limit = None
-                check_size = False
             else:
                 size_limit = max_size
-                check_size = True
 
-            # Merge kubeconfig data from all paths
-            merged: dict = {"contexts": [], "clusters": [], "users": []}
-
-            for path in paths:
-                expanded_path = os.path.expanduser(path)
-                if not os.path.exists(expanded_path):
-                    logger.debug("Kubeconfig path does not exist: %s", os.path.basename(expanded_path))
+            excluded = []
+            for path in index.paths:
+                kubeconfig_size = index.file_size(path)
+                if kubeconfig_size is None:
                     continue
+                if size_limit is not None:
+                    if kubeconfig_size > size_limit:
+                        logger.warning(
+                            "Kubeconfig file too large: %s (%d bytes, max %d bytes). Skipping.",
+                            os.path.basename(path),
+                            kubeconfig_size,
+                            size_limit,
+                        )
+                        excluded.append(path)
+                elif MAX_KUBECONFIG_SIZE > 0 and kubeconfig_size > DEFAULT_KUBECONFIG_SIZE:
+                    # Size check bypassed - only warn when the file exceeds the default limit
+                    logger.warning(
+                        "Kubeconfig file large: %s (%d bytes, exceeds default limit %d bytes). "
+                        "Loading anyway for critical operation.",
+                        os.path.basename(path),
+                        kubeconfig_size,
+                        DEFAULT_KUBECONFIG_SIZE,
+                    )
 
-                try:
-                    # Check file size before loading to prevent memory exhaustion
-                    if check_size:
-                        assert size_limit is not None  # Guaranteed by check_size logic
-                        kubeconfig_size = os.path.getsize(expanded_path)
-                        if kubeconfig_size > size_limit:
-                            logger.warning(
-                                "Kubeconfig file too large: %s (%d bytes, max %d bytes). Skipping.",
-                                os.path.basename(expanded_path),
-                                kubeconfig_size,
-                                size_limit,
-                            )
-                            continue
-                    else:
-                        # Size check bypassed - log warning but continue loading
-                        # Only warn if size checking is meaningful (MAX_KUBECONFIG_SIZE > 0)
-                        # and file exceeds the default limit (not the overridden value)
-                        if MAX_KUBECONFIG_SIZE > 0:
-                            kubeconfig_size = os.path.getsize(expanded_path)
-                            if kubeconfig_size > DEFAULT_KUBECONFIG_SIZE:
-                                logger.warning(
-                                    "Kubeconfig file large: %s (%d bytes, exceeds default limit %d bytes). "
-                                    "Loading anyway for critical operation.",
-                                    os.path.basename(expanded_path),
-                                    kubeconfig_size,
-                                    DEFAULT_KUBECONFIG_SIZE,
-                                )
-
-                    with open(expanded_path) as f:
-                        data = yaml.safe_load(f) or {}
-                        merged["contexts"].extend(data.get("contexts", []))
-                        merged["clusters"].extend(data.get("clusters", []))
-                        merged["users"].extend(data.get("users", []))
-                except (OSError, yaml.YAMLError) as e:
-                    logger.debug("Error loading kubeconfig %s: %s", os.path.basename(expanded_path), e)
-                    continue
-
-            # Update cache with loaded data and file modification times
-            self._kubeconfig_cache = merged
-            self._kubeconfig_paths = [os.path.expanduser(p) for p in paths]
-            self._kubeconfig_mtime = {
-                path: os.path.getmtime(path) for path in self._kubeconfig_paths if os.path.exists(path)
-            }
-
-            return merged
+            if excluded:
+                return kubeconfig_index.KubeconfigIndex(tuple(path for path in index.paths if path not in excluded))
+            return index
 
         except Exception as e:
             logger.debug("Error loading kubeconfig: %s", e)
-            return {}
+            return None
 
-    def _find_context_by_api_url(self, kubeconfig_data: dict, api_url: str, cluster_name: str) -> str:
+    def _find_context_by_api_url(self, index: kubeconfig_index.KubeconfigIndex, api_url: str, cluster_name: str) -> str:
         """
         Find a kubeconfig context that matches the given API server URL.
 
@@ -1118,7 +1240,7 @@ def _find_context_by_api_url(self, kubeconfig_data: dict, api_url: str, cluster_
         differ from ManagedCluster names (e.g., "admin@prod1" vs "prod1").
 
         Args:
-            kubeconfig_data: Parsed kubeconfig as dict
+            index: Kubeconfig index from _load_kubeconfig_index
             api_url: The API server URL from ManagedCluster spec
             cluster_name: The ManagedCluster name (for fallback and logging)
 
@@ -1128,46 +1250,15 @@ def _find_context_by_api_url(self, kubeconfig_data: dict, api_url: str, cluster_
         if not api_url:
             # Fallback to name-based matching if no API URL
             logger.debug("No API URL for %s, trying name-based matching", cluster_name)
-            try:
-                contexts, _ = config.list_kube_config_contexts()
-                for ctx in contexts:
-                    if ctx.get("name") == cluster_name:
-                        return cluster_name
-            except (config.ConfigException, Exception) as e:
-                # Failed to match context by name; returning empty string as fallback
-                logger.debug("Exception during name-based context matching for %s: %s", cluster_name, e)
-            return ""
+            return cluster_name if index.has_context(cluster_name) else ""
 
-        # Normalize the API URL for comparison (extract host)
-        api_host = re.sub(r"https://([^:/]+).*", r"\1", api_url)
-
-        # Build a map of cluster server URL -> cluster name
-        cluster_servers = {}
-        for cluster in kubeconfig_data.get("clusters", []):
-            server = cluster.get("cluster", {}).get("server", "")
-            if server:
-                server_host = re.sub(r"https://([^:/]+).*", r"\1", server)
-                cluster_servers[server_host] = cluster.get("name")
-
-        # Find which kubeconfig cluster matches this API URL
-        matching_cluster = cluster_servers.get(api_host)
-        if not matching_cluster:
-            logger.debug("No kubeconfig cluster matches API URL %s", api_url)
+        context_name = index.context_for_host(api_url) or ""
+        if not context_name:
+            logger.debug("No kubeconfig context matches API URL %s", api_url)
             return ""
 
-        # Find the context that uses this cluster
-        for ctx in kubeconfig_data.get("contexts", []):
-            if ctx.get("context", {}).get("cluster") == matching_cluster:
-                context_name = ctx.get("name", "")
-                logger.debug(
-                    "Matched cluster %s to context %s via API URL %s",
-                    cluster_name,
-                    context_name,
-                    api_url,
-                )
-                return context_name
-
-        return ""
+        logger.debug("Matched cluster %s to context %s via API URL %s", cluster_name, context_name, api_url)
+        return context_name
 
     def _check_klusterlet_connection(  # noqa: C901
         self, context_name: str, cluster_name: str, expected_hub: str
@@ -1198,6 +1289,7 @@ def _check_klusterlet_connection(  # noqa: C901
                 secret = v1.read_namespaced_secret(
                     name="hub-kubeconfig-secret",
                     namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                    _request_timeout=SPOKE_REQUEST_TIMEOUT,
                 )
             except ApiException as e:
                 if e.status == 404:
@@ -1205,6 +1297,7 @@ def _check_klusterlet_connection(  # noqa: C901
                     secret = v1.read_namespaced_secret(
                         name="bootstrap-hub-kubeconfig",
                         namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                        _request_timeout=SPOKE_REQUEST_TIMEOUT,
                     )
                 else:
                     raise
@@ -1239,10 +1332,7 @@ def _check_klusterlet_connection(  # noqa: C901
                 return "unreachable"
 
             # Compare hostnames (ignore port differences)
-            expected_host = re.sub(r"https://([^:/]+).*", r"\1", expected_hub)
-            klusterlet_host = re.sub(r"https://([^:/]+).*", r"\1", klusterlet_hub)
-
-            if expected_host == klusterlet_host:
+            if kubeconfig_index.server_host(expected_hub) == kubeconfig_index.server_host(klusterlet_hub):
                 logger.debug("Cluster %s klusterlet verified (API server endpoint matched expected)", cluster_name)
                 return "verified"
             else:
@@ -18,6 +18,7 @@
 from lib.gitops_detector import safe_record_gitops_markers
 from lib.kube_client import KubeClient
 from lib.validation import InputValidator, ValidationError
+from lib.velero_backups import list_acm_backups
 
 from ..restore_discovery import find_passive_sync_restore
 from .base_validator import BaseValidator
@@ -106,20 +107,23 @@ def _wait_for_backups_complete(self, primary: KubeClient, in_progress: List[str]
 
         while remaining and (time.time() - start_time) < BACKUP_VERIFY_TIMEOUT:
             time.sleep(BACKUP_POLL_INTERVAL)
-            try:
-                backups = primary.list_custom_resources(
-                    group="velero.io",
-                    version="v1",
-                    plural="backups",
-                    namespace=BACKUP_NAMESPACE,
-                )
-            except Exception as exc:
-                logger.debug("Failed to list backups while waiting: %s", exc)
-                return remaining
-
-            remaining = [
-                b.get("metadata", {}).get("name") for b in backups if b.get("status", {}).get("phase") == "InProgress"
-            ]
+            still_running = []
+            # Only the waited-on backups are read; the namespace may hold thousands
+            for name in remaining:
+                try:
+                    backup = primary.get_custom_resource(
+                        group="velero.io",
+                        version="v1",
+                        plural="backups",
+                        name=name,
+                        namespace=BACKUP_NAMESPACE,
+                    )
+                except Exception as exc:
+                    logger.debug("Failed to read backup %s while waiting: %s", name, exc)
+                    return remaining
+                if backup and backup.get("status", {}).get("phase") == "InProgress":
+                    still_running.append(name)
+            remaining = still_running
 
         return remaining
 
@@ -621,23 +625,11 @@ def run(self, primary: KubeClient) -> None:  # noqa: C901
                 )
                 return
 
-            backups = primary.list_custom_resources(
-                group="velero.io",
-                version="v1",
-                plural="backups",
-                namespace=BACKUP_NAMESPACE,
+            # Managed-clusters backups are selected by label on the server; only the latest is read in full
+            mc_backups = list_acm_backups(
+                primary, metadata_only=True, schedule_types=("managedClusters",), name_fallback=False
             )
 
-            # Filter for managed-clusters backups using ACM backup schedule type label
-            mc_backups = [
-                b
-                for b in backups
-                if b.get("metadata", {})
-                .get("labels", {})
-                .get("cluster.open-cluster-management.io/backup-schedule-type")
-                == "managedClusters"
-            ]
-
             if not mc_backups:
                 self.add_result(
                     "ManagedClusters in backup",
@@ -652,7 +644,16 @@ def run(self, primary: KubeClient) -> None:  # noqa: C901
                 key=lambda b: b.get("metadata", {}).get("creationTimestamp", ""),
                 reverse=True,
             )
-            latest_backup = mc_backups[0]
+            latest_backup = (
+                primary.get_custom_resource(
+                    group="velero.io",
+                    version="v1",
+                    plural="backups",
+                    name=mc_backups[0].get("metadata", {}).get("name", ""),
+                    namespace=BACKUP_NAMESPACE,
+                )
+                or mc_backups[0]
+            )
 
             # Check backup status
             phase = latest_backup.get("status", {}).get("phase", "unknown")
@@ -1,7 +1,9 @@
 """Validation result reporting for pre-flight checks."""
 
 import logging
-from typing import Any, Dict, List
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List
 
 logger = logging.getLogger("acm_switchover")
 
@@ -11,6 +13,7 @@ class ValidationReporter:
 
     def __init__(self) -> None:
         self.results: List[Dict[str, Any]] = []
+        self._local = threading.local()
 
     def add_result(
         self,
@@ -27,22 +30,49 @@ def add_result(
             message: Descriptive message about the result
             critical: Whether failure is critical (default: True)
         """
-        self.results.append(
-            {
-                "check": check,
-                "passed": passed,
-                "message": message,
-                "critical": critical,
-            }
-        )
-
-        if passed:
+        result = {
+            "check": check,
+            "passed": passed,
+            "message": message,
+            "critical": critical,
+        }
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            buffer.append(result)
+            return
+        self._record(result)
+
+    def _record(self, result: Dict[str, Any]) -> None:
+        self.results.append(result)
+
+        check, message = result["check"], result["message"]
+        if result["passed"]:
             logger.info(f"✓ {check}: {message}")
-        elif critical:
+        elif result["critical"]:
             logger.error(f"✗ {check}: {message}")
         else:
             logger.warning(f"⚠ {check}: {message}")
 
+    @contextmanager
+    def buffered(self) -> Iterator[List[Dict[str, Any]]]:
+        """Collect results added on the current thread into a list instead of recording them.
+
+        Used by the preflight scheduler so validators running concurrently can be
+        reported in a fixed order with ``extend``.
+        """
+        previous = getattr(self._local, "buffer", None)
+        buffer: List[Dict[str, Any]] = []
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = previous
+
+    def extend(self, results: Iterable[Dict[str, Any]]) -> None:
+        """Record previously buffered results in order."""
+        for result in results:
+            self._record(result)
+
     def critical_failures(self) -> List[Dict[str, Any]]:
         """Get list of critical validation failures."""
         return [r for r in self.results if not r["passed"] and r["critical"]]
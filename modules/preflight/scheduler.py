@@ -0,0 +1,122 @@
+"""Dependency-aware concurrent execution of pre-flight validators.
+
+Each ``ValidationTask`` names the tasks whose return values it needs. Tasks
+whose dependencies are satisfied run concurrently on a small thread pool, so
+independent checks against both hubs overlap their API round trips. Results a
+task adds to the reporter are buffered per task and recorded in declaration
+order, so the report (and its log output) is the same as a sequential run.
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from lib.constants import PREFLIGHT_MAX_WORKERS
+
+from .reporter import ValidationReporter
+
+logger = logging.getLogger("acm_switchover")
+
+
+@dataclass(frozen=True)
+class ValidationTask:
+    """One node of the preflight graph.
+
+    ``func`` receives a dict mapping each name in ``depends_on`` to that task's
+    return value.
+    """
+
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+
+
+def _check_graph(tasks: Sequence[ValidationTask]) -> None:
+    names = [task.name for task in tasks]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate validation task names: {names}")
+    known = set(names)
+    for task in tasks:
+        missing = [dep for dep in task.depends_on if dep not in known]
+        if missing:
+            raise ValueError(f"Validation task {task.name} depends on unknown task(s): {', '.join(missing)}")
+
+    resolved: set = set()
+    remaining = list(tasks)
+    while remaining:
+        ready = [task for task in remaining if set(task.depends_on) <= resolved]
+        if not ready:
+            raise ValueError(f"Dependency cycle among validation tasks: {', '.join(t.name for t in remaining)}")
+        resolved.update(task.name for task in ready)
+        remaining = [task for task in remaining if task.name not in resolved]
+
+
+def run_validation_graph(
+    tasks: Sequence[ValidationTask],
+    reporter: ValidationReporter,
+    max_workers: int = PREFLIGHT_MAX_WORKERS,
+) -> Dict[str, Any]:
+    """
+    Run validation tasks concurrently while honouring their dependencies.
+
+    If a task raises, no further tasks are started; tasks already running are
+    allowed to finish, their results are still reported, and the exception of
+    the earliest-declared failing task is re-raised.
+
+    Args:
+        tasks: Tasks in reporting order
+        reporter: Reporter that receives each task's results in declaration order
+        max_workers: Upper bound on concurrently running tasks
+
+    Returns:
+        Dict of task name to return value for every task that completed
+    """
+    _check_graph(tasks)
+    order = {task.name: index for index, task in enumerate(tasks)}
+    results: Dict[str, Any] = {}
+    buffers: Dict[str, List[Dict[str, Any]]] = {}
+    errors: Dict[str, BaseException] = {}
+    pending = list(tasks)
+    running: Dict[Future, ValidationTask] = {}
+    next_to_report = 0
+
+    def _run(task: ValidationTask, inputs: Dict[str, Any]) -> Tuple[Any, List[Dict[str, Any]], Optional[BaseException]]:
+        with reporter.buffered() as buffer:
+            try:
+                return task.func(inputs), buffer, None
+            except Exception as exc:  # pylint: disable=broad-except
+                return None, buffer, exc
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while pending or running:
+            if not errors:
+                for task in [t for t in pending if all(dep in results for dep in t.depends_on)]:
+                    inputs = {dep: results[dep] for dep in task.depends_on}
+                    running[executor.submit(_run, task, inputs)] = task
+                    pending.remove(task)
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                value, buffer, exc = future.result()
+                buffers[task.name] = buffer
+                if exc is not None:
+                    logger.debug("Validation task %s raised %s", task.name, exc)
+                    errors[task.name] = exc
+                else:
+                    results[task.name] = value
+
+            while next_to_report < len(tasks) and tasks[next_to_report].name in buffers:
+                reporter.extend(buffers.pop(tasks[next_to_report].name))
+                next_to_report += 1
+
+    # Tasks that never started (after a failure) leave gaps; report whatever ran
+    for name in sorted(buffers, key=order.__getitem__):
+        reporter.extend(buffers[name])
+
+    if errors:
+        raise errors[min(errors, key=order.__getitem__)]
+    return results
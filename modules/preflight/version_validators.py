@@ -6,6 +6,7 @@
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 
+from lib import kubeconfig_index
 from lib.constants import (
     ACM_NAMESPACE,
     AUTO_IMPORT_STRATEGY_DEFAULT,
@@ -83,10 +84,7 @@ def _check_duplicate_users(self, primary: KubeClient, secondary: KubeClient) ->
         credentials can collide and cause authentication failures.
         """
         try:
-            from kubernetes import config as k8s_config
-
-            # Load the current kubeconfig to check for duplicates
-            contexts, active_context = k8s_config.list_kube_config_contexts()
+            contexts = kubeconfig_index.get_kubeconfig_index().contexts()
             if not contexts:
                 return
 
@@ -144,26 +142,15 @@ def _check_duplicate_users(self, primary: KubeClient, secondary: KubeClient) ->
     def _check_token_expiration(self, client: KubeClient, hub_label: str) -> None:
         """Check service account token expiration."""
         try:
-            # Get current configuration to extract token
+            # Build the configuration from the shared kubeconfig index
             from kubernetes import client as k8s_client
-            from kubernetes import config as k8s_config
-
-            # Load the current kubeconfig
-            k8s_config.load_kube_config(context=client.context)
 
-            # Get the current configuration
-            try:
-                current_config = k8s_client.Configuration.get_default_copy()
-            except Exception:
-                # Fallback for older kubernetes client versions
-                current_config = k8s_client.Configuration()
-                k8s_config.load_kube_config(
-                    context=client.context,
-                    client_configuration=current_config,
-                )
+            current_config = k8s_client.Configuration()
+            kubeconfig_index.get_kubeconfig_index().load_and_set(current_config, context=client.context)
 
             # Extract token from Bearer auth
-            auth_header = current_config.api_key.get("authorization", "")
+            api_key = current_config.api_key or {}
+            auth_header = api_key.get("authorization") or api_key.get("BearerToken") or ""
             if not auth_header.startswith("Bearer "):
                 self.add_result(
                     f"Token Expiration ({hub_label})",
@@ -521,7 +508,7 @@ def _non_local_cluster_count(self, client: KubeClient) -> int:
             Number of non-local clusters
         """
         try:
-            mcs = client.list_custom_resources(
+            mcs = client.list_metadata(
                 group="cluster.open-cluster-management.io",
                 version="v1",
                 plural="managedclusters",
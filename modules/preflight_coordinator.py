@@ -3,7 +3,7 @@
 # Runbook: Step 0 (pre-flight validation)
 
 import logging
-from typing import Tuple, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
 from kubernetes.client.rest import ApiException
 
@@ -11,6 +11,7 @@
 from lib.constants import OBSERVABILITY_NAMESPACE
 from lib.exceptions import ValidationError
 from lib.kube_client import KubeClient
+from lib.rbac_cache import RBACResultCache
 from lib.rbac_validator import validate_rbac_permissions
 
 from .preflight import (
@@ -30,6 +31,7 @@
     ValidationReporter,
     VersionValidator,
 )
+from .preflight.scheduler import ValidationTask, run_validation_graph
 
 logger = logging.getLogger("acm_switchover")
 
@@ -54,6 +56,7 @@ def __init__(
         include_decommission: bool = False,
         argocd_manage: bool = False,
         skip_gitops_check: bool = False,
+        rbac_cache: Optional[RBACResultCache] = None,
     ) -> None:
         self.primary = primary_client
         self.secondary = secondary_client
@@ -62,6 +65,7 @@ def __init__(
         self.include_decommission = include_decommission
         self.argocd_manage = argocd_manage
         self.skip_gitops_check = skip_gitops_check
+        self.rbac_cache = rbac_cache
 
         self.reporter = ValidationReporter()
         self.kubeconfig_validator = KubeconfigValidator(self.reporter)
@@ -132,12 +136,8 @@ def _get_effective_argocd_rbac_mode(self) -> Tuple[str, str, str]:
         logger.info("Argo CD Applications CRD not found on either hub, skipping Argo CD RBAC permission checks")
         return "none", "unknown", "unknown"
 
-    def validate_all(self) -> Tuple[bool, PreflightConfig]:
-        """Run all validation checks and return pass/fail with detected config."""
-
-        logger.info("Starting pre-flight validation...")
-
-        # RBAC validation (unless explicitly skipped)
+    def _validate_rbac(self) -> None:
+        """Validate RBAC permissions on both hubs (unless explicitly skipped)."""
         if not self.skip_rbac_validation:
             logger.info("Validating RBAC permissions...")
             try:
@@ -170,6 +170,7 @@ def validate_all(self) -> Tuple[bool, PreflightConfig]:
                     argocd_mode=effective_argocd_mode,
                     argocd_install_type=primary_argocd_install_type,
                     secondary_argocd_install_type=secondary_argocd_install_type,
+                    rbac_cache=self.rbac_cache,
                 )
             except ValidationError as e:
                 self.reporter.add_result(
@@ -205,44 +206,77 @@ def validate_all(self) -> Tuple[bool, PreflightConfig]:
         else:
             logger.info("RBAC validation skipped (--skip-rbac-validation specified)")
 
-        # Kubeconfig structure and token validation
-        self.kubeconfig_validator.run(self.primary, self.secondary, method=self.method)
-
-        self.tooling_validator.run()
-        self.namespace_validator.run(self.primary, self.secondary)
-        primary_version, secondary_version = self.version_validator.run(
-            self.primary,
-            self.secondary,
-        )
-
-        # Auto-import strategy (detect-only, ACM 2.14+)
-        AutoImportStrategyValidator(self.reporter).run(
-            self.primary,
-            self.secondary,
-            primary_version,
-            secondary_version,
+    def _build_tasks(self) -> List[ValidationTask]:
+        """Declare the preflight checks and their dependencies, in reporting order."""
+
+        def _auto_import(deps: Dict[str, Any]) -> None:
+            # Auto-import strategy (detect-only, ACM 2.14+)
+            primary_version, secondary_version = deps["versions"]
+            AutoImportStrategyValidator(self.reporter).run(
+                self.primary,
+                self.secondary,
+                primary_version,
+                secondary_version,
+            )
+
+        def _observability_prereqs(deps: Dict[str, Any]) -> None:
+            _primary_observability, secondary_observability = deps["observability"]
+            if secondary_observability:
+                self.observability_prereq_validator.run(self.secondary)
+
+        tasks = [
+            ValidationTask("rbac", lambda _: self._validate_rbac()),
+            # Kubeconfig structure and token validation
+            ValidationTask(
+                "kubeconfig", lambda _: self.kubeconfig_validator.run(self.primary, self.secondary, method=self.method)
+            ),
+            ValidationTask("tooling", lambda _: self.tooling_validator.run()),
+            ValidationTask("namespaces", lambda _: self.namespace_validator.run(self.primary, self.secondary)),
+            ValidationTask("versions", lambda _: self.version_validator.run(self.primary, self.secondary)),
+            ValidationTask("auto_import_strategy", _auto_import, depends_on=("versions",)),
+            ValidationTask(
+                "hub_components_primary", lambda _: self.hub_component_validator.run(self.primary, "primary")
+            ),
+            ValidationTask(
+                "hub_components_secondary", lambda _: self.hub_component_validator.run(self.secondary, "secondary")
+            ),
+            ValidationTask("backups", lambda _: self.backup_validator.run(self.primary)),
+            ValidationTask("backup_schedule", lambda _: self.backup_schedule_validator.run(self.primary)),
+            ValidationTask(
+                "bsl_primary", lambda _: self.backup_storage_location_validator.run(self.primary, "primary")
+            ),
+            ValidationTask(
+                "bsl_secondary", lambda _: self.backup_storage_location_validator.run(self.secondary, "secondary")
+            ),
+            ValidationTask("cluster_deployments", lambda _: self.cluster_deployment_validator.run(self.primary)),
+            ValidationTask(
+                "managed_cluster_backups", lambda _: self.managed_cluster_backup_validator.run(self.primary)
+            ),
+        ]
+        if self.method == "passive":
+            tasks.append(ValidationTask("passive_sync", lambda _: self.passive_sync_validator.run(self.secondary)))
+        tasks.extend(
+            [
+                ValidationTask(
+                    "observability", lambda _: self.observability_detector.detect(self.primary, self.secondary)
+                ),
+                ValidationTask("observability_prereqs", _observability_prereqs, depends_on=("observability",)),
+            ]
         )
+        return tasks
 
-        for label, client in (("primary", self.primary), ("secondary", self.secondary)):
-            self.hub_component_validator.run(client, label)
-
-        self.backup_validator.run(self.primary)
-        self.backup_schedule_validator.run(self.primary)
-        self.backup_storage_location_validator.run(self.primary, "primary")
-        self.backup_storage_location_validator.run(self.secondary, "secondary")
-        self.cluster_deployment_validator.run(self.primary)
-        self.managed_cluster_backup_validator.run(self.primary)
+    def validate_all(self) -> Tuple[bool, PreflightConfig]:
+        """Run all validation checks and return pass/fail with detected config.
 
-        if self.method == "passive":
-            self.passive_sync_validator.run(self.secondary)
+        Independent checks run concurrently (see ``modules.preflight.scheduler``);
+        results are reported in the same order as a sequential run.
+        """
 
-        primary_observability, secondary_observability = self.observability_detector.detect(
-            self.primary,
-            self.secondary,
-        )
+        logger.info("Starting pre-flight validation...")
 
-        if secondary_observability:
-            self.observability_prereq_validator.run(self.secondary)
+        results = run_validation_graph(self._build_tasks(), self.reporter)
+        primary_version, secondary_version = results["versions"]
+        primary_observability, secondary_observability = results["observability"]
 
         self.reporter.print_summary()
 
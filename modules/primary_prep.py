@@ -5,6 +5,7 @@
 # Runbook: Steps 1-3 (Method 1) / F1-F3 (Method 2)
 
 import copy
+import functools
 import logging
 import time
 from typing import Any, Dict, Optional
@@ -12,7 +13,9 @@
 from kubernetes.client.rest import ApiException
 
 from lib import argocd as argocd_lib
+from lib.bulk import run_bulk
 from lib.constants import (
+    ARGOCD_PAUSE_WAVE_SIZE,
     BACKUP_NAMESPACE,
     DISABLE_AUTO_IMPORT_ANNOTATION,
     LOCAL_CLUSTER_NAME,
@@ -49,35 +52,18 @@ def __init__(
         self.argocd_manage = argocd_manage
         self.secondary = secondary_client
 
-    @staticmethod
-    def _pause_entry_matches(entry: Dict[str, Any], hub: str, namespace: str, name: str) -> bool:
-        """Return True when an Argo CD pause-state entry matches one Application."""
-        return entry.get("hub") == hub and entry.get("namespace") == namespace and entry.get("name") == name
-
     @staticmethod
     def _is_pause_applied(entry: Dict[str, Any]) -> bool:
         """Treat missing pause_applied as legacy-applied unless the entry is dry-run only."""
         return entry.get("pause_applied", not entry.get("dry_run", False))
 
-    def _find_pause_entry(
-        self,
-        paused_apps: list[Dict[str, Any]],
-        hub: str,
-        namespace: str,
-        name: str,
-    ) -> Optional[Dict[str, Any]]:
-        for entry in paused_apps:
-            if self._pause_entry_matches(entry, hub, namespace, name):
-                return entry
-        return None
-
-    def _persist_paused_apps(self, paused_apps: list[Dict[str, Any]]) -> None:
+    def _persist_paused_apps(self, paused_apps: argocd_lib.PausedAppIndex) -> None:
         """Persist a deep copy so StateManager notices nested entry changes."""
-        self.state.set_config("argocd_paused_apps", copy.deepcopy(paused_apps))
+        self.state.set_config("argocd_paused_apps", copy.deepcopy(paused_apps.to_list()))
 
     def _upsert_pause_entry(
         self,
-        paused_apps: list[Dict[str, Any]],
+        paused_apps: argocd_lib.PausedAppIndex,
         hub: str,
         namespace: str,
         name: str,
@@ -85,11 +71,7 @@ def _upsert_pause_entry(
         *,
         pause_applied: bool,
     ) -> Dict[str, Any]:
-        entry = self._find_pause_entry(paused_apps, hub, namespace, name)
-        if entry is None:
-            entry = {"hub": hub, "namespace": namespace, "name": name}
-            paused_apps.append(entry)
-
+        entry = paused_apps.upsert(hub, namespace, name)
         entry["original_sync_policy"] = original_sync_policy
         entry["pause_applied"] = pause_applied
         if self.dry_run:
@@ -98,15 +80,6 @@ def _upsert_pause_entry(
             entry.pop("dry_run", None)
         return entry
 
-    def _remove_pause_entry(
-        self,
-        paused_apps: list[Dict[str, Any]],
-        hub: str,
-        namespace: str,
-        name: str,
-    ) -> None:
-        paused_apps[:] = [entry for entry in paused_apps if not self._pause_entry_matches(entry, hub, namespace, name)]
-
     def prepare(self) -> bool:
         """
         Execute all primary hub preparation steps.
@@ -180,7 +153,7 @@ def _pause_argocd_acm_apps(self) -> None:
         run_id = argocd_lib.run_id_or_new(self.state.get_config("argocd_run_id"))
         self.state.set_config("argocd_run_id", run_id)
         self.state.set_config("argocd_pause_dry_run", self.dry_run)
-        paused_apps = copy.deepcopy(self.state.get_config("argocd_paused_apps") or [])
+        paused_apps = argocd_lib.PausedAppIndex(copy.deepcopy(self.state.get_config("argocd_paused_apps") or []))
         pause_failures = 0
 
         for client, hub_label, discovery in discoveries:
@@ -188,23 +161,23 @@ def _pause_argocd_acm_apps(self) -> None:
                 logger.info("Argo CD Applications CRD not found on %s; skipping Argo CD pause", hub_label)
                 continue
             try:
-                apps = argocd_lib.list_argocd_applications(client, namespaces=None)
+                acm_apps = argocd_lib.find_acm_touching_apps(
+                    argocd_lib.iter_argocd_applications(client, namespaces=None)
+                )
             except Exception as exc:
                 raise SwitchoverError(f"Failed to list Argo CD Applications on {hub_label} hub: {exc}") from exc
-            acm_apps = argocd_lib.find_acm_touching_apps(apps)
+            to_pause = []
+            recovered = False
             for impact in acm_apps:
-                meta = impact.app.get("metadata", {}) or {}
-                namespace = meta.get("namespace", "")
-                name = meta.get("name", "")
-                sync_policy = dict((impact.app.get("spec", {}) or {}).get("syncPolicy") or {})
-                has_automated = "automated" in sync_policy
-                existing_entry = self._find_pause_entry(paused_apps, hub_label, namespace, name)
+                namespace, name = impact.namespace, impact.name
+                has_automated = "automated" in impact.sync_policy
+                existing_entry = paused_apps.find(hub_label, namespace, name)
 
                 if existing_entry:
                     if not self._is_pause_applied(existing_entry) and not self.dry_run and not has_automated:
                         existing_entry["pause_applied"] = True
                         existing_entry.pop("dry_run", None)
-                        self._persist_paused_apps(paused_apps)
+                        recovered = True
                         logger.info(
                             "  Recovered Argo CD pause state for %s/%s on %s",
                             namespace,
@@ -219,43 +192,13 @@ def _pause_argocd_acm_apps(self) -> None:
                 if not has_automated:
                     logger.debug("  Skip %s/%s (no auto-sync)", namespace, name)
                     continue
+                to_pause.append(impact)
 
-                entry = self._upsert_pause_entry(
-                    paused_apps,
-                    hub_label,
-                    namespace,
-                    name,
-                    sync_policy,
-                    pause_applied=False,
-                )
+            if recovered:
                 self._persist_paused_apps(paused_apps)
-                result = argocd_lib.pause_autosync(client, impact.app, run_id)
-                if result.patched:
-                    entry["original_sync_policy"] = result.original_sync_policy
-                    entry["pause_applied"] = not self.dry_run
-                    if self.dry_run:
-                        logger.info(
-                            "  [DRY-RUN] Would pause Argo CD Application %s/%s on %s",
-                            result.namespace,
-                            result.name,
-                            hub_label,
-                        )
-                    else:
-                        logger.info(
-                            "  Paused Argo CD Application %s/%s on %s",
-                            result.namespace,
-                            result.name,
-                            hub_label,
-                        )
-                    self._persist_paused_apps(paused_apps)
-                elif result.error:
-                    self._remove_pause_entry(paused_apps, hub_label, namespace, name)
-                    self._persist_paused_apps(paused_apps)
-                    pause_failures += 1
-                else:
-                    self._remove_pause_entry(paused_apps, hub_label, namespace, name)
-                    self._persist_paused_apps(paused_apps)
-                    logger.debug("  Skip %s/%s (no auto-sync)", result.namespace, result.name)
+            for start in range(0, len(to_pause), ARGOCD_PAUSE_WAVE_SIZE):
+                wave = to_pause[start : start + ARGOCD_PAUSE_WAVE_SIZE]
+                pause_failures += self._pause_argocd_wave(client, hub_label, wave, paused_apps, run_id)
         if pause_failures:
             raise SwitchoverError(f"Argo CD auto-sync pause failed for {pause_failures} Application(s)")
         logger.info(
@@ -264,6 +207,77 @@ def _pause_argocd_acm_apps(self) -> None:
             run_id,
         )
 
+    def _pause_argocd_wave(
+        self,
+        client: KubeClient,
+        hub_label: str,
+        wave: list[argocd_lib.AppImpact],
+        paused_apps: argocd_lib.PausedAppIndex,
+        run_id: str,
+    ) -> int:
+        """Pause one wave of Applications on a hub and return the number that failed.
+
+        The whole wave is recorded as unconfirmed with one state write before any
+        patch is sent, and the outcomes are recorded with one more write afterwards.
+        """
+        operations = []
+        entries = {}
+        for impact in wave:
+            namespace, name = impact.namespace, impact.name
+            entries[f"{namespace}/{name}"] = self._upsert_pause_entry(
+                paused_apps,
+                hub_label,
+                namespace,
+                name,
+                dict(impact.sync_policy),
+                pause_applied=False,
+            )
+            operations.append(
+                (f"{namespace}/{name}", functools.partial(argocd_lib.pause_autosync, client, impact.app, run_id))
+            )
+        self._persist_paused_apps(paused_apps)
+
+        bulk = run_bulk(f"Argo CD auto-sync pause on {hub_label} hub", operations)
+        failures = 0
+        for key, entry in entries.items():
+            namespace, name = entry["namespace"], entry["name"]
+            result = bulk.results.get(key)
+            if result is None:
+                logger.warning(
+                    "  Failed to pause Argo CD Application %s/%s on %s: %s",
+                    namespace,
+                    name,
+                    hub_label,
+                    bulk.failed[key],
+                )
+                paused_apps.remove(hub_label, namespace, name)
+                failures += 1
+            elif result.patched:
+                entry["original_sync_policy"] = result.original_sync_policy
+                entry["pause_applied"] = not self.dry_run
+                if self.dry_run:
+                    logger.info(
+                        "  [DRY-RUN] Would pause Argo CD Application %s/%s on %s",
+                        result.namespace,
+                        result.name,
+                        hub_label,
+                    )
+                else:
+                    logger.info(
+                        "  Paused Argo CD Application %s/%s on %s",
+                        result.namespace,
+                        result.name,
+                        hub_label,
+                    )
+            elif result.error:
+                paused_apps.remove(hub_label, namespace, name)
+                failures += 1
+            else:
+                paused_apps.remove(hub_label, namespace, name)
+                logger.debug("  Skip %s/%s (no auto-sync)", result.namespace, result.name)
+        self._persist_paused_apps(paused_apps)
+        return failures
+
     def _pause_backup_schedule(self):
         """Pause BackupSchedule (version-aware)."""
         logger.info("Pausing BackupSchedule...")
@@ -343,7 +357,8 @@ def _disable_auto_import(self):
             logger.warning("No ManagedClusters found")
             return
 
-        count = 0
+        patch = {"metadata": {"annotations": {DISABLE_AUTO_IMPORT_ANNOTATION: ""}}}
+        operations = []
         for mc in managed_clusters:
             mc_name = mc.get("metadata", {}).get("name")
 
@@ -361,15 +376,21 @@ def _disable_auto_import(self):
                 )
                 continue
 
-            # Add annotation
-            patch = {"metadata": {"annotations": {DISABLE_AUTO_IMPORT_ANNOTATION: ""}}}
-
-            self.primary.patch_managed_cluster(name=mc_name, patch=patch)
+            operations.append(
+                (mc_name, functools.partial(self.primary.patch_managed_cluster, name=mc_name, patch=patch))
+            )
 
-            count += 1
+        result = run_bulk("disable-auto-import annotation", operations)
+        for mc_name in result.succeeded:
             logger.debug("Added disable-auto-import annotation to %s", mc_name)
 
-        logger.info("Disabled auto-import on %s ManagedCluster(s)", count)
+        if not result.ok:
+            raise SwitchoverError(
+                f"Failed to add disable-auto-import annotation to {len(result.failed)} ManagedCluster(s): "
+                f"{result.failure_summary()}"
+            )
+
+        logger.info("Disabled auto-import on %s ManagedCluster(s)", len(result.succeeded))
 
     def _scale_down_thanos_compactor(self):
         """Scale down Thanos compactor StatefulSet."""
@@ -9,6 +9,7 @@
     ./show_state.py [state_file]
     ./show_state.py --list
     ./show_state.py --json [state_file]
+    ./show_state.py --timing [state_file]
 """
 
 import argparse
@@ -20,10 +21,14 @@
 from typing import Any, Dict, List, Optional
 
 from lib import __version__, __version_date__
+from lib.state_journal import journal_path_for, read_journal, replay
 from lib.validation import InputValidator, ValidationError
 
 STATE_DIR_ENV_VAR = "ACM_SWITCHOVER_STATE_DIR"
 
+# Width of the waterfall bar column in the timing report
+WATERFALL_WIDTH = 40
+
 # ANSI colors for terminal output
 COLORS = {
     "reset": "\033[0m",
@@ -124,14 +129,15 @@ def find_state_files(state_dir: Optional[str] = None) -> List[str]:
     """Find all state files in the state directory."""
     state_dir = state_dir or _default_state_dir()
     pattern = os.path.join(state_dir, "switchover-*.json")
-    return sorted(glob.glob(pattern))
+    # Skip per-run API metrics files written next to each state file
+    return sorted(path for path in glob.glob(pattern) if not path.endswith(".api-metrics.json"))
 
 
 def load_state(state_file: str) -> Optional[Dict[str, Any]]:
-    """Load state from file."""
+    """Load state from file, including changes still in its write-ahead journal."""
     try:
         with open(state_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            state = json.load(f)
     except FileNotFoundError:
         print(f"Error: State file not found: {state_file}")
         return None
@@ -139,6 +145,13 @@ def load_state(state_file: str) -> Optional[Dict[str, Any]]:
         print(f"Error: Invalid JSON in state file: {e}")
         return None
 
+    if isinstance(state, dict):
+        try:
+            replay(state, read_journal(journal_path_for(state_file)))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Ignoring unreadable state journal: {e}")
+    return state
+
 
 def print_header(title: str, use_color: bool = True):
     """Print a section header."""
@@ -218,6 +231,8 @@ def print_state(state: Dict[str, Any], use_color: bool = True):
             else:
                 print(f"  {key}: {value}")
 
+    print_timing(state, use_color)
+
     # Errors
     errors = state.get("errors", [])
     if errors:
@@ -232,6 +247,116 @@ def print_state(state: Dict[str, Any], use_color: bool = True):
     print()
 
 
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration as e.g. '4.2s', '3m 07s' or '1h 02m'."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    if minutes < 60:
+        return f"{minutes}m {secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def build_timing_rows(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Collect timed phases and steps as rows with start offset and duration.
+
+    Phases come first, then steps, each ordered by start time. A phase that
+    has not ended yet runs until the state file's last update.
+    """
+    last_updated = _parse_timestamp(state.get("last_updated", ""))
+    rows: List[Dict[str, Any]] = []
+
+    for entry in state.get("phase_timings", []):
+        start = _parse_timestamp(entry.get("started_at", ""))
+        if start is None:
+            continue
+        end = _parse_timestamp(entry.get("ended_at", "")) if entry.get("ended_at") else None
+        duration = entry.get("duration_seconds")
+        if end is None:
+            end = max(start, last_updated) if last_updated else start
+        if duration is None:
+            duration = (end - start).total_seconds()
+        phase = entry.get("phase", "unknown")
+        rows.append(
+            {
+                "kind": "phase",
+                "label": PHASE_INFO.get(phase, (phase, ""))[0],
+                "start": start,
+                "duration": float(duration),
+                "open": "ended_at" not in entry,
+                "interrupted": bool(entry.get("interrupted")),
+            }
+        )
+
+    steps = []
+    for step in state.get("completed_steps", []):
+        start = _parse_timestamp(step.get("started_at", ""))
+        if start is None or step.get("duration_seconds") is None:
+            continue
+        steps.append(
+            {
+                "kind": "step",
+                "label": step.get("name", "unknown"),
+                "start": start,
+                "duration": float(step["duration_seconds"]),
+                "open": False,
+                "interrupted": False,
+            }
+        )
+
+    rows.sort(key=lambda row: row["start"])
+    steps.sort(key=lambda row: row["start"])
+    return rows + steps
+
+
+def print_timing(state: Dict[str, Any], use_color: bool = True):
+    """Print phase and step durations as a waterfall relative to the first start."""
+    rows = build_timing_rows(state)
+    if not rows:
+        return
+
+    origin = min(row["start"] for row in rows)
+    span = max((row["start"] - origin).total_seconds() + row["duration"] for row in rows) or 1.0
+    label_width = max(len(row["label"]) for row in rows) + 2
+
+    print_section(f"Timing (total {format_seconds(span)})", use_color)
+    previous_kind = None
+    for row in rows:
+        if row["kind"] != previous_kind:
+            heading = "Phases" if row["kind"] == "phase" else "Steps"
+            print(f"  {color(heading, 'bold', use_color)}")
+            previous_kind = row["kind"]
+
+        offset = (row["start"] - origin).total_seconds()
+        bar_start = int(offset / span * WATERFALL_WIDTH)
+        bar_len = max(1, int(round(row["duration"] / span * WATERFALL_WIDTH)))
+        bar_len = min(bar_len, WATERFALL_WIDTH - bar_start) or 1
+        bar = " " * bar_start + "█" * bar_len
+        share = row["duration"] / span * 100
+
+        note = ""
+        if row["open"]:
+            note = color(" (in progress)", "yellow", use_color)
+        elif row["interrupted"]:
+            note = color(" (interrupted)", "yellow", use_color)
+
+        bar_color = "blue" if row["kind"] == "phase" else "green"
+        print(
+            f"    {row['label']:<{label_width}}"
+            f"{color(f'+{format_seconds(offset):>8}', 'gray', use_color)} "
+            f"{format_seconds(row['duration']):>8} {share:5.1f}%  "
+            f"{color(bar, bar_color, use_color)}{note}"
+        )
+
+
 def print_archived_restores(restores: List[Dict], use_color: bool = True):
     """Print archived restore details."""
     if not restores:
@@ -327,6 +452,9 @@ def main():
 
   # Output as JSON
   %(prog)s --json
+
+  # Show only the phase/step timing waterfall
+  %(prog)s --timing
         """,
     )
 
@@ -347,6 +475,12 @@ def main():
         action="store_true",
         help="Output raw JSON instead of formatted view",
     )
+    parser.add_argument(
+        "--timing",
+        "-t",
+        action="store_true",
+        help="Show only the phase and step timing waterfall",
+    )
     parser.add_argument(
         "--no-color",
         action="store_true",
@@ -386,6 +520,12 @@ def main():
 
     if args.json:
         print(json.dumps(state, indent=2))
+    elif args.timing:
+        if not build_timing_rows(state):
+            print("No timing recorded in this state file.")
+            return 0
+        print_timing(state, use_color)
+        print()
     else:
         print_state(state, use_color)
 
@@ -55,6 +55,7 @@ def mock_secondary_client():
     """Create a mock KubeClient for secondary hub."""
     mock = Mock()
     mock.dry_run = False  # Ensure dry_run is False for tests
+    mock.list_metadata.return_value = []
     return mock
 
 
@@ -158,6 +159,7 @@ def list_custom_resources_side_effect(**kwargs):
             return []
 
         mock_secondary_client.list_custom_resources.side_effect = list_custom_resources_side_effect
+        mock_secondary_client.list_metadata.side_effect = list_custom_resources_side_effect
 
         # Mock patch for activation - mark patch as applied and return patched resource
         def patch_side_effect(**kwargs):
@@ -277,6 +279,7 @@ def list_custom_resources_side_effect(**kwargs):
             return []
 
         mock_secondary_client.list_custom_resources.side_effect = list_custom_resources_side_effect
+        mock_secondary_client.list_metadata.side_effect = list_custom_resources_side_effect
 
         def get_custom_resource_side_effect(**kwargs):
             # Passive sync Restore (used by _verify_passive_sync, _get_restore_or_raise, and _verify_patch_applied)
@@ -444,8 +447,9 @@ def get_custom_resource_side_effect(**kwargs):
 
         mock_secondary_client.get_custom_resource.side_effect = get_custom_resource_side_effect
 
-        # Mock list_custom_resources for managed clusters
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # restore discovery
+        # Mock list_metadata for managed clusters
+        mock_secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "cluster1"}},
             {"metadata": {"name": "local-cluster"}},
         ]
@@ -492,7 +496,8 @@ def get_custom_resource_side_effect(**kwargs):
             return None
 
         mock_secondary_client.get_custom_resource.side_effect = get_custom_resource_side_effect
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # restore discovery
+        mock_secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "prod1"}},
             {"metadata": {"name": "prod2"}},
             {"metadata": {"name": "prod3"}},
@@ -732,7 +737,7 @@ def test_apply_immediate_import_annotations(self, mock_secondary_client, mock_st
         )
 
         mock_secondary_client.get_configmap.return_value = None
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "cluster-a", "annotations": {}}},
             {"metadata": {"name": "cluster-b", "annotations": {IMMEDIATE_IMPORT_ANNOTATION: ""}}},
             {"metadata": {"name": "local-cluster", "annotations": {}}},
@@ -757,7 +762,7 @@ def test_apply_immediate_import_annotations_handles_completed_value(
         )
 
         mock_secondary_client.get_configmap.return_value = {"data": {}}
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "cluster-a", "annotations": {IMMEDIATE_IMPORT_ANNOTATION: "Completed"}}},
             {"metadata": {"name": "local-cluster", "annotations": {}}},
         ]
@@ -801,7 +806,7 @@ def test_apply_immediate_import_annotations_raises_on_failures(self, mock_second
         )
 
         mock_secondary_client.get_configmap.return_value = None
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "cluster-a", "annotations": {}}},
             {"metadata": {"name": "local-cluster", "annotations": {}}},
         ]
@@ -928,13 +933,13 @@ def _make_activation(self, mock_secondary_client, mock_state_manager, min_cluste
 
     def test_zero_clusters_with_min_zero_logs_warning_not_error(self, mock_secondary_client, mock_state_manager):
         """min_managed_clusters=0 should log a warning when zero clusters found, not raise."""
-        mock_secondary_client.list_custom_resources.return_value = []
+        mock_secondary_client.list_metadata.return_value = []
         act = self._make_activation(mock_secondary_client, mock_state_manager, min_clusters=0)
         act._verify_managed_clusters_restored()  # Must not raise
 
     def test_nonzero_min_raises_when_below_threshold(self, mock_secondary_client, mock_state_manager):
         """min_managed_clusters > 0 must raise FatalError when fewer clusters are found."""
-        mock_secondary_client.list_custom_resources.return_value = []
+        mock_secondary_client.list_metadata.return_value = []
         act = self._make_activation(mock_secondary_client, mock_state_manager, min_clusters=2)
 
         with pytest.raises(FatalError, match="Expected at least 2"):
@@ -942,7 +947,7 @@ def test_nonzero_min_raises_when_below_threshold(self, mock_secondary_client, mo
 
     def test_meets_min_cluster_count_passes(self, mock_secondary_client, mock_state_manager):
         """Activation succeeds when cluster count meets or exceeds min_managed_clusters."""
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "cluster-a"}},
             {"metadata": {"name": "cluster-b"}},
         ]
@@ -951,7 +956,7 @@ def test_meets_min_cluster_count_passes(self, mock_secondary_client, mock_state_
 
     def test_local_cluster_excluded_from_count(self, mock_secondary_client, mock_state_manager):
         """local-cluster must not count toward the minimum managed cluster total."""
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "local-cluster"}},
         ]
         act = self._make_activation(mock_secondary_client, mock_state_manager, min_clusters=1)
@@ -0,0 +1,173 @@
+"""Unit tests for lib/api_metrics.py.
+
+Tests per-call aggregation, transport attribution through the retry
+decorator, and the end-of-run table/JSON output.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client import Configuration
+from kubernetes.client.rest import ApiException
+
+from lib import api_metrics
+from lib.kube_client import _InstrumentedApiClient, retry_api_call
+
+
+class _FakeClient:
+    """Minimal object carrying api_metrics, as KubeClient does."""
+
+    def __init__(self, context="hub1"):
+        self.api_metrics = api_metrics.ApiCallMetrics(context)
+        self.failures = []
+
+    @retry_api_call
+    def get_custom_resource(self, group, version, plural, name):
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"metadata": {"name": name}}
+
+    @retry_api_call
+    def list_namespaces(self):
+        return []
+
+
+def _throttled_error():
+    exc = ApiException(status=429)
+    exc.headers = {"Retry-After": "0"}
+    return exc
+
+
+@pytest.mark.unit
+class TestRetryDecoratorMetrics:
+    """Tests for the metrics recorded by retry_api_call."""
+
+    def test_records_calls_and_retries_by_plural(self):
+        fake = _FakeClient()
+        fake.failures = [_throttled_error(), _throttled_error()]
+
+        fake.get_custom_resource("velero.io", "v1", "backups", name="b1")
+        fake.get_custom_resource(group="velero.io", version="v1", plural="backups", name="b2")
+        fake.list_namespaces()
+
+        stats = fake.api_metrics.snapshot()
+        backups = stats[("hub1", "get", "backups")]
+        assert backups.calls == 2
+        assert backups.retries == 2
+        assert stats[("hub1", "list", "namespaces")].calls == 1
+
+    def test_failed_call_is_still_recorded(self):
+        fake = _FakeClient()
+        fake.failures = [ApiException(status=403)]
+
+        with pytest.raises(ApiException):
+            fake.get_custom_resource("velero.io", "v1", "backups", name="b1")
+
+        assert fake.api_metrics.snapshot()[("hub1", "get", "backups")].calls == 1
+
+
+@pytest.mark.unit
+class TestTransportAttribution:
+    """Tests for request-level recording in the instrumented ApiClient."""
+
+    def test_requests_are_attributed_to_active_call(self):
+        metrics = api_metrics.ApiCallMetrics("hub1")
+        api_client = _InstrumentedApiClient(Configuration(), None, metrics)
+        response = MagicMock(status=404, headers={}, data=b'{"kind":"Status"}')
+
+        call = metrics.begin_call("get", "managedclusters")
+        with patch("lib.kube_client.client.ApiClient.call_api", return_value=response), patch(
+            "lib.kube_client.client.ApiClient.response_deserialize"
+        ):
+            api_client.call_api("GET", "https://api.example:6443/apis/x.io/v1/managedclusters/c1")
+            api_client.response_deserialize(response, {})
+        metrics.end_call(call, 0.5)
+
+        entry = metrics.snapshot()[("hub1", "get", "managedclusters")]
+        assert entry.requests == 1
+        assert entry.errors_4xx == 1
+        assert entry.bytes_received == len(response.data)
+        assert entry.total_seconds == 0.5
+
+    def test_legacy_client_is_instrumented_in_request(self):
+        metrics = api_metrics.ApiCallMetrics("hub1")
+        limiter = MagicMock()
+        api_client = _InstrumentedApiClient(Configuration(), limiter, metrics)
+        response = MagicMock(status=200, headers={}, data=b'{"items":[]}')
+        throttled = ApiException(status=429, reason="Too Many Requests")
+        throttled.headers = {"Retry-After": "2"}
+        url = "https://api.example:6443/apis/x.io/v1/managedclusters"
+
+        call = metrics.begin_call("list", "managedclusters")
+        with patch("lib.kube_client._LEGACY_API_CLIENT", True), patch(
+            "lib.kube_client.client.ApiClient.request", create=True, side_effect=[response, throttled]
+        ):
+            api_client.request("GET", url, _preload_content=True)
+            with pytest.raises(ApiException):
+                api_client.request("GET", url, _preload_content=True)
+        metrics.end_call(call, 0.5)
+
+        entry = metrics.snapshot()[("hub1", "list", "managedclusters")]
+        assert entry.requests == 2
+        assert entry.errors_4xx == 1
+        assert entry.bytes_received == len(response.data)
+        limiter.pause.assert_called_once_with(2.0)
+
+    def test_unattributed_requests_use_url_resource(self):
+        metrics = api_metrics.ApiCallMetrics("hub1")
+
+        metrics.record_request("GET", "https://h/api/v1/namespaces/ns1/pods?watch=true", 503, 0.1)
+
+        entry = metrics.snapshot()[("hub1", "get", "pods")]
+        assert entry.errors_5xx == 1
+        assert entry.calls == 0
+
+
+@pytest.mark.unit
+class TestOutput:
+    """Tests for collect, format_table and write_json."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://h/api/v1/namespaces", "namespaces"),
+            ("https://h/api/v1/namespaces/ns1", "namespaces"),
+            ("https://h/api/v1/namespaces/ns1/configmaps/cm", "configmaps"),
+            ("https://h/apis/velero.io/v1/namespaces/ns1/backups?limit=500", "backups"),
+            ("https://h/apis/cluster.open-cluster-management.io/v1/managedclusters", "managedclusters"),
+        ],
+    )
+    def test_resource_from_url(self, url, expected):
+        assert api_metrics._resource_from_url(url) == expected
+
+    def test_collect_sorts_slowest_first_and_skips_missing_clients(self):
+        first = api_metrics.ApiCallMetrics("hub1")
+        second = api_metrics.ApiCallMetrics("hub2")
+        first.end_call(first.begin_call("get", "backups"), 0.2)
+        second.end_call(second.begin_call("list", "managedclusters"), 1.5)
+
+        rows = api_metrics.collect([first, None, second])
+
+        assert [(row["context"], row["resource"]) for row in rows] == [
+            ("hub2", "managedclusters"),
+            ("hub1", "backups"),
+        ]
+        table = api_metrics.format_table(rows, limit=1)
+        assert len(table) == 2
+        assert table[0].startswith("CONTEXT")
+        assert "managedclusters" in table[1]
+
+    def test_write_json_next_to_state_file(self, tmp_path):
+        state_file = str(tmp_path / "switchover-a__b.json")
+        metrics = api_metrics.ApiCallMetrics("hub1")
+        metrics.end_call(metrics.begin_call("patch", "managedclusters"), 0.25)
+
+        path = api_metrics.metrics_path_for_state_file(state_file)
+        api_metrics.write_json(path, api_metrics.collect([metrics]))
+
+        assert path == str(tmp_path / "switchover-a__b.api-metrics.json")
+        with open(path, encoding="utf-8") as handle:
+            payload = json.load(handle)
+        assert payload["calls"][0]["verb"] == "patch"
+        assert payload["calls"][0]["total_seconds"] == 0.25
@@ -4,12 +4,14 @@
 pause/resume autosync logic, and run_id handling.
 """
 
-from unittest.mock import MagicMock
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 from kubernetes.client.rest import ApiException
 
 from lib import argocd as argocd_lib
+from lib.argocd_cache import ArgocdDiscoveryCache
 
 
 @pytest.mark.unit
@@ -67,6 +69,32 @@ def test_includes_app_with_acm_namespace_in_status_resources(self):
         assert len(result) == 1
         assert result[0].resource_count == 1
 
+    def test_keeps_compact_record_and_drops_application(self):
+        """Only identity, syncPolicy and the ACM resource count survive the scan."""
+        sync_policy = {"automated": {"prune": True}, "syncOptions": ["CreateNamespace=true"]}
+
+        def _stream():
+            yield {
+                "metadata": {"namespace": "argocd", "name": "acm-app", "labels": {"team": "platform"}},
+                "spec": {"project": "default", "syncPolicy": sync_policy},
+                "status": {
+                    "resources": [{"kind": "Policy", "namespace": "policies"}, {"kind": "ConfigMap"}],
+                    "history": [{"id": 1}],
+                    "operationState": {"phase": "Succeeded"},
+                },
+            }
+
+        (impact,) = argocd_lib.find_acm_touching_apps(_stream())
+
+        assert impact == argocd_lib.AppImpact(
+            namespace="argocd", name="acm-app", resource_count=1, sync_policy=sync_policy
+        )
+        assert not hasattr(impact, "__dict__")
+        assert impact.app == {
+            "metadata": {"namespace": "argocd", "name": "acm-app"},
+            "spec": {"syncPolicy": sync_policy},
+        }
+
     def test_excludes_app_with_no_acm_resources(self):
         apps = [
             {
@@ -364,6 +392,77 @@ def test_resume_recorded_applications_fails_unconfirmed_pause_entries(self):
         assert summary.restored == 0
         logger.warning.assert_called_with("  Skip %s/%s (pause state was recorded but not confirmed)", "argocd", "app")
 
+    def test_resume_recorded_applications_aggregates_both_hubs(self):
+        """Entries are resumed per hub and tallied the same way as a sequential resume."""
+        entries = [
+            {"hub": hub, "namespace": "argocd", "name": name, "original_sync_policy": {"automated": {}}}
+            for hub, name in (("primary", "a"), ("primary", "b"), ("secondary", "c"), ("secondary", "d"))
+        ]
+        entries.append({"hub": "elsewhere", "namespace": "argocd", "name": "e", "original_sync_policy": {}})
+        primary, secondary = MagicMock(), MagicMock()
+        outcomes = {
+            "a": argocd_lib.ResumeResult(namespace="argocd", name="a", restored=True),
+            "b": argocd_lib.ResumeResult(
+                namespace="argocd", name="b", restored=False, skip_reason=argocd_lib.RESUME_SKIP_REASON_MARKER_MISSING
+            ),
+            "c": argocd_lib.ResumeResult(namespace="argocd", name="c", restored=True),
+        }
+
+        def resume_side_effect(client, namespace, name, original_sync_policy, run_id):
+            if name == "d":
+                raise RuntimeError("connection reset")
+            assert client is (primary if name in ("a", "b") else secondary)
+            return outcomes[name]
+
+        with patch("lib.argocd.resume_autosync", side_effect=resume_side_effect) as resume_autosync:
+            summary = argocd_lib.resume_recorded_applications(entries, "run-1", primary, secondary, MagicMock())
+
+        assert resume_autosync.call_count == 4
+        assert summary == argocd_lib.ResumeSummary(restored=2, already_resumed=1, failed=2)
+
+    def test_resume_recorded_applications_patches_duplicate_record_once(self):
+        """A repeated record counts as already resumed without a second patch."""
+        entry = {"hub": "primary", "namespace": "argocd", "name": "a", "original_sync_policy": {"automated": {}}}
+        restored = argocd_lib.ResumeResult(namespace="argocd", name="a", restored=True)
+
+        with patch("lib.argocd.resume_autosync", return_value=restored) as resume_autosync:
+            summary = argocd_lib.resume_recorded_applications(
+                [entry, dict(entry)], "run-1", MagicMock(), None, MagicMock()
+            )
+
+        resume_autosync.assert_called_once()
+        assert summary == argocd_lib.ResumeSummary(restored=1, already_resumed=1, failed=0)
+
+
+@pytest.mark.unit
+class TestPausedAppIndex:
+    """Test PausedAppIndex."""
+
+    def test_round_trips_records_including_malformed_ones(self):
+        records = [
+            {"hub": "primary", "namespace": "argocd", "name": "a", "pause_applied": True},
+            "not-a-record",
+            {"hub": "secondary", "namespace": "argocd", "name": "a", "pause_applied": False},
+        ]
+        index = argocd_lib.PausedAppIndex(records)
+
+        assert index.to_list() == records
+        assert index == records
+        assert len(index) == 3
+        assert index.find("secondary", "argocd", "a") is records[2]
+        assert index.find("primary", "argocd", "b") is None
+
+    def test_upsert_appends_once_and_remove_drops_every_duplicate(self):
+        duplicate = {"hub": "primary", "namespace": "argocd", "name": "a"}
+        index = argocd_lib.PausedAppIndex([duplicate, dict(duplicate)])
+
+        created = index.upsert("primary", "argocd", "b")
+        assert index.upsert("primary", "argocd", "b") is created
+        assert index.upsert("primary", "argocd", "a") is duplicate
+
+        index.remove("primary", "argocd", "a")
+        assert index.to_list() == [{"hub": "primary", "namespace": "argocd", "name": "b"}]
+
 
 @pytest.mark.unit
 class TestDetectArgocdInstallation:
@@ -421,24 +520,102 @@ def test_application_crd_lookup_failure_raises(self):
             argocd_lib.detect_argocd_installation(client)
 
 
+def _discovery_client(host="https://api.hub1.example:6443", crd_versions=("10", None)):
+    client = MagicMock()
+    client.core_v1.api_client.configuration.host = host
+    versions = dict(zip(argocd_lib.ARGOCD_CRD_NAMES, crd_versions))
+    client.get_metadata.side_effect = lambda **kw: (
+        {"metadata": {"resourceVersion": versions[kw["name"]]}} if versions[kw["name"]] else None
+    )
+    client.get_custom_resource.side_effect = lambda **kw: (
+        {"metadata": {"name": kw["name"]}} if kw["name"] == argocd_lib.ARGOCD_APPLICATIONS_CRD else None
+    )
+    return client
+
+
+@pytest.mark.unit
+class TestDiscoveryCache:
+    """Test per-process and on-disk reuse of detect_argocd_installation results."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_cache(self):
+        yield
+        argocd_lib.configure_discovery_cache(None)
+
+    def test_result_is_memoized_per_client(self):
+        client = _discovery_client()
+
+        first = argocd_lib.detect_argocd_installation(client)
+        assert argocd_lib.detect_argocd_installation(client) is first
+        assert client.get_custom_resource.call_count == 2
+
+    def test_unknown_install_type_is_not_memoized(self):
+        client = MagicMock()
+        client.get_custom_resource.side_effect = [
+            {"metadata": {"name": "applications.argoproj.io"}},
+            ApiException(status=500, reason="Internal Server Error"),
+            {"metadata": {"name": "applications.argoproj.io"}},
+            None,
+        ]
+
+        assert argocd_lib.detect_argocd_installation(client).install_type == "unknown"
+        assert argocd_lib.detect_argocd_installation(client).install_type == "vanilla"
+
+    def test_disk_cache_is_reused_across_processes_until_a_crd_changes(self, tmp_path):
+        argocd_lib.configure_discovery_cache(ArgocdDiscoveryCache(str(tmp_path)))
+        first = argocd_lib.detect_argocd_installation(_discovery_client())
+
+        rerun = _discovery_client()
+        assert argocd_lib.detect_argocd_installation(rerun) == first
+        rerun.get_custom_resource.assert_not_called()
+        assert rerun.get_metadata.call_count == 2
+
+        upgraded = _discovery_client(crd_versions=("11", None))
+        assert argocd_lib.detect_argocd_installation(upgraded) == first
+        assert upgraded.get_custom_resource.call_count == 2
+
+    def test_disk_cache_is_keyed_by_api_server_and_expires(self, tmp_path):
+        argocd_lib.configure_discovery_cache(ArgocdDiscoveryCache(str(tmp_path)))
+        argocd_lib.detect_argocd_installation(_discovery_client())
+
+        other_hub = _discovery_client(host="https://api.hub2.example:6443")
+        argocd_lib.detect_argocd_installation(other_hub)
+        assert other_hub.get_custom_resource.call_count == 2
+
+        argocd_lib.configure_discovery_cache(ArgocdDiscoveryCache(str(tmp_path), ttl_seconds=60))
+        with patch("lib.argocd_cache.time.time", return_value=time.time() + 120):
+            expired = _discovery_client()
+            argocd_lib.detect_argocd_installation(expired)
+        assert expired.get_custom_resource.call_count == 2
+
+    def test_zero_ttl_skips_disk_layer(self, tmp_path):
+        argocd_lib.configure_discovery_cache(ArgocdDiscoveryCache(str(tmp_path), ttl_seconds=0))
+        client = _discovery_client()
+
+        argocd_lib.detect_argocd_installation(client)
+
+        client.get_metadata.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
+
 @pytest.mark.unit
 class TestListArgocdApplications:
     def test_cluster_wide_404_returns_empty(self):
         client = MagicMock()
-        client.list_custom_resources.side_effect = ApiException(status=404, reason="Not Found")
+        client.iter_custom_resources.side_effect = ApiException(status=404, reason="Not Found")
 
         assert argocd_lib.list_argocd_applications(client, namespaces=None) == []
 
     def test_cluster_wide_non_404_raises(self):
         client = MagicMock()
-        client.list_custom_resources.side_effect = ApiException(status=403, reason="Forbidden")
+        client.iter_custom_resources.side_effect = ApiException(status=403, reason="Forbidden")
 
         with pytest.raises(ApiException):
             argocd_lib.list_argocd_applications(client, namespaces=None)
 
     def test_namespaced_listing_aggregates_results(self):
         client = MagicMock()
-        client.list_custom_resources.side_effect = [
+        client.iter_custom_resources.side_effect = [
             [{"metadata": {"namespace": "argocd", "name": "app-1"}}],
             [{"metadata": {"namespace": "openshift-gitops", "name": "app-2"}}],
         ]
@@ -446,3 +623,18 @@ def test_namespaced_listing_aggregates_results(self):
         apps = argocd_lib.list_argocd_applications(client, namespaces=["argocd", "openshift-gitops"])
 
         assert [app["metadata"]["name"] for app in apps] == ["app-1", "app-2"]
+
+    def test_iter_streams_without_materializing(self):
+        client = MagicMock()
+        pages = iter(
+            [
+                {"metadata": {"namespace": "argocd", "name": "app-1"}},
+                {"metadata": {"namespace": "argocd", "name": "app-2"}},
+            ]
+        )
+        client.iter_custom_resources.return_value = pages
+
+        stream = argocd_lib.iter_argocd_applications(client)
+
+        assert next(stream)["metadata"]["name"] == "app-1"
+        assert next(pages)["metadata"]["name"] == "app-2"
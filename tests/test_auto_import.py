@@ -33,7 +33,7 @@ def test_secondary_with_existing_clusters_and_default(self):
         primary.get_configmap.return_value = primary_cm
         # Secondary has one non-local cluster, default strategy
         secondary.get_configmap.return_value = None
-        secondary.list_custom_resources.return_value = [
+        secondary.list_metadata.return_value = [
             {"metadata": {"name": "cluster-a"}},
             {"metadata": {"name": "local-cluster"}},
         ]
@@ -54,7 +54,7 @@ def test_primary_non_default_warns(self):
 
         primary.get_configmap.return_value = {"data": {AUTO_IMPORT_STRATEGY_KEY: AUTO_IMPORT_STRATEGY_SYNC}}
         secondary.get_configmap.return_value = None
-        secondary.list_custom_resources.return_value = []
+        secondary.list_metadata.return_value = []
 
         validator.run(primary, secondary, primary_version="2.14.0", secondary_version="2.14.0")
         msgs = [r for r in reporter.results if r["check"].startswith("Auto-Import Strategy (primary)")]
@@ -70,7 +70,7 @@ def test_sets_import_and_sync_when_flag_on(self, tmp_path):
 
         # Mock client with one non-local managed cluster and default strategy
         client = Mock()
-        client.list_custom_resources.return_value = [{"metadata": {"name": "c1"}}]
+        client.list_metadata.return_value = [{"metadata": {"name": "c1"}}]
         client.get_configmap.return_value = None
 
         act = SecondaryActivation(
@@ -0,0 +1,76 @@
+"""Unit tests for lib/bulk.py.
+
+Tests the bounded-concurrency executor used for per-ManagedCluster mutations.
+"""
+
+import threading
+import time
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from lib.bulk import RateLimiter, run_bulk
+
+
+@pytest.mark.unit
+class TestRunBulk:
+    """Tests for run_bulk."""
+
+    def test_aggregates_successes_and_failures(self):
+        """Raised exceptions and False returns are failures; the rest still run."""
+
+        def _fail():
+            raise ApiException(status=409, reason="Conflict")
+
+        result = run_bulk(
+            "test patch",
+            [("c2", lambda: {}), ("c1", lambda: None), ("bad", _fail), ("declined", lambda: False)],
+            qps=None,
+        )
+
+        assert result.succeeded == ["c1", "c2"]
+        assert set(result.failed) == {"bad", "declined"}
+        assert not result.ok
+        assert result.failure_summary() == "bad (409 Conflict), declined"
+        assert result.results == {"c2": {}, "c1": None, "declined": False}
+
+    def test_empty_operations(self):
+        """No operations produce an empty, successful result."""
+        result = run_bulk("noop", [])
+
+        assert result.ok
+        assert result.succeeded == []
+
+    def test_concurrency_is_bounded(self):
+        """No more than max_workers operations run at the same time."""
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def _op():
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+
+        result = run_bulk("bounded", [(f"c{i}", _op) for i in range(12)], max_workers=3, qps=None)
+
+        assert len(result.succeeded) == 12
+        assert 1 < active["peak"] <= 3
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_spaces_call_starts(self):
+        """Starts are spaced 1/qps apart even when callers arrive together."""
+        limiter = RateLimiter(qps=50)
+        start = time.monotonic()
+
+        for _ in range(5):
+            limiter.acquire()
+
+        # The first call starts immediately, the remaining four wait 20ms each
+        assert time.monotonic() - start >= 0.075
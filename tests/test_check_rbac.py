@@ -1,7 +1,7 @@
 """Tests for check_rbac.py CLI tool."""
 
 import sys
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 
@@ -98,8 +98,8 @@ def test_dual_hub_success(self, mock_logging, mock_rbac_cls, mock_kube_cls):
         assert exc_info.value.code == 0
         assert mock_kube_cls.call_args_list == [call(context="hub1"), call(context="hub2")]
         assert mock_rbac_cls.call_args_list == [
-            call(primary_client, role="operator"),
-            call(secondary_client, role="operator"),
+            call(primary_client, role="operator", batched=True, cache=ANY),
+            call(secondary_client, role="operator", batched=True, cache=ANY),
         ]
         primary_validator.validate_all_permissions.assert_called_once_with(
             include_decommission=True,
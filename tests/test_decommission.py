@@ -13,7 +13,7 @@
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import modules.decommission as decommission_module
-from lib.constants import ACM_NAMESPACE, OBSERVABILITY_NAMESPACE
+from lib.constants import ACM_NAMESPACE, MANAGED_CLUSTER_DELETE_SETTLE_SECONDS, OBSERVABILITY_NAMESPACE
 from lib.exceptions import SwitchoverError
 
 Decommission = decommission_module.Decommission
@@ -24,6 +24,7 @@ def mock_primary_client():
     """Create a mock KubeClient for primary hub."""
     client = Mock()
     client.list_managed_clusters = Mock(return_value=[])
+    client.iter_managed_clusters = Mock(return_value=[])
     return client
 
 
@@ -52,7 +53,7 @@ def test_decommission_non_interactive_with_observability(
 
         # Mock resources
         mock_primary_client.list_custom_resources.return_value = [{"metadata": {"name": "observability"}}]
-        mock_primary_client.list_managed_clusters.return_value = [{"metadata": {"name": "cluster1"}}]
+        mock_primary_client.iter_managed_clusters.return_value = [{"metadata": {"name": "cluster1"}}]
         mock_primary_client.delete_custom_resource.return_value = True
 
         result = decommission_with_obs.decommission(interactive=False)
@@ -73,7 +74,7 @@ def test_decommission_non_interactive_without_observability(
             {"metadata": {"name": "cluster1"}},
             {"metadata": {"name": "cluster2"}},
         ]
-        mock_primary_client.list_managed_clusters.return_value = [
+        mock_primary_client.iter_managed_clusters.return_value = [
             {"metadata": {"name": "cluster1"}},
             {"metadata": {"name": "cluster2"}},
         ]
@@ -103,7 +104,7 @@ def test_decommission_interactive_user_confirms(
         mock_wait.return_value = True
 
         mock_primary_client.list_custom_resources.return_value = []
-        mock_primary_client.list_managed_clusters.return_value = []
+        mock_primary_client.iter_managed_clusters.return_value = []
         mock_primary_client.delete_custom_resource.return_value = True
 
         result = decommission_with_obs.decommission(interactive=True)
@@ -148,7 +149,7 @@ def test_delete_managed_clusters_excludes_local(self, mock_wait, decommission_wi
             {"metadata": {"name": "local-cluster"}},
             {"metadata": {"name": "cluster2"}},
         ]
-        mock_primary_client.list_managed_clusters.return_value = [
+        mock_primary_client.iter_managed_clusters.return_value = [
             {"metadata": {"name": "cluster1"}},
             {"metadata": {"name": "local-cluster"}},
             {"metadata": {"name": "cluster2"}},
@@ -161,12 +162,37 @@ def test_delete_managed_clusters_excludes_local(self, mock_wait, decommission_wi
         # Should have waited for ManagedCluster removal
         mock_wait.assert_called_once()
 
+    @patch("modules.decommission.wait_for_condition")
+    def test_removal_wait_lists_metadata_and_coalesces_events(
+        self, mock_wait, decommission_with_obs, mock_primary_client
+    ):
+        """The removal check reads names only, and the watch coalesces deletion bursts."""
+        mock_wait.return_value = True
+        mock_primary_client.iter_managed_clusters.return_value = [{"metadata": {"name": "cluster1"}}]
+        mock_primary_client.list_metadata.return_value = [
+            {"metadata": {"name": "cluster1"}},
+            {"metadata": {"name": "local-cluster"}},
+        ]
+
+        decommission_with_obs._delete_managed_clusters()
+
+        condition = mock_wait.call_args.args[1]
+        mock_primary_client.list_managed_clusters.reset_mock()
+        done, detail = condition()
+
+        assert not done
+        assert detail == "1 ManagedCluster(s) remaining: cluster1"
+        mock_primary_client.list_managed_clusters.assert_not_called()
+        assert mock_primary_client.list_metadata.call_args.kwargs["plural"] == "managedclusters"
+        watch = mock_wait.call_args.kwargs["watch"]
+        assert watch._settle_seconds == MANAGED_CLUSTER_DELETE_SETTLE_SECONDS
+
     @patch("modules.decommission.wait_for_condition")
     def test_delete_managed_clusters_timeout(self, mock_wait, decommission_with_obs, mock_primary_client):
         """Test that deletion fails when ManagedClusters are not removed in time."""
         mock_wait.return_value = False  # Simulate timeout
 
-        mock_primary_client.list_managed_clusters.return_value = [
+        mock_primary_client.iter_managed_clusters.return_value = [
             {"metadata": {"name": "cluster1"}},
             {"metadata": {"name": "local-cluster"}},
         ]
@@ -176,10 +202,33 @@ def test_delete_managed_clusters_timeout(self, mock_wait, decommission_with_obs,
 
         assert "ManagedClusters not fully removed" in str(exc_info.value)
 
+    @patch("modules.decommission.wait_for_condition")
+    def test_delete_managed_clusters_reports_failed_deletes(
+        self, mock_wait, decommission_with_obs, mock_primary_client
+    ):
+        """Failed deletes are aggregated after all clusters were attempted, and no wait is started."""
+        mock_primary_client.iter_managed_clusters.return_value = [
+            {"metadata": {"name": "cluster1"}},
+            {"metadata": {"name": "cluster2"}},
+        ]
+
+        def delete_side_effect(**kwargs):
+            if kwargs["name"] == "cluster1":
+                raise RuntimeError("boom")
+            return True
+
+        mock_primary_client.delete_custom_resource.side_effect = delete_side_effect
+
+        with pytest.raises(SwitchoverError, match=r"Failed to delete 1 ManagedCluster\(s\): cluster1 \(boom\)"):
+            decommission_with_obs._delete_managed_clusters()
+
+        assert mock_primary_client.delete_custom_resource.call_count == 2
+        mock_wait.assert_not_called()
+
     def test_delete_managed_clusters_none_found(self, decommission_with_obs, mock_primary_client):
         """Test when no managed clusters exist."""
         mock_primary_client.list_custom_resources.return_value = []
-        mock_primary_client.list_managed_clusters.return_value = []
+        mock_primary_client.iter_managed_clusters.return_value = []
 
         decommission_with_obs._delete_managed_clusters()
 
@@ -263,7 +312,7 @@ def list_side_effect(*args, **kwargs):
             return []
 
         mock_primary_client.list_custom_resources.side_effect = list_side_effect
-        mock_primary_client.list_managed_clusters.return_value = []
+        mock_primary_client.iter_managed_clusters.return_value = []
         mock_primary_client.delete_custom_resource.return_value = True
 
         # Only operator pods remain after MCH deletion
@@ -304,7 +353,7 @@ def test_full_decommission_workflow(self, mock_wait, mock_primary_client):
             [{"metadata": {"name": "cluster1"}}],  # ManagedClusters
             [{"metadata": {"name": "multiclusterhub"}}],  # MCH
         ]
-        mock_primary_client.list_managed_clusters.return_value = [{"metadata": {"name": "cluster1"}}]
+        mock_primary_client.iter_managed_clusters.return_value = [{"metadata": {"name": "cluster1"}}]
         mock_primary_client.delete_custom_resource.return_value = True
 
         result = decomm.decommission(interactive=False)
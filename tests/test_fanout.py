@@ -0,0 +1,125 @@
+"""Unit tests for lib/fanout.py.
+
+Tests the AIMD concurrency limiter and the adaptive fan-out: ordering of
+results, error collection, the concurrency ceiling, and the overall budget.
+"""
+
+import threading
+import time
+
+import pytest
+
+from lib.fanout import AIMDLimiter, run_adaptive
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestAIMDLimiter:
+    """Tests for AIMDLimiter."""
+
+    def test_slow_start_adds_one_per_healthy_call(self):
+        limiter = AIMDLimiter(initial=4, maximum=100, latency_target=1.0)
+        for _ in range(4):
+            limiter.record(0.1, ok=True)
+
+        assert limiter.limit == 8
+
+    def test_failure_halves_then_grows_additively(self):
+        clock = FakeClock()
+        limiter = AIMDLimiter(initial=16, maximum=100, latency_target=1.0, clock=clock)
+
+        limiter.record(0.1, ok=False)
+        assert limiter.limit == 8
+
+        for _ in range(9):
+            limiter.record(0.1, ok=True)
+        assert limiter.limit == 9
+
+    def test_slow_call_counts_as_congestion(self):
+        limiter = AIMDLimiter(initial=10, latency_target=1.0, clock=FakeClock())
+        limiter.record(2.5, ok=True)
+
+        assert limiter.limit == 5
+
+    def test_at_most_one_decrease_per_latency_target(self):
+        clock = FakeClock()
+        limiter = AIMDLimiter(initial=16, latency_target=1.0, clock=clock)
+
+        limiter.record(0.1, ok=False)
+        limiter.record(0.1, ok=False)
+        assert limiter.limit == 8
+
+        clock.now = 1.5
+        limiter.record(0.1, ok=False)
+        assert limiter.limit == 4
+
+    def test_limit_stays_within_bounds(self):
+        clock = FakeClock()
+        limiter = AIMDLimiter(initial=2, minimum=2, maximum=3, latency_target=1.0, clock=clock)
+        for _ in range(10):
+            limiter.record(0.1, ok=True)
+        assert limiter.limit == 3
+
+        for step in range(5):
+            clock.now = step * 2.0
+            limiter.record(0.1, ok=False)
+        assert limiter.limit == 2
+
+
+@pytest.mark.unit
+class TestRunAdaptive:
+    """Tests for run_adaptive."""
+
+    def test_collects_results_and_errors(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        result = run_adaptive("test", [("a", lambda: 1), ("b", fail), ("c", lambda: 3)])
+
+        assert result.results == {"a": 1, "c": 3}
+        assert list(result.errors) == ["b"]
+        assert not result.budget_exhausted
+
+    def test_never_exceeds_limiter_ceiling(self):
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def call():
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.01)
+            with lock:
+                in_flight["now"] -= 1
+
+        limiter = AIMDLimiter(initial=2, maximum=4, latency_target=5.0)
+        result = run_adaptive("test", [(str(i), call) for i in range(40)], limiter=limiter)
+
+        assert len(result.results) == 40
+        assert 2 < in_flight["peak"] <= 4
+
+    def test_budget_stops_starting_new_calls(self):
+        def slow():
+            time.sleep(0.3)
+            return "done"
+
+        limiter = AIMDLimiter(initial=1, maximum=1, latency_target=5.0)
+        result = run_adaptive("test", [("a", slow), ("b", slow), ("c", slow)], limiter=limiter, budget_seconds=0.1)
+
+        # The call in flight when the budget ran out was waited for and kept
+        assert result.results == {"a": "done"}
+        assert result.not_started == ["b", "c"]
+        assert result.budget_exhausted
+
+    def test_unhealthy_results_reduce_concurrency(self):
+        limiter = AIMDLimiter(initial=8, latency_target=5.0)
+        run_adaptive("test", [("a", lambda: "unreachable")], limiter=limiter, is_healthy=lambda v: v != "unreachable")
+
+        assert limiter.limit == 4
@@ -24,6 +24,45 @@
 ACM_BACKUP_LABEL = {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"}
 
 
+def _selected(backups, label_selector):
+    """Apply an ACM schedule-type ``in``/``notin`` label selector the way the apiserver would."""
+    key, operator, values = label_selector.split(" ", 2)
+    values = set(values.strip("()").split(","))
+    return [
+        b for b in backups if (((b.get("metadata", {}).get("labels") or {}).get(key) in values) == (operator == "in"))
+    ]
+
+
+def _serve_backups(client, initial, *polls):
+    """Serve Velero Backup lists to list_acm_backups with server-side label selection.
+
+    ``initial`` answers the first full list; each metadata poll then takes the
+    next entry of ``polls`` (a list of backups, or an exception to raise), and
+    the last entry repeats.
+    """
+    state = {"current": initial, "polls": list(polls) or [initial]}
+
+    def iter_custom_resources(**kwargs):
+        state["current"] = initial
+        return iter(_selected(initial, kwargs["label_selector"]))
+
+    def list_metadata(**kwargs):
+        if " notin " not in kwargs["label_selector"]:
+            poll = state["polls"].pop(0) if len(state["polls"]) > 1 else state["polls"][0]
+            if isinstance(poll, Exception):
+                raise poll
+            state["current"] = poll
+        return _selected(state["current"], kwargs["label_selector"])
+
+    client.iter_custom_resources.side_effect = iter_custom_resources
+    client.list_metadata.side_effect = list_metadata
+
+
+def _metadata_polls(client):
+    """Return how many labelled metadata polls list_acm_backups made."""
+    return sum(1 for c in client.list_metadata.call_args_list if " notin " not in c.kwargs["label_selector"])
+
+
 def create_mock_step_context(is_step_completed_func, mark_step_completed_func):
     """Create a mock step context manager that mimics StepContext behavior."""
 
@@ -122,14 +161,10 @@ def test_finalize_success(
                     "status": {"phase": "Enabled"},
                 }
             ],  # fix_backup_collision
+            [],  # _get_backup_verify_timeout
+        ]
+        mock_secondary_client.iter_custom_resources.side_effect = [
             [],  # Initial backups
-            [],  # Loop iteration 1
-            [
-                {
-                    "metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL},
-                    "status": {"phase": "InProgress"},
-                }
-            ],  # Loop iteration 2 - new ACM backup
             [
                 {
                     "metadata": {
@@ -144,10 +179,14 @@ def test_finalize_success(
 
         mch_response = {"metadata": {"name": "multiclusterhub"}, "status": {"phase": "Running"}}
         # _fix_backup_schedule_collision calls get_custom_resource twice (before-delete read + post-delete
-        # re-read), then _verify_mch_health calls it once for the MCH object.
+        # re-read), _verify_new_backups reads the new backup once, then _verify_mch_health reads the MCH.
+        mock_secondary_client.list_metadata.return_value = [
+            {"metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL}}
+        ]  # Loop iteration 1 - new ACM backup
         mock_secondary_client.get_custom_resource.side_effect = [
             {"metadata": {"name": "schedule", "uid": "uid-1"}, "spec": {}},  # before deletion
             None,  # after deletion — schedule gone, safe to create
+            {"metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL}, "status": {"phase": "InProgress"}},
             mch_response,  # MCH health check
         ]
         mock_secondary_client.get_pods.return_value = []
@@ -405,29 +444,31 @@ def test_verify_new_backups_success(self, mock_time, finalization, mock_secondar
 
         # Sequence of API calls:
         # 1. Initial list (empty)
-        # 2. Loop 1 list (still empty)
-        # 3. Loop 2 list (new backup found)
+        # 2. Loop 1 metadata list (still empty)
+        # 3. Loop 2 metadata list (new backup found), then GET for its phase
         # Velero uses "Completed" phase, not "Finished"
-        mock_secondary_client.list_custom_resources.side_effect = [
+        _serve_backups(
+            mock_secondary_client,
             [],
             [],
-            [
-                {
-                    "metadata": {"name": "new-backup", "labels": ACM_BACKUP_LABEL},
-                    "status": {"phase": "Completed"},
-                }
-            ],
-        ]
+            [{"metadata": {"name": "new-backup", "labels": ACM_BACKUP_LABEL}}],
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "new-backup", "labels": ACM_BACKUP_LABEL},
+            "status": {"phase": "Completed"},
+        }
 
         finalization._verify_new_backups(timeout=10)
 
-        assert mock_secondary_client.list_custom_resources.call_count == 3
+        assert mock_secondary_client.iter_custom_resources.call_count == 1
+        assert _metadata_polls(mock_secondary_client) == 2
+        assert mock_secondary_client.get_custom_resource.call_args.kwargs["name"] == "new-backup"
 
     @patch("modules.finalization.time")
     def test_verify_new_backups_timeout(self, mock_time, finalization, mock_secondary_client):
         """Backup verification timeout must raise SwitchoverError (fail closed)."""
         mock_time.time.side_effect = [0, 10, 45, 51]
-        mock_secondary_client.list_custom_resources.return_value = []
+        _serve_backups(mock_secondary_client, [], [])
 
         with pytest.raises(SwitchoverError, match="No new backup created"):
             finalization._verify_new_backups(timeout=50)
@@ -436,15 +477,13 @@ def test_verify_new_backups_timeout(self, mock_time, finalization, mock_secondar
     def test_verify_new_backups_stores_backup_name(self, mock_time, finalization, mock_secondary_client):
         """Successful backup detection must record the backup name in state."""
         mock_time.time.side_effect = [0, 1]
-        mock_secondary_client.list_custom_resources.side_effect = [
-            [],
-            [
-                {
-                    "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
-                    "status": {"phase": "Completed"},
-                }
-            ],
-        ]
+        _serve_backups(
+            mock_secondary_client, [], [{"metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL}}]
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
+            "status": {"phase": "Completed"},
+        }
 
         finalization._verify_new_backups(timeout=10)
 
@@ -456,7 +495,7 @@ def test_verify_new_backups_reuses_recorded_backup_name(self, finalization, mock
             "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
             "status": {"phase": "Completed"},
         }
-        mock_secondary_client.list_custom_resources.return_value = [recorded_backup]
+        _serve_backups(mock_secondary_client, [recorded_backup])
         mock_secondary_client.get_custom_resource.return_value = recorded_backup
         finalization.state.get_config.side_effect = lambda key, default=None: (
             "acm-backup-001" if key == "post_switchover_backup_name" else None
@@ -481,7 +520,7 @@ def test_verify_new_backups_accepts_existing_post_enable_backup_on_resume(
             },
             "status": {"phase": "Completed", "completionTimestamp": backup_ts},
         }
-        mock_secondary_client.list_custom_resources.return_value = [existing_backup]
+        _serve_backups(mock_secondary_client, [existing_backup])
         mock_secondary_client.get_custom_resource.return_value = None
         finalization.state.get_config.side_effect = lambda key, default=None: {
             "post_switchover_backup_name": None,
@@ -498,16 +537,16 @@ def test_verify_new_backups_accepts_known_acm_name_without_label_and_logs_warnin
     ):
         """Known ACM backup names are accepted with a warning when the ACM label is missing."""
         mock_time.time.side_effect = [0, 0, 1, 2]
-        mock_secondary_client.list_custom_resources.side_effect = [
+        _serve_backups(
+            mock_secondary_client,
             [],
             [],
-            [
-                {
-                    "metadata": {"name": "acm-managed-clusters-schedule-20260306100000"},
-                    "status": {"phase": "Completed"},
-                }
-            ],
-        ]
+            [{"metadata": {"name": "acm-managed-clusters-schedule-20260306100000"}}],
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-managed-clusters-schedule-20260306100000"},
+            "status": {"phase": "Completed"},
+        }
 
         with caplog.at_level(logging.WARNING):
             finalization._verify_new_backups(timeout=10)
@@ -523,19 +562,25 @@ def test_verify_new_backups_accepts_known_acm_name_without_label_and_logs_warnin
     def test_verify_new_backups_ignores_unrelated_velero_backups(self, mock_time, finalization, mock_secondary_client):
         """Only ACM-owned backups should count as post-switchover evidence."""
         mock_time.time.side_effect = [0, 0, 1, 2]
-        mock_secondary_client.list_custom_resources.side_effect = [
+        _serve_backups(
+            mock_secondary_client,
             [],
-            [{"metadata": {"name": "manual-backup"}, "status": {"phase": "Completed"}}],
+            [{"metadata": {"name": "manual-backup"}}],
             [
-                {
-                    "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
-                    "status": {"phase": "Completed"},
-                }
+                {"metadata": {"name": "manual-backup"}},
+                {"metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL}},
             ],
-        ]
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
+            "status": {"phase": "Completed"},
+        }
 
         finalization._verify_new_backups(timeout=10)
 
+        assert [c.kwargs["name"] for c in mock_secondary_client.get_custom_resource.call_args_list] == [
+            "acm-backup-001"
+        ]
         finalization.state.set_config.assert_any_call("post_switchover_backup_name", "acm-backup-001")
 
     @patch("modules.finalization.time")
@@ -544,25 +589,25 @@ def test_verify_new_backups_retries_after_transient_list_error(
     ):
         """Transient backup list failures should be tolerated until a later poll succeeds."""
         mock_time.time.side_effect = [0, 0, 1]
-        mock_secondary_client.list_custom_resources.side_effect = [
+        _serve_backups(
+            mock_secondary_client,
             [],
             ApiException(status=500, reason="temporary failure"),
-            [
-                {
-                    "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
-                    "status": {"phase": "Completed"},
-                }
-            ],
-        ]
+            [{"metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL}}],
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
+            "status": {"phase": "Completed"},
+        }
 
         finalization._verify_new_backups(timeout=10)
 
-        assert mock_secondary_client.list_custom_resources.call_count == 3
+        assert _metadata_polls(mock_secondary_client) == 2
         finalization.state.set_config.assert_any_call("post_switchover_backup_name", "acm-backup-001")
 
     def test_verify_new_backups_wraps_initial_transient_list_error(self, finalization, mock_secondary_client):
         """Initial backup discovery should not leak raw ApiException on retryable failures."""
-        mock_secondary_client.list_custom_resources.side_effect = ApiException(status=500, reason="temporary failure")
+        mock_secondary_client.iter_custom_resources.side_effect = ApiException(status=500, reason="temporary failure")
 
         with pytest.raises(
             SwitchoverError,
@@ -570,7 +615,7 @@ def test_verify_new_backups_wraps_initial_transient_list_error(self, finalizatio
         ):
             finalization._verify_new_backups(timeout=10)
 
-        assert mock_secondary_client.list_custom_resources.call_count == 1
+        assert mock_secondary_client.iter_custom_resources.call_count == 1
 
     def test_cleanup_restore_resources_raises_when_delete_fails(
         self, finalization, mock_secondary_client, mock_state_manager
@@ -592,16 +637,13 @@ def test_verify_new_backups_fails_fast_on_permanent_list_error(
     ):
         """Permanent backup list failures should surface immediately instead of timing out."""
         mock_time.time.side_effect = [0, 0]
-        mock_secondary_client.list_custom_resources.side_effect = [
-            [],
-            ApiException(status=403, reason="Forbidden"),
-        ]
+        _serve_backups(mock_secondary_client, [], ApiException(status=403, reason="Forbidden"))
 
         with pytest.raises(SwitchoverError, match="Failed to list Velero backups"):
             finalization._verify_new_backups(timeout=10)
 
         mock_time.sleep.assert_not_called()
-        assert mock_secondary_client.list_custom_resources.call_count == 2
+        assert _metadata_polls(mock_secondary_client) == 1
 
     def test_verify_backup_integrity_success(self, finalization, mock_secondary_client):
         """Backup integrity should pass for a recent completed backup with no errors (recorded name path)."""
@@ -880,11 +922,184 @@ def test_backup_max_age_derived_from_schedule(self, finalization):
             ("*/15 * * * *", 15 * 60),
             ("0 */2 * * *", 2 * 3600),
             ("0 0 * * *", 24 * 3600),
+            ("30 2 * * 0", 7 * 24 * 3600),
+            ("0 1 1 * *", 31 * 24 * 3600),
+            ("0 8-18/2 * * *", 14 * 3600),
+            ("0 0,6 * * 1-5", 3 * 24 * 3600 - 6 * 3600),
+            ("0 0 1 1 *", None),
+            ("0 0 1 * 1", None),
+            ("0 * * * MON", None),
         ],
     )
     def test_parse_cron_interval_seconds(self, finalization, cron_expr, expected_seconds):
         assert finalization._parse_cron_interval_seconds(cron_expr) == expected_seconds
 
+    @pytest.mark.parametrize(
+        ("cron_expr", "expected"),
+        [
+            ("*/15 * * * *", "2026-03-06T10:15:00+00:00"),
+            ("0 */4 * * *", "2026-03-06T12:00:00+00:00"),
+            ("0 0 * * *", "2026-03-07T00:00:00+00:00"),
+            ("30 2 * * 0", "2026-03-08T02:30:00+00:00"),
+            ("0 8-18/2 * * 1-5", "2026-03-06T12:00:00+00:00"),
+            ("0 1 1 * *", "2026-04-01T01:00:00+00:00"),
+            ("CRON_TZ=UTC 0 * * * *", None),
+            ("0 * * * MON", None),
+            ("61 * * * *", None),
+        ],
+    )
+    def test_next_cron_run(self, finalization, cron_expr, expected):
+        after = datetime(2026, 3, 6, 10, 7, 30, tzinfo=timezone.utc)
+
+        next_run = finalization._next_cron_run(cron_expr, after)
+
+        assert (next_run.isoformat() if next_run else None) == expected
+
+    def test_next_scheduled_backup_uses_schedule_cron_and_enabled_at(self, finalization):
+        finalization._cached_schedules = [
+            {"metadata": {"name": "schedule-rhacm"}, "spec": {"veleroSchedule": "0 * * * *"}}
+        ]
+        enabled_at = datetime(2026, 3, 6, 10, 7, 30, tzinfo=timezone.utc)
+
+        assert finalization._get_next_scheduled_backup_at(enabled_at) == datetime(2026, 3, 6, 11, tzinfo=timezone.utc)
+        assert finalization._get_next_scheduled_backup_at(None) is None
+
+    @patch("modules.finalization.time")
+    def test_verify_new_backups_polls_without_backup_watch(self, mock_time, finalization, mock_secondary_client):
+        """Without a usable watch, backups are still polled every interval even when the next run is known."""
+        next_run = datetime.now(timezone.utc) + timedelta(minutes=10)
+        mock_time.time.side_effect = [0, 0, 1, 2]
+        polls_before_sleep = []
+        mock_time.sleep.side_effect = lambda seconds: polls_before_sleep.append(_metadata_polls(mock_secondary_client))
+        _serve_backups(
+            mock_secondary_client, [], [], [{"metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL}}]
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
+            "status": {"phase": "New"},
+        }
+
+        with patch.object(finalization, "_get_next_scheduled_backup_at", return_value=next_run):
+            finalization._verify_new_backups(timeout=3600)
+
+        mock_time.sleep.assert_called_once_with(finalization_module.BACKUP_POLL_INTERVAL)
+        assert polls_before_sleep == [1]
+        assert _metadata_polls(mock_secondary_client) == 2
+        finalization.state.set_config.assert_any_call("post_switchover_backup_name", "acm-backup-001")
+
+    @patch("modules.finalization.ResourceWatch")
+    @patch("modules.finalization.time")
+    def test_verify_new_backups_idles_on_backup_watch_until_next_scheduled_run(
+        self, mock_time, mock_watch_cls, finalization, mock_secondary_client
+    ):
+        """With a usable watch, no backups are listed until shortly before the next scheduled run."""
+        backup_watch = mock_watch_cls.return_value
+        backup_watch.active = True
+        next_run = datetime.now(timezone.utc) + timedelta(minutes=10)
+        mock_time.time.side_effect = [0, 0]
+        polls_during_idle = []
+        backup_watch.wait_for_change.side_effect = lambda seconds: polls_during_idle.append(
+            _metadata_polls(mock_secondary_client)
+        )
+        _serve_backups(
+            mock_secondary_client, [], [{"metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL}}]
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
+            "status": {"phase": "New"},
+        }
+
+        with patch.object(finalization, "_get_next_scheduled_backup_at", return_value=next_run):
+            finalization._verify_new_backups(timeout=3600)
+
+        idle = backup_watch.wait_for_change.call_args_list[0].args[0]
+        assert 600 - finalization_module.BACKUP_SCHEDULE_WAKE_LEAD - 5 <= idle <= 600
+        assert polls_during_idle == [0]
+        assert _metadata_polls(mock_secondary_client) == 1
+        mock_time.sleep.assert_not_called()
+        finalization.state.set_config.assert_any_call("post_switchover_backup_name", "acm-backup-001")
+
+    @patch("modules.finalization.ResourceWatch")
+    @patch("modules.finalization.time")
+    def test_verify_new_backups_waits_on_backup_watch(
+        self, mock_time, mock_watch_cls, finalization, mock_secondary_client
+    ):
+        """With a usable watch, waits between checks block on ACM backup events instead of sleeping."""
+        backup_watch = mock_watch_cls.return_value
+        backup_watch.active = True
+        backup_watch.wait_for_change.return_value = True
+        mock_time.time.side_effect = [0, 0, 1, 2]
+        _serve_backups(
+            mock_secondary_client,
+            [],
+            [],
+            [{"metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL}}],
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-backup-001", "labels": ACM_BACKUP_LABEL},
+            "status": {"phase": "InProgress"},
+        }
+
+        finalization._verify_new_backups(timeout=10)
+
+        assert mock_watch_cls.call_args.kwargs["label_selector"] == finalization_module.ACM_BACKUP_SCHEDULE_TYPE_LABEL
+        backup_watch.wait_for_change.assert_called_once_with(finalization_module.BACKUP_POLL_INTERVAL)
+        mock_time.sleep.assert_not_called()
+        backup_watch.stop.assert_called_once()
+
+    def test_check_velero_logs_scans_every_pod_since_backup_start(self, finalization, mock_secondary_client, caplog):
+        """Each Velero pod is streamed with a since-window; matching lines are counted per pod."""
+        started_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+        mock_secondary_client.get_pods.return_value = [
+            {"metadata": {"name": "velero-a"}},
+            {"metadata": {"name": "velero-b"}},
+        ]
+        logs = {
+            "velero-a": [
+                'level=error msg="backup failed" backup=acm-backup-001',
+                "level=info msg=done backup=acm-backup-001",
+                "level=error msg=unrelated backup=other",
+            ],
+            "velero-b": ['level=info msg="Backup FAILED" backup=acm-backup-001'],
+        }
+        mock_secondary_client.iter_pod_log_lines.side_effect = lambda **kwargs: iter(logs[kwargs["name"]])
+
+        with caplog.at_level(logging.WARNING):
+            finalization._check_velero_logs_for_backup("acm-backup-001", started_at=started_at)
+
+        windows = [c.kwargs["since_seconds"] for c in mock_secondary_client.iter_pod_log_lines.call_args_list]
+        assert all(
+            600 + finalization_module.VELERO_LOG_SINCE_SLACK <= w <= 605 + finalization_module.VELERO_LOG_SINCE_SLACK
+            for w in windows
+        )
+        assert len(windows) == 2
+        assert "velero-a show 1 error line(s)" in caplog.text
+        assert "velero-b show 1 error line(s)" in caplog.text
+
+    def test_check_velero_logs_without_start_time_reads_tail(self, finalization, mock_secondary_client, caplog):
+        """Without a start time the last lines are read; a failing pod is reported and others still scanned."""
+        mock_secondary_client.get_pods.return_value = [
+            {"metadata": {"name": "velero-a"}},
+            {"metadata": {"name": "velero-b"}},
+        ]
+
+        def stream(**kwargs):
+            if kwargs["name"] == "velero-a":
+                raise ApiException(status=500, reason="boom")
+            return iter(["level=info msg=ok backup=acm-backup-001"])
+
+        mock_secondary_client.iter_pod_log_lines.side_effect = stream
+
+        with caplog.at_level(logging.INFO):
+            finalization._check_velero_logs_for_backup("acm-backup-001")
+
+        assert all(
+            c.kwargs["tail_lines"] == finalization_module.VELERO_LOG_TAIL_LINES
+            for c in mock_secondary_client.iter_pod_log_lines.call_args_list
+        )
+        assert "Unable to read Velero logs from velero-a" in caplog.text
+        assert "No Velero log errors found for backup acm-backup-001" in caplog.text
+
     def test_verify_backup_integrity_skips_age_without_new_backup(self, finalization, mock_secondary_client):
         """Backup age enforcement should be skipped if no post-switchover backup name is recorded."""
         backup_ts = (datetime.now(timezone.utc) - timedelta(seconds=1200)).isoformat().replace("+00:00", "Z")
@@ -901,46 +1116,51 @@ def test_verify_backup_integrity_skips_age_without_new_backup(self, finalization
                 "warnings": 0,
             },
         }
-        mock_secondary_client.list_custom_resources.return_value = [backup]
+        _serve_backups(mock_secondary_client, [backup])
         mock_secondary_client.get_pods.return_value = []
         # No recorded backup name → falls back to latest-by-timestamp, age check skipped
         finalization.state.get_config.return_value = None
 
+        finalization._cached_schedules = []
         finalization._verify_backup_integrity(max_age_seconds=600)
 
     def test_verify_backup_integrity_fallback_ignores_unrelated_backups(self, finalization, mock_secondary_client):
         """Fallback integrity path should consider only ACM-owned backups."""
         acm_backup_ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         manual_backup_ts = (datetime.now(timezone.utc) + timedelta(seconds=1)).isoformat().replace("+00:00", "Z")
-        mock_secondary_client.list_custom_resources.return_value = [
-            {
-                "metadata": {
-                    "name": "manual-backup",
-                    "creationTimestamp": manual_backup_ts,
-                },
-                "status": {
-                    "phase": "Completed",
-                    "completionTimestamp": manual_backup_ts,
-                    "errors": 99,
-                },
-            },
-            {
-                "metadata": {
-                    "name": "backup-1",
-                    "creationTimestamp": acm_backup_ts,
-                    "labels": ACM_BACKUP_LABEL,
+        _serve_backups(
+            mock_secondary_client,
+            [
+                {
+                    "metadata": {
+                        "name": "manual-backup",
+                        "creationTimestamp": manual_backup_ts,
+                    },
+                    "status": {
+                        "phase": "Completed",
+                        "completionTimestamp": manual_backup_ts,
+                        "errors": 99,
+                    },
                 },
-                "status": {
-                    "phase": "Completed",
-                    "completionTimestamp": acm_backup_ts,
-                    "errors": 0,
-                    "warnings": 0,
+                {
+                    "metadata": {
+                        "name": "backup-1",
+                        "creationTimestamp": acm_backup_ts,
+                        "labels": ACM_BACKUP_LABEL,
+                    },
+                    "status": {
+                        "phase": "Completed",
+                        "completionTimestamp": acm_backup_ts,
+                        "errors": 0,
+                        "warnings": 0,
+                    },
                 },
-            },
-        ]
+            ],
+        )
         mock_secondary_client.get_pods.return_value = []
         finalization.state.get_config.return_value = None
 
+        finalization._cached_schedules = []
         finalization._verify_backup_integrity(max_age_seconds=600)
 
     def test_verify_backup_integrity_enforces_age_with_recorded_backup_name(self, finalization, mock_secondary_client):
@@ -986,12 +1206,13 @@ def test_verify_backup_integrity_skips_age_if_backup_before_enable(self, finaliz
                 "warnings": 0,
             },
         }
-        mock_secondary_client.list_custom_resources.return_value = [backup]
+        _serve_backups(mock_secondary_client, [backup])
         mock_secondary_client.get_pods.return_value = []
         finalization.state.get_config.side_effect = lambda key, default=None: (
             enabled_ts if key == "backup_schedule_enabled_at" else None
         )
 
+        finalization._cached_schedules = []
         finalization._verify_backup_integrity(max_age_seconds=600)
 
     def test_verify_backup_integrity_uses_recorded_name_not_latest(self, finalization, mock_secondary_client):
@@ -1043,8 +1264,8 @@ def test_verify_backup_integrity_fails_when_recorded_backup_missing(self, finali
         }
         # get_custom_resource returns None for the recorded name (pruned)
         mock_secondary_client.get_custom_resource.return_value = None
-        # list_custom_resources returns a fallback backup
-        mock_secondary_client.list_custom_resources.return_value = [fallback_backup]
+        # iter_custom_resources returns a fallback backup
+        _serve_backups(mock_secondary_client, [fallback_backup])
         mock_secondary_client.get_pods.return_value = []
         finalization._cached_schedules = []
         finalization.state.get_config.side_effect = lambda key, default=None: (
@@ -1465,14 +1686,12 @@ def test_verify_old_hub_state(self, finalization_with_primary, mock_secondary_cl
         # get_pods is called for both thanos-compact and observatorium-api checks
         assert primary.get_pods.call_count == 2
 
-    @patch("modules.finalization.time")
-    def test_old_hub_observability_reports_success_when_all_pods_gone(self, mock_time, finalization_with_primary):
+    def test_old_hub_observability_reports_success_when_all_pods_gone(self, finalization_with_primary):
         """Observability shutdown should report success when old-hub pods terminate."""
         fin, primary = finalization_with_primary
         compactor_pods = [{"metadata": {"name": "compact-0"}}]
         api_pods = [{"metadata": {"name": "api-0"}}]
-        primary.get_pods.side_effect = [[], []]
-        mock_time.time.side_effect = [0, 0]
+        primary.get_pods.return_value = []
 
         with patch.object(finalization_module, "logger") as logger:
             compactor_pods_after, api_pods_after = fin._wait_for_observability_scale_down(
@@ -1488,30 +1707,28 @@ def test_old_hub_observability_reports_success_when_all_pods_gone(self, mock_tim
 
         assert compactor_pods_after == []
         assert api_pods_after == []
-        assert primary.get_pods.call_args_list == [
-            call(
-                namespace=finalization_module.OBSERVABILITY_NAMESPACE,
-                label_selector="app.kubernetes.io/name=thanos-compact",
-            ),
-            call(
-                namespace=finalization_module.OBSERVABILITY_NAMESPACE,
-                label_selector="app.kubernetes.io/name=observatorium-api",
-            ),
-        ]
-        mock_time.sleep.assert_not_called()
+        assert primary.get_pods.call_count == 2
+        primary.get_pods.assert_any_call(
+            namespace=finalization_module.OBSERVABILITY_NAMESPACE,
+            label_selector="app.kubernetes.io/name=thanos-compact",
+        )
+        primary.get_pods.assert_any_call(
+            namespace=finalization_module.OBSERVABILITY_NAMESPACE,
+            label_selector="app.kubernetes.io/name=observatorium-api",
+        )
         logger.info.assert_any_call("%s is scaled down on old hub", "Thanos compactor")
         logger.info.assert_any_call("%s is scaled down on old hub", "Observatorium API")
         logger.info.assert_any_call("All observability components scaled down on old hub")
         logger.warning.assert_not_called()
 
-    @patch("modules.finalization.time")
-    def test_old_hub_observability_warns_when_pods_remain(self, mock_time, finalization_with_primary):
+    @patch("lib.rollout.wait_for_condition")
+    def test_old_hub_observability_warns_when_pods_remain(self, mock_wait, finalization_with_primary):
         """Observability shutdown should warn when old-hub pods remain after waiting."""
         fin, primary = finalization_with_primary
         compactor_pods = [{"metadata": {"name": "compact-0"}}]
-        primary.get_pods.side_effect = [[{"metadata": {"name": "compact-0"}}]]
-        mock_time.time.side_effect = [0, 0, finalization_module.OBSERVABILITY_TERMINATE_TIMEOUT + 1]
-        mock_time.sleep.return_value = None
+        primary.get_pods.return_value = [{"metadata": {"name": "compact-0"}}]
+        # Check once, then report a timeout
+        mock_wait.side_effect = lambda description, condition_fn, **kwargs: condition_fn()[0]
 
         with patch.object(finalization_module, "logger") as logger:
             compactor_pods_after, api_pods_after = fin._wait_for_observability_scale_down(
@@ -1531,7 +1748,9 @@ def test_old_hub_observability_warns_when_pods_remain(self, mock_time, finalizat
             namespace=finalization_module.OBSERVABILITY_NAMESPACE,
             label_selector="app.kubernetes.io/name=thanos-compact",
         )
-        mock_time.sleep.assert_called_once_with(finalization_module.OBSERVABILITY_TERMINATE_INTERVAL)
+        mock_wait.assert_called_once()
+        assert mock_wait.call_args.kwargs["timeout"] == finalization_module.OBSERVABILITY_TERMINATE_TIMEOUT
+        assert mock_wait.call_args.kwargs["interval"] == finalization_module.OBSERVABILITY_TERMINATE_INTERVAL
         logger.warning.assert_any_call(
             "%s still running on old hub (%s pod(s)) after waiting",
             "Thanos compactor",
@@ -1543,6 +1762,49 @@ def test_old_hub_observability_warns_when_pods_remain(self, mock_time, finalizat
         )
         assert call("All observability components scaled down on old hub") not in logger.info.call_args_list
 
+    @patch("modules.finalization.track_rollouts")
+    def test_old_hub_scale_down_tracks_new_hub_in_same_wait(
+        self, mock_track, finalization_with_primary, mock_state_manager, mock_secondary_client
+    ):
+        """With observability on the new hub, both hubs should be tracked by one concurrent wait."""
+        fin, primary = finalization_with_primary
+        mock_state_manager.get_config.side_effect = lambda key, default=None: key == "secondary_has_observability"
+
+        fin._wait_for_observability_scale_down(
+            compactor_pods=[{"metadata": {"name": "compact-0"}}],
+            api_pods=[{"metadata": {"name": "api-0"}}],
+        )
+
+        mock_track.assert_called_once()
+        rollouts = mock_track.call_args[0][0]
+        assert [(r.hub, r.kind, r.replicas) for r in rollouts] == [
+            ("old hub", "statefulsets", 0),
+            ("old hub", "deployments", 0),
+            ("new hub", "statefulsets", None),
+            ("new hub", "deployments", None),
+        ]
+        assert [r.client for r in rollouts] == [primary, primary, mock_secondary_client, mock_secondary_client]
+
+    @patch("lib.rollout.wait_for_condition")
+    def test_old_hub_scale_down_warns_when_new_hub_not_ready(
+        self, mock_wait, finalization_with_primary, mock_state_manager, mock_secondary_client
+    ):
+        """A new-hub workload below its desired replicas should be reported, not raised."""
+        fin, primary = finalization_with_primary
+        mock_state_manager.get_config.side_effect = lambda key, default=None: key == "secondary_has_observability"
+        primary.get_pods.return_value = []
+        mock_secondary_client.get_statefulset.return_value = {"spec": {"replicas": 1}, "status": {"readyReplicas": 1}}
+        mock_secondary_client.get_deployment.return_value = {"spec": {"replicas": 2}, "status": {"readyReplicas": 1}}
+        mock_wait.side_effect = lambda description, condition_fn, **kwargs: condition_fn()[0]
+
+        with patch.object(finalization_module, "logger") as logger:
+            fin._wait_for_observability_scale_down(compactor_pods=[{"metadata": {"name": "compact-0"}}], api_pods=[])
+
+        logger.info.assert_any_call("%s is ready on new hub", finalization_module.THANOS_COMPACTOR_STATEFULSET)
+        logger.warning.assert_called_once_with(
+            "%s is not ready on new hub (%d ready)", finalization_module.OBSERVATORIUM_API_DEPLOYMENT, 1
+        )
+
     def test_old_hub_observability_dry_run_only_reports_intent(self, finalization_with_primary):
         """Dry-run observability shutdown should only log what would be scaled down."""
         fin, primary = finalization_with_primary
@@ -1607,14 +1869,10 @@ def test_finalize_skips_verify_old_hub_state_when_action_none(
                     "status": {"phase": "Enabled"},
                 }
             ],  # fix_backup_collision
+            [],  # _get_backup_verify_timeout
+        ]
+        mock_secondary_client.iter_custom_resources.side_effect = [
             [],  # Initial backups
-            [],  # Loop iteration 1
-            [
-                {
-                    "metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL},
-                    "status": {"phase": "InProgress"},
-                }
-            ],  # Loop iteration 2 - new ACM backup
             [
                 {
                     "metadata": {
@@ -1626,9 +1884,13 @@ def test_finalize_skips_verify_old_hub_state_when_action_none(
                 }
             ],  # verify_backup_integrity
         ]
+        mock_secondary_client.list_metadata.return_value = [
+            {"metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL}}
+        ]  # Loop iteration 1 - new ACM backup
         mock_secondary_client.get_custom_resource.side_effect = [
             {"metadata": {"name": "schedule", "uid": "uid-1"}, "spec": {}},  # before deletion
             None,  # after deletion
+            {"metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL}, "status": {"phase": "InProgress"}},
             {"metadata": {"name": "multiclusterhub"}, "status": {"phase": "Running"}},  # MCH health
         ]
         mock_secondary_client.get_pods.return_value = []
@@ -1692,13 +1954,9 @@ def test_finalize_calls_verify_old_hub_state_when_action_secondary(
                     "spec": {"veleroSchedule": "*/15 * * * *"},
                 }
             ],  # _get_backup_verify_timeout
+        ]
+        mock_secondary_client.iter_custom_resources.side_effect = [
             [],  # Initial backups
-            [
-                {
-                    "metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL},
-                    "status": {"phase": "InProgress"},
-                }
-            ],  # New ACM backup detected
             [
                 {
                     "metadata": {
@@ -1710,9 +1968,13 @@ def test_finalize_calls_verify_old_hub_state_when_action_secondary(
                 }
             ],  # verify_backup_integrity
         ]
+        mock_secondary_client.list_metadata.return_value = [
+            {"metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL}}
+        ]  # New ACM backup detected
         mock_secondary_client.get_custom_resource.side_effect = [
             {"metadata": {"name": "schedule", "uid": "uid-1"}, "spec": {}},  # before deletion
             None,  # after deletion
+            {"metadata": {"name": "backup-1", "labels": ACM_BACKUP_LABEL}, "status": {"phase": "InProgress"}},
             {"metadata": {"name": "multiclusterhub"}, "status": {"phase": "Running"}},  # MCH health
         ]
         mock_secondary_client.get_pods.return_value = []
@@ -2005,16 +2267,16 @@ def test_verify_new_backups_persists_fallback_detected_backup(self, mock_time, m
         from lib.utils import StateManager
 
         mock_time.time.side_effect = [0, 0, 1, 2]
-        mock_secondary_client.list_custom_resources.side_effect = [
+        _serve_backups(
+            mock_secondary_client,
             [],
             [],
-            [
-                {
-                    "metadata": {"name": "acm-managed-clusters-schedule-20260306100000"},
-                    "status": {"phase": "Completed"},
-                }
-            ],
-        ]
+            [{"metadata": {"name": "acm-managed-clusters-schedule-20260306100000"}}],
+        )
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "acm-managed-clusters-schedule-20260306100000"},
+            "status": {"phase": "Completed"},
+        }
 
         state = StateManager(str(tmp_path / "state.json"))
         fin = Finalization(
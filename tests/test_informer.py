@@ -0,0 +1,156 @@
+"""Unit tests for lib/informer.py.
+
+Tests the watch-maintained list cache used by KubeClient.
+"""
+
+import threading
+import time
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from lib.informer import ResourceInformer
+
+
+def _mc(name, resource_version="1", **labels):
+    return {"metadata": {"name": name, "resourceVersion": resource_version, "labels": labels}}
+
+
+class _FakeClient:
+    """Client double with a scripted LIST and a queue-driven watch stream."""
+
+    def __init__(self, items, resource_version="100"):
+        self.items = items
+        self.resource_version = resource_version
+        self.list_calls = 0
+        self.watch_calls = []
+        self.events = []
+        self.watch_error = None
+        self.event_ready = threading.Event()
+        self.released = threading.Event()
+
+    def _list_custom_resources_snapshot(self, **kwargs):
+        self.list_calls += 1
+        return [dict(item) for item in self.items], self.resource_version
+
+    def watch_custom_resources(self, **kwargs):
+        self.watch_calls.append(kwargs)
+        if self.watch_error is not None:
+            raise self.watch_error
+        while not self.released.is_set():
+            if self.event_ready.wait(0.01):
+                self.event_ready.clear()
+                while self.events:
+                    yield self.events.pop(0)
+
+
+@pytest.fixture
+def fake_client():
+    client = _FakeClient([_mc("cluster-b"), _mc("cluster-a")])
+    yield client
+    client.released.set()
+
+
+def _informer(client):
+    return ResourceInformer(client, "cluster.open-cluster-management.io", "v1", "managedclusters")
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+@pytest.mark.unit
+class TestResourceInformer:
+    """Tests for ResourceInformer."""
+
+    def test_second_read_served_from_cache(self, fake_client):
+        """Only the first read LISTs; later reads return sorted copies from memory."""
+        informer = _informer(fake_client)
+
+        first = informer.list()
+        second = informer.list()
+        second[0]["metadata"]["name"] = "mutated"
+        third = informer.list()
+        informer.invalidate()
+
+        assert [item["metadata"]["name"] for item in first] == ["cluster-b", "cluster-a"]
+        assert [item["metadata"]["name"] for item in third] == ["cluster-a", "cluster-b"]
+        assert fake_client.list_calls == 1
+        assert informer.hits == 2
+        assert _wait_until(lambda: fake_client.watch_calls)
+        assert fake_client.watch_calls[0]["resource_version"] == "100"
+
+    def test_watch_events_update_cache(self, fake_client):
+        """ADDED, MODIFIED and DELETED events are applied to the cached collection."""
+        informer = _informer(fake_client)
+        informer.list()
+        assert _wait_until(lambda: fake_client.watch_calls)
+
+        fake_client.events.extend(
+            [
+                {"type": "ADDED", "raw_object": _mc("cluster-c", "101")},
+                {"type": "MODIFIED", "raw_object": _mc("cluster-a", "102", env="prod")},
+                {"type": "DELETED", "raw_object": _mc("cluster-b", "103")},
+            ]
+        )
+        fake_client.event_ready.set()
+
+        def _names():
+            return [item["metadata"]["name"] for item in informer.list()]
+
+        assert _wait_until(lambda: _names() == ["cluster-a", "cluster-c"])
+        assert informer.list()[0]["metadata"]["labels"] == {"env": "prod"}
+        assert fake_client.list_calls == 1
+        informer.invalidate()
+
+    def test_invalidate_forces_relist(self, fake_client):
+        """Own writes invalidate the cache so the next read re-lists."""
+        informer = _informer(fake_client)
+        informer.list()
+
+        informer.invalidate()
+        fake_client.items.append(_mc("cluster-z"))
+        names = [item["metadata"]["name"] for item in informer.list()]
+        informer.invalidate()
+
+        assert fake_client.list_calls == 2
+        assert "cluster-z" in names
+
+    def test_denied_watch_disables_cache(self, fake_client):
+        """A 403 on the watch disables caching and every read re-lists."""
+        fake_client.watch_error = ApiException(status=403, reason="Forbidden")
+        informer = _informer(fake_client)
+
+        informer.list()
+        assert _wait_until(lambda: informer.disabled_reason is not None)
+        informer.list()
+
+        assert "403" in informer.disabled_reason
+        assert fake_client.list_calls == 2
+        assert not informer.synced
+
+    def test_invalidate_during_list_skips_caching(self, fake_client):
+        """A snapshot listed before a concurrent invalidate is returned but not cached."""
+        informer = _informer(fake_client)
+        original_list = fake_client._list_custom_resources_snapshot
+
+        def _list_then_write(**kwargs):
+            result = original_list(**kwargs)
+            informer.invalidate()
+            fake_client.items.append(_mc("cluster-z"))
+            fake_client._list_custom_resources_snapshot = original_list
+            return result
+
+        fake_client._list_custom_resources_snapshot = _list_then_write
+
+        first = [item["metadata"]["name"] for item in informer.list()]
+        assert not informer.synced
+        second = [item["metadata"]["name"] for item in informer.list()]
+        informer.invalidate()
+
+        assert "cluster-z" not in first
+        assert "cluster-z" in second
+        assert fake_client.list_calls == 2
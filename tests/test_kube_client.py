@@ -5,19 +5,28 @@
 """
 
 import errno
+import threading
 from itertools import chain, repeat
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from kubernetes.client import Configuration
 from kubernetes.client.rest import ApiException
+from kubernetes.config.config_exception import ConfigException
 
-from lib.kube_client import KubeClient, api_call, is_retryable_error
+from lib.kube_client import (
+    KubeClient,
+    _InstrumentedApiClient,
+    _wait_retry_after_or_exponential,
+    api_call,
+    is_retryable_error,
+)
 
 
 @pytest.fixture
 def mock_k8s_apis():
     """Mock Kubernetes API clients."""
-    with patch("lib.kube_client.config.load_kube_config") as mock_config, patch(
+    with patch("lib.kube_client.kubeconfig_index.get_kubeconfig_index") as mock_config, patch(
         "lib.kube_client.client.CustomObjectsApi"
     ) as mock_custom_cls, patch("lib.kube_client.client.CoreV1Api") as mock_core_cls, patch(
         "lib.kube_client.client.AppsV1Api"
@@ -214,6 +223,152 @@ def test_list_custom_resources_pagination(self, kube_client, mock_k8s_apis):
         assert [item["metadata"]["name"] for item in results] == ["item1", "item2"]
         assert mock_k8s_apis["custom_api"].list_cluster_custom_object.call_count == 2
 
+    def test_iter_custom_resources_fetches_pages_lazily(self, kube_client, mock_k8s_apis):
+        """iter_custom_resources requests the next page only once the current one is consumed."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_namespaced_custom_object.side_effect = [
+            {"items": [{"metadata": {"name": "b1"}}, {"metadata": {"name": "b2"}}], "metadata": {"continue": "t"}},
+            {"items": [{"metadata": {"name": "b3"}}], "metadata": {}},
+        ]
+
+        items = kube_client.iter_custom_resources("velero.io", "v1", "backups", namespace="backup-ns", page_size=2)
+
+        assert next(items)["metadata"]["name"] == "b1"
+        assert custom_api.list_namespaced_custom_object.call_count == 1
+        assert [item["metadata"]["name"] for item in items] == ["b2", "b3"]
+        calls = custom_api.list_namespaced_custom_object.call_args_list
+        assert [c.kwargs["limit"] for c in calls] == [2, 2]
+        assert calls[0].kwargs["_continue"] is None
+        assert calls[1].kwargs["_continue"] == "t"
+
+    def test_iter_custom_resources_missing_resource_yields_nothing(self, kube_client, mock_k8s_apis):
+        """A 404 (CRD not installed) ends the iteration without raising."""
+        mock_k8s_apis["custom_api"].list_cluster_custom_object.side_effect = ApiException(status=404)
+
+        assert list(kube_client.iter_custom_resources("argoproj.io", "v1alpha1", "applications")) == []
+
+    def test_iter_custom_resources_forwards_field_selector(self, kube_client, mock_k8s_apis):
+        """A field selector is sent with every page request; none is sent by default."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_cluster_custom_object.return_value = {"items": [], "metadata": {}}
+
+        list(kube_client.iter_custom_resources("coordination.k8s.io", "v1", "leases", field_selector="metadata.name=x"))
+        list(kube_client.iter_custom_resources("coordination.k8s.io", "v1", "leases"))
+
+        calls = custom_api.list_cluster_custom_object.call_args_list
+        assert calls[0].kwargs["field_selector"] == "metadata.name=x"
+        assert "field_selector" not in calls[1].kwargs
+
+    def test_list_metadata_requests_partial_object_metadata(self, kube_client, mock_k8s_apis):
+        """list_metadata asks for PartialObjectMetadataList and follows continue tokens."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_cluster_custom_object.side_effect = [
+            {"items": [{"kind": "PartialObjectMetadata", "metadata": {"name": "c1"}}], "metadata": {"continue": "t"}},
+            {"items": [{"kind": "PartialObjectMetadata", "metadata": {"name": "c2"}}], "metadata": {}},
+        ]
+
+        items = kube_client.list_metadata("cluster.open-cluster-management.io", "v1", "managedclusters")
+
+        assert [item["metadata"]["name"] for item in items] == ["c1", "c2"]
+        for call_args in custom_api.list_cluster_custom_object.call_args_list:
+            accept = call_args.kwargs["_headers"]["Accept"]
+            assert accept.startswith("application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io")
+        assert custom_api.list_cluster_custom_object.call_args_list[1].kwargs["_continue"] == "t"
+
+    def test_get_metadata_requests_partial_object_metadata(self, kube_client, mock_k8s_apis):
+        """get_metadata asks for a PartialObjectMetadata and maps 404 to None."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.get_cluster_custom_object.return_value = {"metadata": {"resourceVersion": "7"}}
+
+        crd = kube_client.get_metadata("apiextensions.k8s.io", "v1", "customresourcedefinitions", "x.example.io")
+
+        assert crd == {"metadata": {"resourceVersion": "7"}}
+        accept = custom_api.get_cluster_custom_object.call_args.kwargs["_headers"]["Accept"]
+        assert accept.startswith("application/json;as=PartialObjectMetadata;v=v1;g=meta.k8s.io")
+
+        custom_api.get_cluster_custom_object.side_effect = ApiException(status=404)
+        assert (
+            kube_client.get_metadata("apiextensions.k8s.io", "v1", "customresourcedefinitions", "y.example.io") is None
+        )
+
+    def test_list_metadata_missing_resource_returns_empty(self, kube_client, mock_k8s_apis):
+        """A 404 (CRD not installed) yields an empty list like list_custom_resources."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = ApiException(status=404)
+
+        assert kube_client.list_metadata("velero.io", "v1", "backups", namespace="backup-ns") == []
+
+    def test_watch_custom_resources_primes_resource_version(self, kube_client, mock_k8s_apis):
+        """Watches start from the current list resourceVersion and filter by name."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_namespaced_custom_object.return_value = {"items": [], "metadata": {"resourceVersion": "100"}}
+        watcher = MagicMock()
+        watcher.stream.return_value = iter([{"type": "MODIFIED", "raw_object": {}}])
+
+        events = list(
+            kube_client.watch_custom_resources(
+                "cluster.open-cluster-management.io",
+                "v1beta1",
+                "restores",
+                namespace="backup-ns",
+                name="restore-acm-full",
+                watcher=watcher,
+            )
+        )
+
+        assert events == [{"type": "MODIFIED", "raw_object": {}}]
+        custom_api.list_namespaced_custom_object.assert_called_once_with(
+            group="cluster.open-cluster-management.io",
+            version="v1beta1",
+            plural="restores",
+            limit=1,
+            field_selector="metadata.name=restore-acm-full",
+            namespace="backup-ns",
+        )
+        stream_kwargs = watcher.stream.call_args.kwargs
+        assert watcher.stream.call_args.args == (custom_api.list_namespaced_custom_object,)
+        assert stream_kwargs["resource_version"] == "100"
+        assert stream_kwargs["allow_watch_bookmarks"] is True
+        assert stream_kwargs["field_selector"] == "metadata.name=restore-acm-full"
+        watcher.stop.assert_called_once()
+
+    def test_informer_cache_serves_lists_and_invalidates_on_write(self, kube_client, mock_k8s_apis):
+        """Cached collections LIST once; the client's own patches force a re-list."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_cluster_custom_object.return_value = {
+            "items": [{"metadata": {"name": "cluster1"}}],
+            "metadata": {"resourceVersion": "10"},
+        }
+        released = threading.Event()
+
+        def _idle_watch(**_kwargs):
+            released.wait(5)
+            yield from ()
+
+        kube_client.enable_informer_cache()
+        try:
+            with patch.object(kube_client, "watch_custom_resources", side_effect=_idle_watch):
+                kube_client.list_managed_clusters()
+                kube_client.list_managed_clusters()
+                assert custom_api.list_cluster_custom_object.call_count == 1
+
+                kube_client.patch_managed_cluster("cluster1", {"metadata": {"labels": {"a": "b"}}})
+                kube_client.list_managed_clusters()
+                assert custom_api.list_cluster_custom_object.call_count == 2
+
+                # Bounded lists bypass the cache
+                kube_client.list_custom_resources(
+                    "cluster.open-cluster-management.io", "v1", "managedclusters", max_items=1
+                )
+                assert custom_api.list_cluster_custom_object.call_count == 3
+
+                # Metadata-only lists of cached collections are trimmed from the cache
+                metadata = kube_client.list_metadata("cluster.open-cluster-management.io", "v1", "managedclusters")
+                assert metadata == [{"metadata": {"name": "cluster1"}}]
+                assert custom_api.list_cluster_custom_object.call_count == 3
+        finally:
+            kube_client._invalidate_informers("cluster.open-cluster-management.io", "v1", "managedclusters")
+            released.set()
+
     def test_scale_statefulset(self, kube_client, mock_k8s_apis):
         """Test scaling statefulset."""
         response = MagicMock()
@@ -636,21 +791,28 @@ def test_create_or_patch_configmap_no_nested_retry_on_read(self, kube_client, mo
 class TestKubeClientInitialization:
     """Test cases for KubeClient initialization."""
 
-    @patch("lib.kube_client.config.load_kube_config")
-    def test_init_with_context(self, mock_load_config):
+    @patch("lib.kube_client.kubeconfig_index.get_kubeconfig_index")
+    def test_init_with_context(self, mock_get_index):
         """Test initializing with a specific context."""
         kc = KubeClient(context="test-context")
         assert kc.context == "test-context"
         assert kc.dry_run is False
-        mock_load_config.assert_called_once_with(context="test-context")
+        mock_get_index.return_value.load_and_set.assert_called_once_with(ANY, context="test-context")
 
-    @patch("lib.kube_client.config.load_kube_config")
-    def test_init_without_context(self, mock_load_config):
+    @patch("lib.kube_client.kubeconfig_index.get_kubeconfig_index")
+    def test_init_without_context(self, mock_get_index):
         """Test initializing without a context."""
         kc = KubeClient()
         assert kc.context is None
         assert kc.dry_run is False
-        mock_load_config.assert_called_once_with(context=None)
+        mock_get_index.return_value.load_and_set.assert_called_once_with(ANY, context=None)
+
+    @patch("lib.kube_client.kubeconfig_index.get_kubeconfig_index")
+    def test_init_unknown_context_raises(self, mock_get_index):
+        """An unknown context surfaces the kubeconfig error."""
+        mock_get_index.return_value.load_and_set.side_effect = ConfigException("no such context")
+        with pytest.raises(ConfigException):
+            KubeClient(context="missing")
 
 
 @pytest.mark.unit
@@ -829,6 +991,66 @@ def test_file_oserror_is_not_retryable(self):
         assert is_retryable_error(OSError(errno.EEXIST, "File exists")) is False
 
 
+@pytest.mark.unit
+class TestApiThrottling:
+    """Tests for client-side throttling and Retry-After handling."""
+
+    @staticmethod
+    def _retry_state(exc, attempt=1):
+        outcome = MagicMock()
+        outcome.failed = True
+        outcome.exception.return_value = exc
+        return MagicMock(outcome=outcome, attempt_number=attempt)
+
+    def test_retry_wait_honors_retry_after_header(self):
+        """Tenacity waits for the server-provided Retry-After instead of backing off."""
+        exc = ApiException(status=429)
+        exc.headers = {"Retry-After": "3"}
+
+        assert _wait_retry_after_or_exponential(self._retry_state(exc)) == 3.0
+
+    def test_retry_wait_falls_back_to_exponential(self):
+        """Without Retry-After the exponential backoff is used."""
+        delay = _wait_retry_after_or_exponential(self._retry_state(ApiException(status=503)))
+
+        assert 1 <= delay <= 30
+
+    def test_429_response_pauses_rate_limiter(self):
+        """A 429 with Retry-After pauses the shared bucket."""
+        limiter = MagicMock()
+        api_client = _InstrumentedApiClient(Configuration(), limiter)
+        response = MagicMock(status=429, headers={"Retry-After": "2"})
+
+        with patch("lib.kube_client.client.ApiClient.call_api", return_value=response):
+            assert api_client.call_api("GET", "/apis") is response
+
+        limiter.acquire.assert_called_once()
+        limiter.pause.assert_called_once_with(2.0)
+
+    def test_429_exception_pauses_rate_limiter(self):
+        """A raised 429 ApiException with Retry-After also pauses the bucket."""
+        limiter = MagicMock()
+        api_client = _InstrumentedApiClient(Configuration(), limiter)
+        exc = ApiException(status=429, reason="Too Many Requests")
+        exc.headers = {"Retry-After": "3"}
+
+        with patch("lib.kube_client.client.ApiClient.call_api", side_effect=exc):
+            with pytest.raises(ApiException):
+                api_client.call_api("GET", "/apis")
+
+        limiter.pause.assert_called_once_with(3.0)
+
+    def test_throttle_stats(self, mock_k8s_apis):
+        """Stats are reported when throttling is enabled and None when disabled."""
+        throttled = KubeClient(context="test-context", qps=10, burst=5)
+        unthrottled = KubeClient(context="test-context", qps=0)
+
+        stats = throttled.throttle_stats()
+        assert stats["qps"] == 10.0
+        assert stats["burst"] == 5
+        assert unthrottled.throttle_stats() is None
+
+
 @pytest.mark.unit
 class TestDeleteOperationsNormalMode:
     """Tests for delete operations in normal (non-dry-run) mode."""
@@ -1143,6 +1365,34 @@ def test_get_pod_logs_negative_tail_lines_raises(self, kube_client, mock_k8s_api
         with pytest.raises(ValidationError):
             kube_client.get_pod_logs("test-pod", "test-ns", tail_lines=-1)
 
+    def test_iter_pod_log_lines_streams_chunks(self, kube_client, mock_k8s_apis):
+        """Lines split across chunks are reassembled; the response is released afterwards."""
+        response = MagicMock()
+        response.stream.return_value = iter([b"first li", b"ne\nsecond\nthi", b"rd"])
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.return_value = response
+
+        lines = list(kube_client.iter_pod_log_lines("test-pod", "test-ns", container="velero", since_seconds=600))
+
+        assert lines == ["first line", "second", "third"]
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.assert_called_once_with(
+            name="test-pod", namespace="test-ns", _preload_content=False, container="velero", since_seconds=600
+        )
+        response.release_conn.assert_called_once()
+
+    def test_iter_pod_log_lines_404_yields_nothing(self, kube_client, mock_k8s_apis):
+        """A missing pod yields no lines."""
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.side_effect = ApiException(status=404)
+
+        assert list(kube_client.iter_pod_log_lines("gone", "test-ns")) == []
+
+    def test_iter_pod_log_lines_negative_since_seconds_raises(self, kube_client, mock_k8s_apis):
+        """Negative since_seconds is rejected before any request."""
+        from lib.validation import ValidationError
+
+        with pytest.raises(ValidationError, match="since_seconds"):
+            list(kube_client.iter_pod_log_lines("test-pod", "test-ns", since_seconds=-5))
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.assert_not_called()
+
     def test_get_pod_logs_dry_run_returns_empty(self, dry_run_client, mock_k8s_apis):
         """Test dry-run mode returns empty string without API call."""
         result = dry_run_client.get_pod_logs("test-pod", "test-ns")
@@ -0,0 +1,137 @@
+"""Unit tests for lib/kubeconfig_index.py.
+
+Tests multi-file merging, host and context lookups, staleness tracking and
+building client configurations from the parsed entries.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+from kubernetes.client import Configuration
+from kubernetes.config.config_exception import ConfigException
+
+from lib.kubeconfig_index import KubeconfigIndex, get_kubeconfig_index, server_host
+
+
+def _write(path, contexts, clusters, users=None, current=None):
+    data = {"apiVersion": "v1", "contexts": contexts, "clusters": clusters, "users": users or []}
+    if current:
+        data["current-context"] = current
+    path.write_text(yaml.dump(data))
+    return str(path)
+
+
+@pytest.fixture
+def two_files(tmp_path):
+    (tmp_path / "ca.crt").write_text("CA")
+    first = _write(
+        tmp_path / "a.yaml",
+        contexts=[
+            {"name": "hub1", "context": {"cluster": "c1", "user": "u1"}},
+            {"name": "shared", "context": {"cluster": "c1", "user": "u1"}},
+        ],
+        clusters=[
+            {"name": "c1", "cluster": {"server": "https://API.Hub1.example:6443", "certificate-authority": "ca.crt"}}
+        ],
+        users=[{"name": "u1", "user": {"token": "token-1"}}],
+        current="hub1",
+    )
+    second = _write(
+        tmp_path / "b.yaml",
+        contexts=[
+            {"name": "hub2", "context": {"cluster": "c2", "user": "u2"}},
+            {"name": "shared", "context": {"cluster": "c2", "user": "u2"}},
+        ],
+        clusters=[{"name": "c2", "cluster": {"server": "https://api.hub2.example"}}],
+        users=[{"name": "u2", "user": {"token": "token-2"}}],
+        current="hub2",
+    )
+    return first, second
+
+
+@pytest.mark.unit
+class TestServerHost:
+    """Tests for API server host normalization."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://api.example.com:6443", "api.example.com"),
+            ("https://API.Example.com/path", "api.example.com"),
+            ("api.example.com:6443", "api.example.com"),
+            ("https://[fd00::1]:6443", "fd00::1"),
+            ("", ""),
+        ],
+    )
+    def test_server_host(self, url, expected):
+        assert server_host(url) == expected
+
+
+@pytest.mark.unit
+class TestKubeconfigIndex:
+    """Tests for merging and lookups."""
+
+    def test_first_definition_wins_and_last_current_context_wins(self, two_files):
+        index = KubeconfigIndex(two_files)
+
+        assert sorted(ctx["name"] for ctx in index.contexts()) == ["hub1", "hub2", "shared"]
+        assert index.server_for_context("shared") == "https://API.Hub1.example:6443"
+        assert index.current_context == "hub2"
+        assert len(index.merged["contexts"]) == 4
+
+    def test_context_for_host(self, two_files):
+        index = KubeconfigIndex(two_files)
+
+        assert index.context_for_host("https://api.hub1.example:443/apis") == "hub1"
+        assert index.context_for_host("https://api.hub2.example:6443") == "hub2"
+        assert index.context_for_host("https://api.unknown.example") is None
+
+    def test_missing_and_invalid_files_are_skipped(self, tmp_path, two_files):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("{{{{invalid yaml")
+        index = KubeconfigIndex((str(tmp_path / "missing.yaml"), str(bad), two_files[1]))
+
+        assert [ctx["name"] for ctx in index.contexts()] == ["hub2", "shared"]
+        assert index.file_size(str(tmp_path / "missing.yaml")) is None
+
+    def test_load_and_set_resolves_relative_paths(self, two_files, tmp_path):
+        configuration = Configuration()
+        KubeconfigIndex(two_files).load_and_set(configuration, context="hub1")
+
+        assert configuration.host == "https://API.Hub1.example:6443"
+        assert configuration.ssl_ca_cert == str(tmp_path / "ca.crt")
+        assert configuration.api_key["BearerToken"] == "Bearer token-1"
+
+    def test_load_and_set_defaults_to_current_context(self, two_files):
+        configuration = Configuration()
+        KubeconfigIndex(two_files).load_and_set(configuration)
+
+        assert configuration.host == "https://api.hub2.example"
+
+    def test_unknown_context_raises(self, two_files):
+        with pytest.raises(ConfigException):
+            KubeconfigIndex(two_files).load_and_set(Configuration(), context="nope")
+
+
+@pytest.mark.unit
+class TestSharedIndex:
+    """Tests for the process-wide index."""
+
+    def test_reused_until_a_file_changes(self, two_files, monkeypatch):
+        monkeypatch.setenv("KUBECONFIG", os.pathsep.join(two_files))
+        first = get_kubeconfig_index()
+
+        assert get_kubeconfig_index() is first
+
+        _write(
+            Path(two_files[1]),
+            contexts=[{"name": "hub3", "context": {"cluster": "c3"}}],
+            clusters=[{"name": "c3", "cluster": {"server": "https://api.hub3.example.com"}}],
+        )
+        second = get_kubeconfig_index()
+
+        assert second is not first
+        assert second.has_context("hub3")
+        assert get_kubeconfig_index(force_reload=True) is not second
@@ -1323,7 +1323,7 @@ def test_main_resume_only_uses_existing_reversed_default_state_file(self, tmp_pa
                 main()
 
         assert exc_info.value.code == EXIT_SUCCESS
-        state_manager.assert_called_once_with(str(reversed_path))
+        state_manager.assert_called_once_with(str(reversed_path), journal=False)
         assert args.state_file == str(reversed_path)
 
     def test_main_resume_only_missing_state_file_exits_before_state_manager(self, tmp_path):
@@ -1615,6 +1615,7 @@ def test_run_phase_preflight_passes_argocd_flags_to_preflight_validator(self):
             include_decommission=False,
             argocd_manage=True,
             skip_gitops_check=False,
+            rbac_cache=None,
         )
         report_argocd_impact.assert_called_once_with(primary, secondary, logger, argocd_manage=True)
 
@@ -1657,6 +1658,7 @@ def test_run_phase_preflight_passes_decommission_intent_to_preflight_validator(
             include_decommission=True,
             argocd_manage=False,
             skip_gitops_check=False,
+            rbac_cache=None,
         )
 
     def test_report_argocd_impact_warns_instead_of_raising_on_list_failure(self):
@@ -1673,7 +1675,7 @@ def test_report_argocd_impact_warns_instead_of_raising_on_list_failure(self):
             "acm_switchover.argocd_lib.detect_argocd_installation",
             return_value=discovery,
         ), patch(
-            "acm_switchover.argocd_lib.list_argocd_applications",
+            "acm_switchover.argocd_lib.iter_argocd_applications",
             side_effect=ApiException(status=403, reason="Forbidden"),
         ):
             _report_argocd_acm_impact(primary, secondary, logger)
@@ -1703,7 +1705,7 @@ def test_report_argocd_impact_warns_on_non_blocking_failures(self, side_effect):
             "acm_switchover.argocd_lib.detect_argocd_installation",
             return_value=discovery,
         ), patch(
-            "acm_switchover.argocd_lib.list_argocd_applications",
+            "acm_switchover.argocd_lib.iter_argocd_applications",
             side_effect=side_effect,
         ):
             _report_argocd_acm_impact(primary, secondary, logger)
@@ -1787,14 +1789,14 @@ def test_argocd_advisory_warning_shown_without_argocd_manage(self):
             namespace="openshift-gitops",
             name="acm-config",
             resource_count=3,
-            app={"spec": {"syncPolicy": {"automated": {"prune": True, "selfHeal": True}}}},
+            sync_policy={"automated": {"prune": True, "selfHeal": True}},
         )
 
         with patch(
             "acm_switchover.argocd_lib.detect_argocd_installation",
             return_value=discovery,
         ), patch(
-            "acm_switchover.argocd_lib.list_argocd_applications",
+            "acm_switchover.argocd_lib.iter_argocd_applications",
             return_value=[{"metadata": {"name": "acm-config"}}],
         ), patch(
             "acm_switchover.argocd_lib.find_acm_touching_apps",
@@ -1824,14 +1826,14 @@ def test_argocd_advisory_warning_hidden_with_argocd_manage(self):
             namespace="openshift-gitops",
             name="acm-config",
             resource_count=3,
-            app={"spec": {"syncPolicy": {"automated": {"prune": True, "selfHeal": True}}}},
+            sync_policy={"automated": {"prune": True, "selfHeal": True}},
         )
 
         with patch(
             "acm_switchover.argocd_lib.detect_argocd_installation",
             return_value=discovery,
         ), patch(
-            "acm_switchover.argocd_lib.list_argocd_applications",
+            "acm_switchover.argocd_lib.iter_argocd_applications",
             return_value=[{"metadata": {"name": "acm-config"}}],
         ), patch(
             "acm_switchover.argocd_lib.find_acm_touching_apps",
@@ -1861,14 +1863,14 @@ def test_argocd_advisory_warning_only_for_autosync_apps(self):
             namespace="openshift-gitops",
             name="acm-config",
             resource_count=3,
-            app={"spec": {"syncPolicy": {}}},
+            sync_policy={},
         )
 
         with patch(
             "acm_switchover.argocd_lib.detect_argocd_installation",
             return_value=discovery,
         ), patch(
-            "acm_switchover.argocd_lib.list_argocd_applications",
+            "acm_switchover.argocd_lib.iter_argocd_applications",
             return_value=[{"metadata": {"name": "acm-config"}}],
         ), patch(
             "acm_switchover.argocd_lib.find_acm_touching_apps",
@@ -4,6 +4,7 @@
 """
 
 import base64
+import logging
 import os
 import sys
 import time
@@ -29,6 +30,9 @@
     OBSERVABILITY_NAMESPACE,
 )
 from lib.exceptions import SwitchoverError
+from lib.fanout import FanOutResult
+from lib.kubeconfig_index import KubeconfigIndex
+from lib.spoke_clients import SpokeClientPool
 
 PostActivationVerification = post_activation_module.PostActivationVerification
 
@@ -93,10 +97,10 @@ def post_verify_no_obs(mock_secondary_client, mock_state_manager):
 class TestPostActivationVerification:
     """Tests for PostActivationVerification class."""
 
-    def test_build_managed_cluster_clients_disables_kubeconfig_persistence(
+    def test_build_managed_cluster_clients_uses_shared_kubeconfig_index(
         self, mock_secondary_client, mock_state_manager
     ):
-        """Per-context clients should not persist refreshed credentials back to kubeconfig."""
+        """Per-context clients are built from the shared kubeconfig index, not a fresh parse."""
         verify = PostActivationVerification(
             secondary_client=mock_secondary_client,
             state_manager=mock_state_manager,
@@ -106,12 +110,14 @@ def test_build_managed_cluster_clients_disables_kubeconfig_persistence(
         core_v1 = Mock(name="core_v1")
         apps_v1 = Mock(name="apps_v1")
 
-        with patch("modules.post_activation.config.new_client_from_config", return_value=api_client) as new_client:
+        with patch("modules.post_activation.kubeconfig_index.get_kubeconfig_index") as get_index:
+            new_client = get_index.return_value.new_api_client
+            new_client.return_value = api_client
             with patch("modules.post_activation.client.CoreV1Api", return_value=core_v1) as core_ctor:
                 with patch("modules.post_activation.client.AppsV1Api", return_value=apps_v1) as apps_ctor:
                     result = verify._build_managed_cluster_clients("managed-context")
 
-        new_client.assert_called_once_with(context="managed-context", persist_config=False)
+        new_client.assert_called_once_with("managed-context")
         core_ctor.assert_called_once_with(api_client=api_client)
         apps_ctor.assert_called_once_with(api_client=api_client)
         assert result == (core_v1, apps_v1)
@@ -125,7 +131,7 @@ def test_klusterlet_verification_bypasses_kubeconfig_size_limit(self, mock_secon
         )
 
         with patch.object(verify, "_get_hub_api_server", return_value="https://new-hub"):
-            with patch.object(verify, "_load_kubeconfig_data", return_value={}) as mock_load:
+            with patch.object(verify, "_load_kubeconfig_index", return_value=None) as mock_load:
                 verify._verify_klusterlet_connections()
 
         mock_load.assert_called_with(max_size=0)
@@ -846,6 +852,13 @@ def _kubeconfig_yaml(clusters=None, contexts=None):
     return yaml.dump(data)
 
 
+def _index_for(tmp_path, kube_data):
+    """Build a KubeconfigIndex over a kubeconfig file holding kube_data."""
+    path = tmp_path / "kubeconfig"
+    path.write_text(_kubeconfig_yaml(clusters=kube_data.get("clusters"), contexts=kube_data.get("contexts")))
+    return KubeconfigIndex((str(path),))
+
+
 # ========================================================================
 # 1. Klusterlet parallel verification (_verify_klusterlet_connections)
 # ========================================================================
@@ -853,7 +866,7 @@ def _kubeconfig_yaml(clusters=None, contexts=None):
 class TestKlusterletParallelVerification:
     """Tests for _verify_klusterlet_connections parallel execution."""
 
-    def test_filters_local_cluster(self, mock_secondary_client, mock_state_manager):
+    def test_filters_local_cluster(self, mock_secondary_client, mock_state_manager, tmp_path):
         """local-cluster should be excluded from klusterlet verification."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -865,13 +878,13 @@ def test_filters_local_cluster(self, mock_secondary_client, mock_state_manager):
         ]
 
         with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
-            with patch.object(pav, "_load_kubeconfig_data", return_value={"contexts": [], "clusters": []}):
+            with patch.object(pav, "_load_kubeconfig_index", return_value=_index_for(tmp_path, {})):
                 with patch.object(pav, "_check_klusterlet_connection") as mock_check:
                     pav._verify_klusterlet_connections()
 
         mock_check.assert_not_called()
 
-    def test_categorizes_verified_wrong_hub_unreachable(self, mock_secondary_client, mock_state_manager):
+    def test_categorizes_verified_wrong_hub_unreachable(self, mock_secondary_client, mock_state_manager, tmp_path):
         """Results should be categorized into verified / wrong_hub / unreachable."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -907,7 +920,7 @@ def fake_check(ctx, name, hub):
             return {"c1": "verified", "c2": "wrong_hub", "c3": "unreachable"}[name]
 
         with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
-            with patch.object(pav, "_load_kubeconfig_data", return_value=kube_data):
+            with patch.object(pav, "_load_kubeconfig_index", return_value=_index_for(tmp_path, kube_data)):
                 with patch.object(pav, "_check_klusterlet_connection", side_effect=fake_check):
                     with patch.object(pav, "_force_klusterlet_reconnect", return_value=True) as mock_fix:
                         pav._verify_klusterlet_connections()
@@ -916,12 +929,76 @@ def fake_check(ctx, name, hub):
         mock_fix.assert_called_once()
         assert mock_fix.call_args[0][0] == "c2"
 
+    def test_fix_pass_reuses_check_pass_client(self, mock_secondary_client, mock_state_manager, tmp_path):
+        """A wrong-hub cluster is fixed over the client opened by its check; all clients are closed after."""
+        pav = _make_pav(mock_secondary_client, mock_state_manager)
+        built = {}
+
+        def build(context):
+            built.setdefault(context, []).append(Mock(name=context))
+            return built[context][-1]
+
+        pav._spoke_clients = SpokeClientPool(factory=build)
+        mock_secondary_client.list_custom_resources.return_value = [
+            {"metadata": {"name": name}, "spec": {"managedClusterClientConfigs": [{"url": f"https://api.{name}:6443"}]}}
+            for name in ("c1", "c2")
+        ]
+        kube_data = {
+            "contexts": [{"name": f"ctx-{n}", "context": {"cluster": f"k{n}"}} for n in ("c1", "c2")],
+            "clusters": [{"name": f"k{n}", "cluster": {"server": f"https://api.{n}:6443"}} for n in ("c1", "c2")],
+        }
+
+        def fake_check(ctx, name, hub):
+            pav._build_managed_cluster_clients(ctx)
+            return "verified" if name == "c1" else "wrong_hub"
+
+        def fake_fix(name, ctx):
+            pav._build_managed_cluster_clients(ctx)
+            return True
+
+        with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
+            with patch.object(pav, "_load_kubeconfig_index", return_value=_index_for(tmp_path, kube_data)):
+                with patch.object(pav, "_check_klusterlet_connection", side_effect=fake_check):
+                    with patch.object(pav, "_force_klusterlet_reconnect", side_effect=fake_fix):
+                        pav._verify_klusterlet_connections()
+
+        assert {context: len(clients) for context, clients in built.items()} == {"ctx-c1": 1, "ctx-c2": 1}
+        assert all(clients[0].close.call_count == 1 for clients in built.values())
+        assert len(pav._spoke_clients) == 0
+
+    def test_budget_exhausted_skips_remaining_clusters(
+        self, mock_secondary_client, mock_state_manager, caplog, tmp_path
+    ):
+        """Clusters not checked within the budget are reported and never fixed."""
+        pav = _make_pav(mock_secondary_client, mock_state_manager)
+        mock_secondary_client.list_custom_resources.return_value = [
+            {"metadata": {"name": name}, "spec": {"managedClusterClientConfigs": [{"url": f"https://api.{name}:6443"}]}}
+            for name in ("c1", "c2")
+        ]
+        kube_data = {
+            "contexts": [{"name": f"ctx-{n}", "context": {"cluster": f"k{n}"}} for n in ("c1", "c2")],
+            "clusters": [{"name": f"k{n}", "cluster": {"server": f"https://api.{n}:6443"}} for n in ("c1", "c2")],
+        }
+        checks = FanOutResult(
+            description="Klusterlet check", results={"c1": ("verified", "ctx-c1")}, not_started=["c2"]
+        )
+
+        with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
+            with patch.object(pav, "_load_kubeconfig_index", return_value=_index_for(tmp_path, kube_data)):
+                with patch.object(post_activation_module, "run_adaptive", return_value=checks) as mock_run:
+                    with caplog.at_level(logging.WARNING, logger="acm_switchover"):
+                        pav._verify_klusterlet_connections()
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.kwargs["budget_seconds"] <= pav.klusterlet_budget
+        assert "exhausted before 1 cluster(s) were checked: c2" in caplog.text
+
     def test_no_hub_api_server_skips(self, mock_secondary_client, mock_state_manager):
         """If hub API server can't be determined, skip verification."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
         with patch.object(pav, "_get_hub_api_server", return_value=""):
-            with patch.object(pav, "_load_kubeconfig_data") as mock_load:
+            with patch.object(pav, "_load_kubeconfig_index") as mock_load:
                 pav._verify_klusterlet_connections()
 
         mock_load.assert_not_called()
@@ -931,13 +1008,13 @@ def test_no_kubeconfig_skips(self, mock_secondary_client, mock_state_manager):
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
         with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
-            with patch.object(pav, "_load_kubeconfig_data", return_value={}):
+            with patch.object(pav, "_load_kubeconfig_index", return_value=None):
                 with patch.object(pav, "_check_klusterlet_connection") as mock_check:
                     pav._verify_klusterlet_connections()
 
         mock_check.assert_not_called()
 
-    def test_cluster_without_api_url(self, mock_secondary_client, mock_state_manager):
+    def test_cluster_without_api_url(self, mock_secondary_client, mock_state_manager, tmp_path):
         """Clusters without managedClusterClientConfigs get empty api_url."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -945,17 +1022,17 @@ def test_cluster_without_api_url(self, mock_secondary_client, mock_state_manager
             {"metadata": {"name": "orphan"}, "spec": {}},
         ]
 
-        kube_data = {"contexts": [], "clusters": []}
+        index = _index_for(tmp_path, {"contexts": [], "clusters": []})
 
         with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
-            with patch.object(pav, "_load_kubeconfig_data", return_value=kube_data):
+            with patch.object(pav, "_load_kubeconfig_index", return_value=index):
                 with patch.object(pav, "_find_context_by_api_url", return_value="") as mock_find:
                     pav._verify_klusterlet_connections()
 
         # Called with empty api_url
-        mock_find.assert_called_once_with(kube_data, "", "orphan")
+        mock_find.assert_called_once_with(index, "", "orphan")
 
-    def test_check_cluster_exception_returns_unreachable(self, mock_secondary_client, mock_state_manager):
+    def test_check_cluster_exception_returns_unreachable(self, mock_secondary_client, mock_state_manager, tmp_path):
         """Exceptions in check_cluster inner function should yield 'unreachable'."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -972,13 +1049,150 @@ def test_check_cluster_exception_returns_unreachable(self, mock_secondary_client
         }
 
         with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
-            with patch.object(pav, "_load_kubeconfig_data", return_value=kube_data):
+            with patch.object(pav, "_load_kubeconfig_index", return_value=_index_for(tmp_path, kube_data)):
                 with patch.object(pav, "_find_context_by_api_url", return_value="ctx-c1"):
                     with patch.object(pav, "_check_klusterlet_connection", side_effect=RuntimeError("boom")):
                         # Should not raise; c1 lands in unreachable bucket
                         pav._verify_klusterlet_connections()
 
 
+def _lease_mc(name, available=True, since="2026-01-01T10:01:00Z"):
+    conditions = [{"type": "ManagedClusterConditionAvailable", "status": "True", "lastTransitionTime": since}]
+    return {
+        "metadata": {"name": name},
+        "spec": {"managedClusterClientConfigs": [{"url": f"https://api.{name}:6443"}]},
+        "status": {"conditions": conditions if available else []},
+    }
+
+
+def _lease(namespace, renew_time):
+    return {"metadata": {"namespace": namespace}, "spec": {"renewTime": renew_time, "leaseDurationSeconds": 60}}
+
+
+@pytest.mark.unit
+class TestKlusterletLeaseVerification:
+    """Tests for the hub-side lease check (--klusterlet-verify-mode lease/auto)."""
+
+    NOW = "2026-01-01T10:03:00Z"
+
+    def _make(self, secondary, state, mode, managed_clusters, leases, activation_start="2026-01-01T10:00:00Z"):
+        state.get_phase_timings.return_value = (
+            [{"phase": "activation", "started_at": activation_start}] if activation_start else []
+        )
+        secondary.list_custom_resources.return_value = managed_clusters
+        secondary.iter_custom_resources.return_value = iter(leases)
+        pav = _make_pav(secondary, state)
+        pav.klusterlet_verify_mode = mode
+        return pav
+
+    def _check(self, pav):
+        now = post_activation_module._parse_timestamp(self.NOW)
+        with patch.object(post_activation_module, "datetime", wraps=post_activation_module.datetime) as mock_dt:
+            mock_dt.now.return_value = now
+            return pav._check_klusterlet_leases()
+
+    def test_classifies_clusters_from_leases(self, mock_secondary_client, mock_state_manager):
+        pav = self._make(
+            mock_secondary_client,
+            mock_state_manager,
+            "lease",
+            [
+                _lease_mc("fresh"),
+                _lease_mc("old-lease", since="2026-01-01T09:00:00Z"),
+                _lease_mc("reconnected"),
+                _lease_mc("expired"),
+                _lease_mc("missing"),
+                _lease_mc("down", available=False),
+                _lease_mc(LOCAL_CLUSTER_NAME),
+            ],
+            [
+                _lease("fresh", "2026-01-01T10:02:00Z"),
+                _lease("old-lease", "2026-01-01T09:59:30Z"),
+                _lease("reconnected", "2026-01-01T09:59:30Z"),
+                _lease("expired", "2026-01-01T09:50:00Z"),
+                _lease("down", "2026-01-01T10:02:00Z"),
+            ],
+        )
+
+        status = self._check(pav)
+
+        assert status == {
+            "fresh": "connected",
+            "old-lease": "stale_lease",
+            "reconnected": "connected",
+            "expired": "stale_lease",
+            "missing": "no_lease",
+            "down": "unavailable",
+        }
+        kwargs = mock_secondary_client.iter_custom_resources.call_args.kwargs
+        assert kwargs["plural"] == "leases"
+        assert kwargs["field_selector"] == "metadata.name=managed-cluster-lease"
+
+    def test_unknown_activation_time_only_requires_fresh_lease(self, mock_secondary_client, mock_state_manager):
+        pav = self._make(
+            mock_secondary_client,
+            mock_state_manager,
+            "lease",
+            [_lease_mc("c1", since="2026-01-01T09:00:00Z")],
+            [_lease("c1", "2026-01-01T09:59:30Z")],
+            activation_start=None,
+        )
+
+        assert self._check(pav) == {"c1": "connected"}
+
+    def test_lease_mode_never_contacts_managed_clusters(self, mock_secondary_client, mock_state_manager):
+        pav = self._make(mock_secondary_client, mock_state_manager, "lease", [], [])
+
+        with patch.object(pav, "_check_klusterlet_leases", return_value={"c1": "connected", "c2": "stale_lease"}):
+            with patch.object(pav, "_load_kubeconfig_index") as mock_load:
+                with patch.object(post_activation_module, "run_adaptive") as mock_run:
+                    pav._verify_klusterlet_connections()
+
+        mock_load.assert_not_called()
+        mock_run.assert_not_called()
+
+    def test_lease_mode_list_failure_is_a_warning(self, mock_secondary_client, mock_state_manager, caplog):
+        pav = self._make(mock_secondary_client, mock_state_manager, "lease", [], [])
+
+        with patch.object(pav, "_check_klusterlet_leases", side_effect=ApiException(status=403)):
+            with patch.object(post_activation_module, "run_adaptive") as mock_run:
+                with caplog.at_level(logging.WARNING, logger="acm_switchover"):
+                    pav._verify_klusterlet_connections()
+
+        mock_run.assert_not_called()
+        assert "Could not read klusterlet leases" in caplog.text
+
+    def test_auto_mode_checks_only_unproven_clusters(self, mock_secondary_client, mock_state_manager, tmp_path):
+        pav = self._make(mock_secondary_client, mock_state_manager, "auto", [_lease_mc("c1"), _lease_mc("c2")], [])
+        kube_data = {
+            "contexts": [{"name": f"ctx-{n}", "context": {"cluster": f"k{n}"}} for n in ("c1", "c2")],
+            "clusters": [{"name": f"k{n}", "cluster": {"server": f"https://api.{n}:6443"}} for n in ("c1", "c2")],
+        }
+
+        with patch.object(pav, "_check_klusterlet_leases", return_value={"c1": "connected", "c2": "stale_lease"}):
+            with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
+                with patch.object(pav, "_load_kubeconfig_index", return_value=_index_for(tmp_path, kube_data)):
+                    with patch.object(pav, "_check_klusterlet_connection", return_value="verified") as mock_check:
+                        pav._verify_klusterlet_connections()
+
+        mock_check.assert_called_once_with("ctx-c2", "c2", "https://hub:6443")
+
+    def test_auto_mode_falls_back_to_spoke_checks(self, mock_secondary_client, mock_state_manager, tmp_path):
+        pav = self._make(mock_secondary_client, mock_state_manager, "auto", [_lease_mc("c1")], [])
+        kube_data = {
+            "contexts": [{"name": "ctx-c1", "context": {"cluster": "kc1"}}],
+            "clusters": [{"name": "kc1", "cluster": {"server": "https://api.c1:6443"}}],
+        }
+
+        with patch.object(pav, "_check_klusterlet_leases", side_effect=ApiException(status=403)):
+            with patch.object(pav, "_get_hub_api_server", return_value="https://hub:6443"):
+                with patch.object(pav, "_load_kubeconfig_index", return_value=_index_for(tmp_path, kube_data)):
+                    with patch.object(pav, "_check_klusterlet_connection", return_value="verified") as mock_check:
+                        pav._verify_klusterlet_connections()
+
+        mock_check.assert_called_once_with("ctx-c1", "c1", "https://hub:6443")
+
+
 # ========================================================================
 # 2. Kubeconfig loading / parsing (_load_kubeconfig_data)
 # ========================================================================
@@ -1168,7 +1382,7 @@ def test_explicit_max_size_positive(self, mock_secondary_client, mock_state_mana
 class TestFindContextByApiUrl:
     """Tests for _find_context_by_api_url hostname matching and fallback."""
 
-    def test_hostname_match(self, mock_secondary_client, mock_state_manager):
+    def test_hostname_match(self, mock_secondary_client, mock_state_manager, tmp_path):
         """Should match context by API URL hostname."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -1181,10 +1395,12 @@ def test_hostname_match(self, mock_secondary_client, mock_state_manager):
             ],
         }
 
-        result = pav._find_context_by_api_url(kube_data, "https://api.prod.example.com:6443", "prod")
+        result = pav._find_context_by_api_url(
+            _index_for(tmp_path, kube_data), "https://api.prod.example.com:6443", "prod"
+        )
         assert result == "admin@prod"
 
-    def test_hostname_match_ignores_port(self, mock_secondary_client, mock_state_manager):
+    def test_hostname_match_ignores_port(self, mock_secondary_client, mock_state_manager, tmp_path):
         """Port differences should not prevent a match."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -1197,10 +1413,12 @@ def test_hostname_match_ignores_port(self, mock_secondary_client, mock_state_man
             ],
         }
 
-        result = pav._find_context_by_api_url(kube_data, "https://api.a.example.com:443", "cluster-a")
+        result = pav._find_context_by_api_url(
+            _index_for(tmp_path, kube_data), "https://api.a.example.com:443", "cluster-a"
+        )
         assert result == "ctx-a"
 
-    def test_no_match_returns_empty(self, mock_secondary_client, mock_state_manager):
+    def test_no_match_returns_empty(self, mock_secondary_client, mock_state_manager, tmp_path):
         """No matching cluster should return empty string."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -1213,16 +1431,18 @@ def test_no_match_returns_empty(self, mock_secondary_client, mock_state_manager)
             ],
         }
 
-        result = pav._find_context_by_api_url(kube_data, "https://api.unknown.example.com:6443", "unknown")
+        result = pav._find_context_by_api_url(
+            _index_for(tmp_path, kube_data), "https://api.unknown.example.com:6443", "unknown"
+        )
         assert result == ""
 
     def test_empty_api_url_name_fallback_success(self, mock_secondary_client, mock_state_manager):
         """Empty api_url should fall back to name-based context matching."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
-        with patch("modules.post_activation.config.list_kube_config_contexts") as mock_list:
-            mock_list.return_value = ([{"name": "prod-cluster"}], {"name": "prod-cluster"})
-            result = pav._find_context_by_api_url({}, "", "prod-cluster")
+        index = Mock()
+        index.has_context.side_effect = lambda name: name == "prod-cluster"
+        result = pav._find_context_by_api_url(index, "", "prod-cluster")
 
         assert result == "prod-cluster"
 
@@ -1230,25 +1450,13 @@ def test_empty_api_url_name_fallback_no_match(self, mock_secondary_client, mock_
         """Empty api_url with no matching context name should return empty."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
-        with patch("modules.post_activation.config.list_kube_config_contexts") as mock_list:
-            mock_list.return_value = ([{"name": "other-ctx"}], {"name": "other-ctx"})
-            result = pav._find_context_by_api_url({}, "", "my-cluster")
-
-        assert result == ""
-
-    def test_empty_api_url_config_exception(self, mock_secondary_client, mock_state_manager):
-        """ConfigException during name-based fallback should return empty."""
-        pav = _make_pav(mock_secondary_client, mock_state_manager)
-
-        from kubernetes import config as kube_config
-
-        with patch("modules.post_activation.config.list_kube_config_contexts") as mock_list:
-            mock_list.side_effect = kube_config.ConfigException("no config")
-            result = pav._find_context_by_api_url({}, "", "my-cluster")
+        index = Mock()
+        index.has_context.side_effect = lambda name: name == "other-ctx"
+        result = pav._find_context_by_api_url(index, "", "my-cluster")
 
         assert result == ""
 
-    def test_cluster_in_kubeconfig_but_no_context_using_it(self, mock_secondary_client, mock_state_manager):
+    def test_cluster_in_kubeconfig_but_no_context_using_it(self, mock_secondary_client, mock_state_manager, tmp_path):
         """Cluster matched by URL but no context references it should return empty."""
         pav = _make_pav(mock_secondary_client, mock_state_manager)
 
@@ -1261,9 +1469,29 @@ def test_cluster_in_kubeconfig_but_no_context_using_it(self, mock_secondary_clie
             ],
         }
 
-        result = pav._find_context_by_api_url(kube_data, "https://api.orphan:6443", "orphan")
+        result = pav._find_context_by_api_url(_index_for(tmp_path, kube_data), "https://api.orphan:6443", "orphan")
         assert result == ""
 
+    def test_host_index_normalizes_scheme_case_and_path(self, mock_secondary_client, mock_state_manager, tmp_path):
+        """Hosts are compared without scheme, port, path or case; the first context of a host wins."""
+        kube_data = {
+            "clusters": [
+                {"name": "kc-a", "cluster": {"server": "https://API.A.example.com:6443/"}},
+                {"name": "kc-b", "cluster": {"server": "https://api.b.example.com"}},
+            ],
+            "contexts": [
+                {"name": "ctx-a", "context": {"cluster": "kc-a"}},
+                {"name": "ctx-a-2", "context": {"cluster": "kc-a"}},
+                {"name": "ctx-b", "context": {"cluster": "kc-b"}},
+            ],
+        }
+
+        index = _index_for(tmp_path, kube_data)
+
+        pav = _make_pav(mock_secondary_client, mock_state_manager)
+        assert pav._find_context_by_api_url(index, "https://api.a.example.com:443/apis", "a") == "ctx-a"
+        assert pav._find_context_by_api_url(index, "https://API.B.example.com", "b") == "ctx-b"
+
 
 # ========================================================================
 # 4. Klusterlet connection check (_check_klusterlet_connection)
@@ -1313,7 +1541,7 @@ def test_fallback_to_bootstrap_secret(self, mock_secondary_client, mock_state_ma
 
         bootstrap_secret = self._make_secret("https://api.newhub.com:6443")
 
-        def side_effect(name, namespace):
+        def side_effect(name, namespace, **kwargs):
             if name == "hub-kubeconfig-secret":
                 raise ApiException(status=404)
             return bootstrap_secret
@@ -1323,6 +1551,9 @@ def side_effect(name, namespace):
         result = pav._check_klusterlet_connection("ctx-c1", "c1", "https://api.newhub.com:6443")
         assert result == "verified"
         assert mock_v1.read_namespaced_secret.call_count == 2
+        assert mock_v1.read_namespaced_secret.call_args.kwargs["_request_timeout"] == (
+            post_activation_module.SPOKE_REQUEST_TIMEOUT
+        )
 
     def test_unreachable_on_empty_kubeconfig(self, mock_secondary_client, mock_state_manager):
         """Should return 'unreachable' when secret has no kubeconfig data."""
@@ -1433,21 +1664,26 @@ def test_unreachable_on_empty_server_url(self, mock_secondary_client, mock_state
 class TestScaleUpObservability:
     """Tests for _scale_up_observability_components."""
 
-    def test_both_at_zero_scales_up(self, mock_secondary_client, mock_state_manager):
-        """Both components at 0 replicas should be scaled up."""
+    @patch("modules.post_activation.track_rollouts")
+    def test_both_at_zero_scales_up(self, mock_track, mock_secondary_client, mock_state_manager):
+        """Both components at 0 replicas should be scaled up and tracked in one concurrent wait."""
         pav = _make_pav(mock_secondary_client, mock_state_manager, obs=True)
 
         mock_secondary_client.get_deployment.return_value = {"spec": {"replicas": 0}}
         mock_secondary_client.get_statefulset.return_value = {"spec": {"replicas": 0}}
-        mock_secondary_client.wait_for_pods_ready.return_value = True
 
         pav._scale_up_observability_components()
 
         mock_secondary_client.scale_deployment.assert_called_once()
         mock_secondary_client.scale_statefulset.assert_called_once()
-        assert mock_secondary_client.wait_for_pods_ready.call_count == 2
+        mock_track.assert_called_once()
+        rollouts = mock_track.call_args[0][0]
+        assert [(r.kind, r.replicas) for r in rollouts] == [("deployments", 2), ("statefulsets", 1)]
+        assert {r.hub for r in rollouts} == {"new hub"}
+        mock_secondary_client.wait_for_pods_ready.assert_not_called()
 
-    def test_already_running_no_scale(self, mock_secondary_client, mock_state_manager):
+    @patch("modules.post_activation.track_rollouts")
+    def test_already_running_no_scale(self, mock_track, mock_secondary_client, mock_state_manager):
         """Already-running components should not be scaled."""
         pav = _make_pav(mock_secondary_client, mock_state_manager, obs=True)
 
@@ -1458,70 +1694,74 @@ def test_already_running_no_scale(self, mock_secondary_client, mock_state_manage
 
         mock_secondary_client.scale_deployment.assert_not_called()
         mock_secondary_client.scale_statefulset.assert_not_called()
-        mock_secondary_client.wait_for_pods_ready.assert_not_called()
+        mock_track.assert_not_called()
 
-    def test_deployment_not_found(self, mock_secondary_client, mock_state_manager):
+    @patch("modules.post_activation.track_rollouts")
+    def test_deployment_not_found(self, mock_track, mock_secondary_client, mock_state_manager):
         """Missing deployment should be skipped, statefulset still checked."""
         pav = _make_pav(mock_secondary_client, mock_state_manager, obs=True)
 
         mock_secondary_client.get_deployment.return_value = None
         mock_secondary_client.get_statefulset.return_value = {"spec": {"replicas": 0}}
-        mock_secondary_client.wait_for_pods_ready.return_value = True
 
         pav._scale_up_observability_components()
 
         mock_secondary_client.scale_deployment.assert_not_called()
         mock_secondary_client.scale_statefulset.assert_called_once()
 
-    def test_statefulset_not_found(self, mock_secondary_client, mock_state_manager):
+    @patch("modules.post_activation.track_rollouts")
+    def test_statefulset_not_found(self, mock_track, mock_secondary_client, mock_state_manager):
         """Missing statefulset should be skipped, deployment still checked."""
         pav = _make_pav(mock_secondary_client, mock_state_manager, obs=True)
 
         mock_secondary_client.get_deployment.return_value = {"spec": {"replicas": 0}}
         mock_secondary_client.get_statefulset.return_value = None
-        mock_secondary_client.wait_for_pods_ready.return_value = True
 
         pav._scale_up_observability_components()
 
         mock_secondary_client.scale_deployment.assert_called_once()
         mock_secondary_client.scale_statefulset.assert_not_called()
 
-    def test_deployment_exception_continues(self, mock_secondary_client, mock_state_manager):
+    @patch("modules.post_activation.track_rollouts")
+    def test_deployment_exception_continues(self, mock_track, mock_secondary_client, mock_state_manager):
         """ApiException on deployment should not prevent statefulset check."""
         pav = _make_pav(mock_secondary_client, mock_state_manager, obs=True)
 
         mock_secondary_client.get_deployment.side_effect = ApiException(status=500)
         mock_secondary_client.get_statefulset.return_value = {"spec": {"replicas": 0}}
-        mock_secondary_client.wait_for_pods_ready.return_value = True
 
         pav._scale_up_observability_components()
 
         mock_secondary_client.scale_statefulset.assert_called_once()
 
-    def test_statefulset_exception_continues(self, mock_secondary_client, mock_state_manager):
+    @patch("modules.post_activation.track_rollouts")
+    def test_statefulset_exception_continues(self, mock_track, mock_secondary_client, mock_state_manager):
         """ApiException on statefulset should not prevent wait for deployment."""
         pav = _make_pav(mock_secondary_client, mock_state_manager, obs=True)
 
         mock_secondary_client.get_deployment.return_value = {"spec": {"replicas": 0}}
         mock_secondary_client.get_statefulset.side_effect = ApiException(status=500)
-        mock_secondary_client.wait_for_pods_ready.return_value = True
 
         pav._scale_up_observability_components()
 
         mock_secondary_client.scale_deployment.assert_called_once()
         # Only deployment should be waited on
-        assert mock_secondary_client.wait_for_pods_ready.call_count == 1
+        assert [r.kind for r in mock_track.call_args[0][0]] == ["deployments"]
 
-    def test_pods_not_ready_warns(self, mock_secondary_client, mock_state_manager):
+    @patch("lib.rollout.wait_for_condition", return_value=False)
+    def test_pods_not_ready_warns(self, mock_wait, mock_secondary_client, mock_state_manager, caplog):
         """Pods failing to become ready should not raise, just warn."""
         pav = _make_pav(mock_secondary_client, mock_state_manager, obs=True)
 
         mock_secondary_client.get_deployment.return_value = {"spec": {"replicas": 0}}
         mock_secondary_client.get_statefulset.return_value = {"spec": {"replicas": 0}}
-        mock_secondary_client.wait_for_pods_ready.return_value = False
 
         # Should not raise
-        pav._scale_up_observability_components()
+        with caplog.at_level(logging.WARNING, logger="acm_switchover"):
+            pav._scale_up_observability_components()
+
+        assert mock_wait.call_count == 2
+        assert "observability-thanos-compact pods did not become ready in time" in caplog.text
 
 
 # ========================================================================
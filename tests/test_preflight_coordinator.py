@@ -86,6 +86,7 @@ def test_validate_all_passes_expected_argocd_rbac_mode(argocd_manage, skip_gitop
         argocd_mode=expected_mode,
         argocd_install_type="vanilla" if expected_mode != "none" else "unknown",
         secondary_argocd_install_type="vanilla" if expected_mode != "none" else "unknown",
+        rbac_cache=None,
     )
 
 
@@ -118,6 +119,7 @@ def test_validate_all_skips_argocd_rbac_when_applications_crd_missing():
         argocd_mode="none",
         argocd_install_type="unknown",
         secondary_argocd_install_type="unknown",
+        rbac_cache=None,
     )
 
 
@@ -150,6 +152,7 @@ def test_validate_all_includes_decommission_permissions_when_requested():
         argocd_mode="none",
         argocd_install_type="unknown",
         secondary_argocd_install_type="unknown",
+        rbac_cache=None,
     )
 
 
@@ -204,6 +207,7 @@ def test_validate_all_uses_requested_argocd_mode_when_discovery_is_forbidden():
         argocd_mode="check",
         argocd_install_type="unknown",
         secondary_argocd_install_type="unknown",
+        rbac_cache=None,
     )
 
 
@@ -290,6 +294,7 @@ def test_validate_all_skips_argocd_when_skip_gitops_check_set():
         argocd_mode="none",
         argocd_install_type="unknown",
         secondary_argocd_install_type="unknown",
+        rbac_cache=None,
     )
 
 
@@ -329,4 +334,26 @@ def test_validate_all_passes_per_hub_argocd_install_types():
         argocd_mode="check",
         argocd_install_type="operator",
         secondary_argocd_install_type="vanilla",
+        rbac_cache=None,
     )
+
+
+@pytest.mark.unit
+def test_validate_all_feeds_versions_and_observability_to_dependent_checks():
+    """Dependent checks receive upstream results; the report keeps the sequential order."""
+    validator = _build_validator()
+    validator.skip_rbac_validation = True
+    validator.backup_validator.run = Mock(side_effect=lambda _client: validator.reporter.add_result("b", True, "ok"))
+    validator.tooling_validator.run = Mock(side_effect=lambda: validator.reporter.add_result("t", True, "ok"))
+    validator.observability_detector.detect = Mock(return_value=(False, True))
+
+    with patch("modules.preflight_coordinator.AutoImportStrategyValidator") as auto_import_validator:
+        passed, config = validator.validate_all()
+
+    assert passed is True
+    auto_import_validator.return_value.run.assert_called_once_with(
+        validator.primary, validator.secondary, "2.14.0", "2.14.0"
+    )
+    validator.observability_prereq_validator.run.assert_called_once_with(validator.secondary)
+    assert config["secondary_observability_detected"] is True
+    assert [r["check"] for r in validator.reporter.results] == ["t", "b"]
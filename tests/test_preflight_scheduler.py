@@ -0,0 +1,97 @@
+"""Unit tests for modules/preflight/scheduler.py."""
+
+import threading
+import time
+
+import pytest
+
+from modules.preflight.reporter import ValidationReporter
+from modules.preflight.scheduler import ValidationTask, run_validation_graph
+
+
+def _reporting_task(reporter, name, delay=0.0, depends_on=(), value=None):
+    def _func(deps):
+        time.sleep(delay)
+        reporter.add_result(name, True, f"deps={sorted(deps)}")
+        return value
+
+    return ValidationTask(name, _func, depends_on=depends_on)
+
+
+@pytest.mark.unit
+class TestRunValidationGraph:
+    """Tests for run_validation_graph."""
+
+    def test_reports_in_declaration_order_regardless_of_completion(self):
+        reporter = ValidationReporter()
+        tasks = [
+            _reporting_task(reporter, "slow", delay=0.05),
+            _reporting_task(reporter, "fast"),
+            _reporting_task(reporter, "faster"),
+        ]
+
+        run_validation_graph(tasks, reporter)
+
+        assert [r["check"] for r in reporter.results] == ["slow", "fast", "faster"]
+
+    def test_dependencies_receive_upstream_values(self):
+        reporter = ValidationReporter()
+        seen = {}
+
+        def _consumer(deps):
+            seen.update(deps)
+
+        tasks = [
+            _reporting_task(reporter, "versions", delay=0.02, value=("2.14.0", "2.14.1")),
+            ValidationTask("auto_import", _consumer, depends_on=("versions",)),
+        ]
+
+        results = run_validation_graph(tasks, reporter)
+
+        assert seen == {"versions": ("2.14.0", "2.14.1")}
+        assert results["versions"] == ("2.14.0", "2.14.1")
+
+    def test_independent_tasks_run_concurrently(self):
+        reporter = ValidationReporter()
+        barrier = threading.Barrier(3, timeout=2)
+        tasks = [ValidationTask(f"hub{i}", lambda _: barrier.wait()) for i in range(3)]
+
+        # Would raise BrokenBarrierError if the tasks ran one after another
+        run_validation_graph(tasks, reporter, max_workers=3)
+
+    def test_failure_stops_dependents_and_reraises(self):
+        reporter = ValidationReporter()
+        ran = []
+
+        def _fail(_deps):
+            reporter.add_result("versions", False, "unreachable")
+            raise RuntimeError("boom")
+
+        tasks = [
+            ValidationTask("versions", _fail),
+            ValidationTask("auto_import", lambda _: ran.append("auto_import"), depends_on=("versions",)),
+        ]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_validation_graph(tasks, reporter)
+
+        assert ran == []
+        assert [r["check"] for r in reporter.results] == ["versions"]
+
+    @pytest.mark.parametrize(
+        "tasks,match",
+        [
+            ([ValidationTask("a", lambda _: None, depends_on=("missing",))], "unknown"),
+            (
+                [
+                    ValidationTask("a", lambda _: None, depends_on=("b",)),
+                    ValidationTask("b", lambda _: None, depends_on=("a",)),
+                ],
+                "cycle",
+            ),
+            ([ValidationTask("a", lambda _: None), ValidationTask("a", lambda _: None)], "Duplicate"),
+        ],
+    )
+    def test_rejects_invalid_graphs(self, tasks, match):
+        with pytest.raises(ValueError, match=match):
+            run_validation_graph(tasks, ValidationReporter())
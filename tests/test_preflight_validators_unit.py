@@ -143,6 +143,26 @@ def test_backup_status_fails_when_backups_disappear_after_wait(self, reporter, m
         assert "no backups found after waiting" in reporter.results[-1]["message"]
         validator._wait_for_backups_complete.assert_called_once_with(mock_kube_client, ["backup-a"])
 
+    @patch("modules.preflight.backup_validators.time")
+    def test_wait_for_backups_complete_reads_only_waited_backups(self, mock_time, reporter, mock_kube_client):
+        """Waiting re-reads each in-progress backup by name instead of listing the namespace."""
+        validator = BackupValidator(reporter)
+        mock_time.time.side_effect = [0, 1, 2, 3]
+        phases = {"backup-a": iter(["InProgress", "Completed"]), "backup-b": iter(["Completed"])}
+        mock_kube_client.get_custom_resource.side_effect = lambda **kwargs: {
+            "metadata": {"name": kwargs["name"]},
+            "status": {"phase": next(phases[kwargs["name"]])},
+        }
+
+        assert validator._wait_for_backups_complete(mock_kube_client, ["backup-a", "backup-b"]) == []
+
+        assert [c.kwargs["name"] for c in mock_kube_client.get_custom_resource.call_args_list] == [
+            "backup-a",
+            "backup-b",
+            "backup-a",
+        ]
+        mock_kube_client.list_custom_resources.assert_not_called()
+
     def test_latest_backup_failed(self, reporter, mock_kube_client):
         """Test critical failure when latest backup failed."""
         validator = BackupValidator(reporter)
@@ -523,20 +543,16 @@ def test_run_calls_all_checks(self, reporter, mock_kube_client):
         conn_results = [r for r in reporter.results if "Connectivity" in r["check"]]
         assert len(conn_results) == 2
 
-    @patch("modules.preflight.version_validators.k8s_config", create=True)
-    def test_check_duplicate_users_no_duplicates(self, mock_k8s_config, reporter, mock_kube_client):
+    def test_check_duplicate_users_no_duplicates(self, reporter, mock_kube_client):
         """Test duplicate user check when no duplicates exist."""
         validator = KubeconfigValidator(reporter)
         mock_kube_client.context = "hub1"
 
-        with patch("kubernetes.config.list_kube_config_contexts") as mock_list:
-            mock_list.return_value = (
-                [
-                    {"name": "hub1", "context": {"user": "user-a"}},
-                    {"name": "hub2", "context": {"user": "user-b"}},
-                ],
-                {"name": "hub1"},
-            )
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index") as mock_index:
+            mock_index.return_value.contexts.return_value = [
+                {"name": "hub1", "context": {"user": "user-a"}},
+                {"name": "hub2", "context": {"user": "user-b"}},
+            ]
             other_client = Mock()
             other_client.context = "hub2"
             validator._check_duplicate_users(mock_kube_client, other_client)
@@ -544,20 +560,16 @@ def test_check_duplicate_users_no_duplicates(self, mock_k8s_config, reporter, mo
         dup_results = [r for r in reporter.results if "User Names" in r["check"]]
         assert dup_results[0]["passed"] is True
 
-    @patch("modules.preflight.version_validators.k8s_config", create=True)
-    def test_check_duplicate_users_with_collision(self, mock_k8s_config, reporter, mock_kube_client):
+    def test_check_duplicate_users_with_collision(self, reporter, mock_kube_client):
         """Test duplicate user check detects collision affecting our contexts."""
         validator = KubeconfigValidator(reporter)
         mock_kube_client.context = "hub1"
 
-        with patch("kubernetes.config.list_kube_config_contexts") as mock_list:
-            mock_list.return_value = (
-                [
-                    {"name": "hub1", "context": {"user": "same-user"}},
-                    {"name": "hub2", "context": {"user": "same-user"}},
-                ],
-                {"name": "hub1"},
-            )
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index") as mock_index:
+            mock_index.return_value.contexts.return_value = [
+                {"name": "hub1", "context": {"user": "same-user"}},
+                {"name": "hub2", "context": {"user": "same-user"}},
+            ]
             other_client = Mock()
             other_client.context = "hub2"
             validator._check_duplicate_users(mock_kube_client, other_client)
@@ -566,14 +578,13 @@ def test_check_duplicate_users_with_collision(self, mock_k8s_config, reporter, m
         assert dup_results[0]["passed"] is False
         assert "credential collision" in dup_results[0]["message"]
 
-    @patch("modules.preflight.version_validators.k8s_config", create=True)
-    def test_check_duplicate_users_exception(self, mock_k8s_config, reporter, mock_kube_client):
+    def test_check_duplicate_users_exception(self, reporter, mock_kube_client):
         """Test duplicate user check handles exceptions gracefully."""
         validator = KubeconfigValidator(reporter)
         mock_kube_client.context = "hub1"
 
-        with patch("kubernetes.config.list_kube_config_contexts") as mock_list:
-            mock_list.side_effect = Exception("kubeconfig error")
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index") as mock_index:
+            mock_index.side_effect = Exception("kubeconfig error")
             other_client = Mock()
             other_client.context = "hub2"
             validator._check_duplicate_users(mock_kube_client, other_client)
@@ -587,8 +598,8 @@ def test_check_token_expiration_no_bearer(self, reporter, mock_kube_client):
         validator = KubeconfigValidator(reporter)
         mock_kube_client.context = "test-ctx"
 
-        with patch("kubernetes.config.load_kube_config"), patch(
-            "kubernetes.client.Configuration.get_default_copy"
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index"), patch(
+            "kubernetes.client.Configuration"
         ) as mock_config:
             cfg = Mock()
             cfg.api_key = {"authorization": "Basic abc123"}
@@ -614,8 +625,8 @@ def test_check_token_expiration_valid_jwt(self, reporter, mock_kube_client):
         payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
         fake_jwt = f"header.{payload_b64}.signature"
 
-        with patch("kubernetes.config.load_kube_config"), patch(
-            "kubernetes.client.Configuration.get_default_copy"
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index"), patch(
+            "kubernetes.client.Configuration"
         ) as mock_config:
             cfg = Mock()
             cfg.api_key = {"authorization": f"Bearer {fake_jwt}"}
@@ -640,8 +651,8 @@ def test_check_token_expiration_expired_jwt(self, reporter, mock_kube_client):
         payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
         fake_jwt = f"header.{payload_b64}.signature"
 
-        with patch("kubernetes.config.load_kube_config"), patch(
-            "kubernetes.client.Configuration.get_default_copy"
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index"), patch(
+            "kubernetes.client.Configuration"
         ) as mock_config:
             cfg = Mock()
             cfg.api_key = {"authorization": f"Bearer {fake_jwt}"}
@@ -667,8 +678,8 @@ def test_check_token_expiration_soon_expiry(self, reporter, mock_kube_client):
         payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
         fake_jwt = f"header.{payload_b64}.signature"
 
-        with patch("kubernetes.config.load_kube_config"), patch(
-            "kubernetes.client.Configuration.get_default_copy"
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index"), patch(
+            "kubernetes.client.Configuration"
         ) as mock_config:
             cfg = Mock()
             cfg.api_key = {"authorization": f"Bearer {fake_jwt}"}
@@ -692,8 +703,8 @@ def test_check_token_expiration_no_exp_claim(self, reporter, mock_kube_client):
         payload_b64 = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
         fake_jwt = f"header.{payload_b64}.signature"
 
-        with patch("kubernetes.config.load_kube_config"), patch(
-            "kubernetes.client.Configuration.get_default_copy"
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index"), patch(
+            "kubernetes.client.Configuration"
         ) as mock_config:
             cfg = Mock()
             cfg.api_key = {"authorization": f"Bearer {fake_jwt}"}
@@ -710,8 +721,8 @@ def test_check_token_expiration_invalid_jwt_format(self, reporter, mock_kube_cli
         validator = KubeconfigValidator(reporter)
         mock_kube_client.context = "test-ctx"
 
-        with patch("kubernetes.config.load_kube_config"), patch(
-            "kubernetes.client.Configuration.get_default_copy"
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index"), patch(
+            "kubernetes.client.Configuration"
         ) as mock_config:
             cfg = Mock()
             cfg.api_key = {"authorization": "Bearer not.a-valid-jwt"}
@@ -728,7 +739,8 @@ def test_check_token_expiration_exception(self, reporter, mock_kube_client):
         validator = KubeconfigValidator(reporter)
         mock_kube_client.context = "test-ctx"
 
-        with patch("kubernetes.config.load_kube_config", side_effect=Exception("no config")):
+        with patch("modules.preflight.version_validators.kubeconfig_index.get_kubeconfig_index") as mock_index:
+            mock_index.side_effect = Exception("no config")
             validator._check_token_expiration(mock_kube_client, "primary")
 
         token_results = [r for r in reporter.results if "Token" in r["check"]]
@@ -1146,7 +1158,7 @@ def test_warns_when_cluster_created_after_backup(self, reporter, mock_kube_clien
 
         # Mock joined managed clusters (one created before backup, one after)
         mock_kube_client.list_custom_resources.side_effect = [
-            # First call: list managed clusters
+            # List managed clusters
             [
                 {
                     "metadata": {"name": "cluster-before", "creationTimestamp": "2025-12-01T10:00:00Z"},
@@ -1157,21 +1169,25 @@ def test_warns_when_cluster_created_after_backup(self, reporter, mock_kube_clien
                     "status": {"conditions": [{"type": "ManagedClusterJoined", "status": "True"}]},
                 },
             ],
-            # Second call: list backups (with required ACM label)
-            [
-                {
-                    "metadata": {
-                        "name": "acm-managed-clusters-schedule-20251210100000",
-                        "creationTimestamp": "2025-12-10T10:00:00Z",
-                        "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
-                    },
-                    "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+        ]
+        # Managed-clusters backups are listed metadata-only, then the latest is read in full
+        mock_kube_client.list_metadata.return_value = [
+            {
+                "metadata": {
+                    "name": "acm-managed-clusters-schedule-20251210100000",
+                    "creationTimestamp": "2025-12-10T10:00:00Z",
+                    "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
                 },
-            ],
+            },
         ]
 
         # Mock get_custom_resource for individual cluster lookups
-        def get_cluster(group, version, plural, name):
+        def get_cluster(group, version, plural, name, namespace=None):
+            if plural == "backups":
+                return {
+                    "metadata": {"name": name, "creationTimestamp": "2025-12-10T10:00:00Z"},
+                    "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+                }
             if name == "cluster-before":
                 return {"metadata": {"name": "cluster-before", "creationTimestamp": "2025-12-01T10:00:00Z"}}
             elif name == "cluster-after":
@@ -1196,7 +1212,7 @@ def test_no_warning_when_all_clusters_before_backup(self, reporter, mock_kube_cl
 
         # Mock joined managed clusters (all created before backup)
         mock_kube_client.list_custom_resources.side_effect = [
-            # First call: list managed clusters
+            # List managed clusters
             [
                 {
                     "metadata": {"name": "cluster-1", "creationTimestamp": "2025-12-01T10:00:00Z"},
@@ -1207,21 +1223,25 @@ def test_no_warning_when_all_clusters_before_backup(self, reporter, mock_kube_cl
                     "status": {"conditions": [{"type": "ManagedClusterJoined", "status": "True"}]},
                 },
             ],
-            # Second call: list backups (with required ACM label)
-            [
-                {
-                    "metadata": {
-                        "name": "acm-managed-clusters-schedule-20251210100000",
-                        "creationTimestamp": "2025-12-10T10:00:00Z",
-                        "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
-                    },
-                    "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+        ]
+        # Managed-clusters backups are listed metadata-only, then the latest is read in full
+        mock_kube_client.list_metadata.return_value = [
+            {
+                "metadata": {
+                    "name": "acm-managed-clusters-schedule-20251210100000",
+                    "creationTimestamp": "2025-12-10T10:00:00Z",
+                    "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
                 },
-            ],
+            },
         ]
 
         # Mock get_custom_resource for individual cluster lookups
-        def get_cluster(group, version, plural, name):
+        def get_cluster(group, version, plural, name, namespace=None):
+            if plural == "backups":
+                return {
+                    "metadata": {"name": name, "creationTimestamp": "2025-12-10T10:00:00Z"},
+                    "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+                }
             if name == "cluster-1":
                 return {"metadata": {"name": "cluster-1", "creationTimestamp": "2025-12-01T10:00:00Z"}}
             elif name == "cluster-2":
@@ -1236,6 +1256,10 @@ def get_cluster(group, version, plural, name):
         results = reporter.results
         warning_results = [r for r in results if "after backup" in r.get("check", "").lower()]
         assert len(warning_results) == 0
+        assert results[-1]["passed"] is True
+        assert mock_kube_client.list_metadata.call_args.kwargs["label_selector"] == (
+            "cluster.open-cluster-management.io/backup-schedule-type in (managedClusters)"
+        )
 
 
 class TestVersionValidator:
@@ -1505,7 +1529,7 @@ def test_secondary_acm_214_sync_strategy(self, reporter):
         secondary_client = Mock()
         primary_client.get_configmap.return_value = None
         secondary_client.get_configmap.return_value = {"data": {AUTO_IMPORT_STRATEGY_KEY: AUTO_IMPORT_STRATEGY_SYNC}}
-        secondary_client.list_custom_resources.return_value = [
+        secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "cluster1"}},
         ]
 
@@ -1522,7 +1546,7 @@ def test_secondary_acm_214_default_with_existing_clusters(self, reporter):
         secondary_client = Mock()
         primary_client.get_configmap.return_value = None
         secondary_client.get_configmap.return_value = None
-        secondary_client.list_custom_resources.return_value = [
+        secondary_client.list_metadata.return_value = [
             {"metadata": {"name": "cluster1"}},
             {"metadata": {"name": "cluster2"}},
         ]
@@ -1540,7 +1564,7 @@ def test_secondary_acm_214_default_no_clusters(self, reporter):
         secondary_client = Mock()
         primary_client.get_configmap.return_value = None
         secondary_client.get_configmap.return_value = None
-        secondary_client.list_custom_resources.return_value = []
+        secondary_client.list_metadata.return_value = []
 
         validator.run(primary_client, secondary_client, "2.14.0", "2.14.0")
 
@@ -1555,7 +1579,7 @@ def test_secondary_acm_214_error_reading_configmap(self, reporter):
         secondary_client = Mock()
         primary_client.get_configmap.return_value = None
         secondary_client.get_configmap.side_effect = Exception("connection error")
-        secondary_client.list_custom_resources.return_value = []
+        secondary_client.list_metadata.return_value = []
 
         validator.run(primary_client, secondary_client, "2.14.0", "2.14.0")
 
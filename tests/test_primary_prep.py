@@ -11,6 +11,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from kubernetes.client.rest import ApiException
 
 # Add parent to path to import modules directly
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -189,11 +190,15 @@ def test_pause_argocd_acm_apps_records_paused(self, mock_primary_client, mock_st
             "spec": {"syncPolicy": {"automated": {}}},
             "status": {"resources": [{"kind": "BackupSchedule", "namespace": "open-cluster-management-backup"}]},
         }
-        impacts = [argocd_lib.AppImpact(namespace="argocd", name="app-1", resource_count=1, app=app)]
+        impacts = [
+            argocd_lib.AppImpact(
+                namespace="argocd", name="app-1", resource_count=1, sync_policy=app["spec"]["syncPolicy"]
+            )
+        ]
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch("modules.primary_prep.argocd_lib.pause_autosync") as pause_autosync,
         ):
@@ -242,11 +247,15 @@ def test_pause_argocd_acm_apps_dry_run_records_apps(self, mock_primary_client, m
             "spec": {"syncPolicy": {"automated": {"prune": True}}},
             "status": {"resources": [{"kind": "Restore", "namespace": "open-cluster-management-backup"}]},
         }
-        impacts = [argocd_lib.AppImpact(namespace="argocd", name="app-2", resource_count=1, app=app)]
+        impacts = [
+            argocd_lib.AppImpact(
+                namespace="argocd", name="app-2", resource_count=1, sync_policy=app["spec"]["syncPolicy"]
+            )
+        ]
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch("modules.primary_prep.argocd_lib.pause_autosync") as pause_autosync,
         ):
@@ -304,10 +313,11 @@ def test_pause_argocd_acm_apps_clears_state_when_no_crd(self, mock_primary_clien
             call.args == ("argocd_pause_dry_run", False) for call in mock_state_manager.set_config.call_args_list
         )
 
-    def test_pause_argocd_acm_apps_persists_each_app_incrementally(self, mock_primary_client, mock_state_manager):
-        """Each paused app must be saved to state independently so a crash preserves prior pauses.
+    @pytest.mark.parametrize("wave_size", [50, 1])
+    def test_pause_argocd_acm_apps_persists_once_per_wave(self, mock_primary_client, mock_state_manager, wave_size):
+        """Each wave is recorded before its patches run and confirmed after, with one write each.
 
-        Verifies that set_config receives a fresh list copy on every iteration (not the same
+        Verifies that set_config receives a fresh list copy on every write (not the same
         mutable reference), so the equality guard in StateManager correctly detects changes.
         """
         prep = PrimaryPreparation(
@@ -339,8 +349,12 @@ def test_pause_argocd_acm_apps_persists_each_app_incrementally(self, mock_primar
             "status": {"resources": [{"kind": "Restore", "namespace": "open-cluster-management-backup"}]},
         }
         impacts = [
-            argocd_lib.AppImpact(namespace="argocd", name="app-1", resource_count=1, app=app1),
-            argocd_lib.AppImpact(namespace="argocd", name="app-2", resource_count=1, app=app2),
+            argocd_lib.AppImpact(
+                namespace="argocd", name="app-1", resource_count=1, sync_policy=app1["spec"]["syncPolicy"]
+            ),
+            argocd_lib.AppImpact(
+                namespace="argocd", name="app-2", resource_count=1, sync_policy=app2["spec"]["syncPolicy"]
+            ),
         ]
 
         def pause_side_effect(client, app, run_id):
@@ -354,30 +368,30 @@ def pause_side_effect(client, app, run_id):
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app1, app2]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app1, app2]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch("modules.primary_prep.argocd_lib.pause_autosync", side_effect=pause_side_effect),
+            patch("modules.primary_prep.ARGOCD_PAUSE_WAVE_SIZE", wave_size),
         ):
             prep._pause_argocd_acm_apps()
 
         paused_calls = [
             call for call in mock_state_manager.set_config.call_args_list if call.args[0] == "argocd_paused_apps"
         ]
-        assert len(paused_calls) == 4, "set_config must persist provisional and confirmed state for each app"
-
-        first_list = paused_calls[0].args[1]
-        second_list = paused_calls[1].args[1]
-        third_list = paused_calls[2].args[1]
-        fourth_list = paused_calls[3].args[1]
-
-        assert first_list is not second_list
-        assert second_list is not third_list
-        assert third_list is not fourth_list
-        assert first_list[0]["pause_applied"] is False
-        assert second_list[0]["pause_applied"] is True
-        assert len(third_list) == 2
-        assert third_list[1]["pause_applied"] is False
-        assert fourth_list[1]["pause_applied"] is True
+        lists = [call.args[1] for call in paused_calls]
+        assert all(first is not second for first, second in zip(lists, lists[1:]))
+        if wave_size == 1:
+            assert [[entry["pause_applied"] for entry in paused] for paused in lists] == [
+                [False],
+                [True],
+                [True, False],
+                [True, True],
+            ]
+        else:
+            assert [[entry["pause_applied"] for entry in paused] for paused in lists] == [
+                [False, False],
+                [True, True],
+            ]
 
     def test_pause_argocd_acm_apps_raises_on_patch_failure(self, mock_primary_client, mock_state_manager):
         """Patch failures must fail the Argo CD pause step instead of being treated as no-op."""
@@ -404,11 +418,15 @@ def test_pause_argocd_acm_apps_raises_on_patch_failure(self, mock_primary_client
             "spec": {"syncPolicy": {"automated": {}}},
             "status": {"resources": [{"kind": "Restore", "namespace": "open-cluster-management-backup"}]},
         }
-        impacts = [argocd_lib.AppImpact(namespace="argocd", name="app-1", resource_count=1, app=app)]
+        impacts = [
+            argocd_lib.AppImpact(
+                namespace="argocd", name="app-1", resource_count=1, sync_policy=app["spec"]["syncPolicy"]
+            )
+        ]
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch(
                 "modules.primary_prep.argocd_lib.pause_autosync",
@@ -468,11 +486,15 @@ def test_pause_argocd_failure_removes_stale_pause_entry(self, mock_primary_clien
             "spec": {"syncPolicy": {"automated": {}}},
             "status": {"resources": [{"kind": "Restore", "namespace": "open-cluster-management-backup"}]},
         }
-        impacts = [argocd_lib.AppImpact(namespace="openshift-gitops", name="acm-app", resource_count=1, app=app)]
+        impacts = [
+            argocd_lib.AppImpact(
+                namespace="openshift-gitops", name="acm-app", resource_count=1, sync_policy=app["spec"]["syncPolicy"]
+            )
+        ]
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch(
                 "modules.primary_prep.argocd_lib.pause_autosync",
@@ -490,6 +512,61 @@ def test_pause_argocd_failure_removes_stale_pause_entry(self, mock_primary_clien
 
         assert mock_state_manager.get_config("argocd_paused_apps") == []
 
+    def test_pause_argocd_wave_counts_raised_patch_as_failure(self, mock_primary_client, mock_state_manager):
+        """An app whose pause raises is dropped from state without stopping the rest of its wave."""
+        prep = PrimaryPreparation(
+            primary_client=mock_primary_client,
+            state_manager=mock_state_manager,
+            acm_version="2.12.0",
+            has_observability=False,
+            dry_run=False,
+            argocd_manage=True,
+        )
+        mock_state_manager.get_config.side_effect = lambda key, default=None: {
+            "argocd_run_id": "run-1",
+            "argocd_paused_apps": [],
+        }.get(key, default)
+
+        discovery = argocd_lib.ArgocdDiscoveryResult(
+            has_applications_crd=True,
+            has_argocds_crd=False,
+            install_type="vanilla",
+        )
+        apps = [
+            {"metadata": {"namespace": "argocd", "name": name}, "spec": {"syncPolicy": {"automated": {}}}}
+            for name in ("app-1", "app-2", "app-3")
+        ]
+        impacts = [
+            argocd_lib.AppImpact(
+                namespace="argocd",
+                name=app["metadata"]["name"],
+                resource_count=1,
+                sync_policy=app["spec"]["syncPolicy"],
+            )
+            for app in apps
+        ]
+
+        def pause_side_effect(client, app, run_id):
+            name = app["metadata"]["name"]
+            if name == "app-2":
+                raise RuntimeError("connection reset")
+            return argocd_lib.PauseResult(
+                namespace="argocd", name=name, original_sync_policy={"automated": {}}, patched=True
+            )
+
+        with (
+            patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=apps),
+            patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
+            patch("modules.primary_prep.argocd_lib.pause_autosync", side_effect=pause_side_effect) as pause_autosync,
+        ):
+            with pytest.raises(SwitchoverError, match="pause failed for 1"):
+                prep._pause_argocd_acm_apps()
+
+        assert pause_autosync.call_count == 3
+        final = [call for call in mock_state_manager.set_config.call_args_list if call.args[0] == "argocd_paused_apps"]
+        assert [entry["name"] for entry in final[-1].args[1]] == ["app-1", "app-3"]
+
     def test_pause_argocd_acm_apps_recovers_pending_entry_when_app_already_paused(
         self, mock_primary_client, mock_state_manager
     ):
@@ -525,11 +602,15 @@ def test_pause_argocd_acm_apps_recovers_pending_entry_when_app_already_paused(
             "spec": {"syncPolicy": {"syncOptions": ["CreateNamespace=true"]}},
             "status": {"resources": [{"kind": "Restore", "namespace": "open-cluster-management-backup"}]},
         }
-        impacts = [argocd_lib.AppImpact(namespace="argocd", name="app-1", resource_count=1, app=app)]
+        impacts = [
+            argocd_lib.AppImpact(
+                namespace="argocd", name="app-1", resource_count=1, sync_policy=app["spec"]["syncPolicy"]
+            )
+        ]
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch("modules.primary_prep.argocd_lib.pause_autosync") as pause_autosync,
         ):
@@ -583,11 +664,15 @@ def test_pause_argocd_acm_apps_keeps_recorded_entry_when_app_already_paused(
             "spec": {"syncPolicy": {"syncOptions": ["CreateNamespace=true"]}},
             "status": {"resources": [{"kind": "Restore", "namespace": "open-cluster-management-backup"}]},
         }
-        impacts = [argocd_lib.AppImpact(namespace="argocd", name="app-1", resource_count=1, app=app)]
+        impacts = [
+            argocd_lib.AppImpact(
+                namespace="argocd", name="app-1", resource_count=1, sync_policy=app["spec"]["syncPolicy"]
+            )
+        ]
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch("modules.primary_prep.argocd_lib.pause_autosync") as pause_autosync,
         ):
@@ -700,6 +785,26 @@ def test_disable_auto_import_skips_already_annotated_clusters(self, primary_prep
             patch={"metadata": {"annotations": {DISABLE_AUTO_IMPORT_ANNOTATION: ""}}},
         )
 
+    def test_disable_auto_import_reports_all_failed_clusters(self, primary_prep_with_obs, mock_primary_client):
+        """A failed patch must not stop the others; every failure is reported together."""
+        mock_primary_client.list_managed_clusters.return_value = [
+            {"metadata": {"name": "cluster1"}},
+            {"metadata": {"name": "cluster2"}},
+            {"metadata": {"name": "cluster3"}},
+        ]
+
+        def patch_side_effect(name, patch):
+            if name != "cluster2":
+                raise ApiException(status=403, reason="Forbidden")
+            return {}
+
+        mock_primary_client.patch_managed_cluster.side_effect = patch_side_effect
+
+        with pytest.raises(SwitchoverError, match=r"2 ManagedCluster\(s\): cluster1 \(403 Forbidden\), cluster3"):
+            primary_prep_with_obs._disable_auto_import()
+
+        assert mock_primary_client.patch_managed_cluster.call_count == 3
+
     def test_disable_auto_import_no_clusters(self, primary_prep_with_obs, mock_primary_client):
         """Test when no managed clusters exist."""
         mock_primary_client.list_custom_resources.return_value = []
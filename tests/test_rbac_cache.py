@@ -0,0 +1,109 @@
+"""Unit tests for lib/rbac_cache.py.
+
+Tests cache keying by API server and identity, TTL and refresh handling, and
+that a batched RBACValidator is served from the cache on a repeat run.
+"""
+
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client import Configuration
+
+from lib.rbac_cache import RBACCacheEntry, RBACResultCache, cache_dir_for_state_dir, client_identity
+from lib.rbac_validator import RBACValidator
+
+
+def _client(host="https://api.hub1.example:6443", token="Bearer abc"):
+    configuration = Configuration()
+    configuration.host = host
+    configuration.api_key = {"authorization": token} if token else {}
+    client = MagicMock()
+    client.core_v1.api_client.configuration = configuration
+    client.namespace_exists = MagicMock(return_value=True)
+    return client
+
+
+@pytest.mark.unit
+class TestCacheKey:
+    """Tests for identity and key derivation."""
+
+    def test_token_is_hashed_not_stored(self):
+        identity = client_identity(_client(token="Bearer secret-token"))
+
+        assert identity.startswith("token:")
+        assert "secret-token" not in identity
+
+    def test_entries_differ_by_server_identity_role_and_mode(self, tmp_path):
+        cache = RBACResultCache(str(tmp_path))
+        base = cache.entry(_client(), "operator", "none").path
+
+        assert cache.entry(_client(), "operator", "none").path == base
+        assert cache.entry(_client(host="https://api.hub2.example:6443"), "operator", "none").path != base
+        assert cache.entry(_client(token="Bearer other"), "operator", "none").path != base
+        assert cache.entry(_client(), "validator", "none").path != base
+        assert cache.entry(_client(), "operator", "manage").path != base
+
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        assert RBACResultCache(str(tmp_path), ttl_seconds=0).entry(_client(), "operator", "none") is None
+
+    def test_cache_dir_is_inside_state_dir(self):
+        assert cache_dir_for_state_dir(".state") == os.path.join(".state", "rbac-cache")
+
+
+@pytest.mark.unit
+class TestCacheEntry:
+    """Tests for load/store behaviour."""
+
+    def test_only_granted_results_are_stored(self, tmp_path):
+        entry = RBACCacheEntry(str(tmp_path / "entry.json"), ttl_seconds=60)
+        entry.store({("", "pods", "get", "ns1"): (True, ""), ("", "pods", "delete", "ns1"): (False, "denied")})
+
+        assert RBACCacheEntry(entry.path, ttl_seconds=60).load() == {("", "pods", "get", "ns1"): (True, "")}
+        assert oct(os.stat(entry.path).st_mode & 0o777) == "0o600"
+
+    def test_expired_entry_is_ignored(self, tmp_path):
+        path = tmp_path / "entry.json"
+        path.write_text(
+            json.dumps({"version": 1, "cached_at": time.time() - 120, "granted": [["", "nodes", "get", None]]})
+        )
+
+        assert RBACCacheEntry(str(path), ttl_seconds=60).load() == {}
+        assert RBACCacheEntry(str(path), ttl_seconds=600).load() == {("", "nodes", "get", None): (True, "")}
+
+    def test_refresh_ignores_existing_entry(self, tmp_path):
+        entry = RBACCacheEntry(str(tmp_path / "entry.json"), ttl_seconds=60)
+        entry.store({("", "nodes", "get", None): (True, "")})
+
+        assert RBACCacheEntry(entry.path, ttl_seconds=60, refresh=True).load() == {}
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        path = tmp_path / "entry.json"
+        path.write_text("{not json")
+
+        assert RBACCacheEntry(str(path), ttl_seconds=60).load() == {}
+
+
+@pytest.mark.unit
+class TestValidatorUsesCache:
+    """Tests for RBACValidator with an on-disk cache."""
+
+    @patch("kubernetes.client.AuthorizationV1Api")
+    def test_repeat_validation_is_served_from_cache(self, mock_auth_cls, tmp_path):
+        api = MagicMock()
+        api.create_self_subject_access_review.return_value = MagicMock(status=MagicMock(allowed=True, reason=None))
+        mock_auth_cls.return_value = api
+        client = _client()
+        cache = RBACResultCache(str(tmp_path))
+
+        first = RBACValidator(client, batched=True, cache=cache.entry(client, "operator", "none"))
+        assert first.validate_cluster_permissions()[0] is True
+        calls_after_first_run = api.create_self_subject_access_review.call_count
+
+        second = RBACValidator(client, batched=True, cache=cache.entry(client, "operator", "none"))
+        assert second.validate_cluster_permissions()[0] is True
+
+        assert calls_after_first_run > 0
+        assert api.create_self_subject_access_review.call_count == calls_after_first_run
@@ -6,10 +6,11 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from kubernetes.client import V1ResourceRule, V1SubjectRulesReviewStatus
 from kubernetes.client.rest import ApiException
 
 from lib.exceptions import ValidationError
-from lib.rbac_validator import RBACValidator, validate_decommission_permissions, validate_rbac_permissions
+from lib.rbac_validator import RBACValidator, rule_allows, validate_decommission_permissions, validate_rbac_permissions
 
 
 class TestRBACValidator:
@@ -360,6 +361,110 @@ def test_validate_managed_cluster_permissions_validator_role(self, mock_client):
         assert "get" in verbs_checked
 
 
+class TestBatchedPermissionChecks:
+    """Test cases for SelfSubjectRulesReview-based batched validation."""
+
+    @pytest.mark.parametrize(
+        "rule,check,expected",
+        [
+            (V1ResourceRule(api_groups=[""], resources=["pods"], verbs=["get"]), ("", "pods", "get"), True),
+            (V1ResourceRule(api_groups=[""], resources=["pods"], verbs=["get"]), ("", "pods", "list"), False),
+            (V1ResourceRule(api_groups=["*"], resources=["*"], verbs=["*"]), ("apps", "deployments", "patch"), True),
+            (
+                V1ResourceRule(api_groups=["apps"], resources=["*/scale"], verbs=["get"]),
+                ("apps", "statefulsets/scale", "get"),
+                True,
+            ),
+            (
+                V1ResourceRule(api_groups=["apps"], resources=["statefulsets"], verbs=["get"]),
+                ("apps", "statefulsets/scale", "get"),
+                False,
+            ),
+            (
+                V1ResourceRule(api_groups=[""], resources=["secrets"], resource_names=["one"], verbs=["get"]),
+                ("", "secrets", "get"),
+                False,
+            ),
+        ],
+    )
+    def test_rule_allows(self, rule, check, expected):
+        assert rule_allows(rule, *check) is expected
+
+    @pytest.fixture
+    def mock_client(self):
+        client = MagicMock()
+        client.namespace_exists = MagicMock(return_value=True)
+        return client
+
+    @staticmethod
+    def _auth_api(rules_by_namespace, incomplete=False):
+        api = MagicMock()
+
+        def _rules_review(body):
+            rules = rules_by_namespace.get(body.spec.namespace, [])
+            return MagicMock(
+                status=V1SubjectRulesReviewStatus(resource_rules=rules, non_resource_rules=[], incomplete=incomplete)
+            )
+
+        api.create_self_subject_rules_review.side_effect = _rules_review
+        api.create_self_subject_access_review.return_value = MagicMock(status=MagicMock(allowed=True, reason=None))
+        return api
+
+    @patch("kubernetes.client.AuthorizationV1Api")
+    def test_namespaces_use_one_rules_review_each(self, mock_auth_cls, mock_client):
+        everything = [V1ResourceRule(api_groups=["*"], resources=["*"], verbs=["*"])]
+        api = self._auth_api({ns: everything for ns in RBACValidator.OPERATOR_HUB_NAMESPACE_PERMISSIONS})
+        mock_auth_cls.return_value = api
+        validator = RBACValidator(mock_client, batched=True)
+
+        all_valid, errors = validator.validate_namespace_permissions()
+
+        assert all_valid is True
+        assert errors == []
+        assert api.create_self_subject_rules_review.call_count == len(RBACValidator.OPERATOR_HUB_NAMESPACE_PERMISSIONS)
+        api.create_self_subject_access_review.assert_not_called()
+
+    @patch("kubernetes.client.AuthorizationV1Api")
+    def test_missing_rule_is_reported_without_access_review(self, mock_auth_cls, mock_client):
+        read_only = [V1ResourceRule(api_groups=["*"], resources=["*"], verbs=["get", "list"])]
+        api = self._auth_api({ns: read_only for ns in RBACValidator.OPERATOR_HUB_NAMESPACE_PERMISSIONS})
+        mock_auth_cls.return_value = api
+        validator = RBACValidator(mock_client, batched=True)
+
+        all_valid, errors = validator.validate_namespace_permissions(skip_observability=True)
+
+        assert all_valid is False
+        assert (
+            "Missing permission in open-cluster-management-backup: create core/configmaps - Not granted by any RBAC rule"
+            in errors
+        )
+        api.create_self_subject_access_review.assert_not_called()
+
+    @patch("kubernetes.client.AuthorizationV1Api")
+    def test_incomplete_review_falls_back_to_access_review(self, mock_auth_cls, mock_client):
+        api = self._auth_api({}, incomplete=True)
+        mock_auth_cls.return_value = api
+        validator = RBACValidator(mock_client, role="validator", batched=True)
+
+        all_valid, _ = validator.validate_managed_cluster_permissions()
+
+        assert all_valid is True
+        assert api.create_self_subject_access_review.call_count == 2
+
+    @patch("kubernetes.client.AuthorizationV1Api")
+    def test_cluster_scope_uses_access_reviews_once(self, mock_auth_cls, mock_client):
+        api = self._auth_api({})
+        mock_auth_cls.return_value = api
+        validator = RBACValidator(mock_client, batched=True)
+        expected = sum(len(verbs) for _, _, verbs in RBACValidator.OPERATOR_CLUSTER_PERMISSIONS)
+
+        assert validator.validate_cluster_permissions()[0] is True
+        assert validator.validate_cluster_permissions()[0] is True
+
+        assert api.create_self_subject_access_review.call_count == expected
+        api.create_self_subject_rules_review.assert_not_called()
+
+
 class TestValidateRBACPermissions:
     """Test cases for validate_rbac_permissions function."""
 
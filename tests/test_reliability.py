@@ -17,7 +17,7 @@
 @pytest.fixture
 def kube_client():
     """Fixture to provide a mocked KubeClient."""
-    with patch("kubernetes.config.load_kube_config"), patch("kubernetes.client.CoreV1Api"), patch(
+    with patch("lib.kube_client.kubeconfig_index.get_kubeconfig_index"), patch("kubernetes.client.CoreV1Api"), patch(
         "kubernetes.client.AppsV1Api"
     ), patch("kubernetes.client.CustomObjectsApi"):
         yield KubeClient(context="test-context")
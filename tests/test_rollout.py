@@ -0,0 +1,114 @@
+"""Unit tests for lib/rollout.py.
+
+Tests cover rollout resolution by pod count and readyReplicas, the watch on
+the workload, and that track_rollouts waits on all workloads concurrently.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from lib.rollout import WorkloadRollout, track_rollouts
+
+
+def _rollout(client, kind="deployments", replicas=None, hub="new hub"):
+    return WorkloadRollout(hub, client, kind, "obs-api", "obs-ns", "app=obs-api", replicas=replicas)
+
+
+@pytest.mark.unit
+class TestWorkloadRollout:
+    """Tests for a single rollout check."""
+
+    def test_scale_to_zero_counts_pods(self):
+        client = Mock()
+        client.get_pods.side_effect = [[{"metadata": {"name": "api-0"}}], []]
+        rollout = _rollout(client, replicas=0, hub="old hub")
+
+        assert rollout.observe() == (False, "1 pod(s) remaining")
+        assert rollout.remaining_pods == [{"metadata": {"name": "api-0"}}]
+        assert rollout.observe() == (True, "0 pod(s) remaining")
+        assert rollout.done is True
+        client.get_pods.assert_called_with(namespace="obs-ns", label_selector="app=obs-api")
+        client.get_deployment.assert_not_called()
+
+    def test_scale_up_uses_ready_replicas(self):
+        client = Mock()
+        client.get_statefulset.side_effect = [{"status": {"readyReplicas": 1}}, {"status": {"readyReplicas": 2}}]
+        rollout = _rollout(client, kind="statefulsets", replicas=2)
+
+        assert rollout.observe() == (False, "1/2 ready")
+        assert rollout.observe() == (True, "2/2 ready")
+        client.get_statefulset.assert_called_with(name="obs-api", namespace="obs-ns")
+        client.get_pods.assert_not_called()
+
+    def test_default_target_is_workload_spec(self):
+        client = Mock()
+        client.get_deployment.return_value = {"spec": {"replicas": 3}, "status": {"readyReplicas": 3}}
+
+        assert _rollout(client).observe() == (True, "3/3 ready")
+
+    def test_missing_workload_only_resolves_without_explicit_target(self):
+        client = Mock()
+        client.get_deployment.return_value = None
+
+        spec_rollout = _rollout(client)
+        assert spec_rollout.observe() == (True, "workload not found")
+        assert spec_rollout.found is False
+        assert _rollout(client, replicas=2).observe() == (False, "workload not found")
+
+    def test_api_error_keeps_waiting(self):
+        client = Mock()
+        client.get_deployment.side_effect = ApiException(status=500)
+
+        done, detail = _rollout(client, replicas=1).observe()
+
+        assert done is False
+        assert detail.startswith("check failed")
+
+    def test_watches_the_workload(self):
+        watch = _rollout(Mock(), kind="statefulsets").watch()
+
+        assert watch.description == "statefulsets/obs-api in obs-ns"
+
+    def test_rejects_unknown_kind(self):
+        with pytest.raises(ValueError):
+            _rollout(Mock(), kind="daemonsets")
+
+
+@pytest.mark.unit
+class TestTrackRollouts:
+    """Tests for concurrent tracking."""
+
+    def test_rollouts_are_waited_on_concurrently(self):
+        # Each check blocks until both rollouts are being checked at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _pods(**kwargs):
+            barrier.wait()
+            return []
+
+        def _deployment(**kwargs):
+            barrier.wait()
+            return {"status": {"readyReplicas": 2}}
+
+        old_hub, new_hub = Mock(), Mock()
+        old_hub.get_pods.side_effect = _pods
+        new_hub.get_deployment.side_effect = _deployment
+        rollouts = [_rollout(old_hub, replicas=0, hub="old hub"), _rollout(new_hub, replicas=2)]
+
+        assert track_rollouts(rollouts, timeout=10, interval=1) is True
+        assert [r.done for r in rollouts] == [True, True]
+
+    @patch("lib.rollout.wait_for_condition")
+    def test_reports_failure_when_any_rollout_times_out(self, mock_wait):
+        mock_wait.side_effect = [True, False]
+        rollouts = [_rollout(Mock(), replicas=0), _rollout(Mock(), replicas=1)]
+
+        assert track_rollouts(rollouts, timeout=30, interval=5) is False
+        assert {c.kwargs["timeout"] for c in mock_wait.call_args_list} == {30}
+        assert all(c.kwargs["watch"] is not None for c in mock_wait.call_args_list)
+
+    def test_no_rollouts(self):
+        assert track_rollouts([], timeout=30, interval=5) is True
@@ -8,7 +8,9 @@
 
 from show_state import (
     _default_state_dir,
+    build_timing_rows,
     find_state_files,
+    format_seconds,
     format_timestamp,
     load_state,
 )
@@ -55,12 +57,52 @@ def test_find_state_files_discovers_json_files(self, tmp_path: Path, monkeypatch
         f2 = state_dir / "switchover-x__y.json"
         f1.write_text("{}", encoding="utf-8")
         f2.write_text("{}", encoding="utf-8")
+        (state_dir / "switchover-a__b.api-metrics.json").write_text("{}", encoding="utf-8")
 
         monkeypatch.setenv("ACM_SWITCHOVER_STATE_DIR", str(state_dir))
         files = find_state_files()
         assert len(files) == 2
         assert str(f1) in files and str(f2) in files
 
+    def test_format_seconds(self):
+        assert format_seconds(4.24) == "4.2s"
+        assert format_seconds(187) == "3m 07s"
+        assert format_seconds(3720) == "1h 02m"
+
+    def test_build_timing_rows_orders_phases_then_steps(self):
+        state = {
+            "last_updated": "2026-01-01T00:10:00+00:00",
+            "phase_timings": [
+                {"phase": "activation", "started_at": "2026-01-01T00:02:00+00:00"},
+                {
+                    "phase": "preflight_validation",
+                    "started_at": "2026-01-01T00:00:00+00:00",
+                    "ended_at": "2026-01-01T00:02:00+00:00",
+                    "duration_seconds": 120,
+                },
+            ],
+            "completed_steps": [
+                {"name": "legacy_step", "timestamp": "2026-01-01T00:01:00+00:00"},
+                {
+                    "name": "wait_restore_completion",
+                    "timestamp": "2026-01-01T00:09:00+00:00",
+                    "started_at": "2026-01-01T00:03:00+00:00",
+                    "duration_seconds": 360,
+                },
+            ],
+        }
+
+        rows = build_timing_rows(state)
+
+        assert [(row["kind"], row["label"]) for row in rows] == [
+            ("phase", "Pre-flight"),
+            ("phase", "Activation"),
+            ("step", "wait_restore_completion"),
+        ]
+        # The open phase runs until last_updated
+        assert rows[1]["open"] is True
+        assert rows[1]["duration"] == 480
+
     def test_load_state_success_and_errors(self, tmp_path: Path, capsys):
         good = tmp_path / "good.json"
         bad = tmp_path / "bad.json"
@@ -77,6 +119,20 @@ def test_load_state_success_and_errors(self, tmp_path: Path, capsys):
         assert "Error: State file not found" in captured
         assert "Error: Invalid JSON in state file" in captured
 
+    def test_load_state_applies_pending_journal_records(self, tmp_path: Path):
+        state_file = tmp_path / "switchover-a__b.json"
+        state_file.write_text(json.dumps({"config": {}, "journal_seq": 1}), encoding="utf-8")
+        (tmp_path / "switchover-a__b.json.journal").write_text(
+            '{"seq":1,"op":"config","key":"old","value":1}\n'
+            '{"seq":2,"op":"config","key":"argocd_run_id","value":"abc","ts":"2026-01-01T00:00:00+00:00"}\n',
+            encoding="utf-8",
+        )
+
+        state = load_state(str(state_file))
+
+        assert state["config"] == {"argocd_run_id": "abc"}
+        assert state["last_updated"] == "2026-01-01T00:00:00+00:00"
+
 
 @pytest.mark.unit
 class TestShowStateMain:
@@ -142,6 +198,34 @@ def test_main_uses_most_recent_state_file_and_prints_json(self, monkeypatch: pyt
         loaded = json.loads(json_str)
         assert loaded.get("current_phase") in {"init", "completed"}
 
+    def test_main_timing_flag_prints_waterfall(self, monkeypatch: pytest.MonkeyPatch, capsys, tmp_path: Path):
+        state_file = tmp_path / "switchover-a__b.json"
+        state_file.write_text(
+            json.dumps(
+                {
+                    "current_phase": "completed",
+                    "phase_timings": [
+                        {
+                            "phase": "preflight_validation",
+                            "started_at": "2026-01-01T00:00:00+00:00",
+                            "ended_at": "2026-01-01T00:01:00+00:00",
+                            "duration_seconds": 60,
+                        }
+                    ],
+                    "completed_steps": [],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        result = main_cli(args=["--timing", "--no-color", str(state_file)])
+
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "Timing (total 1m 00s)" in out
+        assert "Pre-flight" in out
+        assert "100.0%" in out
+
     def test_main_returns_error_when_no_state_files(self, monkeypatch: pytest.MonkeyPatch, capsys, tmp_path: Path):
         monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("ACM_SWITCHOVER_STATE_DIR", str(tmp_path / ".state"))
@@ -0,0 +1,97 @@
+"""Unit tests for lib/spoke_clients.py.
+
+Tests per-context reuse, LRU eviction with close, discard/close, and
+concurrent first use of the same context.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lib.spoke_clients import SpokeClientPool
+
+
+def _factory():
+    created = []
+
+    def build(context):
+        api_client = MagicMock(name=f"api_client-{context}")
+        created.append((context, api_client))
+        return api_client
+
+    return build, created
+
+
+@pytest.mark.unit
+class TestSpokeClientPool:
+    """Tests for SpokeClientPool."""
+
+    def test_same_context_reuses_client(self):
+        build, created = _factory()
+        pool = SpokeClientPool(factory=build)
+
+        assert pool.api_client("ctx-a") is pool.api_client("ctx-a")
+        assert len(created) == 1
+
+    def test_least_recently_used_client_is_closed_on_eviction(self):
+        build, created = _factory()
+        pool = SpokeClientPool(max_size=2, factory=build)
+
+        first = pool.api_client("ctx-a")
+        second = pool.api_client("ctx-b")
+        pool.api_client("ctx-a")  # ctx-b is now least recently used
+        pool.api_client("ctx-c")
+
+        second.close.assert_called_once()
+        first.close.assert_not_called()
+        assert len(pool) == 2
+        assert pool.api_client("ctx-b") is not second
+
+    def test_discard_and_close_release_clients(self):
+        build, _ = _factory()
+        pool = SpokeClientPool(factory=build)
+        first = pool.api_client("ctx-a")
+        second = pool.api_client("ctx-b")
+
+        pool.discard("ctx-a")
+        pool.discard("missing")
+        first.close.assert_called_once()
+        assert len(pool) == 1
+
+        pool.close()
+        second.close.assert_called_once()
+        assert len(pool) == 0
+
+    def test_concurrent_first_use_keeps_one_client(self):
+        barrier = threading.Barrier(4)
+        built = []
+
+        def build(context):
+            barrier.wait(timeout=5)
+            api_client = MagicMock(name=context)
+            built.append(api_client)
+            return api_client
+
+        pool = SpokeClientPool(factory=build)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: pool.api_client("ctx-a"), range(4)))
+
+        assert len({id(result) for result in results}) == 1
+        assert len(pool) == 1
+        assert sum(api_client.close.call_count for api_client in built) == 3
+
+    def test_clients_bind_typed_apis_to_pooled_client(self):
+        build, created = _factory()
+        pool = SpokeClientPool(factory=build)
+
+        with patch("lib.spoke_clients.client.CoreV1Api") as core_ctor, patch(
+            "lib.spoke_clients.client.AppsV1Api"
+        ) as apps_ctor:
+            pool.clients("ctx-a")
+            pool.clients("ctx-a")
+
+        assert len(created) == 1
+        core_ctor.assert_called_with(api_client=created[0][1])
+        apps_ctor.assert_called_with(api_client=created[0][1])
@@ -74,13 +74,13 @@ def test_primary_prep_records_pause_state_consumed_by_finalization(
                 namespace="openshift-gitops",
                 name="acm-restore",
                 resource_count=1,
-                app=app,
+                sync_policy=app["spec"]["syncPolicy"],
             )
         ]
 
         with (
             patch("modules.primary_prep.argocd_lib.detect_argocd_installation", return_value=discovery),
-            patch("modules.primary_prep.argocd_lib.list_argocd_applications", return_value=[app]),
+            patch("modules.primary_prep.argocd_lib.iter_argocd_applications", return_value=[app]),
             patch("modules.primary_prep.argocd_lib.find_acm_touching_apps", return_value=impacts),
             patch("modules.primary_prep.argocd_lib.run_id_or_new", return_value="run-123"),
             patch("modules.primary_prep.argocd_lib.pause_autosync") as pause_autosync,
@@ -138,7 +138,7 @@ def test_activation_flag_causes_finalization_to_delete_import_configmap(self, st
             manage_auto_import_strategy=True,
         )
 
-        secondary_client.list_custom_resources.return_value = [{"metadata": {"name": "cluster-a"}}]
+        secondary_client.list_metadata.return_value = [{"metadata": {"name": "cluster-a"}}]
         secondary_client.get_configmap.side_effect = [
             None,
             {"data": {AUTO_IMPORT_STRATEGY_KEY: AUTO_IMPORT_STRATEGY_SYNC}},
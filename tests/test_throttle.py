@@ -0,0 +1,81 @@
+"""Unit tests for lib/throttle.py.
+
+Tests the per-client token bucket and Retry-After parsing.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from lib.constants import RETRY_AFTER_MAX_SECONDS
+from lib.throttle import TokenBucket, parse_retry_after
+
+
+@pytest.mark.unit
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            (None, None),
+            ({}, None),
+            ({"Content-Type": "application/json"}, None),
+            ({"Retry-After": "3"}, 3.0),
+            ({"retry-after": "1.5"}, 1.5),
+            ({"Retry-After": "-4"}, 0.0),
+            ({"Retry-After": "100000"}, float(RETRY_AFTER_MAX_SECONDS)),
+            ({"Retry-After": "soon"}, None),
+        ],
+    )
+    def test_delta_seconds(self, headers, expected):
+        assert parse_retry_after(headers) == expected
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        delay = parse_retry_after({"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+        assert 25 <= delay <= 30
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_is_served_without_waiting(self):
+        bucket = TokenBucket(qps=1, burst=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert bucket.stats()["throttled_requests"] == 0
+
+    def test_requests_beyond_burst_wait_for_refill(self):
+        bucket = TokenBucket(qps=100, burst=1)
+        start = time.monotonic()
+
+        bucket.acquire()
+        waited = bucket.acquire()
+
+        stats = bucket.stats()
+        assert waited > 0
+        assert time.monotonic() - start >= 0.009
+        assert stats["requests"] == 2
+        assert stats["throttled_requests"] == 1
+        assert stats["throttled_seconds"] > 0
+
+    def test_pause_holds_back_all_tokens(self):
+        bucket = TokenBucket(qps=1000, burst=10)
+
+        bucket.pause(0.05)
+        waited = bucket.acquire()
+
+        assert waited >= 0.045
+        assert bucket.stats()["retry_after_pauses"] == 1
+
+    def test_rejects_non_positive_qps(self):
+        with pytest.raises(ValueError):
+            TokenBucket(qps=0, burst=1)
@@ -4,7 +4,9 @@
 Tests cover StateManager, Phase enum, version comparison, and logging setup.
 """
 
+import json
 import os
+import stat
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -86,6 +88,43 @@ def test_mark_step_completed(self, state_manager):
         assert completed[0]["name"] == "step1"
         assert "timestamp" in completed[0]
 
+    def test_step_context_records_start_and_duration(self, state_manager):
+        """Steps run through state.step() persist their start time and duration."""
+        with state_manager.step("timed_step") as should_run:
+            assert should_run
+
+        entry = state_manager.state["completed_steps"][0]
+        assert entry["name"] == "timed_step"
+        assert entry["started_at"] <= entry["timestamp"]
+        assert entry["duration_seconds"] >= 0
+
+    def test_set_phase_records_phase_timings(self, state_manager):
+        """Each transition closes the open phase; terminal phases open none."""
+        state_manager.set_phase(Phase.PREFLIGHT)
+        state_manager.set_phase(Phase.PREFLIGHT)  # re-entering keeps the open entry
+        state_manager.set_phase(Phase.PRIMARY_PREP)
+        state_manager.set_phase(Phase.COMPLETED)
+
+        timings = state_manager.get_phase_timings()
+        assert [t["phase"] for t in timings] == ["preflight_validation", "primary_preparation"]
+        assert all("ended_at" in t and t["duration_seconds"] >= 0 for t in timings)
+
+    def test_phase_left_open_by_interrupted_run_is_closed_at_last_step(self, tmp_path):
+        """A phase still open from a previous process ends at its last completed step."""
+        state_path = tmp_path / "interrupted.json"
+        sm = StateManager(str(state_path))
+        sm.set_phase(Phase.ACTIVATION)
+        sm.mark_step_completed("activate_managed_clusters")
+        last_step_at = sm.state["completed_steps"][-1]["timestamp"]
+
+        resumed = StateManager(str(state_path))
+        resumed.set_phase(Phase.POST_ACTIVATION)
+
+        activation = resumed.get_phase_timings()[0]
+        assert activation["interrupted"] is True
+        assert activation["ended_at"] == last_step_at
+        assert "ended_at" not in resumed.get_phase_timings()[1]
+
     def test_mark_step_completed_persists_immediately(self, tmp_path):
         """Completed steps should be persisted without explicit save_state."""
         state_path = tmp_path / "state-step.json"
@@ -279,6 +318,7 @@ def test_restore_runtime_checkpoint_restores_phase_and_timestamp_only(self, tmp_
         assert reloaded.get_current_phase() == Phase.INIT
         assert reloaded.get_config("primary_version") == "2.14.0"
         assert reloaded.state["last_updated"] == original_timestamp
+        assert reloaded.get_phase_timings() == []
 
     def test_ensure_contexts_stores_values(self, tmp_path):
         """Contexts should be persisted and reloaded."""
@@ -953,6 +993,35 @@ def test_boundary_values(self):
         assert format_duration(3600.0) == "1.0h"
 
 
+@pytest.mark.unit
+class TestAtomicWriteJson:
+    """Test cases for atomic_write_json."""
+
+    def test_writes_owner_only_file_and_creates_directory(self, tmp_path):
+        """The file is created with mode 0600 under a new directory, without leftovers."""
+        from lib.utils import atomic_write_json
+
+        path = tmp_path / "cache" / "entry.json"
+        atomic_write_json(str(path), {"a": 1})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert os.listdir(path.parent) == ["entry.json"]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """An unserializable payload leaves the old file and no temporary file."""
+        from lib.utils import atomic_write_json
+
+        path = tmp_path / "entry.json"
+        atomic_write_json(str(path), {"a": 1})
+
+        with pytest.raises(TypeError):
+            atomic_write_json(str(path), {"a": object()})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+        assert os.listdir(tmp_path) == ["entry.json"]
+
+
 @pytest.mark.unit
 class TestConfirmAction:
     """Test cases for confirm_action utility function."""
@@ -233,6 +233,32 @@ def test_min_managed_clusters_zero_passes_validation(self):
 
         InputValidator.validate_all_cli_args(args)
 
+    @pytest.mark.parametrize(
+        "overrides,flag",
+        [
+            ({"api_qps": -1.0}, "api-qps"),
+            ({"api_burst": 0}, "api-burst"),
+            ({"rbac_cache_ttl": -1}, "rbac-cache-ttl"),
+            ({"argocd_discovery_cache_ttl": -1}, "argocd-discovery-cache-ttl"),
+            ({"klusterlet_verify_budget": -5}, "klusterlet-verify-budget"),
+        ],
+    )
+    def test_numeric_tuning_flags_reject_invalid_values(self, overrides, flag):
+        """Numeric tuning flags reject negative values; --api-burst must be at least 1."""
+        args = MockArgs(
+            primary_context="primary-hub",
+            secondary_context="secondary-hub",
+            method="passive",
+            old_hub_action="secondary",
+            log_format="text",
+            state_file=".state/switchover-state.json",
+            decommission=False,
+            **overrides,
+        )
+
+        with pytest.raises(ValidationError, match=flag):
+            InputValidator.validate_all_cli_args(args)
+
     def test_min_managed_clusters_positive_passes_validation(self):
         """Positive managed cluster thresholds remain valid."""
         args = MockArgs(
@@ -0,0 +1,99 @@
+"""Unit tests for lib/velero_backups.py.
+
+Tests the server-side label selectors and the name-pattern fallback that is
+applied only to backups without a recognised schedule-type label.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from lib.constants import ACM_BACKUP_SCHEDULE_TYPE_LABEL, BACKUP_NAMESPACE
+from lib.velero_backups import acm_backup_ownership_signal, acm_backup_selector, list_acm_backups
+
+
+def _backup(name, schedule_type=None):
+    labels = {ACM_BACKUP_SCHEDULE_TYPE_LABEL: schedule_type} if schedule_type else {}
+    return {"metadata": {"name": name, "labels": labels}}
+
+
+@pytest.mark.unit
+class TestSelectors:
+    """Tests for selector construction and ownership signals."""
+
+    def test_selector_lists_schedule_types(self):
+        assert acm_backup_selector(("resources", "managedClusters")) == (
+            f"{ACM_BACKUP_SCHEDULE_TYPE_LABEL} in (managedClusters,resources)"
+        )
+        assert acm_backup_selector(("resources",), negate=True) == f"{ACM_BACKUP_SCHEDULE_TYPE_LABEL} notin (resources)"
+
+    def test_ownership_signal(self):
+        assert acm_backup_ownership_signal(_backup("anything", "credentials")) == "label"
+        assert acm_backup_ownership_signal(_backup("acm-resources-schedule-20260101000000")) == "name-pattern"
+        assert acm_backup_ownership_signal(_backup("manual-backup")) is None
+
+
+@pytest.mark.unit
+class TestListAcmBackups:
+    """Tests for list_acm_backups."""
+
+    def test_labelled_backups_come_from_label_selected_list(self):
+        client = Mock()
+        client.iter_custom_resources.return_value = iter([_backup("b1", "resources")])
+        client.list_metadata.return_value = [_backup("manual-backup")]
+
+        backups = list_acm_backups(client)
+
+        assert [b["metadata"]["name"] for b in backups] == ["b1"]
+        kwargs = client.iter_custom_resources.call_args.kwargs
+        assert kwargs["namespace"] == BACKUP_NAMESPACE
+        assert kwargs["label_selector"] == acm_backup_selector()
+        assert client.list_metadata.call_args.kwargs["label_selector"] == acm_backup_selector(negate=True)
+
+    def test_name_fallback_fetches_only_matching_residue(self, caplog):
+        client = Mock()
+        client.iter_custom_resources.return_value = iter([])
+        client.list_metadata.return_value = [
+            _backup("manual-backup"),
+            _backup("acm-credentials-schedule-20260101000000"),
+            _backup("acm-resources-schedule-20260101000000", "not-an-acm-type"),
+        ]
+        client.get_custom_resource.side_effect = lambda **kwargs: {
+            "metadata": {"name": kwargs["name"]},
+            "status": {"phase": "Completed"},
+        }
+
+        backups = list_acm_backups(client)
+
+        assert [b["metadata"]["name"] for b in backups] == [
+            "acm-credentials-schedule-20260101000000",
+            "acm-resources-schedule-20260101000000",
+        ]
+        assert all(b["status"]["phase"] == "Completed" for b in backups)
+        assert client.get_custom_resource.call_count == 2
+        assert "name-pattern fallback" in caplog.text
+
+    def test_metadata_only_with_schedule_type_subset(self):
+        client = Mock()
+        client.list_metadata.side_effect = [
+            [_backup("mc-1", "managedClusters")],
+            [
+                _backup("acm-managed-clusters-schedule-20260101000000"),
+                _backup("acm-credentials-schedule-20260101000000"),
+                _backup("acm-managed-clusters-schedule-20260102000000", "credentials"),
+            ],
+        ]
+
+        backups = list_acm_backups(client, metadata_only=True, schedule_types=("managedClusters",))
+
+        assert [b["metadata"]["name"] for b in backups] == ["mc-1", "acm-managed-clusters-schedule-20260101000000"]
+        client.iter_custom_resources.assert_not_called()
+        client.get_custom_resource.assert_not_called()
+
+    def test_without_name_fallback_only_one_list(self):
+        client = Mock()
+        client.list_metadata.return_value = [_backup("mc-1", "managedClusters")]
+
+        list_acm_backups(client, metadata_only=True, name_fallback=False)
+
+        assert client.list_metadata.call_count == 1
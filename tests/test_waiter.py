@@ -4,11 +4,14 @@
 """
 
 import logging
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
+from kubernetes.client.rest import ApiException
 
-from lib.waiter import wait_for_condition
+from lib.waiter import ResourceWatch, wait_for_condition
 
 
 @pytest.fixture
@@ -135,3 +138,123 @@ def test_wait_timeout_no_last_chance(self, mock_time, mock_logger):
         )
 
         assert result is False
+
+
+class _FakeWatchClient:
+    """Client double whose watch streams are scripted per connection."""
+
+    def __init__(self, *streams):
+        self.watch_enabled = True
+        self.calls = []
+        self._streams = list(streams)
+        self.released = threading.Event()
+
+    def watch_custom_resources(self, **kwargs):
+        self.calls.append(kwargs)
+        stream = self._streams.pop(0) if self._streams else []
+        for item in stream:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        # Hold the connection open like a quiet watch until the test finishes
+        self.released.wait(5)
+
+
+def _event(event_type, resource_version):
+    return {"type": event_type, "raw_object": {"metadata": {"resourceVersion": resource_version}}}
+
+
+@pytest.mark.unit
+class TestResourceWatch:
+    """Tests for the watch-backed wake-ups used by wait_for_condition."""
+
+    def test_condition_rechecked_on_watch_event(self, mock_logger):
+        """A watch event re-evaluates the condition without waiting a full interval."""
+        client = _FakeWatchClient([_event("MODIFIED", "42")])
+        condition = Mock(side_effect=[(False, "pending"), (True, "done")])
+        watch = ResourceWatch(client, "g", "v1", "restores", namespace="ns", name="r", settle_seconds=0)
+
+        started = time.monotonic()
+        try:
+            result = wait_for_condition(
+                "watched",
+                condition,
+                timeout=10,
+                interval=30,
+                logger=mock_logger,
+                watch=watch,
+            )
+        finally:
+            client.released.set()
+
+        assert result is True
+        assert condition.call_count == 2
+        assert time.monotonic() - started < 5
+        assert client.calls[0]["name"] == "r"
+        assert not watch.active
+
+    def test_watch_denied_disables_watch(self):
+        """A 403 from the apiserver marks the watch unavailable."""
+        client = _FakeWatchClient([ApiException(status=403, reason="Forbidden")])
+        watch = ResourceWatch(client, "g", "v1", "managedclusters")
+
+        assert watch.start() is True
+        watch._thread.join(2)
+
+        assert watch.active is False
+        assert "403" in watch.unavailable_reason
+
+    def test_expired_resource_version_restarts_watch(self):
+        """A 410 clears the resourceVersion, reconnects and wakes the waiter."""
+        client = _FakeWatchClient(
+            [_event("BOOKMARK", "7"), ApiException(status=410, reason="Gone")],
+            [],
+        )
+        watch = ResourceWatch(client, "g", "v1", "multiclusterhubs", settle_seconds=0)
+
+        watch.start()
+        try:
+            assert watch.wait_for_change(2) is True
+            deadline = time.monotonic() + 2
+            while len(client.calls) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            watch.stop()
+            client.released.set()
+
+        assert client.calls[0]["resource_version"] is None
+        assert client.calls[1]["resource_version"] is None
+
+    def test_bookmark_advances_resource_version_without_wakeup(self):
+        """Bookmarks are tracked for reconnects but do not wake the waiter."""
+        client = _FakeWatchClient([_event("BOOKMARK", "11")], [])
+        watch = ResourceWatch(client, "g", "v1", "restores", namespace="ns")
+
+        watch.start()
+        try:
+            assert watch.wait_for_change(0.2) is False
+            assert watch._resource_version == "11"
+        finally:
+            watch.stop()
+            client.released.set()
+
+    @patch("lib.waiter.time")
+    def test_falls_back_to_polling_when_watches_disabled(self, mock_time, mock_logger):
+        """Clients without watch support keep the fixed-interval sleep."""
+        mock_time.time.side_effect = [0, 10, 10, 20]
+        client = Mock()
+        condition = Mock(side_effect=[(False, "pending"), (True, "done")])
+        watch = ResourceWatch(client, "g", "v1", "restores", namespace="ns")
+
+        result = wait_for_condition(
+            "polled",
+            condition,
+            interval=5,
+            logger=mock_logger,
+            watch=watch,
+        )
+
+        assert result is True
+        mock_time.sleep.assert_called_once_with(5)
+        client.watch_custom_resources.assert_not_called()
+        assert watch.unavailable_reason == "watches disabled for this client"